@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+from pathlib import Path
 
 logging.getLogger("streamlit").setLevel(logging.ERROR)
 logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(
@@ -23,6 +25,12 @@ from pywp.coordinate_integration import (
     transform_xy_to_crs,
 )
 from pywp.coordinate_systems import CoordinateSystem
+from pywp.crs_batch import (
+    CrsBatchInputError,
+    convert_coordinate_table,
+    coordinate_result_frame,
+    parse_dms_series,
+)
 from pywp.ui_theme import apply_page_style
 
 _DEFAULT_OUTPUT_CRS = CoordinateSystem.WGS84_UTM_ZONE_43N
@@ -38,6 +46,8 @@ _CALCULATOR_INPUT_CRS_OPTIONS = [
     (_WGS84_INPUT_LABEL, CoordinateSystem.WGS84),
 ]
 _SWAP_CRS_BUTTON_LABEL = "⇄"
+_BATCH_UPLOAD_PREVIEW_ROWS = 200
+_BATCH_UPLOAD_CACHE_KEY = "crs_calc_batch_upload_cache"
 
 
 def _labels(options: list[tuple[str, CoordinateSystem]]) -> list[str]:
@@ -109,32 +119,10 @@ def _default_batch_editor_frame() -> pd.DataFrame:
 
 
 def _parse_dms_component(text: str) -> tuple[str, float]:
-    tokens = re.findall(r"[NSEW]|[-+]?\d+(?:[.,]\d+)?", str(text).upper())
-    if len(tokens) != 4:
-        raise ValueError("ожидается формат вида `N 71 10 14.94`.")
-    direction = str(tokens[0])
-    if direction not in {"N", "S", "E", "W"}:
-        raise ValueError("неверное направление: используйте N/S/E/W.")
-    degrees = float(str(tokens[1]).replace(",", "."))
-    minutes = float(str(tokens[2]).replace(",", "."))
-    seconds = float(str(tokens[3]).replace(",", "."))
-    if degrees < 0.0:
-        raise ValueError("градусы должны быть неотрицательными.")
-    if minutes < 0.0 or minutes >= 60.0:
-        raise ValueError("минуты должны быть в диапазоне [0, 60).")
-    if seconds < 0.0 or seconds >= 60.0:
-        raise ValueError("секунды должны быть в диапазоне [0, 60).")
-    limit = 90.0 if direction in {"N", "S"} else 180.0
-    if degrees > limit:
-        raise ValueError(f"градусы для {direction} должны быть <= {limit:.0f}.")
-    if degrees == limit and (minutes > 0.0 or seconds > 0.0):
-        raise ValueError(
-            f"для {direction} при {limit:.0f}° минуты и секунды должны быть равны 0."
-        )
-    decimal = degrees + minutes / 60.0 + seconds / 3600.0
-    if direction in {"S", "W"}:
-        decimal *= -1.0
-    return direction, decimal
+    parsed = parse_dms_series([text])
+    if parsed.error[0]:
+        raise ValueError(str(parsed.error[0]))
+    return str(parsed.direction[0]), float(parsed.decimal_deg[0])
 
 
 def _parse_wgs84_dms_input(text: str) -> tuple[float, float]:
@@ -188,40 +176,99 @@ def _normalize_batch_editor_frame(
     return result.reset_index(drop=True), invalid_count
 
 
+def _batch_result_columns(
+    input_crs: CoordinateSystem,
+    output_crs: CoordinateSystem,
+) -> tuple[str, str, str, str]:
+    input_label = _crs_display_name(input_crs, output=False)
+    output_label = _crs_display_name(output_crs, output=True)
+    return (
+        f"X input ({input_label})",
+        f"Y input ({input_label})",
+        f"X output ({output_label})",
+        f"Y output ({output_label})",
+    )
+
+
 def _batch_result_frame(
     *,
     points: pd.DataFrame,
     input_crs: CoordinateSystem,
     output_crs: CoordinateSystem,
 ) -> pd.DataFrame:
-    input_label = _crs_display_name(input_crs, output=False)
-    output_label = _crs_display_name(output_crs, output=True)
-    columns = {
-        f"X input ({input_label})": [],
-        f"Y input ({input_label})": [],
-        f"X output ({output_label})": [],
-        f"Y output ({output_label})": [],
-    }
+    columns = _batch_result_columns(input_crs, output_crs)
     if points.empty:
-        return pd.DataFrame(columns=columns.keys())
-
-    rows: list[dict[str, str]] = []
-    for x_in, y_in in points[["X", "Y"]].itertuples(index=False, name=None):
-        x_out, y_out = transform_xy_to_crs(
-            float(x_in),
-            float(y_in),
-            input_crs,
-            output_crs,
-        )
-        rows.append(
-            {
-                f"X input ({input_label})": _format_value(float(x_in), input_crs),
-                f"Y input ({input_label})": _format_value(float(y_in), input_crs),
-                f"X output ({output_label})": _format_value(float(x_out), output_crs),
-                f"Y output ({output_label})": _format_value(float(y_out), output_crs),
-            }
+        return pd.DataFrame(columns=list(columns))
+    return coordinate_result_frame(
+        points["X"].to_numpy(dtype=float),
+        points["Y"].to_numpy(dtype=float),
+        input_crs=input_crs,
+        output_crs=output_crs,
+        columns=columns,
+    )
+
+
+def _render_batch_upload(
+    *,
+    input_crs: CoordinateSystem,
+    output_crs: CoordinateSystem,
+) -> None:
+    uploaded_points = st.file_uploader(
+        "Файл точек (CSV или XLSX)",
+        type=["csv", "xlsx"],
+        key="crs_calc_batch_upload",
+        help=(
+            "Столбцы X и Y (или первые два столбца). Файл пересчитывается "
+            "частями, на странице показываются первые "
+            f"{_BATCH_UPLOAD_PREVIEW_ROWS} строк."
+        ),
+    )
+    if uploaded_points is None:
+        return
+    signature = (
+        str(uploaded_points.name),
+        hashlib.blake2b(uploaded_points.getbuffer(), digest_size=16).hexdigest(),
+        str(input_crs.value),
+        str(output_crs.value),
+    )
+    cached = st.session_state.get(_BATCH_UPLOAD_CACHE_KEY)
+    if isinstance(cached, dict) and cached.get("signature") == signature:
+        conversion = cached["conversion"]
+    else:
+        uploaded_points.seek(0)
+        try:
+            conversion = convert_coordinate_table(
+                uploaded_points,
+                file_name=str(uploaded_points.name),
+                input_crs=input_crs,
+                output_crs=output_crs,
+                columns=_batch_result_columns(input_crs, output_crs),
+                preview_rows=_BATCH_UPLOAD_PREVIEW_ROWS,
+            )
+        except CrsBatchInputError as exc:
+            st.warning(f"Не удалось прочитать файл точек: {exc}")
+            return
+        st.session_state[_BATCH_UPLOAD_CACHE_KEY] = {
+            "signature": signature,
+            "conversion": conversion,
+        }
+    if conversion.invalid_row_count:
+        st.warning(
+            "Пропущены строки без полной числовой пары X/Y: "
+            f"{conversion.invalid_row_count}."
         )
-    return pd.DataFrame(rows, columns=columns.keys())
+    if not conversion.converted_row_count:
+        st.info("В файле не найдено точек для пересчёта.")
+        return
+    st.caption(f"Пересчитано точек: {conversion.converted_row_count}.")
+    st.dataframe(conversion.preview, hide_index=True, width="stretch")
+    st.download_button(
+        "Скачать результат CSV",
+        data=conversion.csv_bytes,
+        file_name=f"{Path(str(uploaded_points.name)).stem}_converted.csv",
+        mime="text/csv",
+        key="crs_calc_batch_upload_download",
+    )
 
 
 def _result_frame(
@@ -420,6 +467,7 @@ def run_page() -> None:
             hide_index=True,
             width="stretch",
         )
+        _render_batch_upload(input_crs=input_crs, output_crs=output_crs)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import bisect
+import os
 import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import Iterable
 
 import numpy as np
@@ -9,6 +13,7 @@ import pandas as pd
 
 from pywp.constants import SMALL
 from pywp.mcm import add_dls, wrap_azimuth_deg
+from pywp.parallel import PROCESS_POOL_ERRORS, process_pool_context
 from pywp.pydantic_base import FrozenArbitraryModel
 from pywp.reference_trajectories import ImportedTrajectoryWell
 from pywp.ui_utils import dls_to_pi
@@ -28,6 +33,9 @@ KOP_BUILD_RATE_THRESHOLD_DEG_PER_30M = 0.55
 KOP_MIN_BUILD_INTERVAL_M = 60.0
 KOP_VERTICAL_BASELINE_MAX_INC_DEG = 10.0
 KOP_INC_BUFFER_DEG = 3.0
+# Process pools only pay off for funds of at least this many wells.
+_PARALLEL_MIN_WELLS = 200
+_PARALLEL_MAX_WORKERS = 8
 
 
 def _optional_dls_to_pi(value: float | None) -> float | None:
@@ -126,6 +134,21 @@ class ActualFundWellAnalysis(FrozenArbitraryModel):
 
 
 
+@dataclass(frozen=True)
+class _SurveyArrays:
+    """Resampled survey columns plus the smoothed INC/DLS shared by detectors."""
+
+    md: np.ndarray
+    inc: np.ndarray
+    azi: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    dls: np.ndarray
+    stable_inc: np.ndarray
+    stable_dls: np.ndarray
+
+
 ZONE_VERTICAL = "vertical"
 ZONE_BUILD1 = "build1"
 ZONE_HOLD = "hold"
@@ -171,9 +194,9 @@ def actual_well_is_pilot_name(name: object) -> bool:
 
 
 def actual_well_is_horizontal(stations: pd.DataFrame) -> bool:
-    survey = _reconstruct_actual_survey(stations)
+    survey = _survey_arrays(_reconstruct_actual_survey(stations))
     interval = _terminal_horizontal_interval(survey)
-    max_inc = float(np.nanmax(survey["INC_deg"].to_numpy(dtype=float)))
+    max_inc = float(np.nanmax(survey.inc))
     return bool(
         max_inc >= HORIZONTAL_INC_THRESHOLD_DEG
         and interval[2] >= HORIZONTAL_MIN_INTERVAL_M
@@ -188,8 +211,52 @@ def build_actual_fund_well_analysis(
 
 def build_actual_fund_well_analyses(
     actual_wells: Iterable[ImportedTrajectoryWell],
+    *,
+    parallel_workers: int | None = None,
 ) -> tuple[ActualFundWellAnalysis, ...]:
-    return tuple(_analyze_actual_well(well) for well in actual_wells)
+    """Analyze wells in input order, fanning out to a process pool for big funds.
+
+    ``parallel_workers=None`` sizes the pool from the CPU count once the fund
+    is large enough to pay for the pool start; ``0`` or ``1`` analyzes
+    in-process. Analysis errors propagate exactly as in the serial run.
+    """
+    wells = list(actual_wells)
+
+    def analyze_serial() -> tuple[ActualFundWellAnalysis, ...]:
+        return tuple(_analyze_actual_well(well) for well in wells)
+
+    if parallel_workers is None:
+        workers = (
+            min(os.cpu_count() or 1, _PARALLEL_MAX_WORKERS)
+            if len(wells) >= _PARALLEL_MIN_WELLS
+            else 0
+        )
+    else:
+        workers = int(max(parallel_workers, 0))
+    if workers <= 1 or len(wells) <= 1:
+        return analyze_serial()
+
+    workers = min(workers, len(wells))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=process_pool_context(),
+        ) as executor:
+            outcomes = tuple(
+                executor.map(
+                    _analyze_actual_well_outcome,
+                    wells,
+                    chunksize=max(len(wells) // (workers * 4), 1),
+                )
+            )
+    except PROCESS_POOL_ERRORS:
+        return analyze_serial()
+    # Worker errors come back as values so they never pass for a pool
+    # failure; the first one in input order is raised, as in the serial run.
+    for _analysis, error in outcomes:
+        if error is not None:
+            raise error
+    return tuple(analysis for analysis, _error in outcomes)
 
 
 def build_actual_fund_well_metrics(
@@ -198,35 +265,45 @@ def build_actual_fund_well_metrics(
     return tuple(item.metrics for item in build_actual_fund_well_analyses(actual_wells))
 
 
+def _analyze_actual_well_outcome(
+    actual_well: ImportedTrajectoryWell,
+) -> tuple[ActualFundWellAnalysis | None, Exception | None]:
+    try:
+        return _analyze_actual_well(actual_well), None
+    except Exception as exc:  # noqa: BLE001
+        return None, exc
+
+
 def _analyze_actual_well(actual_well: ImportedTrajectoryWell) -> ActualFundWellAnalysis:
     stations = _reconstruct_actual_survey(actual_well.stations)
+    survey = _survey_arrays(stations)
     source_md_values = actual_well.stations["MD_m"].to_numpy(dtype=float)
     source_z_values = actual_well.stations["Z_m"].to_numpy(dtype=float)
-    md_values = stations["MD_m"].to_numpy(dtype=float)
-    z_values = stations["Z_m"].to_numpy(dtype=float)
-    x_values = stations["X_m"].to_numpy(dtype=float)
-    y_values = stations["Y_m"].to_numpy(dtype=float)
-    inc_values = stations["INC_deg"].to_numpy(dtype=float)
+    md_values = survey.md
+    z_values = survey.z
+    x_values = survey.x
+    y_values = survey.y
+    inc_values = survey.inc
     terminal_horizontal_start_md, _, terminal_horizontal_length_m = (
-        _terminal_horizontal_interval(stations)
+        _terminal_horizontal_interval(survey)
     )
     provisional_hold_start_md, provisional_hold_end_md, _, _ = _detect_hold_interval(
-        stations=stations,
+        survey=survey,
         kop_md_m=None,
         horizontal_entry_md_m=terminal_horizontal_start_md,
     )
     kop_md = _detect_kop_md(
-        stations=stations,
+        survey=survey,
         hold_start_md_m=provisional_hold_start_md,
     )
     horizontal_entry_md = _detect_horizontal_entry_md(
-        stations=stations,
+        survey=survey,
         kop_md_m=kop_md,
         hold_end_md_m=provisional_hold_end_md,
         terminal_horizontal_start_md_m=terminal_horizontal_start_md,
     )
     hold_start_md, hold_end_md, hold_inc, hold_azi = _detect_hold_interval(
-        stations=stations,
+        survey=survey,
         kop_md_m=kop_md,
         horizontal_entry_md_m=horizontal_entry_md,
     )
@@ -257,8 +334,8 @@ def _analyze_actual_well(actual_well: ImportedTrajectoryWell) -> ActualFundWellA
         )
     )
     build_mask = md_values <= build_limit_md + SMALL
-    max_dls = _robust_max_dls(stations)
-    max_build_dls = _robust_max_dls(stations.loc[build_mask].reset_index(drop=True))
+    max_dls = _robust_max_dls(md_values, survey.dls)
+    max_build_dls = _robust_max_dls(md_values[build_mask], survey.dls[build_mask])
     exclusion_reason = _analysis_exclusion_reason(
         is_horizontal=is_horizontal,
         kop_md_m=kop_md,
@@ -307,7 +384,7 @@ def _analyze_actual_well(actual_well: ImportedTrajectoryWell) -> ActualFundWellA
         analysis_exclusion_reason=exclusion_reason,
     )
     zone_summaries = _build_zone_summaries(
-        stations=stations,
+        survey=survey,
         kop_md_m=kop_md,
         hold_start_md_m=hold_start_md,
         hold_end_md_m=hold_end_md,
@@ -318,6 +395,7 @@ def _analyze_actual_well(actual_well: ImportedTrajectoryWell) -> ActualFundWellA
         metrics=metrics,
         survey=_annotate_actual_fund_survey(
             stations=stations,
+            md_values=md_values,
             zone_summaries=zone_summaries,
         ),
         zone_summaries=zone_summaries,
@@ -326,14 +404,14 @@ def _analyze_actual_well(actual_well: ImportedTrajectoryWell) -> ActualFundWellA
 
 def _build_zone_summaries(
     *,
-    stations: pd.DataFrame,
+    survey: _SurveyArrays,
     kop_md_m: float | None,
     hold_start_md_m: float | None,
     hold_end_md_m: float | None,
     horizontal_entry_md_m: float | None,
 ) -> tuple[ActualFundZoneSummary, ...]:
-    md_start = float(stations["MD_m"].iloc[0])
-    md_end = float(stations["MD_m"].iloc[-1])
+    md_start = float(survey.md[0])
+    md_end = float(survey.md[-1])
     intervals: list[tuple[str, float, float]] = []
 
     def add_interval(zone_key: str, start_m: float | None, end_m: float | None) -> None:
@@ -374,9 +452,12 @@ def _build_zone_summaries(
 
     zone_summaries: list[ActualFundZoneSummary] = []
     for zone_key, zone_start_md, zone_end_md in intervals:
-        interval_df = _survey_interval(stations, zone_start_md, zone_end_md)
-        inc_stats = _series_stats(interval_df["INC_deg"])
-        dls_stats = _series_stats(interval_df["DLS_deg_per_30m"])
+        inc_stats = _value_stats(
+            _interval_values(survey.md, survey.inc, zone_start_md, zone_end_md)
+        )
+        dls_stats = _value_stats(
+            _interval_values(survey.md, survey.dls, zone_start_md, zone_end_md)
+        )
         zone_summaries.append(
             ActualFundZoneSummary(
                 zone_key=zone_key,
@@ -398,6 +479,7 @@ def _build_zone_summaries(
 def _annotate_actual_fund_survey(
     *,
     stations: pd.DataFrame,
+    md_values: np.ndarray,
     zone_summaries: tuple[ActualFundZoneSummary, ...],
 ) -> pd.DataFrame:
     annotated = stations.copy()
@@ -407,28 +489,21 @@ def _annotate_actual_fund_survey(
         x_values - float(x_values[0]),
         y_values - float(y_values[0]),
     )
-    zone_keys: list[str] = []
-    zone_labels: list[str] = []
-    md_values = annotated["MD_m"].to_numpy(dtype=float)
-    for md_value in md_values.tolist():
-        summary = next(
-            (
-                item
-                for item in zone_summaries
-                if float(item.md_from_m) - SMALL
-                <= float(md_value)
-                <= float(item.md_to_m) + SMALL
-            ),
-            None,
+    zone_keys = np.full(len(md_values), ZONE_BUILD1, dtype=object)
+    zone_labels = np.full(len(md_values), ZONE_LABELS[ZONE_BUILD1], dtype=object)
+    assigned = np.zeros(len(md_values), dtype=bool)
+    # The first zone containing a station wins, as zones share their borders.
+    for item in zone_summaries:
+        inside = (
+            ~assigned
+            & (md_values >= float(item.md_from_m) - SMALL)
+            & (md_values <= float(item.md_to_m) + SMALL)
         )
-        if summary is None:
-            zone_keys.append(ZONE_BUILD1)
-            zone_labels.append(ZONE_LABELS[ZONE_BUILD1])
-        else:
-            zone_keys.append(str(summary.zone_key))
-            zone_labels.append(str(summary.zone_label))
-    annotated["AnalysisZoneKey"] = zone_keys
-    annotated["AnalysisZoneLabel"] = zone_labels
+        zone_keys[inside] = str(item.zone_key)
+        zone_labels[inside] = str(item.zone_label)
+        assigned |= inside
+    annotated["AnalysisZoneKey"] = zone_keys.tolist()
+    annotated["AnalysisZoneLabel"] = zone_labels.tolist()
     return annotated
 
 
@@ -486,63 +561,10 @@ def summarize_actual_fund_by_depth(
     *,
     relative_tolerance: float = DEPTH_CLUSTER_REL_TOLERANCE,
 ) -> tuple[ActualFundDepthClusterSummary, ...]:
-    eligible = [
-        item
-        for item in metrics
-        if bool(item.is_analysis_eligible)
-        and item.horizontal_entry_tvd_m is not None
-        and item.kop_md_m is not None
-    ]
-    if not eligible:
-        return ()
-    ordered = sorted(eligible, key=lambda item: float(item.horizontal_entry_tvd_m))
-    clusters: list[list[ActualFundWellMetrics]] = []
-    current: list[ActualFundWellMetrics] = []
-    for item in ordered:
-        depth_tvd = float(item.horizontal_entry_tvd_m)
-        if not current:
-            current = [item]
-            continue
-        current_depths = np.asarray(
-            [float(candidate.horizontal_entry_tvd_m) for candidate in current],
-            dtype=float,
-        )
-        cluster_center = float(np.median(current_depths))
-        max_allowed_gap = max(80.0, abs(cluster_center) * float(relative_tolerance))
-        if abs(depth_tvd - cluster_center) <= max_allowed_gap:
-            current.append(item)
-        else:
-            clusters.append(current)
-            current = [item]
-    if current:
-        clusters.append(current)
-
-    summaries: list[ActualFundDepthClusterSummary] = []
-    for index, cluster_items in enumerate(clusters, start=1):
-        depths = np.asarray(
-            [float(item.horizontal_entry_tvd_m) for item in cluster_items],
-            dtype=float,
-        )
-        kops = np.asarray(
-            [float(item.kop_md_m) for item in cluster_items],
-            dtype=float,
-        )
-        filtered_depths = _filter_depth_cluster_outliers(depths)
-        filtered_kops = _filter_depth_cluster_outliers(kops)
-        summaries.append(
-            ActualFundDepthClusterSummary(
-                cluster_id=f"DEPTH-{index:02d}",
-                well_count=len(cluster_items),
-                depth_from_tvd_m=float(np.min(depths)),
-                depth_to_tvd_m=float(np.max(depths)),
-                median_horizontal_entry_tvd_m=float(np.median(depths)),
-                median_kop_md_m=float(np.median(kops)),
-                anchor_horizontal_entry_tvd_m=_cluster_anchor_value(filtered_depths),
-                anchor_kop_md_m=_cluster_anchor_value(filtered_kops),
-                well_names=tuple(str(item.name) for item in cluster_items),
-            )
-        )
-    return tuple(summaries)
+    return ActualFundDepthClusterIndex(
+        metrics,
+        relative_tolerance=relative_tolerance,
+    ).summaries()
 
 
 def actual_fund_depth_rows(
@@ -571,10 +593,260 @@ def build_actual_fund_kop_depth_function(
     *,
     relative_tolerance: float = DEPTH_CLUSTER_REL_TOLERANCE,
 ) -> ActualFundKopDepthFunction | None:
-    clusters = summarize_actual_fund_by_depth(
-        metrics,
-        relative_tolerance=relative_tolerance,
+    return _kop_depth_function_from_clusters(
+        summarize_actual_fund_by_depth(
+            metrics,
+            relative_tolerance=relative_tolerance,
+        )
     )
+
+
+class ActualFundDepthClusterIndex:
+    """Depth clusters of eligible wells kept up to date as wells come and go.
+
+    Wells are kept sorted by horizontal-entry TVD (ties in insertion order)
+    and split greedily: a well joins the current cluster while it stays
+    within the tolerance of the running median. Adding or removing a well
+    rescans only from the cluster it touches until the cluster boundaries
+    match the previous ones again, and only rescanned clusters recompute
+    their statistics, so curation of a large fund stays cheap. Clusters and
+    their statistics equal a full ``summarize_actual_fund_by_depth`` over
+    the same wells; only wells tied on depth may be listed in ``well_names``
+    in a different order, since a re-added well goes after its ties.
+    """
+
+    def __init__(
+        self,
+        metrics: Iterable[ActualFundWellMetrics] = (),
+        *,
+        relative_tolerance: float = DEPTH_CLUSTER_REL_TOLERANCE,
+    ) -> None:
+        self.relative_tolerance = float(relative_tolerance)
+        self._keys: list[tuple[float, int]] = []
+        self._entries: list[_DepthClusterEntry] = []
+        self._keys_by_name: dict[str, list[tuple[float, int]]] = defaultdict(list)
+        self._metrics_by_name: dict[str, list[ActualFundWellMetrics]] = defaultdict(list)
+        self._cluster_starts: list[int] = []
+        self._cluster_stats: list[_DepthClusterStats] = []
+        self._next_sequence = 0
+        for item in metrics:
+            self._metrics_by_name[str(item.name)].append(item)
+            entry = self._new_entry(item)
+            if entry is not None:
+                self._entries.append(entry)
+        self._entries.sort(key=lambda entry: (entry.depth_tvd_m, entry.sequence))
+        self._keys = [(entry.depth_tvd_m, entry.sequence) for entry in self._entries]
+        self._rescan(from_cluster=0, changed_index=len(self._entries), shift=0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, metric: ActualFundWellMetrics) -> bool:
+        """Insert one well; wells not eligible for the analysis are ignored."""
+        self._metrics_by_name[str(metric.name)].append(metric)
+        entry = self._new_entry(metric)
+        if entry is None:
+            return False
+        key = (entry.depth_tvd_m, entry.sequence)
+        index = bisect.bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._entries.insert(index, entry)
+        self._rescan(
+            from_cluster=self._cluster_at(index - 1),
+            changed_index=index,
+            shift=1,
+        )
+        return True
+
+    def remove(self, name: str) -> bool:
+        """Drop every well with this name; returns whether one was present."""
+        self._metrics_by_name.pop(str(name), None)
+        keys = self._keys_by_name.pop(str(name), [])
+        for key in keys:
+            index = bisect.bisect_left(self._keys, key)
+            del self._keys[index]
+            del self._entries[index]
+            self._rescan(
+                from_cluster=self._cluster_at(index - 1),
+                changed_index=index,
+                shift=-1,
+            )
+        return bool(keys)
+
+    def sync(self, metrics: Iterable[ActualFundWellMetrics]) -> bool:
+        """Bring the index to ``metrics`` through ``remove``/``add`` only.
+
+        Wells whose metrics are unchanged stay in place; a changed well is
+        removed and inserted again after any wells of equal depth. Returns
+        whether anything changed.
+        """
+        incoming: dict[str, list[ActualFundWellMetrics]] = defaultdict(list)
+        for item in metrics:
+            incoming[str(item.name)].append(item)
+        stale_names = [
+            name
+            for name, items in self._metrics_by_name.items()
+            if incoming.get(name) != items
+        ]
+        for name in stale_names:
+            self.remove(name)
+        added = False
+        for name, items in incoming.items():
+            if name in self._metrics_by_name:
+                continue
+            for item in items:
+                self.add(item)
+            added = True
+        return bool(stale_names) or added
+
+    def summaries(self) -> tuple[ActualFundDepthClusterSummary, ...]:
+        return tuple(
+            ActualFundDepthClusterSummary(
+                cluster_id=f"DEPTH-{index:02d}",
+                well_count=stats.well_count,
+                depth_from_tvd_m=stats.depth_from_tvd_m,
+                depth_to_tvd_m=stats.depth_to_tvd_m,
+                median_horizontal_entry_tvd_m=stats.median_horizontal_entry_tvd_m,
+                median_kop_md_m=stats.median_kop_md_m,
+                anchor_horizontal_entry_tvd_m=stats.anchor_horizontal_entry_tvd_m,
+                anchor_kop_md_m=stats.anchor_kop_md_m,
+                well_names=stats.well_names,
+            )
+            for index, stats in enumerate(self._cluster_stats, start=1)
+        )
+
+    def kop_depth_function(self) -> ActualFundKopDepthFunction | None:
+        return _kop_depth_function_from_clusters(self.summaries())
+
+    def _new_entry(self, metric: ActualFundWellMetrics) -> _DepthClusterEntry | None:
+        if (
+            not bool(metric.is_analysis_eligible)
+            or metric.horizontal_entry_tvd_m is None
+            or metric.kop_md_m is None
+        ):
+            return None
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        depth_tvd_m = float(metric.horizontal_entry_tvd_m)
+        self._keys_by_name[str(metric.name)].append((depth_tvd_m, sequence))
+        return _DepthClusterEntry(
+            depth_tvd_m=depth_tvd_m,
+            sequence=sequence,
+            kop_md_m=float(metric.kop_md_m),
+            name=str(metric.name),
+        )
+
+    def _cluster_at(self, index: int) -> int:
+        if index < 0 or not self._cluster_starts:
+            return 0
+        return max(bisect.bisect_right(self._cluster_starts, index) - 1, 0)
+
+    def _rescan(self, *, from_cluster: int, changed_index: int, shift: int) -> None:
+        """Re-split entries from ``from_cluster`` on after an edit at ``changed_index``.
+
+        Old cluster starts past the edit are shifted by ``shift``; the scan
+        stops as soon as it opens a cluster at one of them, because the
+        greedy split after a cluster start depends only on later entries.
+        """
+        old_tail_starts = [
+            start + shift
+            for start in self._cluster_starts[from_cluster + 1 :]
+            if start + shift > changed_index
+            or (shift < 0 and start + shift == changed_index)
+        ]
+        resync_starts = set(old_tail_starts)
+        old_tail_stats = (
+            self._cluster_stats[len(self._cluster_stats) - len(old_tail_starts) :]
+            if old_tail_starts
+            else []
+        )
+        scan_start = self._cluster_starts[from_cluster] if self._cluster_starts else 0
+        if scan_start > changed_index:
+            scan_start = changed_index
+        new_starts: list[int] = []
+        new_stats: list[_DepthClusterStats] = []
+        resync_at: int | None = None
+        cluster_start = scan_start
+        count = len(self._entries)
+        index = scan_start
+        while cluster_start < count:
+            index = cluster_start + 1
+            while index < count and self._joins_cluster(cluster_start, index):
+                index += 1
+            new_starts.append(cluster_start)
+            new_stats.append(self._cluster_stats_for(cluster_start, index))
+            cluster_start = index
+            if cluster_start in resync_starts:
+                resync_at = cluster_start
+                break
+        if resync_at is None:
+            tail_starts: list[int] = []
+            tail_stats: list[_DepthClusterStats] = []
+        else:
+            keep_from = old_tail_starts.index(resync_at)
+            tail_starts = old_tail_starts[keep_from:]
+            tail_stats = old_tail_stats[keep_from:]
+        self._cluster_starts = (
+            self._cluster_starts[:from_cluster] + new_starts + tail_starts
+        )
+        self._cluster_stats = (
+            self._cluster_stats[:from_cluster] + new_stats + tail_stats
+        )
+
+    def _joins_cluster(self, cluster_start: int, index: int) -> bool:
+        size = index - cluster_start
+        middle = cluster_start + size // 2
+        # Entries are sorted, so the running median is the middle entry.
+        if size % 2:
+            center = self._entries[middle].depth_tvd_m
+        else:
+            center = (
+                self._entries[middle - 1].depth_tvd_m + self._entries[middle].depth_tvd_m
+            ) / 2.0
+        max_allowed_gap = max(80.0, abs(center) * self.relative_tolerance)
+        return abs(self._entries[index].depth_tvd_m - center) <= max_allowed_gap
+
+    def _cluster_stats_for(self, start: int, stop: int) -> _DepthClusterStats:
+        cluster = self._entries[start:stop]
+        depths = np.asarray([entry.depth_tvd_m for entry in cluster], dtype=float)
+        kops = np.asarray([entry.kop_md_m for entry in cluster], dtype=float)
+        return _DepthClusterStats(
+            well_count=len(cluster),
+            depth_from_tvd_m=float(np.min(depths)),
+            depth_to_tvd_m=float(np.max(depths)),
+            median_horizontal_entry_tvd_m=float(np.median(depths)),
+            median_kop_md_m=float(np.median(kops)),
+            anchor_horizontal_entry_tvd_m=_cluster_anchor_value(
+                _filter_depth_cluster_outliers(depths)
+            ),
+            anchor_kop_md_m=_cluster_anchor_value(_filter_depth_cluster_outliers(kops)),
+            well_names=tuple(entry.name for entry in cluster),
+        )
+
+
+@dataclass(frozen=True)
+class _DepthClusterEntry:
+    depth_tvd_m: float
+    sequence: int
+    kop_md_m: float
+    name: str
+
+
+@dataclass(frozen=True)
+class _DepthClusterStats:
+    well_count: int
+    depth_from_tvd_m: float
+    depth_to_tvd_m: float
+    median_horizontal_entry_tvd_m: float
+    median_kop_md_m: float
+    anchor_horizontal_entry_tvd_m: float
+    anchor_kop_md_m: float
+    well_names: tuple[str, ...]
+
+
+def _kop_depth_function_from_clusters(
+    clusters: tuple[ActualFundDepthClusterSummary, ...],
+) -> ActualFundKopDepthFunction | None:
     if not clusters:
         return None
     depths = tuple(float(item.anchor_horizontal_entry_tvd_m) for item in clusters)
@@ -664,11 +936,36 @@ def summarize_actual_fund_by_pad(
     return tuple(summaries)
 
 
-def _terminal_horizontal_interval(
-    stations: pd.DataFrame,
-) -> tuple[float | None, float | None, float]:
+def _survey_arrays(stations: pd.DataFrame) -> _SurveyArrays:
     md_values = stations["MD_m"].to_numpy(dtype=float)
     inc_values = stations["INC_deg"].to_numpy(dtype=float)
+    dls_values = stations["DLS_deg_per_30m"].to_numpy(dtype=float)
+    window_size = _robust_window_size(md_values)
+    return _SurveyArrays(
+        md=md_values,
+        inc=inc_values,
+        azi=stations["AZI_deg"].to_numpy(dtype=float),
+        x=stations["X_m"].to_numpy(dtype=float),
+        y=stations["Y_m"].to_numpy(dtype=float),
+        z=stations["Z_m"].to_numpy(dtype=float),
+        dls=dls_values,
+        stable_inc=(
+            _rolling_median(inc_values, window_size=window_size)
+            if len(inc_values)
+            else np.asarray([], dtype=float)
+        ),
+        stable_dls=_rolling_median(
+            np.where(np.isfinite(dls_values), dls_values, 0.0),
+            window_size=window_size,
+        ),
+    )
+
+
+def _terminal_horizontal_interval(
+    survey: _SurveyArrays,
+) -> tuple[float | None, float | None, float]:
+    md_values = survey.md
+    inc_values = survey.inc
     if len(md_values) == 0:
         return None, None, 0.0
     mask = inc_values >= HORIZONTAL_INC_THRESHOLD_DEG
@@ -689,25 +986,16 @@ def _terminal_horizontal_interval(
 
 def _detect_horizontal_entry_md(
     *,
-    stations: pd.DataFrame,
+    survey: _SurveyArrays,
     kop_md_m: float | None,
     hold_end_md_m: float | None,
     terminal_horizontal_start_md_m: float | None,
 ) -> float | None:
     if terminal_horizontal_start_md_m is None:
         return None
-    md_values = stations["MD_m"].to_numpy(dtype=float)
-    inc_values = stations["INC_deg"].to_numpy(dtype=float)
-    dls_values = stations["DLS_deg_per_30m"].to_numpy(dtype=float)
-    step_m = (
-        float(np.median(np.diff(md_values)))
-        if len(md_values) > 1
-        else ACTUAL_FUND_RESAMPLE_STEP_M
-    )
-    window_size = max(3, int(round(ROBUST_DLS_WINDOW_M / max(step_m, 1.0))))
-    stable_dls = _rolling_median(
-        np.where(np.isfinite(dls_values), dls_values, 0.0), window_size=window_size
-    )
+    md_values = survey.md
+    inc_values = survey.inc
+    stable_dls = survey.stable_dls
     tail_length_m = max(HORIZONTAL_MIN_INTERVAL_M, 120.0)
     tail_mask = md_values >= float(md_values[-1]) - tail_length_m
     tail_dls = stable_dls[tail_mask & np.isfinite(stable_dls)]
@@ -754,32 +1042,33 @@ def _first_threshold_crossing_md(
         return None
     if float(values[0]) >= threshold:
         return float(md_values[0])
-    for index in range(1, len(md_values)):
-        left_value = float(values[index - 1])
-        right_value = float(values[index])
-        if left_value < threshold <= right_value:
-            delta = float(right_value - left_value)
-            if abs(delta) <= SMALL:
-                return float(md_values[index])
-            alpha = float((threshold - left_value) / delta)
-            return float(
-                md_values[index - 1] + alpha * (md_values[index] - md_values[index - 1])
-            )
-    return None
+    crossings = np.flatnonzero((values[:-1] < threshold) & (threshold <= values[1:]))
+    if len(crossings) == 0:
+        return None
+    index = int(crossings[0]) + 1
+    left_value = float(values[index - 1])
+    right_value = float(values[index])
+    delta = float(right_value - left_value)
+    if abs(delta) <= SMALL:
+        return float(md_values[index])
+    alpha = float((threshold - left_value) / delta)
+    return float(
+        md_values[index - 1] + alpha * (md_values[index] - md_values[index - 1])
+    )
 
 
 def _detect_kop_md(
     *,
-    stations: pd.DataFrame,
+    survey: _SurveyArrays,
     hold_start_md_m: float | None,
 ) -> float | None:
-    md_values = stations["MD_m"].to_numpy(dtype=float)
+    md_values = survey.md
     if len(md_values) < 2:
         return None
 
-    stable_inc = _stable_inc_values(stations)
+    stable_inc = survey.stable_inc
     build_rate = _stable_inc_build_rate_deg_per_30m(
-        stations=stations,
+        md_values=md_values,
         stable_inc=stable_inc,
     )
     search_limit_md = (
@@ -828,52 +1117,31 @@ def _interp_1d(md_values: np.ndarray, values: np.ndarray, md_m: float) -> float:
     return float(np.interp(float(md_m), md_values, values))
 
 
-def _interpolate_row(stations: pd.DataFrame, md_m: float) -> dict[str, float]:
-    md_values = stations["MD_m"].to_numpy(dtype=float)
-    return {
-        column: float(
-            np.interp(float(md_m), md_values, stations[column].to_numpy(dtype=float))
-        )
-        for column in (
-            "MD_m",
-            "INC_deg",
-            "AZI_deg",
-            "X_m",
-            "Y_m",
-            "Z_m",
-            "DLS_deg_per_30m",
-        )
-    }
-
-
-def _survey_interval(
-    stations: pd.DataFrame, start_md_m: float, end_md_m: float
-) -> pd.DataFrame:
+def _interval_values(
+    md_values: np.ndarray,
+    values: np.ndarray,
+    start_md_m: float,
+    end_md_m: float,
+) -> np.ndarray:
+    """Station values inside ``[start, end]`` with interpolated end stations."""
     if end_md_m <= start_md_m + SMALL:
-        return pd.DataFrame(columns=stations.columns)
-    interval = stations.loc[
-        (stations["MD_m"] >= float(start_md_m) - SMALL)
-        & (stations["MD_m"] <= float(end_md_m) + SMALL)
-    ].copy()
-    if (
-        interval.empty
-        or abs(float(interval["MD_m"].iloc[0]) - float(start_md_m)) > SMALL
-    ):
-        interval = pd.concat(
-            [pd.DataFrame([_interpolate_row(stations, float(start_md_m))]), interval],
-            ignore_index=True,
-        )
-    if abs(float(interval["MD_m"].iloc[-1]) - float(end_md_m)) > SMALL:
-        interval = pd.concat(
-            [interval, pd.DataFrame([_interpolate_row(stations, float(end_md_m))])],
-            ignore_index=True,
-        )
-    interval = interval.sort_values("MD_m").reset_index(drop=True)
-    return interval
-
-
-def _series_stats(series: pd.Series) -> tuple[float | None, float | None, float | None]:
-    values = series.to_numpy(dtype=float)
+        return np.asarray([], dtype=float)
+    inside = np.flatnonzero(
+        (md_values >= float(start_md_m) - SMALL)
+        & (md_values <= float(end_md_m) + SMALL)
+    )
+    parts = [values[inside]]
+    last_md = float(md_values[inside[-1]]) if len(inside) else None
+    if len(inside) == 0 or abs(float(md_values[inside[0]]) - float(start_md_m)) > SMALL:
+        parts.insert(0, np.asarray([_interp_1d(md_values, values, start_md_m)]))
+        if last_md is None:
+            last_md = float(start_md_m)
+    if abs(float(last_md) - float(end_md_m)) > SMALL:
+        parts.append(np.asarray([_interp_1d(md_values, values, end_md_m)]))
+    return np.concatenate(parts).astype(float, copy=False)
+
+
+def _value_stats(values: np.ndarray) -> tuple[float | None, float | None, float | None]:
     finite = values[np.isfinite(values)]
     if len(finite) == 0:
         return None, None, None
@@ -1010,39 +1278,35 @@ def _station_direction_vectors(
     delta_md = np.diff(md_values)
     segment_vectors = np.diff(positions, axis=0)
     segment_norms = np.linalg.norm(segment_vectors, axis=1)
-    segment_directions = np.zeros_like(segment_vectors, dtype=float)
     valid = segment_norms > SMALL
-    if np.any(valid):
-        segment_directions[valid] = segment_vectors[valid] / segment_norms[valid, None]
-        last_valid = np.array([0.0, 0.0, 1.0], dtype=float)
-        for index in range(len(segment_directions)):
-            if valid[index]:
-                last_valid = segment_directions[index]
-            else:
-                segment_directions[index] = last_valid
-        next_valid = np.array([0.0, 0.0, 1.0], dtype=float)
-        for index in range(len(segment_directions) - 1, -1, -1):
-            if valid[index]:
-                next_valid = segment_directions[index]
-            elif np.linalg.norm(segment_directions[index]) <= SMALL:
-                segment_directions[index] = next_valid
-    else:
-        segment_directions[:] = np.array([0.0, 0.0, 1.0], dtype=float)
+    segment_directions = np.zeros_like(segment_vectors, dtype=float)
+    segment_directions[valid] = segment_vectors[valid] / segment_norms[valid, None]
+    # Zero-length segments repeat the previous direction; leading ones point down.
+    last_valid_index = np.maximum.accumulate(
+        np.where(valid, np.arange(len(valid)), -1)
+    )
+    segment_directions = np.where(
+        (last_valid_index >= 0)[:, None],
+        segment_directions[np.maximum(last_valid_index, 0)],
+        np.array([0.0, 0.0, 1.0], dtype=float),
+    )
     station_directions = np.zeros((len(md_values), 3), dtype=float)
     station_directions[0] = segment_directions[0]
     station_directions[-1] = segment_directions[-1]
-    for index in range(1, len(md_values) - 1):
-        left_weight = float(delta_md[index - 1])
-        right_weight = float(delta_md[index])
+    if len(md_values) > 2:
         weighted = (
-            left_weight * segment_directions[index - 1]
-            + right_weight * segment_directions[index]
+            delta_md[:-1, None] * segment_directions[:-1]
+            + delta_md[1:, None] * segment_directions[1:]
+        )
+        # Row-wise dot products round like ``np.linalg.norm`` of one vector, so
+        # blended directions match the per-station formula bit for bit.
+        norms = np.sqrt(np.matmul(weighted[:, None, :], weighted[:, :, None])[:, 0, 0])
+        degenerate = norms <= SMALL
+        station_directions[1:-1] = np.where(
+            degenerate[:, None],
+            segment_directions[1:],
+            weighted / np.where(degenerate, 1.0, norms)[:, None],
         )
-        norm = float(np.linalg.norm(weighted))
-        if norm <= SMALL:
-            station_directions[index] = segment_directions[index]
-        else:
-            station_directions[index] = weighted / norm
     return _normalize_vectors(station_directions)
 
 
@@ -1071,19 +1335,15 @@ def _regular_md_grid(md_values: np.ndarray, step_m: float) -> np.ndarray:
 def _mask_intervals(
     md_values: np.ndarray, mask: np.ndarray
 ) -> list[tuple[float, float, float]]:
-    intervals: list[tuple[float, float, float]] = []
-    current_start_index: int | None = None
-    for index, is_active in enumerate(mask.tolist()):
-        if is_active and current_start_index is None:
-            current_start_index = index
-        is_last = index == len(mask) - 1
-        if current_start_index is not None and ((not is_active) or is_last):
-            end_index = index if is_active and is_last else index - 1
-            start_md = float(md_values[current_start_index])
-            end_md = float(md_values[end_index])
-            intervals.append((start_md, end_md, float(max(end_md - start_md, 0.0))))
-            current_start_index = None
-    return intervals
+    """``(start_md, end_md, length_m)`` of every run of ``True`` stations."""
+    active = np.asarray(mask, dtype=bool)
+    if len(active) == 0:
+        return []
+    edges = np.diff(np.concatenate([[False], active, [False]]).astype(np.int8))
+    start_md = np.asarray(md_values, dtype=float)[np.flatnonzero(edges == 1)]
+    end_md = np.asarray(md_values, dtype=float)[np.flatnonzero(edges == -1) - 1]
+    lengths = np.maximum(end_md - start_md, 0.0)
+    return list(zip(start_md.tolist(), end_md.tolist(), lengths.tolist()))
 
 
 def _rolling_median(values: np.ndarray, window_size: int) -> np.ndarray:
@@ -1099,22 +1359,24 @@ def _rolling_median(values: np.ndarray, window_size: int) -> np.ndarray:
     )
 
 
-def _robust_max_dls(stations: pd.DataFrame) -> float | None:
-    if len(stations) < 2:
-        return None
-    md_values = stations["MD_m"].to_numpy(dtype=float)
-    dls_values = stations["DLS_deg_per_30m"].to_numpy(dtype=float)
-    finite_mask = np.isfinite(dls_values)
-    if not np.any(finite_mask):
-        return None
+def _robust_window_size(md_values: np.ndarray) -> int:
     step_m = (
         float(np.median(np.diff(md_values)))
         if len(md_values) > 1
         else ACTUAL_FUND_RESAMPLE_STEP_M
     )
-    window_size = max(3, int(round(ROBUST_DLS_WINDOW_M / max(step_m, 1.0))))
+    return max(3, int(round(ROBUST_DLS_WINDOW_M / max(step_m, 1.0))))
+
+
+def _robust_max_dls(md_values: np.ndarray, dls_values: np.ndarray) -> float | None:
+    if len(md_values) < 2:
+        return None
+    finite_mask = np.isfinite(dls_values)
+    if not np.any(finite_mask):
+        return None
     smoothed = _rolling_median(
-        np.where(finite_mask, dls_values, 0.0), window_size=window_size
+        np.where(finite_mask, dls_values, 0.0),
+        window_size=_robust_window_size(md_values),
     )
     finite_smoothed = smoothed[np.isfinite(smoothed)]
     if len(finite_smoothed) == 0:
@@ -1122,30 +1384,13 @@ def _robust_max_dls(stations: pd.DataFrame) -> float | None:
     return float(np.max(finite_smoothed))
 
 
-def _stable_inc_values(stations: pd.DataFrame) -> np.ndarray:
-    inc_values = stations["INC_deg"].to_numpy(dtype=float)
-    md_values = stations["MD_m"].to_numpy(dtype=float)
-    if len(inc_values) == 0:
-        return np.asarray([], dtype=float)
-    step_m = (
-        float(np.median(np.diff(md_values)))
-        if len(md_values) > 1
-        else ACTUAL_FUND_RESAMPLE_STEP_M
-    )
-    window_size = max(3, int(round(ROBUST_DLS_WINDOW_M / max(step_m, 1.0))))
-    return _rolling_median(inc_values, window_size=window_size)
-
-
 def _stable_inc_build_rate_deg_per_30m(
     *,
-    stations: pd.DataFrame,
-    stable_inc: np.ndarray | None = None,
+    md_values: np.ndarray,
+    stable_inc: np.ndarray,
 ) -> np.ndarray:
-    md_values = stations["MD_m"].to_numpy(dtype=float)
     if len(md_values) == 0:
         return np.asarray([], dtype=float)
-    if stable_inc is None:
-        stable_inc = _stable_inc_values(stations)
     if len(md_values) == 1:
         return np.zeros(1, dtype=float)
     delta_md = np.diff(md_values)
@@ -1156,20 +1401,19 @@ def _stable_inc_build_rate_deg_per_30m(
     station_rate = np.zeros(len(md_values), dtype=float)
     station_rate[0] = segment_rate[0]
     station_rate[-1] = segment_rate[-1]
-    for index in range(1, len(md_values) - 1):
-        station_rate[index] = 0.5 * float(segment_rate[index - 1] + segment_rate[index])
+    station_rate[1:-1] = 0.5 * (segment_rate[:-1] + segment_rate[1:])
     return station_rate
 
 
 def _detect_hold_interval(
     *,
-    stations: pd.DataFrame,
+    survey: _SurveyArrays,
     kop_md_m: float | None,
     horizontal_entry_md_m: float | None,
 ) -> tuple[float | None, float | None, float | None, float | None]:
-    md_values = stations["MD_m"].to_numpy(dtype=float)
-    azi_values = stations["AZI_deg"].to_numpy(dtype=float)
-    dls_values = stations["DLS_deg_per_30m"].to_numpy(dtype=float)
+    md_values = survey.md
+    stable_inc = survey.stable_inc
+    stable_dls = survey.stable_dls
 
     analysis_end_md = (
         float(horizontal_entry_md_m)
@@ -1179,27 +1423,17 @@ def _detect_hold_interval(
     search_start_md = (
         float(kop_md_m) + 10.0 if kop_md_m is not None else float(md_values[0]) + 10.0
     )
-    stable_inc = _stable_inc_values(stations)
     candidate_mask = (
         (md_values >= search_start_md)
         & (md_values <= analysis_end_md - 10.0)
         & np.isfinite(stable_inc)
-        & np.isfinite(dls_values)
+        & np.isfinite(survey.dls)
         & (stable_inc >= HOLD_MIN_INC_DEG)
         & (stable_inc <= HOLD_MAX_INC_DEG)
     )
     if not np.any(candidate_mask):
         return None, None, None, None
 
-    step_m = (
-        float(np.median(np.diff(md_values)))
-        if len(md_values) > 1
-        else ACTUAL_FUND_RESAMPLE_STEP_M
-    )
-    window_size = max(3, int(round(ROBUST_DLS_WINDOW_M / max(step_m, 1.0))))
-    stable_dls = _rolling_median(
-        np.where(np.isfinite(dls_values), dls_values, 0.0), window_size=window_size
-    )
     weighted_mode_inc = _weighted_modal_inclination(
         md_values=md_values,
         inc_values=stable_inc,
@@ -1223,7 +1457,7 @@ def _detect_hold_interval(
     start_md, end_md, _ = max(intervals, key=lambda item: (item[2], -item[0]))
     interval_mask = (md_values >= start_md - SMALL) & (md_values <= end_md + SMALL)
     hold_inc = float(np.median(stable_inc[interval_mask]))
-    hold_azi = _circular_median_deg(azi_values[interval_mask])
+    hold_azi = _circular_median_deg(survey.azi[interval_mask])
     return float(start_md), float(end_md), hold_inc, hold_azi
 
 
@@ -1233,18 +1467,22 @@ def _weighted_modal_inclination(
     inc_values: np.ndarray,
     mask: np.ndarray,
 ) -> float | None:
-    if not np.any(mask):
+    active = np.flatnonzero(mask)
+    if len(active) == 0:
         return None
-    rounded = np.round(inc_values).astype(int)
     weights = np.zeros(len(md_values), dtype=float)
     if len(md_values) > 1:
         weights[:-1] = np.diff(md_values)
         weights[-1] = weights[-2]
-    totals: dict[int, float] = defaultdict(float)
-    for index, is_active in enumerate(mask.tolist()):
-        if is_active:
-            totals[int(rounded[index])] += float(weights[index])
-    if not totals:
-        return None
-    best_bin, _ = max(totals.items(), key=lambda item: (item[1], -abs(item[0] - 45)))
+    bins = np.round(inc_values[active]).astype(int)
+    unique_bins, first_index, inverse = np.unique(
+        bins, return_index=True, return_inverse=True
+    )
+    totals = np.bincount(inverse, weights=weights[active])
+    # Ties keep the bin met first along the well, as in a running tally.
+    candidates = [
+        (int(unique_bins[index]), float(totals[index]))
+        for index in np.argsort(first_index, kind="stable")
+    ]
+    best_bin, _ = max(candidates, key=lambda item: (item[1], -abs(item[0] - 45)))
     return float(best_bin)
@@ -715,6 +715,86 @@ def analyze_anti_collision_incremental(
     )
 
 
+def analyze_anti_collision_pairs_for_well(
+    well: AntiCollisionWell,
+    others: list[AntiCollisionWell] | tuple[AntiCollisionWell, ...],
+    *,
+    build_overlap_geometry: bool = True,
+    pair_filter: Callable[[AntiCollisionWell, AntiCollisionWell], bool] | None = None,
+    well_signature_by_name: Mapping[str, str] | None = None,
+    previous_pair_cache: (
+        Mapping[tuple[str, str], AntiCollisionPairCacheEntry] | None
+    ) = None,
+) -> dict[tuple[str, str], AntiCollisionPairCacheEntry]:
+    """Pair cache entries of one well against wells that were analysed earlier.
+
+    The entries use the same keys and signatures as
+    ``analyze_anti_collision_incremental``, so they can be passed to it as
+    ``previous_pair_cache`` once the full well set is known.
+    """
+    ordered_wells = (well, *tuple(others))
+    signatures = {
+        str(name): str(value) for name, value in (well_signature_by_name or {}).items()
+    }
+    previous_pairs = previous_pair_cache or {}
+    well_envelope = _lateral_envelope_for_prefilter(well)
+    signature_well = _pair_cache_signature(well, signatures)
+    entries: dict[tuple[str, str], AntiCollisionPairCacheEntry] = {}
+    for other_index in range(1, len(ordered_wells)):
+        other = ordered_wells[other_index]
+        if str(other.name) == str(well.name) or not _should_analyze_pair(
+            well_a=well,
+            well_b=other,
+            pair_filter=pair_filter,
+        ):
+            continue
+        pair_key = _pair_cache_key(well, other)
+        signature_other = _pair_cache_signature(other, signatures)
+        previous = previous_pairs.get(pair_key)
+        if (
+            previous is not None
+            and {
+                str(previous.well_a): str(previous.signature_a),
+                str(previous.well_b): str(previous.signature_b),
+            }
+            == {str(well.name): signature_well, str(other.name): signature_other}
+            and (
+                bool(getattr(previous, "build_overlap_geometry", True))
+                or not bool(build_overlap_geometry)
+            )
+        ):
+            entries[pair_key] = previous
+            continue
+        if _pair_prefilter_xy_far_apart(
+            lateral_envelope_a=well_envelope,
+            lateral_envelope_b=_lateral_envelope_for_prefilter(other),
+        ):
+            corridors: tuple[AntiCollisionCorridor, ...] = ()
+            zones: tuple[AntiCollisionZone, ...] = ()
+        else:
+            result = _calculate_pair_overlap_job_serial(
+                ordered_wells=ordered_wells,
+                job=_AntiCollisionPairJob(
+                    job_index=int(other_index - 1),
+                    left_index=0,
+                    right_index=int(other_index),
+                    build_overlap_geometry=bool(build_overlap_geometry),
+                ),
+            )
+            corridors = tuple(result.corridors)
+            zones = tuple(result.zones)
+        entries[pair_key] = AntiCollisionPairCacheEntry(
+            well_a=str(well.name),
+            well_b=str(other.name),
+            signature_a=signature_well,
+            signature_b=signature_other,
+            corridors=corridors,
+            zones=zones,
+            build_overlap_geometry=bool(build_overlap_geometry),
+        )
+    return entries
+
+
 def _anti_collision_pair_jobs(
     *,
     ordered_wells: tuple[AntiCollisionWell, ...],
@@ -1318,55 +1398,53 @@ def collision_corridor_tube_mesh(
             np.asarray(ring + normal[None, :] * thickness * 0.5, dtype=float),
         ]
 
-    vertices_list: list[np.ndarray] = []
-    triangles_i: list[int] = []
-    triangles_j: list[int] = []
-    triangles_k: list[int] = []
-    vertex_count = 0
-    ring_starts: list[int] = []
-    ring_sizes: list[int] = []
-
-    for ring in rings:
-        ring_start_index = int(vertex_count)
-        ring_starts.append(ring_start_index)
-        ring_sizes.append(int(len(ring)))
-        vertices_list.append(ring)
-        vertex_count += int(len(ring))
-
-    for ring_index in range(len(rings) - 1):
-        current_start = ring_starts[ring_index]
-        next_start = ring_starts[ring_index + 1]
-        points_per_ring = min(ring_sizes[ring_index], ring_sizes[ring_index + 1])
-        for point_index in range(points_per_ring):
-            next_point_index = (point_index + 1) % points_per_ring
-            a = current_start + point_index
-            b = current_start + next_point_index
-            c = next_start + point_index
-            d = next_start + next_point_index
-            triangles_i.extend([a, b])
-            triangles_j.extend([c, c])
-            triangles_k.extend([b, d])
-
-    for ring_start_index, ring in (
-        (ring_starts[0], rings[0]),
-        (ring_starts[-1], rings[-1]),
-    ):
-        center_index = int(vertex_count)
-        vertices_list.append(np.mean(np.asarray(ring, dtype=float), axis=0)[None, :])
-        vertex_count += 1
-        points_per_ring = int(len(ring))
-        for point_index in range(points_per_ring):
-            next_index = (point_index + 1) % points_per_ring
-            triangles_i.append(center_index)
-            triangles_j.append(ring_start_index + point_index)
-            triangles_k.append(ring_start_index + next_index)
-
-    vertices = np.vstack(vertices_list)
+    ring_sizes = np.asarray([len(ring) for ring in rings], dtype=np.int32)
+    ring_starts = np.concatenate([[0], np.cumsum(ring_sizes)[:-1]]).astype(np.int32)
+    vertex_count = int(np.sum(ring_sizes))
+
+    # Neighbouring rings are stitched over the shorter ring: quad (a, b, c, d)
+    # becomes triangles (a, c, b) and (b, c, d).
+    strip_sizes = np.minimum(ring_sizes[:-1], ring_sizes[1:])
+    strip_of_point = np.repeat(
+        np.arange(len(strip_sizes), dtype=np.int32), strip_sizes
+    )
+    point_index = np.arange(int(np.sum(strip_sizes)), dtype=np.int32) - np.repeat(
+        np.concatenate([[0], np.cumsum(strip_sizes)[:-1]]).astype(np.int32),
+        strip_sizes,
+    )
+    next_point_index = point_index + 1
+    next_point_index[next_point_index == strip_sizes[strip_of_point]] = 0
+    current_start = ring_starts[strip_of_point]
+    next_start = ring_starts[strip_of_point + 1]
+    a = current_start + point_index
+    b = current_start + next_point_index
+    c = next_start + point_index
+    d = next_start + next_point_index
+    triangles_i = [np.column_stack([a, b]).ravel()]
+    triangles_j = [np.column_stack([c, c]).ravel()]
+    triangles_k = [np.column_stack([b, d]).ravel()]
+
+    for cap_offset, ring_position in enumerate((0, len(rings) - 1)):
+        ring_size = int(ring_sizes[ring_position])
+        cap_point_index = np.arange(ring_size, dtype=np.int32)
+        triangles_i.append(np.full(ring_size, vertex_count + cap_offset, dtype=np.int32))
+        triangles_j.append(ring_starts[ring_position] + cap_point_index)
+        triangles_k.append(
+            ring_starts[ring_position] + np.roll(cap_point_index, -1)
+        )
+
+    vertices = np.vstack(
+        [
+            *rings,
+            np.mean(np.asarray(rings[0], dtype=float), axis=0)[None, :],
+            np.mean(np.asarray(rings[-1], dtype=float), axis=0)[None, :],
+        ]
+    )
     return UncertaintyTubeMesh(
         vertices_xyz=np.asarray(vertices, dtype=float),
-        i=np.asarray(triangles_i, dtype=int),
-        j=np.asarray(triangles_j, dtype=int),
-        k=np.asarray(triangles_k, dtype=int),
+        i=np.concatenate(triangles_i).astype(np.int32, copy=False),
+        j=np.concatenate(triangles_j).astype(np.int32, copy=False),
+        k=np.concatenate(triangles_k).astype(np.int32, copy=False),
     )
 
 
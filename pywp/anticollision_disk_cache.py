@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+from pywp.anticollision import AntiCollisionPairCacheEntry, AntiCollisionWell
+from pywp.disk_cache import PickleDiskStore, disk_cache_settings_from_env
+from pywp.pad_optimization import _update_model_signature
+from pywp.uncertainty import PlanningUncertaintyModel
+
+__all__ = [
+    "ANTI_COLLISION_DISK_CACHE_DIR_ENV",
+    "ANTI_COLLISION_DISK_CACHE_MAX_MB_ENV",
+    "AntiCollisionDiskCache",
+    "default_anti_collision_disk_cache",
+    "uncertainty_model_digest",
+]
+
+ANTI_COLLISION_DISK_CACHE_DIR_ENV = "PYWP_ANTICOLLISION_CACHE_DIR"
+ANTI_COLLISION_DISK_CACHE_MAX_MB_ENV = "PYWP_ANTICOLLISION_CACHE_MAX_MB"
+DEFAULT_ANTI_COLLISION_DISK_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Bump when AntiCollisionWell / pair entries change shape: old files then
+# simply stop matching and age out through eviction.
+_CACHE_FORMAT_VERSION = "1"
+_WELLS_DIR = "wells"
+_PAIRS_DIR = "pairs"
+_PARTNERS_DIR = "partners"
+
+
+def uncertainty_model_digest(model: PlanningUncertaintyModel) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    _update_model_signature(digest, model)
+    return digest.hexdigest()
+
+
+class AntiCollisionDiskCache(PickleDiskStore):
+    """Content-addressed on-disk store of anti-collision wells and pairs.
+
+    Entries are addressed by the well/pair signatures already used by the
+    session cache plus the uncertainty model digest, so a changed trajectory
+    or model never hits a stale file. Each well version keeps a partner
+    manifest of the pairs stored with it, so loading probes only pairs that
+    exist instead of every well combination. The least recently used files
+    are evicted once the store grows beyond ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int = DEFAULT_ANTI_COLLISION_DISK_CACHE_MAX_BYTES,
+    ) -> None:
+        super().__init__(
+            root,
+            max_bytes=max_bytes,
+            format_version=_CACHE_FORMAT_VERSION,
+        )
+
+    def load_wells(
+        self,
+        well_signature_by_name: Mapping[str, str],
+        *,
+        model_digest: str,
+    ) -> dict[str, tuple[str, AntiCollisionWell]]:
+        wells: dict[str, tuple[str, AntiCollisionWell]] = {}
+        for name, signature in well_signature_by_name.items():
+            if not str(signature):
+                continue
+            well = self._load(
+                self._well_path(str(name), str(signature), model_digest),
+                AntiCollisionWell,
+            )
+            if well is not None and str(well.name) == str(name):
+                wells[str(name)] = (str(signature), well)
+        return wells
+
+    def load_pairs(
+        self,
+        well_signature_by_name: Mapping[str, str],
+        *,
+        model_digest: str,
+        known_pair_keys: Iterable[tuple[str, str]] = (),
+    ) -> dict[tuple[str, str], AntiCollisionPairCacheEntry]:
+        """Load stored pairs between the given wells, skipping known pairs.
+
+        Only pairs listed in the partner manifests of the current well
+        versions are read. Pairs are addressed by the base well signatures;
+        the incremental analysis still validates sidetrack-aware pair
+        signatures on reuse.
+        """
+        known = {tuple(sorted(key)) for key in known_pair_keys}
+        signatures = {
+            str(name): str(signature)
+            for name, signature in well_signature_by_name.items()
+            if str(signature)
+        }
+        pairs: dict[tuple[str, str], AntiCollisionPairCacheEntry] = {}
+        for name_a, signature_a in sorted(signatures.items()):
+            partners = self._load(
+                self._partners_path(name_a, signature_a, model_digest),
+                frozenset,
+            )
+            for name_b, signature_b in sorted(partners or ()):
+                if name_b <= name_a or signatures.get(name_b) != signature_b:
+                    continue
+                pair_key = (name_a, name_b)
+                if pair_key in known:
+                    continue
+                entry = self._load(
+                    self._pair_path(
+                        name_a, signature_a, name_b, signature_b, model_digest
+                    ),
+                    AntiCollisionPairCacheEntry,
+                )
+                if entry is not None:
+                    pairs[pair_key] = entry
+        return pairs
+
+    def store(
+        self,
+        *,
+        well_cache: Mapping[str, tuple[str, AntiCollisionWell]],
+        pair_cache: Mapping[tuple[str, str], AntiCollisionPairCacheEntry],
+        well_signature_by_name: Mapping[str, str],
+        model_digest: str,
+    ) -> tuple[int, int]:
+        """Persist entries that are not on disk yet; returns stored counts."""
+        signatures = {
+            str(name): str(signature)
+            for name, signature in well_signature_by_name.items()
+        }
+        stored_wells = 0
+        for name, cached in well_cache.items():
+            signature, well = cached
+            if str(signatures.get(str(name), "")) != str(signature):
+                continue
+            if not str(signature) or not isinstance(well, AntiCollisionWell):
+                continue
+            if self._write(
+                self._well_path(str(name), str(signature), model_digest), well
+            ):
+                stored_wells += 1
+        stored_pairs = 0
+        partners_by_well: dict[tuple[str, str], set[tuple[str, str]]] = {}
+        for entry in pair_cache.values():
+            if not isinstance(entry, AntiCollisionPairCacheEntry):
+                continue
+            well_a = (str(entry.well_a), signatures.get(str(entry.well_a), ""))
+            well_b = (str(entry.well_b), signatures.get(str(entry.well_b), ""))
+            if not well_a[1] or not well_b[1]:
+                continue
+            if self._write(
+                self._pair_path(*well_a, *well_b, model_digest),
+                entry,
+            ):
+                stored_pairs += 1
+            partners_by_well.setdefault(well_a, set()).add(well_b)
+            partners_by_well.setdefault(well_b, set()).add(well_a)
+        for (name, signature), partners in partners_by_well.items():
+            path = self._partners_path(name, signature, model_digest)
+            stored_partners = self._load(path, frozenset) or frozenset()
+            if not partners <= stored_partners:
+                self._write(path, stored_partners | partners, replace=True)
+        return stored_wells, stored_pairs
+
+    def _well_path(self, name: str, signature: str, model_digest: str) -> Path:
+        return self._entry_path(_WELLS_DIR, "well", name, signature, model_digest)
+
+    def _pair_path(
+        self,
+        well_a: str,
+        signature_a: str,
+        well_b: str,
+        signature_b: str,
+        model_digest: str,
+    ) -> Path:
+        (first_name, first_signature), (second_name, second_signature) = sorted(
+            ((well_a, signature_a), (well_b, signature_b))
+        )
+        return self._entry_path(
+            _PAIRS_DIR,
+            "pair",
+            first_name,
+            first_signature,
+            second_name,
+            second_signature,
+            model_digest,
+        )
+
+    def _partners_path(self, name: str, signature: str, model_digest: str) -> Path:
+        return self._entry_path(
+            _PARTNERS_DIR, "partners", name, signature, model_digest
+        )
+
+
+def default_anti_collision_disk_cache() -> AntiCollisionDiskCache | None:
+    """Cache under ``$PYWP_ANTICOLLISION_CACHE_DIR`` or ``~/.cache/pywp``.
+
+    Setting the directory variable to an empty string disables the store.
+    """
+    settings = disk_cache_settings_from_env(
+        dir_env=ANTI_COLLISION_DISK_CACHE_DIR_ENV,
+        max_mb_env=ANTI_COLLISION_DISK_CACHE_MAX_MB_ENV,
+        default_dir_name="anticollision",
+        default_max_bytes=DEFAULT_ANTI_COLLISION_DISK_CACHE_MAX_BYTES,
+    )
+    if settings is None:
+        return None
+    root, max_bytes = settings
+    return AntiCollisionDiskCache(root, max_bytes=max_bytes)
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, replace
 from pickle import PicklingError
@@ -19,6 +26,7 @@ from pywp.anticollision import (
     REFERENCE_ANTI_COLLISION_SCOPE_DISTANCE_M,
     analyze_anti_collision,
     analyze_anti_collision_incremental,
+    analyze_anti_collision_pairs_for_well,
     build_anti_collision_well,
 )
 from pywp.anticollision_optimization import (
@@ -76,6 +84,14 @@ class DynamicClusterExecutionPlan:
     blocking_reason: str | None = None
 
 
+@dataclass(frozen=True)
+class StreamingAntiCollisionConflict:
+    well_a: str
+    well_b: str
+    corridor_count: int
+    worst_separation_factor: float
+
+
 @dataclass(frozen=True)
 class _AntiCollisionWellBuildJob:
     index: int
@@ -656,6 +672,140 @@ def build_anti_collision_wells_for_successes(
     )
 
 
+class StreamingAntiCollisionAnalysis:
+    """Anti-collision cones and planned-planned pairs built while a batch runs.
+
+    Successes are handled one at a time on a background thread: the new
+    well's cone is built and paired with the wells finished before it.
+    ``finish`` returns well and pair caches in the format of
+    ``build_incremental_anti_collision_analysis_for_successes``, which then
+    only adds reference wells and pairs it has not seen.
+    """
+
+    def __init__(
+        self,
+        *,
+        model: PlanningUncertaintyModel,
+        name_to_color: Mapping[str, str] | None = None,
+        well_signature: Callable[[SuccessfulWellPlan], str] | None = None,
+        build_overlap_geometry: bool = True,
+        analysis_sample_step_m: float | None = None,
+        previous_well_cache: (
+            Mapping[str, tuple[str, AntiCollisionWell]] | None
+        ) = None,
+        previous_pair_cache: (
+            Mapping[tuple[str, str], AntiCollisionPairCacheEntry] | None
+        ) = None,
+    ) -> None:
+        self._model = model
+        self._name_to_color = dict(name_to_color or {})
+        self._well_signature = well_signature
+        self._build_overlap_geometry = bool(build_overlap_geometry)
+        self._analysis_sample_step_m = analysis_sample_step_m
+        self._well_cache = dict(previous_well_cache or {})
+        self._pair_cache = dict(previous_pair_cache or {})
+        self._successes_by_name: dict[str, SuccessfulWellPlan] = {}
+        self._signature_by_name: dict[str, str] = {}
+        self._wells_by_name: dict[str, AntiCollisionWell] = {}
+        self._conflicts: list[StreamingAntiCollisionConflict] = []
+        self._failed_well_names: list[str] = []
+        self._lock = threading.Lock()
+        self._futures: list[Future] = []
+        self._executor: ThreadPoolExecutor | None = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="pywp-anticollision-stream",
+        )
+
+    @property
+    def failed_well_names(self) -> tuple[str, ...]:
+        with self._lock:
+            return tuple(self._failed_well_names)
+
+    def submit(self, success: SuccessfulWellPlan) -> None:
+        if self._executor is None:
+            raise RuntimeError("Streaming anti-collision analysis is already finished.")
+        self._futures.append(self._executor.submit(self._add_success, success))
+
+    def pop_conflicts(self) -> tuple[StreamingAntiCollisionConflict, ...]:
+        """Conflicts found since the previous call, worst separation first."""
+        with self._lock:
+            conflicts = tuple(self._conflicts)
+            self._conflicts.clear()
+        return tuple(
+            sorted(conflicts, key=lambda item: float(item.worst_separation_factor))
+        )
+
+    def finish(
+        self,
+    ) -> tuple[
+        dict[str, tuple[str, AntiCollisionWell]],
+        dict[tuple[str, str], AntiCollisionPairCacheEntry],
+    ]:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            return dict(self._well_cache), dict(self._pair_cache)
+
+    def _add_success(self, success: SuccessfulWellPlan) -> None:
+        name = str(success.name)
+        try:
+            signature = (
+                str(self._well_signature(success))
+                if self._well_signature is not None
+                else ""
+            )
+            self._successes_by_name.pop(name, None)
+            self._wells_by_name.pop(name, None)
+            self._successes_by_name[name] = success
+            self._signature_by_name[name] = signature
+            successes = list(self._successes_by_name.values())
+            wells, well_cache, _reused, _rebuilt = (
+                build_anti_collision_wells_for_successes(
+                    successes,
+                    model=self._model,
+                    name_to_color=self._name_to_color,
+                    build_overlap_geometry=self._build_overlap_geometry,
+                    analysis_sample_step_m=self._analysis_sample_step_m,
+                    well_signature_by_name=self._signature_by_name,
+                    previous_well_cache=self._well_cache,
+                )
+            )
+            well = wells[-1]
+            entries = analyze_anti_collision_pairs_for_well(
+                well,
+                tuple(self._wells_by_name.values()),
+                build_overlap_geometry=self._build_overlap_geometry,
+                pair_filter=_should_score_anti_collision_pair,
+                well_signature_by_name=self._signature_by_name,
+                previous_pair_cache=self._pair_cache,
+            )
+        except Exception:  # noqa: BLE001
+            with self._lock:
+                self._failed_well_names.append(name)
+            return
+        self._wells_by_name[name] = well
+        conflicts = [
+            StreamingAntiCollisionConflict(
+                well_a=str(entry.well_a),
+                well_b=str(entry.well_b),
+                corridor_count=int(len(entry.corridors)),
+                worst_separation_factor=float(
+                    min(
+                        float(np.min(corridor.separation_factor_values))
+                        for corridor in entry.corridors
+                    )
+                ),
+            )
+            for entry in entries.values()
+            if entry.corridors
+        ]
+        with self._lock:
+            self._well_cache.update(well_cache)
+            self._pair_cache.update(entries)
+            self._conflicts.extend(conflicts)
+
+
 def _reference_uncertainty_model(
     *,
     reference_well: ImportedTrajectoryWell,
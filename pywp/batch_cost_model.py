@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from pywp.classification import (
+    COMPLEXITY_COMPLEX,
+    COMPLEXITY_ORDINARY,
+    COMPLEXITY_VERY_COMPLEX,
+    TRAJECTORY_REVERSE_DIRECTION,
+    TRAJECTORY_SAME_DIRECTION,
+    classify_well,
+)
+from pywp.eclipse_welltrack import WelltrackRecord
+from pywp.pilot_wells import is_pilot_record, is_zbs_record, zbs_target_points_to_pairs
+from pywp.welltrack_targets import ordinary_record_target_layout
+
+__all__ = [
+    "BatchCostEstimate",
+    "BatchParallelOverhead",
+    "PROFILE_MULTI_HORIZONTAL",
+    "PROFILE_MULTI_TARGET",
+    "PROFILE_ORDINARY",
+    "PROFILE_PILOT",
+    "PROFILE_ZBS",
+    "estimate_batch_costs",
+    "estimate_record_cost",
+    "longest_first_order",
+    "predicted_makespan_s",
+    "recommended_parallel_workers",
+    "runtime_history_by_name",
+]
+
+PROFILE_ORDINARY = "ordinary"
+PROFILE_MULTI_TARGET = "multi_target"
+PROFILE_MULTI_HORIZONTAL = "multi_horizontal"
+PROFILE_PILOT = "pilot"
+PROFILE_ZBS = "zbs"
+
+# Median single-core solve times (s) with the default TrajectoryConfig,
+# measured by scripts/calibrate_batch_cost_model.py. They only need to rank
+# wells correctly; history replaces them once a well was solved. Multi-level
+# wells pay for every level transition, so a multi-horizontal well costs more
+# than a target sequence with the same number of points.
+_PROFILE_BASE_COST_S = {
+    PROFILE_ORDINARY: 1.4,
+    PROFILE_MULTI_TARGET: 1.4,
+    PROFILE_MULTI_HORIZONTAL: 2.0,
+    PROFILE_PILOT: 0.05,
+    PROFILE_ZBS: 1.0,
+}
+_EXTRA_TARGET_COST_S = 0.25
+# Very complex wells measured no slower than complex ones, so both share the
+# same factor; reverse-direction wells need the longer entry search.
+_COMPLEXITY_FACTOR = {
+    COMPLEXITY_ORDINARY: 1.0,
+    COMPLEXITY_COMPLEX: 1.4,
+    COMPLEXITY_VERY_COMPLEX: 1.4,
+}
+_TRAJECTORY_TYPE_FACTOR = {
+    TRAJECTORY_SAME_DIRECTION: 1.0,
+    TRAJECTORY_REVERSE_DIRECTION: 1.5,
+}
+# A well re-solved with the same targets lands close to its previous runtime,
+# far closer than the profile model does.
+_HISTORY_WEIGHT = 0.8
+
+# Pool startup is the measured cost of spawning a worker and importing pywp;
+# the per-task pickling overhead is small and refined from observed runs.
+DEFAULT_POOL_STARTUP_S = 1.0
+DEFAULT_TASK_OVERHEAD_S = 0.05
+_OVERHEAD_SMOOTHING = 0.5
+
+
+@dataclass(frozen=True)
+class BatchCostEstimate:
+    well_name: str
+    profile_family: str
+    trajectory_type: str
+    complexity: str
+    target_count: int
+    model_cost_s: float
+    history_runtime_s: float | None
+    predicted_s: float
+
+
+@dataclass(frozen=True)
+class BatchParallelOverhead:
+    """Process-pool overhead measured on previous parallel batch runs."""
+
+    pool_startup_s: float = DEFAULT_POOL_STARTUP_S
+    task_overhead_s: float = DEFAULT_TASK_OVERHEAD_S
+
+    def updated(
+        self,
+        *,
+        wall_s: float,
+        task_runtimes_s: Iterable[float],
+        workers: int,
+    ) -> BatchParallelOverhead:
+        """Blend in the overhead observed for one finished parallel run."""
+        runtimes = [float(item) for item in task_runtimes_s if math.isfinite(item)]
+        if not runtimes or int(workers) <= 1 or not math.isfinite(float(wall_s)):
+            return self
+        ideal_s = _lpt_makespan_s(runtimes, int(workers))
+        observed_startup_s = max(
+            float(wall_s) - ideal_s - self.task_overhead_s * len(runtimes) / workers,
+            0.0,
+        )
+        return BatchParallelOverhead(
+            pool_startup_s=float(
+                (1.0 - _OVERHEAD_SMOOTHING) * self.pool_startup_s
+                + _OVERHEAD_SMOOTHING * observed_startup_s
+            ),
+            task_overhead_s=self.task_overhead_s,
+        )
+
+
+def estimate_record_cost(
+    record: WelltrackRecord,
+    *,
+    history_runtime_s: float | None = None,
+) -> BatchCostEstimate:
+    """Predict the single-core planning time of one WELLTRACK record.
+
+    The model combines the profile family, the business classification of the
+    S -> t1 geometry and the target count; a measured runtime from an earlier
+    run dominates the prediction when available.
+    """
+    name = str(record.name)
+    profile_family, target_count, geometry = _record_profile(record)
+    trajectory_type = TRAJECTORY_SAME_DIRECTION
+    complexity = COMPLEXITY_ORDINARY
+    if geometry is not None:
+        gv_m, offset_m = geometry
+        classification = classify_well(
+            gv_m=gv_m,
+            horizontal_offset_t1_m=offset_m,
+            hold_inc_deg=math.degrees(math.atan2(offset_m, max(gv_m, 1.0))),
+        )
+        trajectory_type = str(classification.trajectory_type)
+        complexity = str(classification.complexity)
+    model_cost_s = (
+        _PROFILE_BASE_COST_S[profile_family]
+        + _EXTRA_TARGET_COST_S * max(target_count - 2, 0)
+    )
+    if profile_family != PROFILE_PILOT:
+        model_cost_s *= _COMPLEXITY_FACTOR.get(complexity, 1.0)
+        model_cost_s *= _TRAJECTORY_TYPE_FACTOR.get(trajectory_type, 1.0)
+    history = (
+        float(history_runtime_s)
+        if history_runtime_s is not None
+        and math.isfinite(float(history_runtime_s))
+        and float(history_runtime_s) > 0.0
+        else None
+    )
+    predicted_s = (
+        model_cost_s
+        if history is None
+        else _HISTORY_WEIGHT * history + (1.0 - _HISTORY_WEIGHT) * model_cost_s
+    )
+    return BatchCostEstimate(
+        well_name=name,
+        profile_family=profile_family,
+        trajectory_type=trajectory_type,
+        complexity=complexity,
+        target_count=int(target_count),
+        model_cost_s=float(model_cost_s),
+        history_runtime_s=history,
+        predicted_s=float(predicted_s),
+    )
+
+
+def estimate_batch_costs(
+    records: Iterable[WelltrackRecord],
+    *,
+    history_runtime_s_by_name: Mapping[str, float] | None = None,
+) -> dict[str, BatchCostEstimate]:
+    history = dict(history_runtime_s_by_name or {})
+    return {
+        str(record.name): estimate_record_cost(
+            record,
+            history_runtime_s=history.get(str(record.name)),
+        )
+        for record in records
+    }
+
+
+def runtime_history_by_name(successes: Iterable[object]) -> dict[str, float]:
+    """Measured solve times of previously planned wells, keyed by well name."""
+    history: dict[str, float] = {}
+    for success in successes:
+        runtime_s = getattr(success, "runtime_s", None)
+        if runtime_s is None:
+            continue
+        value = float(runtime_s)
+        if math.isfinite(value) and value > 0.0:
+            history[str(getattr(success, "name", ""))] = value
+    return history
+
+
+def longest_first_order(
+    names: Iterable[str],
+    cost_s_by_name: Mapping[str, float],
+) -> list[str]:
+    """Order names by descending predicted cost, stable for equal costs."""
+    ordered = [str(name) for name in names]
+    return sorted(
+        ordered,
+        key=lambda name: -float(cost_s_by_name.get(name, 0.0)),
+    )
+
+
+def predicted_makespan_s(
+    costs_s: Iterable[float],
+    *,
+    workers: int,
+    overhead: BatchParallelOverhead | None = None,
+) -> float:
+    """Predicted wall time of a batch; ``workers <= 1`` means in-process."""
+    costs = [max(float(item), 0.0) for item in costs_s]
+    if int(workers) <= 1:
+        return float(sum(costs))
+    overhead = overhead or BatchParallelOverhead()
+    worker_count = min(int(workers), max(len(costs), 1))
+    return float(
+        overhead.pool_startup_s
+        + _lpt_makespan_s(
+            [cost + overhead.task_overhead_s for cost in costs],
+            worker_count,
+        )
+    )
+
+
+def recommended_parallel_workers(
+    costs_s: Iterable[float],
+    *,
+    max_workers: int,
+    overhead: BatchParallelOverhead | None = None,
+) -> int:
+    """Pick the worker count with the smallest predicted makespan.
+
+    Returns ``0`` when the in-process serial run is predicted to be fastest,
+    which matches the ``parallel_workers`` convention of the batch planner.
+    """
+    costs = [max(float(item), 0.0) for item in costs_s]
+    if len(costs) <= 1 or int(max_workers) <= 1:
+        return 0
+    best_workers = 0
+    best_makespan_s = predicted_makespan_s(costs, workers=1)
+    for workers in range(2, min(int(max_workers), len(costs)) + 1):
+        makespan_s = predicted_makespan_s(costs, workers=workers, overhead=overhead)
+        # Extra workers must pay off clearly: each one costs memory and spawn time.
+        if makespan_s < best_makespan_s * 0.9:
+            best_workers = workers
+            best_makespan_s = makespan_s
+    return int(best_workers)
+
+
+def _lpt_makespan_s(costs_s: list[float], workers: int) -> float:
+    loads = [0.0] * max(int(workers), 1)
+    for cost in sorted(costs_s, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + float(cost))
+    return float(max(loads))
+
+
+def _record_profile(
+    record: WelltrackRecord,
+) -> tuple[str, int, tuple[float, float] | None]:
+    points = tuple(record.points)
+    target_count = max(len(points) - 1, 0)
+    if is_pilot_record(record):
+        return PROFILE_PILOT, target_count, None
+    if is_zbs_record(record):
+        try:
+            level_count = len(zbs_target_points_to_pairs(points))
+        except ValueError:
+            level_count = 1
+        return PROFILE_ZBS, 2 * level_count, None
+    try:
+        layout = ordinary_record_target_layout(record)
+    except ValueError:
+        return PROFILE_ORDINARY, target_count, None
+    geometry = (
+        float(layout.t1.z - layout.surface.z),
+        float(math.hypot(layout.t1.x - layout.surface.x, layout.t1.y - layout.surface.y)),
+    )
+    if layout.target_sequence:
+        return PROFILE_MULTI_TARGET, len(layout.target_sequence), geometry
+    if len(layout.target_pairs) > 1:
+        return PROFILE_MULTI_HORIZONTAL, 2 * len(layout.target_pairs), geometry
+    return PROFILE_ORDINARY, 2, geometry
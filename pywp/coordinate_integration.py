@@ -6,7 +6,12 @@ Default CRS: ГК_13N_42 / Pulkovo 1942 Gauss-Kruger CM 75E.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
@@ -39,6 +44,21 @@ CRS_SELECTED_KEY = "trajectory_crs_selected"  # CSV target CRS, kept for compati
 CRS_SELECTBOX_KEY = "trajectory_crs_selectbox"
 CRS_AUTO_CONVERT_KEY = "trajectory_crs_auto_convert"
 
+# Transformed X/Y arrays and meridian convergence series, keyed by content
+# and bounded by the total size of the cached arrays.
+_CRS_RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_crs_result_cache: OrderedDict[tuple[str, ...], np.ndarray] = OrderedDict()
+_crs_result_cache_bytes = 0
+_crs_result_cache_lock = threading.Lock()
+
+# Display-path approximation of CRS transforms over a pad-sized area.
+LOCAL_CRS_APPROXIMATION_TOLERANCE_M = 0.01
+_LOCAL_APPROXIMATION_MAX_EXTENT_M = 50_000.0
+_LOCAL_APPROXIMATION_CELL_M = 1_000.0
+_LOCAL_APPROXIMATION_FIT_NODES = 7
+_LOCAL_APPROXIMATION_CHECK_NODES = 13
+_METERS_PER_DEGREE = 111_320.0
+
 # Default input CRS as per user requirement: ГК_13N_42.
 DEFAULT_CRS = CoordinateSystem.PULKOVO_1942_GK_13N
 DEFAULT_CSV_EXPORT_CRS = CoordinateSystem.WGS84_UTM_ZONE_43N
@@ -323,48 +343,388 @@ def meridian_convergence_series_deg(
     y_values: object,
     crs: CoordinateSystem,
 ) -> np.ndarray | None:
-    effective_crs = _effective_pyproj_crs(crs)
-    if effective_crs is None:
+    if _effective_pyproj_crs(crs) is None:
         return None
-
     x_array = np.asarray(x_values, dtype=float)
     y_array = np.asarray(y_values, dtype=float)
     if x_array.shape != y_array.shape:
         raise ValueError("x_values and y_values must have matching shapes")
+    convergence = meridian_convergence_arrays_deg(
+        [np.column_stack([x_array.reshape(-1), y_array.reshape(-1)])],
+        crs,
+    )[0]
+    if convergence is None:
+        return None
+    return convergence.reshape(x_array.shape)
 
-    result = np.full(x_array.shape, np.nan, dtype=float)
-    finite_mask = np.isfinite(x_array) & np.isfinite(y_array)
-    if not np.any(finite_mask):
-        return result
 
-    if effective_crs.is_geographic():
-        result[finite_mask] = 0.0
-        return result
-    if not effective_crs.is_projected():
-        return None
-    if not can_transform_crs(crs, CoordinateSystem.WGS84):
-        return None
+def meridian_convergence_arrays_deg(
+    xy_arrays: Sequence[object],
+    crs: CoordinateSystem,
+) -> list[np.ndarray | None]:
+    """Meridian convergence for many (N, 2) X/Y arrays at once.
 
+    All wells share one transform to WGS84 and one ``get_factors`` call;
+    results are memoized per array content and CRS.
+    """
+    coords_list = [_xy_rows(values) for values in xy_arrays]
+    effective_crs = _effective_pyproj_crs(crs)
+    if effective_crs is None:
+        return [None] * len(coords_list)
+    finite_masks = [_finite_xy_mask(coords) for coords in coords_list]
+    if effective_crs.is_geographic():
+        return [np.where(mask, 0.0, np.nan) for mask in finite_masks]
+    unavailable = [
+        None if np.any(mask) else np.full(len(mask), np.nan) for mask in finite_masks
+    ]
+    if not effective_crs.is_projected() or not can_transform_crs(
+        crs, CoordinateSystem.WGS84
+    ):
+        return unavailable
     proj = _try_create_proj(crs)
     if proj is None:
-        return None
+        return unavailable
+
+    def compute(coords: np.ndarray) -> np.ndarray | None:
+        result = np.full(len(coords), np.nan, dtype=float)
+        finite_mask = _finite_xy_mask(coords)
+        if not np.any(finite_mask):
+            return result
+        finite_coords = coords[finite_mask]
+        lon_lat = _transform_station_xy_values(
+            finite_coords, crs, CoordinateSystem.WGS84
+        )
+        if lon_lat.shape != finite_coords.shape:
+            return None
+        try:
+            factors = proj.get_factors(lon_lat[:, 0], lon_lat[:, 1])
+        except Exception:
+            return None
+        convergence = np.asarray(factors.meridian_convergence, dtype=float)
+        if convergence.shape != (len(finite_coords),):
+            return None
+        convergence[~np.isfinite(convergence)] = np.nan
+        result[finite_mask] = convergence
+        return result
+
+    return _bulk_cached_rows(
+        coords_list,
+        key_prefix=("convergence", str(crs.value)),
+        compute=compute,
+    )
+
+
+def transform_xy_arrays_to_crs(
+    xy_arrays: Sequence[object],
+    from_crs: CoordinateSystem,
+    to_crs: CoordinateSystem,
+    *,
+    use_cache: bool = True,
+) -> list[np.ndarray]:
+    """Transform many (N, 2) X/Y arrays with a single pyproj call.
+
+    Falls back to copies of the input when the CRS pair cannot be
+    transformed. Results are memoized per array content and CRS pair, so
+    repeated views and exports of the same wells never re-project them;
+    pass ``use_cache=False`` for one-off bulk conversions such as uploads.
+    """
+    coords_list = [_xy_rows(values) for values in xy_arrays]
+    if from_crs == to_crs or not can_transform_crs(from_crs, to_crs):
+        return [coords.copy() for coords in coords_list]
+    if not use_cache:
+        if not coords_list:
+            return []
+        transformed = _transform_station_xy_values(
+            np.concatenate(coords_list), from_crs, to_crs
+        )
+        offsets = np.cumsum([len(coords) for coords in coords_list])[:-1]
+        return list(np.split(transformed, offsets))
+    return _bulk_cached_rows(
+        coords_list,
+        key_prefix=("xy", str(from_crs.value), str(to_crs.value)),
+        compute=lambda coords: _transform_station_xy_values(coords, from_crs, to_crs),
+    )
+
+
+def clear_crs_transform_cache() -> None:
+    global _crs_result_cache_bytes
+    with _crs_result_cache_lock:
+        _crs_result_cache.clear()
+        _crs_result_cache_bytes = 0
+    _cached_local_crs_approximation.cache_clear()
+
+
+@dataclass(frozen=True)
+class LocalCrsApproximation:
+    """Low-order polynomial stand-in for a CRS transform over a small area.
+
+    Source X/Y are normalized around ``origin`` by ``half_extent_m``; the
+    target X/Y are then one matrix product of the polynomial terms and
+    ``coefficients``. ``max_error_m`` is the largest deviation from the exact
+    transform measured on a check grid denser than the fitting grid.
+    """
+
+    from_crs: CoordinateSystem
+    to_crs: CoordinateSystem
+    origin_x: float
+    origin_y: float
+    half_extent_m: float
+    degree: int
+    coefficients: np.ndarray
+    max_error_m: float
+
+    def transform(self, coords: object) -> np.ndarray:
+        """Approximate transform of (N, 2) X/Y; non-finite rows are kept."""
+        source = _xy_rows(coords)
+        result = _polynomial_terms(
+            (source[:, 0] - self.origin_x) / self.half_extent_m,
+            (source[:, 1] - self.origin_y) / self.half_extent_m,
+            degree=self.degree,
+        ) @ self.coefficients
+        keep_mask = ~(_finite_xy_mask(result) & _finite_xy_mask(source))
+        result[keep_mask] = source[keep_mask]
+        return result
+
 
-    coords = np.column_stack([x_array[finite_mask], y_array[finite_mask]])
-    lon_lat = _transform_station_xy_values(coords, crs, CoordinateSystem.WGS84)
-    if lon_lat.shape != coords.shape:
+def fit_local_crs_approximation(
+    xy: object,
+    from_crs: CoordinateSystem,
+    to_crs: CoordinateSystem,
+    *,
+    tolerance_m: float = LOCAL_CRS_APPROXIMATION_TOLERANCE_M,
+    max_degree: int = 2,
+) -> LocalCrsApproximation | None:
+    """Fit an affine (then quadratic) approximation over the X/Y bounding box.
+
+    Returns ``None`` when the pair cannot be transformed exactly, the area is
+    wider than a field-sized region or no fit stays within ``tolerance_m``;
+    callers then fall back to the exact pyproj transform.
+    """
+    coords = _xy_rows(xy)
+    coords = coords[_finite_xy_mask(coords)]
+    if len(coords) == 0:
         return None
+    return _fit_local_crs_approximation_in_box(
+        from_crs,
+        to_crs,
+        float(np.min(coords[:, 0])),
+        float(np.min(coords[:, 1])),
+        float(np.max(coords[:, 0])),
+        float(np.max(coords[:, 1])),
+        tolerance_m=float(tolerance_m),
+        max_degree=int(max_degree),
+    )
 
-    try:
-        factors = proj.get_factors(lon_lat[:, 0], lon_lat[:, 1])
-    except Exception:
+
+def transform_xy_for_display(
+    xy: object,
+    from_crs: CoordinateSystem,
+    to_crs: CoordinateSystem,
+) -> np.ndarray:
+    """Transform X/Y for interactive views through a cached local fit.
+
+    The fit covers the bounding box snapped to a 1 km grid, so reruns and
+    neighbouring wells of the same project reuse it. Exports and the CRS
+    calculator keep the exact ``transform_xy_arrays_to_crs`` path.
+    """
+    coords = _xy_rows(xy)
+    if from_crs == to_crs:
+        return coords.copy()
+    approximation = display_crs_approximation(coords, from_crs, to_crs)
+    if approximation is None:
+        return transform_xy_arrays_to_crs([coords], from_crs, to_crs)[0]
+    return approximation.transform(coords)
+
+
+def display_crs_approximation(
+    xy: object,
+    from_crs: CoordinateSystem,
+    to_crs: CoordinateSystem,
+) -> LocalCrsApproximation | None:
+    """Cached local fit ``transform_xy_for_display`` uses for these X/Y.
+
+    ``None`` means the display path falls back to the exact transform.
+    """
+    coords = _xy_rows(xy)
+    finite_coords = coords[_finite_xy_mask(coords)]
+    if len(finite_coords) == 0 or from_crs == to_crs:
         return None
+    cell = _LOCAL_APPROXIMATION_CELL_M
+    return _cached_local_crs_approximation(
+        from_crs,
+        to_crs,
+        float(np.floor(np.min(finite_coords[:, 0]) / cell) * cell),
+        float(np.floor(np.min(finite_coords[:, 1]) / cell) * cell),
+        float((np.floor(np.max(finite_coords[:, 0]) / cell) + 1.0) * cell),
+        float((np.floor(np.max(finite_coords[:, 1]) / cell) + 1.0) * cell),
+    )
+
 
-    convergence = np.asarray(factors.meridian_convergence, dtype=float)
-    if convergence.shape != x_array[finite_mask].shape:
+@lru_cache(maxsize=64)
+def _cached_local_crs_approximation(
+    from_crs: CoordinateSystem,
+    to_crs: CoordinateSystem,
+    x_min: float,
+    y_min: float,
+    x_max: float,
+    y_max: float,
+) -> LocalCrsApproximation | None:
+    return _fit_local_crs_approximation_in_box(
+        from_crs,
+        to_crs,
+        x_min,
+        y_min,
+        x_max,
+        y_max,
+        tolerance_m=LOCAL_CRS_APPROXIMATION_TOLERANCE_M,
+        max_degree=2,
+    )
+
+
+def _fit_local_crs_approximation_in_box(
+    from_crs: CoordinateSystem,
+    to_crs: CoordinateSystem,
+    x_min: float,
+    y_min: float,
+    x_max: float,
+    y_max: float,
+    *,
+    tolerance_m: float,
+    max_degree: int,
+) -> LocalCrsApproximation | None:
+    effective_from = _effective_pyproj_crs(from_crs)
+    if (
+        from_crs == to_crs
+        or effective_from is None
+        or not effective_from.is_projected()
+        or not can_transform_crs(from_crs, to_crs)
+    ):
         return None
-    convergence[~np.isfinite(convergence)] = np.nan
-    result[finite_mask] = convergence
-    return result
+    if max(x_max - x_min, y_max - y_min) > _LOCAL_APPROXIMATION_MAX_EXTENT_M:
+        return None
+    origin_x = 0.5 * (x_min + x_max)
+    origin_y = 0.5 * (y_min + y_max)
+    half_extent_m = max(0.5 * (x_max - x_min), 0.5 * (y_max - y_min), 1.0)
+    fit_u, fit_v = _normalized_grid(_LOCAL_APPROXIMATION_FIT_NODES)
+    check_u, check_v = _normalized_grid(_LOCAL_APPROXIMATION_CHECK_NODES)
+    fit_exact, check_exact = transform_xy_arrays_to_crs(
+        [
+            np.column_stack(
+                [origin_x + fit_u * half_extent_m, origin_y + fit_v * half_extent_m]
+            ),
+            np.column_stack(
+                [origin_x + check_u * half_extent_m, origin_y + check_v * half_extent_m]
+            ),
+        ],
+        from_crs,
+        to_crs,
+    )
+    if not (np.all(np.isfinite(fit_exact)) and np.all(np.isfinite(check_exact))):
+        return None
+    if to_crs.is_geographic():
+        latitude_rad = np.radians(float(np.mean(check_exact[:, 1])))
+        error_scale = _METERS_PER_DEGREE * np.array([np.cos(latitude_rad), 1.0])
+    else:
+        error_scale = np.ones(2)
+    for degree in range(1, max(int(max_degree), 1) + 1):
+        coefficients = np.linalg.lstsq(
+            _polynomial_terms(fit_u, fit_v, degree=degree),
+            fit_exact,
+            rcond=None,
+        )[0]
+        residual = (
+            _polynomial_terms(check_u, check_v, degree=degree) @ coefficients
+            - check_exact
+        ) * error_scale
+        max_error_m = float(np.max(np.hypot(residual[:, 0], residual[:, 1])))
+        if max_error_m <= tolerance_m:
+            return LocalCrsApproximation(
+                from_crs=from_crs,
+                to_crs=to_crs,
+                origin_x=origin_x,
+                origin_y=origin_y,
+                half_extent_m=half_extent_m,
+                degree=degree,
+                coefficients=coefficients,
+                max_error_m=max_error_m,
+            )
+    return None
+
+
+def _normalized_grid(nodes: int) -> tuple[np.ndarray, np.ndarray]:
+    axis = np.linspace(-1.0, 1.0, int(nodes))
+    u_values, v_values = np.meshgrid(axis, axis)
+    return u_values.ravel(), v_values.ravel()
+
+
+def _polynomial_terms(u: np.ndarray, v: np.ndarray, *, degree: int) -> np.ndarray:
+    terms = [np.ones_like(u), u, v]
+    if degree >= 2:
+        terms.extend([u * u, u * v, v * v])
+    return np.column_stack(terms)
+
+
+def _xy_rows(values: object) -> np.ndarray:
+    return np.ascontiguousarray(np.asarray(values, dtype=float).reshape(-1, 2))
+
+
+def _finite_xy_mask(coords: np.ndarray) -> np.ndarray:
+    return np.isfinite(coords[:, 0]) & np.isfinite(coords[:, 1])
+
+
+def _xy_signature(coords: np.ndarray) -> str:
+    return hashlib.blake2b(coords.tobytes(), digest_size=16).hexdigest()
+
+
+def _bulk_cached_rows(
+    coords_list: list[np.ndarray],
+    *,
+    key_prefix: tuple[str, ...],
+    compute: Callable[[np.ndarray], np.ndarray | None],
+) -> list:
+    """Serve cached per-array results and compute the rest in one call.
+
+    ``compute`` receives the concatenated rows of all cache misses and
+    returns one result row per input row (or ``None`` when unavailable).
+    Least recently used results are dropped once the cached arrays exceed
+    ``_CRS_RESULT_CACHE_MAX_BYTES``; a single result larger than the limit
+    is returned without being cached.
+    """
+    global _crs_result_cache_bytes
+    keys = [(*key_prefix, _xy_signature(coords)) for coords in coords_list]
+    results: list[np.ndarray | None] = [None] * len(coords_list)
+    missing: list[int] = []
+    with _crs_result_cache_lock:
+        for index, key in enumerate(keys):
+            cached = _crs_result_cache.get(key)
+            if cached is None:
+                missing.append(index)
+                continue
+            _crs_result_cache.move_to_end(key)
+            results[index] = cached.copy()
+    if not missing:
+        return results
+    computed = compute(np.concatenate([coords_list[index] for index in missing]))
+    if computed is None:
+        return results
+    computed = np.asarray(computed, dtype=float)
+    offsets = np.cumsum([len(coords_list[index]) for index in missing])[:-1]
+    with _crs_result_cache_lock:
+        for index, values in zip(missing, np.split(computed, offsets)):
+            results[index] = values.copy()
+            if values.nbytes > _CRS_RESULT_CACHE_MAX_BYTES:
+                continue
+            stored = values.copy()
+            stored.setflags(write=False)
+            replaced = _crs_result_cache.pop(keys[index], None)
+            if replaced is not None:
+                _crs_result_cache_bytes -= replaced.nbytes
+            _crs_result_cache[keys[index]] = stored
+            _crs_result_cache_bytes += stored.nbytes
+        while _crs_result_cache_bytes > _CRS_RESULT_CACHE_MAX_BYTES:
+            _, evicted = _crs_result_cache.popitem(last=False)
+            _crs_result_cache_bytes -= evicted.nbytes
+    return results
 
 
 def csv_export_crs(
@@ -533,22 +893,53 @@ def transform_stations_to_crs(
     Returns:
         Transformed stations DataFrame with renamed columns.
     """
-    if to_crs == from_crs:
-        return stations.copy()
+    return transform_stations_batch_to_crs(
+        [stations],
+        to_crs,
+        from_crs,
+        rename_columns=rename_columns,
+    )[0]
 
-    result = stations.copy()
 
-    # Check if we can actually transform the values
-    can_transform = can_transform_crs(from_crs, to_crs)
+def transform_stations_batch_to_crs(
+    stations_frames: Sequence[pd.DataFrame],
+    to_crs: CoordinateSystem,
+    from_crs: CoordinateSystem = DEFAULT_CRS,
+    *,
+    rename_columns: bool = True,
+) -> list[pd.DataFrame]:
+    """Transform survey stations of many wells with one pyproj call.
 
-    if "X_m" in result.columns and "Y_m" in result.columns and can_transform:
-        transformed = _transform_station_xy_values(
-            result[["X_m", "Y_m"]].to_numpy(dtype=float, copy=True),
+    Same per-frame result as ``transform_stations_to_crs``; the CRS checks
+    run once and the X/Y of all wells go through ``transform_xy_arrays_to_crs``.
+    """
+    if to_crs == from_crs:
+        return [stations.copy() for stations in stations_frames]
+
+    results = [stations.copy() for stations in stations_frames]
+    can_transform = can_transform_crs(from_crs, to_crs)
+    if can_transform:
+        xy_indices = [
+            index
+            for index, result in enumerate(results)
+            if "X_m" in result.columns and "Y_m" in result.columns
+        ]
+        transformed_xy = transform_xy_arrays_to_crs(
+            [
+                np.column_stack(
+                    [
+                        results[index]["X_m"].to_numpy(dtype=float),
+                        results[index]["Y_m"].to_numpy(dtype=float),
+                    ]
+                )
+                for index in xy_indices
+            ],
             from_crs,
             to_crs,
         )
-        result["X_m"] = transformed[:, 0]
-        result["Y_m"] = transformed[:, 1]
+        for index, transformed in zip(xy_indices, transformed_xy):
+            results[index]["X_m"] = transformed[:, 0]
+            results[index]["Y_m"] = transformed[:, 1]
 
     if rename_columns:
         label_crs = to_crs if can_transform else from_crs
@@ -558,15 +949,15 @@ def transform_stations_to_crs(
         )
         if not col_suffix:
             col_suffix = label_crs.name
-        if "X_m" in result.columns:
-            result = result.rename(columns={"X_m": f"X_{col_suffix}_{xy_unit}"})
-        if "Y_m" in result.columns:
-            result = result.rename(columns={"Y_m": f"Y_{col_suffix}_{xy_unit}"})
-        # Z is vertical depth (TVD) - always preserved
-        if "Z_m" in result.columns:
-            result = result.rename(columns={"Z_m": "Z_TVD_m"})
+        rename_map = {
+            "X_m": f"X_{col_suffix}_{xy_unit}",
+            "Y_m": f"Y_{col_suffix}_{xy_unit}",
+            # Z is vertical depth (TVD) - always preserved
+            "Z_m": "Z_TVD_m",
+        }
+        results = [result.rename(columns=rename_map) for result in results]
 
-    return result
+    return results
 
 
 def _transform_station_xy_values(
@@ -706,6 +1097,10 @@ def apply_crs_to_well_view(
 
     Transforms surface, t1, t3 coordinates and survey stations from
     the source CRS to the target CRS. Preserves z (TVD) values.
+    Stations go through ``transform_xy_for_display`` (a local polynomial fit
+    within LOCAL_CRS_APPROXIMATION_TOLERANCE_M of the exact transform); the
+    fit's measured error is kept in ``summary`` under
+    ``display_crs_approximation_error_m`` for the view caption.
     Falls back to original coordinates with a warning if pyproj is
     unavailable or the transformation path is unsupported.
 
@@ -736,13 +1131,25 @@ def apply_crs_to_well_view(
         for pair_t1, pair_t3 in tuple(view.target_pairs)
     )
 
-    # Transform stations
-    stations_tx = transform_stations_to_crs(
-        view.stations,
-        target_crs,
-        source_crs,
-        rename_columns=False,
-    )
+    # Transform stations through the local approximation: this is a view,
+    # exports re-project exactly from the source stations.
+    stations_tx = view.stations.copy()
+    approximation: LocalCrsApproximation | None = None
+    if (
+        can_transform
+        and "X_m" in stations_tx.columns
+        and "Y_m" in stations_tx.columns
+    ):
+        station_xy = np.column_stack(
+            [
+                stations_tx["X_m"].to_numpy(dtype=float),
+                stations_tx["Y_m"].to_numpy(dtype=float),
+            ]
+        )
+        approximation = display_crs_approximation(station_xy, source_crs, target_crs)
+        transformed_xy = transform_xy_for_display(station_xy, source_crs, target_crs)
+        stations_tx["X_m"] = transformed_xy[:, 0]
+        stations_tx["Y_m"] = transformed_xy[:, 1]
 
     # Build new issue messages
     new_messages = list(view.issue_messages)
@@ -754,6 +1161,9 @@ def apply_crs_to_well_view(
     display_crs = target_crs if can_transform else source_crs
     summary["display_crs"] = get_crs_display_suffix(display_crs).strip("()")
     summary["display_crs_xy_unit"] = "deg" if display_crs.is_geographic() else "м"
+    summary.pop("display_crs_approximation_error_m", None)
+    if approximation is not None:
+        summary["display_crs_approximation_error_m"] = float(approximation.max_error_m)
 
     # Build and return updated view
     return view.model_copy(
@@ -815,7 +1225,16 @@ __all__ = [
     "transform_xy_to_crs",
     "transform_point_to_crs",
     "transform_stations_to_crs",
+    "transform_stations_batch_to_crs",
+    "transform_xy_arrays_to_crs",
     "meridian_convergence_series_deg",
+    "meridian_convergence_arrays_deg",
+    "clear_crs_transform_cache",
+    "LocalCrsApproximation",
+    "display_crs_approximation",
+    "fit_local_crs_approximation",
+    "transform_xy_for_display",
+    "LOCAL_CRS_APPROXIMATION_TOLERANCE_M",
     "can_transform_crs",
     "csv_export_crs",
     "format_coordinates_for_display",
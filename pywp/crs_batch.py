@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+import pandas as pd
+
+from pywp.coordinate_integration import transform_xy_arrays_to_crs
+from pywp.coordinate_systems import CoordinateSystem
+
+__all__ = [
+    "CRS_BATCH_CHUNK_ROWS",
+    "CrsBatchConversion",
+    "CrsBatchInputError",
+    "DmsParseResult",
+    "convert_coordinate_table",
+    "coordinate_result_frame",
+    "format_coordinate_values",
+    "iter_coordinate_table_chunks",
+    "parse_coordinate_series",
+    "parse_dms_series",
+]
+
+CRS_BATCH_CHUNK_ROWS = 50_000
+_DMS_TOKEN_PATTERN = r"([NSEW]|[-+]?\d+(?:[.,]\d+)?)"
+_DMS_FORMAT_ERROR = "ожидается формат вида `N 71 10 14.94`."
+_CSV_SNIFF_BYTES = 64 * 1024
+_CSV_PREFERRED_SEPARATORS = (";", "\t")
+
+
+class CrsBatchInputError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class DmsParseResult:
+    """Per-row DMS parse: direction letter, signed degrees and error text.
+
+    Rows that failed to parse have an empty direction, NaN degrees and a
+    non-empty error message.
+    """
+
+    direction: np.ndarray
+    decimal_deg: np.ndarray
+    error: np.ndarray
+
+
+@dataclass(frozen=True)
+class CrsBatchConversion:
+    csv_bytes: bytes
+    converted_row_count: int
+    invalid_row_count: int
+    preview: pd.DataFrame
+
+
+def parse_dms_series(values: Iterable[object]) -> DmsParseResult:
+    """Parse DMS strings such as ``N 71 10 14.94`` column-wise.
+
+    Tokens are pulled out with one regex pass over the whole column; the
+    range checks and the conversion to decimal degrees are array operations.
+    """
+    text = _text_series(values).str.upper()
+    row_count = len(text)
+    tokens = text.str.extractall(_DMS_TOKEN_PATTERN)[0]
+    token_counts = (
+        tokens.groupby(level=0).size().reindex(range(row_count), fill_value=0)
+    ).to_numpy()
+    if tokens.empty:
+        table = pd.DataFrame(index=range(row_count), columns=range(4), dtype=object)
+    else:
+        table = tokens.unstack().reindex(index=range(row_count), columns=range(4))
+    direction = table[0].fillna("").astype(str).to_numpy(dtype=object)
+    degrees, minutes, seconds = (
+        pd.to_numeric(
+            table[column].astype(str).str.replace(",", ".", regex=False),
+            errors="coerce",
+        ).to_numpy(dtype=float)
+        for column in (1, 2, 3)
+    )
+
+    is_latitude = np.isin(direction, ("N", "S"))
+    limit = np.where(is_latitude, 90.0, 180.0)
+    limit_text = np.where(is_latitude, "90", "180").astype(object)
+    error = np.select(
+        [
+            token_counts != 4,
+            ~np.isin(direction, ("N", "S", "E", "W")),
+            np.isnan(degrees) | np.isnan(minutes) | np.isnan(seconds),
+            degrees < 0.0,
+            (minutes < 0.0) | (minutes >= 60.0),
+            (seconds < 0.0) | (seconds >= 60.0),
+            degrees > limit,
+            (degrees == limit) & ((minutes > 0.0) | (seconds > 0.0)),
+        ],
+        [
+            _DMS_FORMAT_ERROR,
+            "неверное направление: используйте N/S/E/W.",
+            _DMS_FORMAT_ERROR,
+            "градусы должны быть неотрицательными.",
+            "минуты должны быть в диапазоне [0, 60).",
+            "секунды должны быть в диапазоне [0, 60).",
+            "градусы для " + direction + " должны быть <= " + limit_text + ".",
+            "для "
+            + direction
+            + " при "
+            + limit_text
+            + "° минуты и секунды должны быть равны 0.",
+        ],
+        default="",
+    ).astype(object)
+
+    failed = error != ""
+    decimal_deg = degrees + minutes / 60.0 + seconds / 3600.0
+    decimal_deg = np.where(np.isin(direction, ("S", "W")), -decimal_deg, decimal_deg)
+    decimal_deg[failed] = np.nan
+    direction = direction.copy()
+    direction[failed] = ""
+    return DmsParseResult(direction=direction, decimal_deg=decimal_deg, error=error)
+
+
+def parse_coordinate_series(
+    values: Iterable[object],
+    *,
+    dms_axis: str | None = None,
+) -> np.ndarray:
+    """Parse a coordinate column; unparsable cells become NaN.
+
+    Decimal commas are accepted. With ``dms_axis`` set to ``"lon"`` or
+    ``"lat"`` non-numeric cells are also read as DMS of that axis.
+    """
+    text = _text_series(values)
+    parsed = pd.to_numeric(
+        text.str.replace(",", ".", regex=False),
+        errors="coerce",
+    ).to_numpy(dtype=float, copy=True)
+    if dms_axis is None:
+        return parsed
+    dms_mask = np.isnan(parsed) & text.ne("").to_numpy(dtype=bool)
+    if not bool(np.any(dms_mask)):
+        return parsed
+    dms = parse_dms_series(text[dms_mask])
+    allowed = ("E", "W") if dms_axis == "lon" else ("N", "S")
+    dms_values = np.where(np.isin(dms.direction, allowed), dms.decimal_deg, np.nan)
+    parsed[dms_mask] = dms_values
+    return parsed
+
+
+def format_coordinate_values(values: object, crs: CoordinateSystem) -> list[str]:
+    decimals = 8 if crs.is_geographic() else 3
+    return list(
+        map(f"{{:.{decimals}f}}".format, np.asarray(values, dtype=float).tolist())
+    )
+
+
+def coordinate_result_frame(
+    x_values: object,
+    y_values: object,
+    *,
+    input_crs: CoordinateSystem,
+    output_crs: CoordinateSystem,
+    columns: Sequence[str],
+) -> pd.DataFrame:
+    """Convert all points with one transform and format the four columns.
+
+    ``columns`` names the input X/Y and output X/Y columns in that order.
+    """
+    x_in = np.asarray(x_values, dtype=float)
+    y_in = np.asarray(y_values, dtype=float)
+    converted = transform_xy_arrays_to_crs(
+        [np.column_stack([x_in, y_in])],
+        input_crs,
+        output_crs,
+        use_cache=False,
+    )[0]
+    x_in_column, y_in_column, x_out_column, y_out_column = columns
+    return pd.DataFrame(
+        {
+            x_in_column: format_coordinate_values(x_in, input_crs),
+            y_in_column: format_coordinate_values(y_in, input_crs),
+            x_out_column: format_coordinate_values(converted[:, 0], output_crs),
+            y_out_column: format_coordinate_values(converted[:, 1], output_crs),
+        },
+        columns=list(columns),
+    )
+
+
+def iter_coordinate_table_chunks(
+    source: BinaryIO,
+    *,
+    file_name: str,
+    chunk_rows: int = CRS_BATCH_CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """Yield raw ``X``/``Y`` cells of a CSV or XLSX upload chunk by chunk.
+
+    Columns named X and Y are used when present, otherwise the first two
+    columns; a first row with two numeric cells is treated as data.
+    """
+    suffix = Path(str(file_name)).suffix.lower()
+    chunk_rows = max(int(chunk_rows), 1)
+    if suffix == ".csv":
+        yield from _iter_csv_chunks(source, chunk_rows=chunk_rows)
+    elif suffix == ".xlsx":
+        yield from _iter_xlsx_chunks(source, chunk_rows=chunk_rows)
+    else:
+        raise CrsBatchInputError(
+            f"Неподдерживаемый формат файла `{file_name}`: ожидается CSV или XLSX."
+        )
+
+
+def convert_coordinate_table(
+    source: BinaryIO,
+    *,
+    file_name: str,
+    input_crs: CoordinateSystem,
+    output_crs: CoordinateSystem,
+    columns: Sequence[str],
+    preview_rows: int = 200,
+    chunk_rows: int = CRS_BATCH_CHUNK_ROWS,
+) -> CrsBatchConversion:
+    """Stream-convert an uploaded point table into CSV bytes.
+
+    Only ``chunk_rows`` points are held as frames at a time; the page shows
+    the first ``preview_rows`` results and offers the CSV for download.
+    """
+    dms_x_axis = "lon" if input_crs.is_geographic() else None
+    dms_y_axis = "lat" if input_crs.is_geographic() else None
+    output = BytesIO()
+    output.write("\ufeff".encode("utf-8"))
+    converted_row_count = 0
+    invalid_row_count = 0
+    preview_frames: list[pd.DataFrame] = []
+    preview_count = 0
+    for chunk in iter_coordinate_table_chunks(
+        source,
+        file_name=file_name,
+        chunk_rows=chunk_rows,
+    ):
+        x_text = _text_series(chunk["X"])
+        y_text = _text_series(chunk["Y"])
+        non_blank = (x_text.ne("") | y_text.ne("")).to_numpy(dtype=bool)
+        x_values = parse_coordinate_series(x_text, dms_axis=dms_x_axis)
+        y_values = parse_coordinate_series(y_text, dms_axis=dms_y_axis)
+        valid = non_blank & ~np.isnan(x_values) & ~np.isnan(y_values)
+        invalid_row_count += int(np.count_nonzero(non_blank & ~valid))
+        if not bool(np.any(valid)):
+            continue
+        result = coordinate_result_frame(
+            x_values[valid],
+            y_values[valid],
+            input_crs=input_crs,
+            output_crs=output_crs,
+            columns=columns,
+        )
+        result.to_csv(
+            output,
+            index=False,
+            header=converted_row_count == 0,
+            sep=",",
+            encoding="utf-8",
+        )
+        converted_row_count += len(result.index)
+        if preview_count < preview_rows:
+            preview_frames.append(result.iloc[: preview_rows - preview_count])
+            preview_count += len(preview_frames[-1].index)
+    preview = (
+        pd.concat(preview_frames, ignore_index=True)
+        if preview_frames
+        else pd.DataFrame(columns=list(columns))
+    )
+    return CrsBatchConversion(
+        csv_bytes=output.getvalue() if converted_row_count else b"",
+        converted_row_count=converted_row_count,
+        invalid_row_count=invalid_row_count,
+        preview=preview,
+    )
+
+
+def _text_series(values: Iterable[object]) -> pd.Series:
+    series = (
+        values.reset_index(drop=True)
+        if isinstance(values, pd.Series)
+        else pd.Series(list(values), dtype=object)
+    )
+    return series.astype(object).where(series.notna(), "").astype(str).str.strip()
+
+
+def _iter_csv_chunks(source: BinaryIO, *, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    sample = source.read(_CSV_SNIFF_BYTES)
+    source.seek(0)
+    encoding = _csv_encoding(sample)
+    sample_text = sample.decode(encoding, errors="replace").lstrip("\ufeff")
+    first_line = next(
+        (line for line in sample_text.splitlines() if line.strip()), ""
+    )
+    separator = _csv_separator(first_line)
+    first_cells = next(csv.reader([first_line], delimiter=separator), [])
+    has_header = not _looks_like_point(first_cells)
+    try:
+        reader = pd.read_csv(
+            source,
+            sep=separator,
+            header=0 if has_header else None,
+            dtype=str,
+            encoding=encoding,
+            keep_default_na=False,
+            skip_blank_lines=True,
+            chunksize=chunk_rows,
+        )
+        with reader:
+            columns: tuple[object, object] | None = None
+            for chunk in reader:
+                if columns is None:
+                    columns = _xy_column_keys(list(chunk.columns))
+                yield pd.DataFrame(
+                    {"X": chunk[columns[0]].to_numpy(), "Y": chunk[columns[1]].to_numpy()}
+                )
+    except pd.errors.EmptyDataError:
+        # Empty or blank files hold no points, like an empty XLSX sheet.
+        return
+    except (pd.errors.ParserError, UnicodeDecodeError) as exc:
+        raise CrsBatchInputError(f"Не удалось разобрать CSV: {exc}") from exc
+
+
+def _iter_xlsx_chunks(source: BinaryIO, *, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    from openpyxl import load_workbook
+
+    try:
+        workbook = load_workbook(source, read_only=True, data_only=True)
+    except Exception as exc:
+        raise CrsBatchInputError(f"Не удалось открыть XLSX: {exc}") from exc
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        first_row = next(rows, None)
+        if first_row is None:
+            return
+        first_cells = ["" if value is None else str(value) for value in first_row]
+        if _looks_like_point(first_cells):
+            x_index, y_index = 0, 1
+            pending: list[tuple[object, ...]] = [first_row]
+        else:
+            x_index, y_index = _xy_column_keys(list(range(len(first_cells))), first_cells)
+            pending = []
+        for row in rows:
+            pending.append(row)
+            if len(pending) >= chunk_rows:
+                yield _xlsx_chunk(pending, x_index, y_index)
+                pending = []
+        if pending:
+            yield _xlsx_chunk(pending, x_index, y_index)
+    finally:
+        workbook.close()
+
+
+def _xlsx_chunk(
+    rows: list[tuple[object, ...]],
+    x_index: int,
+    y_index: int,
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "X": [row[x_index] if len(row) > x_index else None for row in rows],
+            "Y": [row[y_index] if len(row) > y_index else None for row in rows],
+        }
+    )
+
+
+def _xy_column_keys(
+    keys: list[object],
+    names: Sequence[object] | None = None,
+) -> tuple[object, object]:
+    labels = [str(name).strip().upper() for name in (names if names is not None else keys)]
+    if "X" in labels and "Y" in labels:
+        return keys[labels.index("X")], keys[labels.index("Y")]
+    if len(keys) < 2:
+        raise CrsBatchInputError("В файле точек нужны как минимум два столбца: X и Y.")
+    return keys[0], keys[1]
+
+
+def _looks_like_point(cells: Sequence[object]) -> bool:
+    if len(cells) < 2:
+        return False
+    values = pd.to_numeric(
+        pd.Series([str(cell).strip().replace(",", ".") for cell in cells[:2]]),
+        errors="coerce",
+    )
+    return bool(values.notna().all())
+
+
+def _csv_separator(line: str) -> str:
+    # "," is also the decimal separator in Russian locales, so it is only
+    # taken when neither ";" nor a tab is present.
+    for separator in _CSV_PREFERRED_SEPARATORS:
+        if separator in line:
+            return separator
+    return ","
+
+
+def _csv_encoding(sample: bytes) -> str:
+    trimmed = sample[: sample.rfind(b"\n") + 1] or sample
+    try:
+        trimmed.decode("utf-8")
+    except UnicodeDecodeError:
+        return "cp1251"
+    return "utf-8-sig"
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+__all__ = [
+    "PickleDiskStore",
+    "disk_cache_settings_from_env",
+]
+
+_ENTRY_SUFFIX = ".pkl"
+# Running estimate of the store size; eviction rescans the tree only once
+# the estimate crosses ``max_bytes``.
+_USAGE_FILE = "usage.txt"
+
+
+class PickleDiskStore:
+    """Content-addressed pickle files under one root with LRU eviction.
+
+    Entry paths are derived from a blake2b digest of the format version and
+    the key parts, so bumping ``format_version`` orphans old files and they
+    age out through eviction. Writes are atomic; unreadable or mistyped
+    entries are deleted on load. Subclasses decide what the key parts are.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int,
+        format_version: str,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max(max_bytes, 0))
+        self._format_version = str(format_version)
+        self._written_bytes = 0
+
+    def evict_if_needed(self) -> int:
+        """Run ``evict`` only when the estimated store size exceeds the limit.
+
+        The estimate is the size recorded by the last full scan plus the
+        bytes this instance has written since, so most runs skip the tree
+        walk entirely.
+        """
+        if self._written_bytes <= 0:
+            return 0
+        written_bytes, self._written_bytes = self._written_bytes, 0
+        try:
+            recorded_bytes = int((self.root / _USAGE_FILE).read_text().strip())
+        except (OSError, ValueError):
+            return self.evict()
+        estimated_bytes = recorded_bytes + written_bytes
+        if estimated_bytes > self.max_bytes:
+            return self.evict()
+        self._record_usage(estimated_bytes)
+        return 0
+
+    def evict(self) -> int:
+        """Drop least recently used files until the store fits ``max_bytes``."""
+        if not self.root.is_dir():
+            return 0
+        files: list[tuple[float, int, Path]] = []
+        for path in self.root.rglob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((float(stat.st_mtime), int(stat.st_size), path))
+        total_bytes = int(sum(size for _, size, _ in files))
+        evicted = 0
+        for _, size, path in sorted(files, key=lambda item: item[0]):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_bytes -= size
+            evicted += 1
+        self._record_usage(total_bytes)
+        return evicted
+
+    def _entry_path(self, kind_dir: str, *parts: str) -> Path:
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(self._format_version.encode("utf-8"))
+        for part in parts:
+            digest.update(b"\0")
+            digest.update(str(part).encode("utf-8"))
+        key = digest.hexdigest()
+        return self.root / kind_dir / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _load(self, path: Path, expected_type: type) -> object | None:
+        try:
+            with path.open("rb") as handle:
+                value = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(value, expected_type):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def _write(self, path: Path, value: object, *, replace: bool = False) -> bool:
+        if not replace and path.exists():
+            return False
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with temporary.open("wb") as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+                written_bytes = handle.tell()
+            os.replace(temporary, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            try:
+                temporary.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
+        self._written_bytes += int(written_bytes)
+        return True
+
+    def _record_usage(self, total_bytes: int) -> None:
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            (self.root / _USAGE_FILE).write_text(str(int(total_bytes)))
+        except OSError:
+            pass
+
+
+def disk_cache_settings_from_env(
+    *,
+    dir_env: str,
+    max_mb_env: str,
+    default_dir_name: str,
+    default_max_bytes: int,
+) -> tuple[Path, int] | None:
+    """Root and size limit from ``$dir_env`` / ``$max_mb_env``.
+
+    The root defaults to ``~/.cache/pywp/<default_dir_name>``; setting the
+    directory variable to an empty string disables the store (``None``).
+    Invalid or negative size limits fall back to ``default_max_bytes``.
+    """
+    configured_root = os.environ.get(dir_env)
+    if configured_root is not None and not configured_root.strip():
+        return None
+    root = (
+        Path(configured_root).expanduser()
+        if configured_root is not None
+        else Path.home() / ".cache" / "pywp" / str(default_dir_name)
+    )
+    max_bytes = int(default_max_bytes)
+    raw_max_mb = os.environ.get(max_mb_env, "").strip()
+    if raw_max_mb:
+        try:
+            max_mb = float(raw_max_mb)
+        except ValueError:
+            max_mb = float("nan")
+        if np.isfinite(max_mb) and max_mb >= 0.0:
+            max_bytes = int(max_mb * 1024 * 1024)
+    return root, max_bytes
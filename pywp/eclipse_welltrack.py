@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import math
 import re
-from typing import Callable, Iterable, Literal, Mapping
+from typing import Iterable, Literal, Mapping
 
+import numpy as np
 from pydantic import field_validator, model_validator
 from pywp.models import Point3D
-from pywp.pydantic_base import FrozenModel, coerce_model_like
+from pywp.pydantic_base import FrozenArbitraryModel, FrozenModel, coerce_model_like
 
 _WELLTRACK_RE = re.compile(r"^\s*WELLTRACK\b(.*)$", flags=re.IGNORECASE)
 DEFAULT_WELLTRACK_ENCODINGS: tuple[str, ...] = ("utf-8", "cp1251", "latin-1")
@@ -92,6 +93,13 @@ class WelltrackRecord(FrozenModel):
         return self
 
 
+class WelltrackArrays(FrozenArbitraryModel):
+    """One WELLTRACK block as an ``(n, 4)`` array of X, Y, Z, MD rows."""
+
+    name: str
+    xyz_md: np.ndarray
+
+
 def decode_welltrack_bytes(
     raw: bytes,
     encodings: tuple[str, ...] = DEFAULT_WELLTRACK_ENCODINGS,
@@ -111,36 +119,29 @@ def decode_welltrack_bytes(
 
 
 def parse_welltrack_text(text: str) -> list[WelltrackRecord]:
-    records: list[WelltrackRecord] = []
-    current_name: str | None = None
-    numeric_tokens: list[str] = []
+    return [
+        WelltrackRecord(
+            name=item.name,
+            points=tuple(
+                WelltrackPoint(x=x, y=y, z=z, md=md)
+                for x, y, z, md in item.xyz_md.tolist()
+            ),
+        )
+        for item in parse_welltrack_arrays(text)
+    ]
 
-    def finalize_current(line_no: int) -> None:
-        nonlocal current_name, numeric_tokens
-        if current_name is None:
-            return
-        if len(numeric_tokens) % 4 != 0:
-            raise WelltrackParseError(
-                f"WELLTRACK '{current_name}': ожидались группы X Y Z MD по 4 значения, "
-                f"получено {len(numeric_tokens)} значений в строке {line_no}."
-            )
-        points: list[WelltrackPoint] = []
-        for index in range(0, len(numeric_tokens), 4):
-            try:
-                x = float(numeric_tokens[index + 0])
-                y = float(numeric_tokens[index + 1])
-                z = float(numeric_tokens[index + 2])
-                md = float(numeric_tokens[index + 3])
-            except ValueError as exc:
-                raise WelltrackParseError(
-                    f"WELLTRACK '{current_name}': не удалось разобрать число около строки {line_no}: {exc}"
-                ) from exc
-            points.append(WelltrackPoint(x=x, y=y, z=z, md=md))
-        _validate_record_md(points=points, well_name=current_name)
-
-        records.append(WelltrackRecord(name=current_name, points=tuple(points)))
-        current_name = None
-        numeric_tokens = []
+
+def parse_welltrack_arrays(text: str) -> list[WelltrackArrays]:
+    """Parse WELLTRACK blocks without building a model per point.
+
+    Data lines are only collected while scanning; the numbers of a block are
+    split and converted in one pass once its ``/`` (or ``;``), the next
+    WELLTRACK keyword or the end of text closes it. Values after a closing
+    terminator on the same line are ignored.
+    """
+    blocks: list[WelltrackArrays] = []
+    current_name: str | None = None
+    body_lines: list[str] = []
 
     lines = text.splitlines()
     for line_no, raw_line in enumerate(lines, start=1):
@@ -151,30 +152,67 @@ def parse_welltrack_text(text: str) -> list[WelltrackRecord]:
         welltrack_match = _WELLTRACK_RE.match(line)
         if welltrack_match is not None:
             if current_name is not None:
-                finalize_current(line_no=line_no)
+                blocks.append(
+                    _welltrack_arrays(current_name, body_lines, line_no=line_no)
+                )
             rest = welltrack_match.group(1).strip()
-            name, tail = _parse_well_name(rest=rest, line_no=line_no)
-            current_name = name
-            _consume_tail_tokens(
-                tail=tail,
-                numeric_tokens=numeric_tokens,
-                finalize=lambda: finalize_current(line_no=line_no),
-            )
+            current_name, line = _parse_well_name(rest=rest, line_no=line_no)
+            body_lines = []
+        elif current_name is None:
             continue
 
-        if current_name is None:
+        terminator_index = _record_terminator_index(line)
+        if terminator_index < 0:
+            body_lines.append(line)
             continue
+        body_lines.append(line[:terminator_index])
+        blocks.append(_welltrack_arrays(current_name, body_lines, line_no=line_no))
+        current_name = None
+        body_lines = []
 
-        _consume_tail_tokens(
-            tail=line,
-            numeric_tokens=numeric_tokens,
-            finalize=lambda: finalize_current(line_no=line_no),
+    if current_name is not None:
+        blocks.append(
+            _welltrack_arrays(
+                current_name,
+                body_lines,
+                line_no=len(lines) if lines else 1,
+            )
         )
 
-    if current_name is not None:
-        finalize_current(line_no=len(lines) if lines else 1)
+    return blocks
 
-    return records
+
+def _record_terminator_index(line: str) -> int:
+    slash_index = line.find("/")
+    semicolon_index = line.find(";")
+    if slash_index < 0:
+        return semicolon_index
+    if semicolon_index < 0:
+        return slash_index
+    return min(slash_index, semicolon_index)
+
+
+def _welltrack_arrays(
+    name: str,
+    body_lines: list[str],
+    *,
+    line_no: int,
+) -> WelltrackArrays:
+    numeric_tokens = " ".join(body_lines).split()
+    if len(numeric_tokens) % 4 != 0:
+        raise WelltrackParseError(
+            f"WELLTRACK '{name}': ожидались группы X Y Z MD по 4 значения, "
+            f"получено {len(numeric_tokens)} значений в строке {line_no}."
+        )
+    try:
+        values = np.asarray(list(map(float, numeric_tokens)), dtype=float)
+    except ValueError as exc:
+        raise WelltrackParseError(
+            f"WELLTRACK '{name}': не удалось разобрать число около строки {line_no}: {exc}"
+        ) from exc
+    xyz_md = values.reshape(-1, 4)
+    _validate_md_values(xyz_md[:, 3], well_name=name)
+    return WelltrackArrays(name=name, xyz_md=xyz_md)
 
 
 def parse_welltrack_points_table(
@@ -857,29 +895,34 @@ def _parse_well_name(rest: str, line_no: int) -> tuple[str, str]:
     return name, remainder
 
 
-def _consume_tail_tokens(tail: str, numeric_tokens: list[str], finalize: Callable[[], None]) -> None:
-    normalized = tail.replace("/", " / ").replace(";", " ; ")
-    for token in normalized.split():
-        if token in {"/", ";"}:
-            finalize()
-            continue
-        numeric_tokens.append(token)
-
-
 def _validate_record_md(points: list[WelltrackPoint], well_name: str) -> None:
     if not points:
         return
-    for index, point in enumerate(points, start=1):
-        if not math.isfinite(float(point.md)):
-            raise WelltrackParseError(
-                f"WELLTRACK '{well_name}': MD at point #{index} must be finite."
-            )
-        if index == 1:
-            continue
-        previous_md = float(points[index - 2].md)
-        current_md = float(point.md)
-        if current_md + _MD_EPS < previous_md:
-            raise WelltrackParseError(
-                f"WELLTRACK '{well_name}': MD must be non-decreasing by point order. "
-                f"Found MD[{index - 1}]={previous_md:.3f} > MD[{index}]={current_md:.3f}."
-            )
+    _validate_md_values(
+        np.fromiter((float(point.md) for point in points), dtype=float, count=len(points)),
+        well_name=well_name,
+    )
+
+
+def _validate_md_values(md_values: np.ndarray, *, well_name: str) -> None:
+    count = int(md_values.size)
+    if count == 0:
+        return
+    non_finite = np.flatnonzero(~np.isfinite(md_values))
+    decreasing = np.flatnonzero(md_values[1:] + _MD_EPS < md_values[:-1])
+    # Report whichever problem a point-by-point scan would meet first; at the
+    # same point the finiteness check comes first.
+    non_finite_at = int(non_finite[0]) if non_finite.size else count
+    decreasing_at = int(decreasing[0]) + 1 if decreasing.size else count
+    if non_finite_at < count and non_finite_at <= decreasing_at:
+        raise WelltrackParseError(
+            f"WELLTRACK '{well_name}': MD at point #{non_finite_at + 1} must be finite."
+        )
+    if decreasing_at < count:
+        previous_md = float(md_values[decreasing_at - 1])
+        current_md = float(md_values[decreasing_at])
+        raise WelltrackParseError(
+            f"WELLTRACK '{well_name}': MD must be non-decreasing by point order. "
+            f"Found MD[{decreasing_at}]={previous_md:.3f} > "
+            f"MD[{decreasing_at + 1}]={current_md:.3f}."
+        )
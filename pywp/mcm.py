@@ -5,7 +5,9 @@ import pandas as pd
 
 from pywp.constants import DEG2RAD, RAD2DEG
 from pywp.models import Point3D
-_DOGLEG_SINGULARITY_TOL_RAD = 1e-3
+
+# Minimum-curvature ratio factors diverge as the dogleg approaches 180 deg.
+DOGLEG_SINGULARITY_TOL_RAD = 1e-3
 
 
 def wrap_azimuth_deg(azi_deg: np.ndarray | float) -> np.ndarray:
@@ -33,7 +35,7 @@ def ratio_factor(beta_rad: np.ndarray | float, eps: float = 1e-12) -> np.ndarray
     abs_beta = np.abs(beta)
     if np.any(~np.isfinite(beta)):
         raise ValueError("beta_rad must contain only finite values.")
-    if np.any(abs_beta >= (np.pi - _DOGLEG_SINGULARITY_TOL_RAD)):
+    if np.any(abs_beta >= (np.pi - DOGLEG_SINGULARITY_TOL_RAD)):
         raise ValueError(
             "dogleg angle is too close to 180 degrees for stable minimum-curvature evaluation."
         )
@@ -6,7 +6,13 @@ import numpy as np
 import pandas as pd
 
 from pywp.constants import RAD2DEG
-from pywp.mcm import add_dls, dogleg_angle_rad, minimum_curvature_increment
+from pywp.mcm import (
+    DOGLEG_SINGULARITY_TOL_RAD,
+    add_dls,
+    dogleg_angle_rad,
+    minimum_curvature_increment,
+    ratio_factor,
+)
 from pywp.models import PlannerResult, Point3D, TrajectoryConfig
 from pywp.planner_types import PlanningError
 from pywp.segments import BuildSegment, HoldSegment
@@ -36,6 +42,64 @@ class _ConstantDlsTransitionCandidate:
     md_span_m: float
 
 
+@dataclass(frozen=True)
+class _ConstantDlsTransitionProblem:
+    start_inc_deg: float
+    start_azi_deg: float
+    end_inc_deg: float
+    end_azi_deg: float
+    target_delta: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    scale_m: float
+
+    def residuals(self, params: np.ndarray) -> np.ndarray:
+        values = np.asarray(params, dtype=float).reshape(-1, 4)
+        delta, _, _, valid = _constant_dls_transition_delta_xyz_batch(
+            start_inc_deg=self.start_inc_deg,
+            start_azi_deg=self.start_azi_deg,
+            mid_inc_deg=values[:, 0],
+            mid_azi_deg=values[:, 1],
+            end_inc_deg=self.end_inc_deg,
+            end_azi_deg=self.end_azi_deg,
+            dls_deg_per_30m=values[:, 2],
+            hold_length_m=values[:, 3],
+        )
+        residual = (delta - self.target_delta[None, :]) / self.scale_m
+        residual[~valid] = 1e6
+        return residual
+
+    def project(self, params: np.ndarray) -> np.ndarray:
+        values = np.array(params, dtype=float).reshape(-1, 4)
+        values[:, 1] = np.mod(values[:, 1], 360.0)
+        return np.clip(values, self.lower[None, :], self.upper[None, :])
+
+    def with_closed_form_hold(self, params: np.ndarray) -> np.ndarray:
+        # The hold enters the endpoint linearly along the mid tangent, so its
+        # least-squares optimum for fixed arcs is a single projection.
+        values = self.project(params)
+        no_hold = values.copy()
+        no_hold[:, 3] = 0.0
+        delta, _, _, valid = _constant_dls_transition_delta_xyz_batch(
+            start_inc_deg=self.start_inc_deg,
+            start_azi_deg=self.start_azi_deg,
+            mid_inc_deg=no_hold[:, 0],
+            mid_azi_deg=no_hold[:, 1],
+            end_inc_deg=self.end_inc_deg,
+            end_azi_deg=self.end_azi_deg,
+            dls_deg_per_30m=no_hold[:, 2],
+            hold_length_m=no_hold[:, 3],
+        )
+        tangent = _xyz_direction_vectors(values[:, 0], values[:, 1])
+        hold = np.einsum("ij,ij->i", tangent, self.target_delta[None, :] - delta)
+        values[:, 3] = np.where(
+            valid,
+            np.clip(hold, self.lower[3], self.upper[3]),
+            values[:, 3],
+        )
+        return values
+
+
 def extend_plan_with_multi_horizontal_targets(
     *,
     base_result: PlannerResult,
@@ -440,11 +504,6 @@ def _constant_dls_transition_candidate(
     segment_name: str,
     config: TrajectoryConfig,
 ) -> _ConstantDlsTransitionCandidate:
-    try:
-        from scipy.optimize import least_squares
-    except ImportError as exc:  # pragma: no cover - scipy is a runtime dependency.
-        raise PlanningError("scipy недоступен для Constant-DLS fallback.") from exc
-
     dls_limit = _horizontal_dls_limit(config)
     if dls_limit <= SMALL:
         raise PlanningError("лимит HORIZONTAL ПИ должен быть положительным.")
@@ -461,52 +520,141 @@ def _constant_dls_transition_candidate(
     if gap_m <= SMALL:
         raise PlanningError("точки перехода совпадают.")
 
-    start_inc = float(current["inc_deg"])
-    start_azi = float(current["azi_deg"]) % 360.0
-    end_inc = float(target_inc_deg)
-    end_azi = float(target_azi_deg) % 360.0
-    max_inc = float(config.max_inc_deg)
-    max_hold_m = float(max(gap_m * MAX_TRANSITION_MD_MULTIPLIER, gap_m + 500.0))
-    dls_lower = float(max(min(dls_limit * 0.02, 0.03), 1e-4))
-    scale_m = float(max(gap_m, 1.0))
+    problem = _ConstantDlsTransitionProblem(
+        start_inc_deg=float(current["inc_deg"]),
+        start_azi_deg=float(current["azi_deg"]) % 360.0,
+        end_inc_deg=float(target_inc_deg),
+        end_azi_deg=float(target_azi_deg) % 360.0,
+        target_delta=target_delta,
+        lower=np.array(
+            [0.0, 0.0, float(max(min(dls_limit * 0.02, 0.03), 1e-4)), 0.0],
+            dtype=float,
+        ),
+        upper=np.array(
+            [
+                float(config.max_inc_deg),
+                360.0,
+                dls_limit,
+                float(max(gap_m * MAX_TRANSITION_MD_MULTIPLIER, gap_m + 500.0)),
+            ],
+            dtype=float,
+        ),
+        scale_m=float(max(gap_m, 1.0)),
+    )
+    seeds = np.asarray(
+        _constant_dls_transition_seeds(
+            current=current,
+            target=target,
+            target_inc_deg=problem.end_inc_deg,
+            target_azi_deg=problem.end_azi_deg,
+            dls_limit_deg_per_30m=dls_limit,
+            max_inc_deg=float(config.max_inc_deg),
+            max_hold_m=float(problem.upper[3]),
+        ),
+        dtype=float,
+    ).reshape(-1, 4)
+
+    # Closed-form hold plus a vectorized Levenberg-Marquardt over all seeds;
+    # per-seed scipy least_squares is kept only as a last-resort fallback.
+    for solve in (
+        _solve_constant_dls_transition_batch,
+        _solve_constant_dls_transition_scipy,
+    ):
+        solutions = solve(problem=problem, seeds=seeds)
+        best = _select_constant_dls_transition_candidate(
+            problem=problem,
+            solutions=solutions,
+            current=current,
+            target=target,
+            segment_name=segment_name,
+            config=config,
+        )
+        if best is not None:
+            return best
+
+    raise PlanningError(
+        "не удалось подобрать Constant-DLS переход с ПИ не выше "
+        f"{dls_to_pi(dls_limit):.2f} deg/10m."
+    )
+
 
-    def residual(values: np.ndarray) -> np.ndarray:
-        inc_mid, azi_mid, dls_value, hold_length = [float(item) for item in values]
+def _solve_constant_dls_transition_batch(
+    *,
+    problem: _ConstantDlsTransitionProblem,
+    seeds: np.ndarray,
+    max_iterations: int = 60,
+) -> np.ndarray:
+    if len(seeds) == 0:
+        return np.empty((0, 4), dtype=float)
+    params = problem.with_closed_form_hold(seeds)
+    residual = problem.residuals(params)
+    cost = np.einsum("ij,ij->i", residual, residual)
+    damping = np.full(len(params), 1e-3, dtype=float)
+    tolerance = (1e-6 / problem.scale_m) ** 2
+    # The hold is eliminated in closed form and each seed keeps its DLS, so
+    # only the mid-hold direction (INC, AZI) is iterated. With the DLS free
+    # the three residuals leave a one-parameter family of exact solutions and
+    # LM slides along it towards low DLS; scipy stays next to the seed DLS
+    # (limit, 0.75 and 0.5 of it), which is what fixing it reproduces.
+    free = np.array([0, 1])
+    span = (problem.upper - problem.lower)[free]
+    for _ in range(int(max_iterations)):
+        active = (cost > tolerance) & (damping < 1e12)
+        if not np.any(active):
+            break
+        p = params[active]
+        r = residual[active]
+        step = 1e-7 * np.maximum(np.abs(p[:, free]), 1.0)
+        step = np.where(p[:, free] + step > problem.upper[None, free], -step, step)
+        perturbed = np.repeat(p[:, None, :], len(free), axis=1)
+        perturbed[:, np.arange(len(free)), free] += step
+        perturbed = problem.with_closed_form_hold(perturbed.reshape(-1, 4))
+        jac = (
+            problem.residuals(perturbed).reshape(-1, len(free), 3) - r[:, None, :]
+        ) / step[:, :, None]
+        normal = np.einsum("nik,njk->nij", jac, jac)
+        gradient = np.einsum("nik,nk->ni", jac, r)
+        diagonal = np.maximum(np.diagonal(normal, axis1=1, axis2=2), 1e-12)
+        lm = normal + damping[active, None, None] * (
+            diagonal[:, :, None] * np.eye(len(free))[None, :, :]
+        )
         try:
-            delta, _, _ = _constant_dls_transition_delta_xyz(
-                start_inc_deg=start_inc,
-                start_azi_deg=start_azi,
-                mid_inc_deg=inc_mid,
-                mid_azi_deg=azi_mid,
-                end_inc_deg=end_inc,
-                end_azi_deg=end_azi,
-                dls_deg_per_30m=dls_value,
-                hold_length_m=hold_length,
-            )
-        except ValueError:
-            return np.full(3, 1e6, dtype=float)
-        if not np.all(np.isfinite(delta)):
-            return np.full(3, 1e6, dtype=float)
-        return (delta - target_delta) / scale_m
+            delta = -np.linalg.solve(lm, gradient[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            break
+        trial = p.copy()
+        trial[:, free] += np.clip(delta, -0.25 * span[None, :], 0.25 * span[None, :])
+        trial = problem.with_closed_form_hold(trial)
+        trial_residual = problem.residuals(trial)
+        trial_cost = np.einsum("ij,ij->i", trial_residual, trial_residual)
+        improved = np.isfinite(trial_cost) & (trial_cost < cost[active])
+        indices = np.flatnonzero(active)
+        accepted = indices[improved]
+        params[accepted] = trial[improved]
+        residual[accepted] = trial_residual[improved]
+        cost[accepted] = trial_cost[improved]
+        damping[accepted] = np.maximum(damping[accepted] * 0.3, 1e-12)
+        rejected = indices[~improved]
+        damping[rejected] = damping[rejected] * 10.0
+    return params[cost <= tolerance]
+
+
+def _solve_constant_dls_transition_scipy(
+    *,
+    problem: _ConstantDlsTransitionProblem,
+    seeds: np.ndarray,
+) -> np.ndarray:
+    try:
+        from scipy.optimize import least_squares
+    except ImportError as exc:  # pragma: no cover - scipy is a runtime dependency.
+        raise PlanningError("scipy недоступен для Constant-DLS fallback.") from exc
 
-    best: _ConstantDlsTransitionCandidate | None = None
-    best_score = float("inf")
-    for seed in _constant_dls_transition_seeds(
-        current=current,
-        target=target,
-        target_inc_deg=end_inc,
-        target_azi_deg=end_azi,
-        dls_limit_deg_per_30m=dls_limit,
-        max_inc_deg=max_inc,
-        max_hold_m=max_hold_m,
-    ):
+    solutions: list[np.ndarray] = []
+    for seed in seeds:
         result = least_squares(
-            residual,
+            lambda values: problem.residuals(values)[0],
             np.asarray(seed, dtype=float),
-            bounds=(
-                np.array([0.0, 0.0, dls_lower, 0.0], dtype=float),
-                np.array([max_inc, 360.0, dls_limit, max_hold_m], dtype=float),
-            ),
+            bounds=(problem.lower, problem.upper),
             max_nfev=160,
             xtol=1e-11,
             ftol=1e-11,
@@ -514,8 +662,46 @@ def _constant_dls_transition_candidate(
         )
         if not result.success and float(result.cost) > 1e-14:
             continue
+        solutions.append(np.asarray(result.x, dtype=float))
+    if not solutions:
+        return np.empty((0, 4), dtype=float)
+    return np.vstack(solutions)
+
+
+def _select_constant_dls_transition_candidate(
+    *,
+    problem: _ConstantDlsTransitionProblem,
+    solutions: np.ndarray,
+    current: dict[str, float],
+    target: Point3D,
+    segment_name: str,
+    config: TrajectoryConfig,
+) -> _ConstantDlsTransitionCandidate | None:
+    if len(solutions) == 0:
+        return None
+    _, build1_m, build2_m, valid = _constant_dls_transition_delta_xyz_batch(
+        start_inc_deg=problem.start_inc_deg,
+        start_azi_deg=problem.start_azi_deg,
+        mid_inc_deg=solutions[:, 0],
+        mid_azi_deg=solutions[:, 1],
+        end_inc_deg=problem.end_inc_deg,
+        end_azi_deg=problem.end_azi_deg,
+        dls_deg_per_30m=solutions[:, 2],
+        hold_length_m=solutions[:, 3],
+    )
+    miss_m = np.linalg.norm(problem.residuals(solutions), axis=1) * problem.scale_m
+    md_span = build1_m + solutions[:, 3] + build2_m
+    score = miss_m * 1_000_000.0 + 0.001 * md_span - 0.01 * solutions[:, 2]
+    score[~valid | (miss_m > 1e-4)] = np.inf
+
+    # Stations are only materialized for the best-ranked solutions.
+    max_inc = float(problem.upper[0])
+    dls_limit = float(problem.upper[2])
+    for index in np.argsort(score, kind="stable"):
+        if not np.isfinite(score[index]):
+            break
         inc_mid, azi_mid, dls_value, hold_length = [
-            float(item) for item in result.x
+            float(item) for item in solutions[index]
         ]
         try:
             stations = _build_constant_dls_transition_stations(
@@ -523,8 +709,8 @@ def _constant_dls_transition_candidate(
                 mid_inc_deg=inc_mid,
                 mid_azi_deg=azi_mid,
                 target=target,
-                target_inc_deg=end_inc,
-                target_azi_deg=end_azi,
+                target_inc_deg=problem.end_inc_deg,
+                target_azi_deg=problem.end_azi_deg,
                 dls_deg_per_30m=dls_value,
                 hold_length_m=hold_length,
                 segment_name=segment_name,
@@ -549,36 +735,21 @@ def _constant_dls_transition_candidate(
         max_dls = float(np.max(dls_values)) if len(dls_values) else 0.0
         inc_values = _finite_values(stations["INC_deg"].to_numpy(dtype=float))
         actual_max_inc = float(np.max(inc_values)) if len(inc_values) else 0.0
-        md_span = float(stations["MD_m"].iloc[-1] - stations["MD_m"].iloc[0])
         if endpoint_miss > 1e-4:
             continue
         if max_dls > dls_limit + 1e-6:
             continue
         if actual_max_inc > max_inc + 1e-6:
             continue
-        candidate = _ConstantDlsTransitionCandidate(
+        return _ConstantDlsTransitionCandidate(
             stations=stations,
             dls_deg_per_30m=dls_value,
             endpoint_miss_m=endpoint_miss,
             max_dls_deg_per_30m=max_dls,
             max_inc_deg=actual_max_inc,
-            md_span_m=md_span,
-        )
-        score = float(
-            endpoint_miss * 1_000_000.0
-            + 0.001 * md_span
-            - 0.01 * dls_value
-        )
-        if score < best_score:
-            best = candidate
-            best_score = score
-
-    if best is None:
-        raise PlanningError(
-            "не удалось подобрать Constant-DLS переход с ПИ не выше "
-            f"{dls_to_pi(dls_limit):.2f} deg/10m."
+            md_span_m=float(stations["MD_m"].iloc[-1] - stations["MD_m"].iloc[0]),
         )
-    return best
+    return None
 
 
 def _constant_dls_transition_seeds(
@@ -751,27 +922,30 @@ def _attach_min_curve_positions(
     start_xyz: np.ndarray,
 ) -> pd.DataFrame:
     out = stations.copy().reset_index(drop=True)
-    xs = [float(start_xyz[0])]
-    ys = [float(start_xyz[1])]
-    zs = [float(start_xyz[2])]
-    for idx in range(1, len(out)):
-        dn, de, dz = minimum_curvature_increment(
-            md1_m=float(out.loc[idx - 1, "MD_m"]),
-            inc1_deg=float(out.loc[idx - 1, "INC_deg"]),
-            azi1_deg=float(out.loc[idx - 1, "AZI_deg"]),
-            md2_m=float(out.loc[idx, "MD_m"]),
-            inc2_deg=float(out.loc[idx, "INC_deg"]),
-            azi2_deg=float(out.loc[idx, "AZI_deg"]),
+    md = out["MD_m"].to_numpy(dtype=float)
+    inc = out["INC_deg"].to_numpy(dtype=float)
+    azi = out["AZI_deg"].to_numpy(dtype=float)
+    if len(md) > 1 and np.any(np.diff(md) <= 0.0):
+        raise ValueError("minimum-curvature increment requires md2_m > md1_m.")
+    steps = np.diff(md)
+    increments = np.zeros((len(md), 3), dtype=float)
+    if len(md) > 1:
+        beta = dogleg_angle_rad(inc[:-1], azi[:-1], inc[1:], azi[1:])
+        increments[1:] = _min_curve_xyz_chords(
+            inc1_deg=inc[:-1],
+            azi1_deg=azi[:-1],
+            inc2_deg=inc[1:],
+            azi2_deg=azi[1:],
+            length_m=steps,
+            ratio=ratio_factor(beta),
         )
-        xs.append(xs[-1] + float(de))
-        ys.append(ys[-1] + float(dn))
-        zs.append(zs[-1] + float(dz))
-    out["N_m"] = ys
-    out["E_m"] = xs
-    out["TVD_m"] = zs
-    out["X_m"] = xs
-    out["Y_m"] = ys
-    out["Z_m"] = zs
+    xyz = np.asarray(start_xyz, dtype=float)[None, :] + np.cumsum(increments, axis=0)
+    out["N_m"] = xyz[:, 1]
+    out["E_m"] = xyz[:, 0]
+    out["TVD_m"] = xyz[:, 2]
+    out["X_m"] = xyz[:, 0]
+    out["Y_m"] = xyz[:, 1]
+    out["Z_m"] = xyz[:, 2]
     return add_dls(out)
 
 
@@ -828,6 +1002,86 @@ def _constant_dls_transition_delta_xyz(
     return delta, float(build1_m), float(build2_m)
 
 
+def _constant_dls_transition_delta_xyz_batch(
+    *,
+    start_inc_deg: float,
+    start_azi_deg: float,
+    mid_inc_deg: np.ndarray,
+    mid_azi_deg: np.ndarray,
+    end_inc_deg: float,
+    end_azi_deg: float,
+    dls_deg_per_30m: np.ndarray,
+    hold_length_m: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `_constant_dls_transition_delta_xyz` over candidate arrays.
+
+    Returns endpoint deltas, both build lengths and a validity mask; rows with
+    near-180° doglegs are flagged invalid instead of raising.
+    """
+    mid_inc = np.asarray(mid_inc_deg, dtype=float)
+    mid_azi = np.asarray(mid_azi_deg, dtype=float)
+    dls = np.asarray(dls_deg_per_30m, dtype=float)
+    hold = np.asarray(hold_length_m, dtype=float)
+    beta1 = dogleg_angle_rad(start_inc_deg, start_azi_deg, mid_inc, mid_azi)
+    beta2 = dogleg_angle_rad(mid_inc, mid_azi, end_inc_deg, end_azi_deg)
+    valid = (
+        np.isfinite(beta1)
+        & np.isfinite(beta2)
+        & np.isfinite(hold)
+        & (dls > 0.0)
+        & (beta1 < np.pi - DOGLEG_SINGULARITY_TOL_RAD)
+        & (beta2 < np.pi - DOGLEG_SINGULARITY_TOL_RAD)
+    )
+    beta1 = np.where(valid, beta1, 0.0)
+    beta2 = np.where(valid, beta2, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        build1_m = np.where(
+            beta1 * RAD2DEG > 1e-9, beta1 * RAD2DEG / dls * 30.0, 0.0
+        )
+        build2_m = np.where(
+            beta2 * RAD2DEG > 1e-9, beta2 * RAD2DEG / dls * 30.0, 0.0
+        )
+    build1_m = np.where(valid, build1_m, np.nan)
+    build2_m = np.where(valid, build2_m, np.nan)
+    delta = (
+        _min_curve_xyz_chords(
+            inc1_deg=start_inc_deg,
+            azi1_deg=start_azi_deg,
+            inc2_deg=mid_inc,
+            azi2_deg=mid_azi,
+            length_m=np.where(valid & (build1_m > SMALL), build1_m, 0.0),
+            ratio=ratio_factor(beta1),
+        )
+        + _xyz_direction_vectors(mid_inc, mid_azi)
+        * np.where(valid & (hold > SMALL), hold, 0.0)[:, None]
+        + _min_curve_xyz_chords(
+            inc1_deg=mid_inc,
+            azi1_deg=mid_azi,
+            inc2_deg=end_inc_deg,
+            azi2_deg=end_azi_deg,
+            length_m=np.where(valid & (build2_m > SMALL), build2_m, 0.0),
+            ratio=ratio_factor(beta2),
+        )
+    )
+    return delta, build1_m, build2_m, valid
+
+
+def _min_curve_xyz_chords(
+    *,
+    inc1_deg: np.ndarray | float,
+    azi1_deg: np.ndarray | float,
+    inc2_deg: np.ndarray | float,
+    azi2_deg: np.ndarray | float,
+    length_m: np.ndarray,
+    ratio: np.ndarray,
+) -> np.ndarray:
+    half = 0.5 * np.asarray(length_m, dtype=float) * np.asarray(ratio, dtype=float)
+    return half[:, None] * (
+        _xyz_direction_vectors(inc1_deg, azi1_deg, size=len(half))
+        + _xyz_direction_vectors(inc2_deg, azi2_deg, size=len(half))
+    )
+
+
 def _candidate_control_lengths(*, gap_m: float, min_control_m: float) -> tuple[float, ...]:
     gap = float(gap_m)
     values = {
@@ -1158,6 +1412,27 @@ def _xyz_direction_vector(inc_deg: float, azi_deg: float) -> np.ndarray:
     return np.array([east, north, down], dtype=float)
 
 
+def _xyz_direction_vectors(
+    inc_deg: np.ndarray | float,
+    azi_deg: np.ndarray | float,
+    *,
+    size: int | None = None,
+) -> np.ndarray:
+    inc_rad = np.radians(np.asarray(inc_deg, dtype=float))
+    azi_rad = np.radians(np.asarray(azi_deg, dtype=float))
+    vectors = np.stack(
+        np.broadcast_arrays(
+            np.sin(inc_rad) * np.sin(azi_rad),
+            np.sin(inc_rad) * np.cos(azi_rad),
+            np.cos(inc_rad),
+        ),
+        axis=-1,
+    ).reshape(-1, 3)
+    if size is not None and len(vectors) != int(size):
+        vectors = np.broadcast_to(vectors, (int(size), 3))
+    return vectors
+
+
 def _max_feasible_delta_z_m(
     *,
     current: dict[str, float],
@@ -2,9 +2,25 @@ from __future__ import annotations
 
 import multiprocessing
 import sys
+from concurrent.futures.process import BrokenProcessPool
 from multiprocessing.context import BaseContext
-
-__all__ = ["process_pool_context", "process_pool_start_method"]
+from pickle import PicklingError
+
+__all__ = [
+    "PROCESS_POOL_ERRORS",
+    "process_pool_context",
+    "process_pool_start_method",
+]
+
+# Errors a process pool raises when it cannot start or run the work at all;
+# callers fall back to computing in-process.
+PROCESS_POOL_ERRORS = (
+    BrokenProcessPool,
+    PicklingError,
+    OSError,
+    RuntimeError,
+    ValueError,
+)
 
 
 def process_pool_start_method(platform: str | None = None) -> str:
@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pywp.models import Point3D
+from pywp.reference_trajectories import ImportedTrajectoryWell
+from pywp.welltrack_batch import SuccessfulWellPlan
+
+__all__ = [
+    "PROJECT_STORE_FORMAT_VERSION",
+    "ProjectStore",
+    "ProjectStoreError",
+    "open_project_store",
+    "save_project_store",
+]
+
+PROJECT_STORE_FORMAT_VERSION = 2
+_MANIFEST_FILE = "manifest.json"
+_STATIONS_DIR = "stations"
+_DEV_EXPORT_DIR = "dev_export_rows"
+_PLAN_STATIONS_DIR = "plan_stations"
+_COLUMN_GROUPS = (_STATIONS_DIR, _DEV_EXPORT_DIR, _PLAN_STATIONS_DIR)
+
+
+class ProjectStoreError(ValueError):
+    pass
+
+
+class ProjectStore:
+    """Columnar project store opened without reading station data.
+
+    Holds reference wells of every kind (actual fund surveys and approved
+    wells) and computed plans. Every station and ``.dev`` export column of
+    all wells is one ``.npy`` file, memory-mapped on first use; the manifest
+    keeps well metadata, plan models, summary rows and row ranges. A well's
+    DataFrames are built only when the well is asked for and are memoized
+    afterwards.
+    """
+
+    def __init__(self, root: str | Path, manifest: dict[str, object]) -> None:
+        self.root = Path(root)
+        self._well_entries: list[dict[str, object]] = list(manifest["wells"])
+        self._plan_entries: list[dict[str, object]] = list(manifest["plans"])
+        self._index_by_name = {
+            str(entry["name"]): index
+            for index, entry in enumerate(self._well_entries)
+        }
+        self._plan_index_by_name = {
+            str(entry["name"]): index
+            for index, entry in enumerate(self._plan_entries)
+        }
+        self._column_files: dict[str, dict[str, tuple[str, bool]]] = {
+            group: {
+                str(name): (str(file_name), bool(has_missing))
+                for name, file_name, has_missing in manifest["columns"][group]
+            }
+            for group in _COLUMN_GROUPS
+        }
+        self.plan_summary_rows: tuple[dict[str, object], ...] = tuple(
+            dict(row) for row in manifest["plan_summary_rows"]
+        )
+        self._arrays: dict[tuple[str, str], np.ndarray] = {}
+        self._wells: dict[int, ImportedTrajectoryWell] = {}
+        self._plans: dict[int, SuccessfulWellPlan] = {}
+
+    def __len__(self) -> int:
+        return len(self._well_entries)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(str(entry["name"]) for entry in self._well_entries)
+
+    @property
+    def kinds(self) -> tuple[str, ...]:
+        return tuple(str(entry["kind"]) for entry in self._well_entries)
+
+    @property
+    def plan_names(self) -> tuple[str, ...]:
+        return tuple(str(entry["name"]) for entry in self._plan_entries)
+
+    def well(self, key: int | str) -> ImportedTrajectoryWell:
+        index = _entry_index(key, self._index_by_name, len(self._well_entries))
+        cached = self._wells.get(index)
+        if cached is not None:
+            return cached
+        entry = self._well_entries[index]
+        dev_export_entry = entry.get("dev_export_rows")
+        well = ImportedTrajectoryWell(
+            name=str(entry["name"]),
+            kind=str(entry["kind"]),
+            stations=self._frame(_STATIONS_DIR, entry["stations"]),
+            surface=Point3D(*(float(value) for value in entry["surface"])),
+            azimuth_deg=float(entry["azimuth_deg"]),
+            dev_export_rows=(
+                None
+                if dev_export_entry is None
+                else self._frame(_DEV_EXPORT_DIR, dev_export_entry)
+            ),
+        )
+        self._wells[index] = well
+        return well
+
+    def wells(self, *, kind: str | None = None) -> list[ImportedTrajectoryWell]:
+        return [
+            self.well(index)
+            for index, entry in enumerate(self._well_entries)
+            if kind is None or str(entry["kind"]) == str(kind)
+        ]
+
+    def plan(self, key: int | str) -> SuccessfulWellPlan:
+        index = _entry_index(key, self._plan_index_by_name, len(self._plan_entries))
+        cached = self._plans.get(index)
+        if cached is not None:
+            return cached
+        entry = self._plan_entries[index]
+        plan = SuccessfulWellPlan.model_validate(
+            {
+                **dict(entry["model"]),
+                "stations": self._frame(_PLAN_STATIONS_DIR, entry["stations"]),
+            }
+        )
+        self._plans[index] = plan
+        return plan
+
+    def plans(self) -> list[SuccessfulWellPlan]:
+        return [self.plan(index) for index in range(len(self._plan_entries))]
+
+    def _frame(self, group: str, entry: dict[str, object]) -> pd.DataFrame:
+        start = int(entry["start"])
+        stop = int(entry["stop"])
+        columns: dict[str, object] = {}
+        for name, dtype in entry["columns"]:
+            values = np.array(self._column(group, str(name))[start:stop])
+            if self._column_files[group][str(name)][1]:
+                missing = np.asarray(
+                    self._column(group, str(name), missing=True)[start:stop]
+                )
+                if missing.any():
+                    values = values.astype(object)
+                    values[missing] = None
+            if dtype == "object":
+                # pandas would re-infer a string dtype from a bare object array.
+                columns[str(name)] = pd.Series(values, dtype=object)
+            elif str(values.dtype) == str(dtype):
+                columns[str(name)] = values
+            else:
+                columns[str(name)] = pd.Series(values).astype(str(dtype)).array
+        return pd.DataFrame(columns, copy=False)
+
+    def _column(self, group: str, name: str, *, missing: bool = False) -> np.ndarray:
+        key = (group, f"{name}\0missing" if missing else name)
+        array = self._arrays.get(key)
+        if array is None:
+            column_file = self._column_files[group].get(name)
+            if column_file is None:
+                raise ProjectStoreError(
+                    f"Хранилище проекта `{self.root}` не содержит столбец `{name}`."
+                )
+            file_name = column_file[0]
+            if missing:
+                file_name = _missing_mask_file_name(file_name)
+            array = np.load(self.root / group / file_name, mmap_mode="r")
+            self._arrays[key] = array
+        return array
+
+
+def save_project_store(
+    root: str | Path,
+    *,
+    reference_wells: Iterable[ImportedTrajectoryWell] = (),
+    plans: Iterable[SuccessfulWellPlan] = (),
+    plan_summary_rows: Iterable[Mapping[str, object]] = (),
+) -> Path:
+    """Write wells and plans as a columnar store, replacing ``root`` atomically."""
+    target = Path(root)
+    well_list = list(reference_wells)
+    plan_list = list(plans)
+    dev_export_frames = [
+        well.dev_export_rows
+        for well in well_list
+        if well.dev_export_rows is not None
+    ]
+    staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    try:
+        station_files, station_ranges = _write_column_group(
+            staging / _STATIONS_DIR, [well.stations for well in well_list]
+        )
+        dev_export_files, dev_export_ranges = _write_column_group(
+            staging / _DEV_EXPORT_DIR, dev_export_frames
+        )
+        plan_files, plan_ranges = _write_column_group(
+            staging / _PLAN_STATIONS_DIR, [plan.stations for plan in plan_list]
+        )
+        dev_export_iter = iter(dev_export_ranges)
+        manifest = {
+            "format_version": PROJECT_STORE_FORMAT_VERSION,
+            "columns": {
+                _STATIONS_DIR: station_files,
+                _DEV_EXPORT_DIR: dev_export_files,
+                _PLAN_STATIONS_DIR: plan_files,
+            },
+            "wells": [
+                {
+                    "name": str(well.name),
+                    "kind": str(well.kind),
+                    "surface": [
+                        float(well.surface.x),
+                        float(well.surface.y),
+                        float(well.surface.z),
+                    ],
+                    "azimuth_deg": float(well.azimuth_deg),
+                    "stations": station_range,
+                    "dev_export_rows": (
+                        None
+                        if well.dev_export_rows is None
+                        else next(dev_export_iter)
+                    ),
+                }
+                for well, station_range in zip(well_list, station_ranges)
+            ],
+            "plans": [
+                {
+                    "name": str(plan.name),
+                    "model": plan.model_dump(exclude={"stations"}),
+                    "stations": station_range,
+                }
+                for plan, station_range in zip(plan_list, plan_ranges)
+            ],
+            "plan_summary_rows": [dict(row) for row in plan_summary_rows],
+        }
+        try:
+            manifest_text = json.dumps(
+                manifest, ensure_ascii=False, default=_json_scalar
+            )
+        except TypeError as exc:
+            raise ProjectStoreError(
+                f"Не удалось сохранить хранилище проекта `{target}`: {exc}"
+            ) from exc
+        (staging / _MANIFEST_FILE).write_text(manifest_text, encoding="utf-8")
+        previous = target.with_name(f"{target.name}.{os.getpid()}.old")
+        if target.exists():
+            os.replace(target, previous)
+        os.replace(staging, target)
+        shutil.rmtree(previous, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return target
+
+
+def open_project_store(root: str | Path) -> ProjectStore:
+    source = Path(root)
+    try:
+        manifest = json.loads((source / _MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise ProjectStoreError(
+            f"Не удалось прочитать хранилище проекта `{source}`: {exc}"
+        ) from exc
+    version = manifest.get("format_version") if isinstance(manifest, dict) else None
+    if version != PROJECT_STORE_FORMAT_VERSION:
+        raise ProjectStoreError(
+            f"Хранилище проекта `{source}` имеет неподдерживаемую версию "
+            f"формата: {version!r}."
+        )
+    problem = _manifest_problem(manifest)
+    if problem:
+        raise ProjectStoreError(
+            f"Хранилище проекта `{source}` повреждено: {problem}."
+        )
+    return ProjectStore(source, manifest)
+
+
+def _manifest_problem(manifest: dict[str, object]) -> str:
+    """First structural problem of a manifest, or ``""`` when it is usable.
+
+    Checks everything ``ProjectStore`` reads from the manifest, so a store
+    that opens never fails later on a missing key or a mistyped entry.
+    """
+    columns = manifest.get("columns")
+    if not isinstance(columns, dict):
+        return "нет таблицы столбцов"
+    column_names: dict[str, set[str]] = {}
+    for group in _COLUMN_GROUPS:
+        files = columns.get(group)
+        if not isinstance(files, list) or not all(
+            isinstance(item, list)
+            and len(item) == 3
+            and isinstance(item[0], str)
+            and isinstance(item[1], str)
+            and isinstance(item[2], bool)
+            for item in files
+        ):
+            return f"некорректный список столбцов `{group}`"
+        column_names[group] = {str(item[0]) for item in files}
+
+    def range_problem(entry: object, group: str) -> str:
+        if not isinstance(entry, dict):
+            return f"нет диапазона строк `{group}`"
+        start, stop, entry_columns = (
+            entry.get("start"),
+            entry.get("stop"),
+            entry.get("columns"),
+        )
+        if not (
+            isinstance(start, int)
+            and isinstance(stop, int)
+            and 0 <= start <= stop
+            and isinstance(entry_columns, list)
+            and all(
+                isinstance(item, list)
+                and len(item) == 2
+                and str(item[0]) in column_names[group]
+                and isinstance(item[1], str)
+                for item in entry_columns
+            )
+        ):
+            return f"некорректный диапазон строк `{group}`"
+        return ""
+
+    wells = manifest.get("wells")
+    if not isinstance(wells, list):
+        return "нет списка скважин"
+    for entry in wells:
+        if not (
+            isinstance(entry, dict)
+            and isinstance(entry.get("name"), str)
+            and isinstance(entry.get("kind"), str)
+            and isinstance(entry.get("surface"), list)
+            and len(entry["surface"]) == 3
+            and all(
+                isinstance(value, (int, float)) for value in entry["surface"]
+            )
+            and isinstance(entry.get("azimuth_deg"), (int, float))
+        ):
+            return "некорректная запись скважины"
+        problem = range_problem(entry.get("stations"), _STATIONS_DIR)
+        if not problem and entry.get("dev_export_rows") is not None:
+            problem = range_problem(entry["dev_export_rows"], _DEV_EXPORT_DIR)
+        if problem:
+            return f"{problem} скважины `{entry['name']}`"
+    plans = manifest.get("plans")
+    if not isinstance(plans, list):
+        return "нет списка планов"
+    for entry in plans:
+        if not (
+            isinstance(entry, dict)
+            and isinstance(entry.get("name"), str)
+            and isinstance(entry.get("model"), dict)
+        ):
+            return "некорректная запись плана"
+        problem = range_problem(entry.get("stations"), _PLAN_STATIONS_DIR)
+        if problem:
+            return f"{problem} плана `{entry['name']}`"
+    rows = manifest.get("plan_summary_rows")
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        return "некорректные строки сводки планов"
+    return ""
+
+
+def _entry_index(key: int | str, index_by_name: dict[str, int], size: int) -> int:
+    index = index_by_name.get(key) if isinstance(key, str) else int(key)
+    if index is None or not 0 <= index < size:
+        raise KeyError(key)
+    return index
+
+
+def _json_scalar(value: object) -> object:
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _missing_mask_file_name(file_name: str) -> str:
+    return f"{Path(file_name).stem}.missing.npy"
+
+
+def _write_column_group(
+    directory: Path,
+    frames: list[pd.DataFrame],
+) -> tuple[list[tuple[str, str, bool]], list[dict[str, object]]]:
+    """Concatenate frames column by column into one ``.npy`` file per column.
+
+    Returns the ``(column, file name, has missing mask)`` table and, per
+    frame, its row range and ``(column, dtype)`` list; wells lacking a
+    column get padded rows that are never read back. Missing values of text
+    columns are kept in a boolean side file, as ``.npy`` strings cannot
+    hold them.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    column_names: list[str] = []
+    for frame in frames:
+        for name in frame.columns:
+            if str(name) not in column_names:
+                column_names.append(str(name))
+    ranges: list[dict[str, object]] = []
+    offset = 0
+    for frame in frames:
+        ranges.append(
+            {
+                "start": offset,
+                "stop": offset + len(frame),
+                "columns": [
+                    (str(name), str(frame[name].dtype)) for name in frame.columns
+                ],
+            }
+        )
+        offset += len(frame)
+    files: list[tuple[str, str, bool]] = []
+    for column_index, name in enumerate(column_names):
+        parts = [_column_values(frame, name) for frame in frames]
+        if any(values.dtype.kind in "OUS" for values, _ in parts):
+            if any(
+                name in frame.columns
+                and frame[name].dtype == object
+                and values.dtype.kind == "f"
+                for frame, (values, _) in zip(frames, parts)
+            ):
+                raise ProjectStoreError(
+                    f"Столбец `{name}` числовой в одних скважинах и текстовый "
+                    "в других."
+                )
+            values = np.concatenate([values.astype(str) for values, _ in parts])
+        else:
+            values = (
+                np.concatenate([values for values, _ in parts])
+                if parts
+                else np.empty(0, dtype=float)
+            )
+        file_name = f"{column_index:03d}.npy"
+        np.save(directory / file_name, values, allow_pickle=False)
+        missing = (
+            np.concatenate([mask for _, mask in parts])
+            if parts
+            else np.zeros(0, dtype=bool)
+        )
+        has_missing = bool(missing.any())
+        if has_missing:
+            np.save(
+                directory / _missing_mask_file_name(file_name),
+                missing,
+                allow_pickle=False,
+            )
+        files.append((name, file_name, has_missing))
+    return files, ranges
+
+
+def _column_values(frame: pd.DataFrame, name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Column values plus the mask of missing object cells.
+
+    Object columns holding only numbers are stored as float64 so they come
+    back as numbers; object columns mixing text with other values are
+    refused rather than turned into strings.
+    """
+    no_missing = np.zeros(len(frame), dtype=bool)
+    if name not in frame.columns:
+        return np.full(len(frame), np.nan), no_missing
+    series = frame[name]
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(
+        series.dtype
+    ):
+        return series.to_numpy(), no_missing
+    missing = series.isna().to_numpy(dtype=bool)
+    present = series[~missing]
+    if series.dtype == object and len(present):
+        if all(_is_number(value) for value in present):
+            values = np.full(len(series), np.nan)
+            values[~missing] = present.to_numpy(dtype=float)
+            return values, missing
+        if not all(isinstance(value, str) for value in present):
+            raise ProjectStoreError(
+                f"Столбец `{name}` содержит значения разных типов: "
+                "сохраняются только текстовые или числовые столбцы."
+            )
+    text = series.astype(object).where(~missing, "").astype(str)
+    return text.to_numpy(dtype=str), missing
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(
+        value, (bool, np.bool_)
+    )
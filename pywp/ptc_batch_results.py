@@ -4,12 +4,14 @@ import inspect
 import math
 import re
 import zipfile
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import date
 from io import BytesIO
+from itertools import chain
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import BinaryIO
 
 import numpy as np
 import pandas as pd
@@ -20,7 +22,9 @@ from pywp.coordinate_integration import (
     DEFAULT_CRS,
     csv_export_crs,
     get_crs_display_suffix,
+    meridian_convergence_arrays_deg,
     meridian_convergence_series_deg,
+    transform_stations_batch_to_crs,
     transform_stations_to_crs,
     transform_xy_to_crs,
 )
@@ -64,8 +68,12 @@ __all__ = [
     "build_batch_survey_welltrack",
     "find_selected_success",
     "has_md_postcheck_warning",
+    "iter_batch_survey_dev_files",
+    "iter_batch_target_dev_files",
     "pilot_sidetrack_summary_df",
     "survey_export_azimuth_columns",
+    "write_batch_survey_dev_7z",
+    "write_batch_target_dev_7z",
 ]
 
 BATCH_SUMMARY_RENAME_COLUMNS: dict[str, str] = {
@@ -112,6 +120,10 @@ _DEV_EXPORT_REQUIRED_COLUMNS = ("MD", "X", "Y", "Z", "TVD", "DX", "DY")
 _DEV_EXPORT_ANGLE_COLUMNS = ("AZIM_TN", "INCL", "DLS", "AZIM_GN")
 _DEV_EXPORT_COLUMN_WIDTHS: tuple[int, ...] = (14, 13, 13, 12, 14, 13, 11, 15, 12, 11, 12)
 _DEV_EXPORT_DATA_ROW_PREFIX = "    "
+_DEV_EXPORT_ROW_FORMAT = _DEV_EXPORT_DATA_ROW_PREFIX + " ".join(
+    f"%{width}.6f" for width in _DEV_EXPORT_COLUMN_WIDTHS
+)
+_WELLTRACK_ROW_FORMAT = "%.6f %.6f %.6f %.6f"
 TransformXyFunc = Callable[
     [float, float, CoordinateSystem, CoordinateSystem],
     tuple[float, float],
@@ -288,20 +300,12 @@ def build_batch_survey_welltrack(
         csv_export_crs_func=csv_export_crs_func,
         transform_stations_func=transform_stations_func,
     ):
-        lines = [f"WELLTRACK {_welltrack_name_literal(str(success.name))}"]
-        for _, row in stations.iterrows():
-            lines.append(
-                " ".join(
-                    [
-                        _format_export_number(row["X_m"]),
-                        _format_export_number(row["Y_m"]),
-                        _format_export_number(row["Z_m"]),
-                        _format_export_number(row["MD_m"]),
-                    ]
-                )
+        blocks.append(
+            _welltrack_block_text(
+                str(success.name),
+                _export_number_columns(stations, ("X_m", "Y_m", "Z_m", "MD_m")),
             )
-        lines.append("/")
-        blocks.append("\n".join(lines))
+        )
     if not blocks:
         return b""
     return ("\n\n".join(blocks) + "\n").encode("utf-8")
@@ -317,20 +321,12 @@ def build_batch_target_welltrack(
     del target_crs, auto_convert, source_crs
     blocks: list[str] = []
     for record, rows in _iter_prepared_target_rows(records):
-        lines = [f"WELLTRACK {_welltrack_name_literal(str(record.name))}"]
-        for _, row in rows.iterrows():
-            lines.append(
-                " ".join(
-                    [
-                        _format_export_number(row["X_m"]),
-                        _format_export_number(row["Y_m"]),
-                        _format_export_number(row["Z_m"]),
-                        _format_export_number(row["point_md_m"]),
-                    ]
-                )
+        blocks.append(
+            _welltrack_block_text(
+                str(record.name),
+                _export_number_columns(rows, ("X_m", "Y_m", "Z_m", "point_md_m")),
             )
-        lines.append("/")
-        blocks.append("\n".join(lines))
+        )
     if not blocks:
         return b""
     return ("\n\n".join(blocks) + "\n").encode("utf-8")
@@ -347,8 +343,9 @@ def build_batch_survey_dev_7z(
     transform_stations_func: Callable[..., pd.DataFrame] = transform_stations_to_crs,
 ) -> bytes:
     buffer = BytesIO()
-    file_payloads = build_batch_survey_dev_files(
+    written = write_batch_survey_dev_7z(
         successes,
+        buffer,
         target_crs=target_crs,
         auto_convert=auto_convert,
         source_crs=source_crs,
@@ -356,16 +353,38 @@ def build_batch_survey_dev_7z(
         csv_export_crs_func=csv_export_crs_func,
         transform_stations_func=transform_stations_func,
     )
-    if not file_payloads:
-        return b""
-    with TemporaryDirectory() as temp_dir:
-        temp_root = Path(temp_dir)
-        with py7zr.SevenZipFile(buffer, mode="w") as archive:
-            for file_payload in file_payloads:
-                source_path = temp_root / str(file_payload.file_name)
-                source_path.write_bytes(bytes(file_payload.data))
-                archive.write(source_path, str(file_payload.file_name))
-    return buffer.getvalue()
+    return buffer.getvalue() if written else b""
+
+
+def write_batch_survey_dev_7z(
+    successes: list[SuccessfulWellPlan],
+    destination: str | Path | BinaryIO,
+    *,
+    target_crs: CoordinateSystem = DEFAULT_CRS,
+    auto_convert: bool = True,
+    source_crs: CoordinateSystem = DEFAULT_CRS,
+    reference_wells: tuple[ImportedTrajectoryWell, ...] = (),
+    csv_export_crs_func: Callable[..., CoordinateSystem] = csv_export_crs,
+    transform_stations_func: Callable[..., pd.DataFrame] = transform_stations_to_crs,
+) -> int:
+    """Stream per-well ``.dev`` files into a 7z archive at ``destination``.
+
+    Each file is rendered, compressed and dropped before the next one, so
+    peak memory stays at one well's text. Returns the number of archived
+    files; nothing is written when there are none.
+    """
+    return _write_dev_payloads_7z(
+        iter_batch_survey_dev_files(
+            successes,
+            target_crs=target_crs,
+            auto_convert=auto_convert,
+            source_crs=source_crs,
+            reference_wells=reference_wells,
+            csv_export_crs_func=csv_export_crs_func,
+            transform_stations_func=transform_stations_func,
+        ),
+        destination,
+    )
 
 
 def build_batch_target_dev_7z(
@@ -375,23 +394,58 @@ def build_batch_target_dev_7z(
     auto_convert: bool = True,
     source_crs: CoordinateSystem = DEFAULT_CRS,
 ) -> bytes:
-    file_payloads = build_batch_target_dev_files(
+    buffer = BytesIO()
+    written = write_batch_target_dev_7z(
         records,
+        buffer,
         target_crs=target_crs,
         auto_convert=auto_convert,
         source_crs=source_crs,
     )
-    if not file_payloads:
-        return b""
-    buffer = BytesIO()
+    return buffer.getvalue() if written else b""
+
+
+def write_batch_target_dev_7z(
+    records: list[WelltrackRecord],
+    destination: str | Path | BinaryIO,
+    *,
+    target_crs: CoordinateSystem = DEFAULT_CRS,
+    auto_convert: bool = True,
+    source_crs: CoordinateSystem = DEFAULT_CRS,
+) -> int:
+    """Stream per-well target ``.dev`` files into a 7z archive."""
+    return _write_dev_payloads_7z(
+        iter_batch_target_dev_files(
+            records,
+            target_crs=target_crs,
+            auto_convert=auto_convert,
+            source_crs=source_crs,
+        ),
+        destination,
+    )
+
+
+def _write_dev_payloads_7z(
+    payloads: Iterable[DevExportFilePayload],
+    destination: str | Path | BinaryIO,
+) -> int:
+    iterator = iter(payloads)
+    first = next(iterator, None)
+    if first is None:
+        return 0
+    written = 0
+    # py7zr keeps a reference to in-memory sources until the archive is
+    # closed, so every payload goes through one spool file that is removed
+    # as soon as it has been compressed.
     with TemporaryDirectory() as temp_dir:
-        temp_root = Path(temp_dir)
-        with py7zr.SevenZipFile(buffer, mode="w") as archive:
-            for file_payload in file_payloads:
-                source_path = temp_root / str(file_payload.file_name)
-                source_path.write_bytes(bytes(file_payload.data))
-                archive.write(source_path, str(file_payload.file_name))
-    return buffer.getvalue()
+        spool_path = Path(temp_dir) / "payload.dev"
+        with py7zr.SevenZipFile(destination, mode="w") as archive:
+            for file_payload in chain((first,), iterator):
+                spool_path.write_bytes(bytes(file_payload.data))
+                archive.write(spool_path, str(file_payload.file_name))
+                spool_path.unlink()
+                written += 1
+    return written
 
 
 def build_batch_export_package_files(
@@ -663,20 +717,49 @@ def build_batch_survey_dev_files(
     csv_export_crs_func: Callable[..., CoordinateSystem] = csv_export_crs,
     transform_stations_func: Callable[..., pd.DataFrame] = transform_stations_to_crs,
 ) -> tuple[DevExportFilePayload, ...]:
-    del target_crs, auto_convert
-    used_names: set[str] = set()
-    payloads: list[DevExportFilePayload] = []
-    for index, (success, stations) in enumerate(
-        _iter_prepared_success_stations(
+    return tuple(
+        iter_batch_survey_dev_files(
             successes,
-            target_crs=source_crs,
-            auto_convert=False,
+            target_crs=target_crs,
+            auto_convert=auto_convert,
             source_crs=source_crs,
+            reference_wells=reference_wells,
             csv_export_crs_func=csv_export_crs_func,
             transform_stations_func=transform_stations_func,
-        ),
-        start=1,
-    ):
+        )
+    )
+
+
+def iter_batch_survey_dev_files(
+    successes: list[SuccessfulWellPlan],
+    *,
+    target_crs: CoordinateSystem = DEFAULT_CRS,
+    auto_convert: bool = True,
+    source_crs: CoordinateSystem = DEFAULT_CRS,
+    reference_wells: tuple[ImportedTrajectoryWell, ...] = (),
+    csv_export_crs_func: Callable[..., CoordinateSystem] = csv_export_crs,
+    transform_stations_func: Callable[..., pd.DataFrame] = transform_stations_to_crs,
+) -> Iterator[DevExportFilePayload]:
+    """Yield ``.dev`` payloads one well at a time.
+
+    Stations are prepared and meridian convergence prefetched for all wells
+    up front; the text of each file is rendered only when it is requested.
+    """
+    del target_crs, auto_convert
+    used_names: set[str] = set()
+    prepared = _iter_prepared_success_stations(
+        successes,
+        target_crs=source_crs,
+        auto_convert=False,
+        source_crs=source_crs,
+        csv_export_crs_func=csv_export_crs_func,
+        transform_stations_func=transform_stations_func,
+    )
+    _prefetch_meridian_convergence(
+        [stations for _, stations in prepared],
+        source_crs,
+    )
+    for index, (success, stations) in enumerate(prepared, start=1):
         if len(stations.index) < 2:
             continue
         file_name = _unique_export_file_name(
@@ -685,19 +768,16 @@ def build_batch_survey_dev_files(
             extension=".dev",
             used_names=used_names,
         )
-        payloads.append(
-            DevExportFilePayload(
-                well_name=str(success.name),
-                file_name=file_name,
-                data=_dev_export_text(
-                    success=success,
-                    stations=stations,
-                    reference_wells=reference_wells,
-                    source_crs=source_crs,
-                ).encode("utf-8"),
-            )
+        yield DevExportFilePayload(
+            well_name=str(success.name),
+            file_name=file_name,
+            data=_dev_export_text(
+                success=success,
+                stations=stations,
+                reference_wells=reference_wells,
+                source_crs=source_crs,
+            ).encode("utf-8"),
         )
-    return tuple(payloads)
 
 
 def build_batch_target_dev_files(
@@ -707,9 +787,25 @@ def build_batch_target_dev_files(
     auto_convert: bool = True,
     source_crs: CoordinateSystem = DEFAULT_CRS,
 ) -> tuple[DevExportFilePayload, ...]:
+    return tuple(
+        iter_batch_target_dev_files(
+            records,
+            target_crs=target_crs,
+            auto_convert=auto_convert,
+            source_crs=source_crs,
+        )
+    )
+
+
+def iter_batch_target_dev_files(
+    records: list[WelltrackRecord],
+    *,
+    target_crs: CoordinateSystem = DEFAULT_CRS,
+    auto_convert: bool = True,
+    source_crs: CoordinateSystem = DEFAULT_CRS,
+) -> Iterator[DevExportFilePayload]:
     del target_crs, auto_convert
     used_names: set[str] = set()
-    payloads: list[DevExportFilePayload] = []
     for index, (record, rows) in enumerate(_iter_prepared_target_rows(records), start=1):
         if rows.empty:
             continue
@@ -719,18 +815,15 @@ def build_batch_target_dev_files(
             extension=".dev",
             used_names=used_names,
         )
-        payloads.append(
-            DevExportFilePayload(
-                well_name=str(record.name),
-                file_name=file_name,
-                data=_target_dev_export_text(
-                    record=record,
-                    rows=rows,
-                    source_crs=source_crs,
-                ).encode("utf-8"),
-            )
+        yield DevExportFilePayload(
+            well_name=str(record.name),
+            file_name=file_name,
+            data=_target_dev_export_text(
+                record=record,
+                rows=rows,
+                source_crs=source_crs,
+            ).encode("utf-8"),
         )
-    return tuple(payloads)
 
 
 def dev_export_file_name(name: str, *, fallback_index: int = 1) -> str:
@@ -760,6 +853,25 @@ def _iter_prepared_success_stations(
         source_crs=source_crs,
         csv_export_crs_func=csv_export_crs_func,
     )
+    prepared = _sanitized_success_stations(successes)
+    if export_context.should_transform:
+        transformed_frames = _transform_export_stations(
+            [stations for _, stations in prepared],
+            target_crs=target_crs,
+            source_crs=source_crs,
+            transform_stations_func=transform_stations_func,
+        )
+        prepared = [
+            (success, stations)
+            for (success, _), stations in zip(prepared, transformed_frames)
+            if not stations.empty
+        ]
+    return prepared
+
+
+def _sanitized_success_stations(
+    successes: list[SuccessfulWellPlan],
+) -> list[tuple[SuccessfulWellPlan, pd.DataFrame]]:
     prepared: list[tuple[SuccessfulWellPlan, pd.DataFrame]] = []
     for success in successes:
         stations = success.stations.copy()
@@ -770,18 +882,60 @@ def _iter_prepared_success_stations(
         stations = _sanitize_export_stations(stations)
         if stations.empty:
             continue
-        if export_context.should_transform:
-            stations = transform_stations_func(
+        prepared.append((success, stations))
+    return prepared
+
+
+def _transform_export_stations(
+    frames: list[pd.DataFrame],
+    *,
+    target_crs: CoordinateSystem,
+    source_crs: CoordinateSystem,
+    transform_stations_func: Callable[..., pd.DataFrame],
+) -> list[pd.DataFrame]:
+    """Transform all wells at once unless a custom transform is injected."""
+    if transform_stations_func is transform_stations_to_crs:
+        transformed_frames = transform_stations_batch_to_crs(
+            frames,
+            target_crs,
+            source_crs,
+            rename_columns=False,
+        )
+    else:
+        transformed_frames = [
+            transform_stations_func(
                 stations,
                 target_crs,
                 source_crs,
                 rename_columns=False,
             )
-            stations = _sanitize_export_stations(stations)
-            if stations.empty:
-                continue
-        prepared.append((success, stations))
-    return prepared
+            for stations in frames
+        ]
+    return [_sanitize_export_stations(stations) for stations in transformed_frames]
+
+
+def _prefetch_meridian_convergence(
+    frames: list[pd.DataFrame],
+    crs: CoordinateSystem,
+) -> None:
+    """Compute convergence of all wells in one pass to fill the CRS cache.
+
+    Per-well ``meridian_convergence_series_deg`` calls made while building
+    the export rows are then served from the cache.
+    """
+    if frames:
+        meridian_convergence_arrays_deg(
+            [
+                np.column_stack(
+                    [
+                        stations["X_m"].to_numpy(dtype=float),
+                        stations["Y_m"].to_numpy(dtype=float),
+                    ]
+                )
+                for stations in frames
+            ],
+            crs,
+        )
 
 
 def _build_batch_survey_export_frame(
@@ -804,33 +958,41 @@ def _build_batch_survey_export_frame(
         source_crs=source_crs,
         csv_export_crs_func=csv_export_crs_func,
     )
-    frames: list[pd.DataFrame] = []
-    for success in successes:
-        source_stations = success.stations.copy()
-        if source_stations.empty or not set(_SURVEY_EXPORT_REQUIRED_COLUMNS).issubset(
-            source_stations.columns
+    prepared = [
+        (success, source_stations, source_stations.copy())
+        for success, source_stations in _sanitized_success_stations(successes)
+    ]
+    if export_context.should_transform:
+        transformed_frames = _transform_export_stations(
+            [export_stations for _, _, export_stations in prepared],
+            target_crs=target_crs,
+            source_crs=source_crs,
+            transform_stations_func=transform_stations_func,
+        )
+        aligned: list[tuple[SuccessfulWellPlan, pd.DataFrame, pd.DataFrame]] = []
+        for (success, source_stations, _), export_stations in zip(
+            prepared, transformed_frames
         ):
-            continue
-        source_stations = _sanitize_export_stations(source_stations)
-        if source_stations.empty:
-            continue
-
-        export_stations = source_stations.copy()
-        if export_context.should_transform:
-            export_stations = transform_stations_func(
-                export_stations,
-                target_crs,
-                source_crs,
-                rename_columns=False,
-            )
-            export_stations = _sanitize_export_stations(export_stations)
             if export_stations.empty:
                 continue
             source_stations = _align_stations_by_md(source_stations, export_stations)
             export_stations = _align_stations_by_md(export_stations, source_stations)
             if source_stations.empty or export_stations.empty:
                 continue
+            aligned.append((success, source_stations, export_stations))
+        prepared = aligned
+    _prefetch_meridian_convergence(
+        [source_stations for _, source_stations, _ in prepared],
+        source_crs,
+    )
+    if export_context.export_crs != source_crs:
+        _prefetch_meridian_convergence(
+            [export_stations for _, _, export_stations in prepared],
+            export_context.export_crs,
+        )
 
+    frames: list[pd.DataFrame] = []
+    for success, source_stations, export_stations in prepared:
         azimuth_true_deg, azimuth_grid_deg = survey_export_azimuth_columns(
             source_stations=source_stations,
             export_stations=export_stations,
@@ -1248,8 +1410,11 @@ def _dev_export_text(
         "    MD            X            Y            Z           TVD           DX           DY         AZIM_TN        INCL        DLS        AZIM_GN",
         "#==============================================================================================================================================",
     ]
-    for _, row in rows.iterrows():
-        lines.append(_format_dev_export_data_row(row))
+    lines.append(
+        _format_dev_export_data_block(
+            _export_number_columns(rows, _DEV_EXPORT_COLUMNS)
+        )
+    )
     return "\n".join(lines) + "\n"
 
 
@@ -1658,95 +1823,76 @@ def _target_dev_export_text(
         "#==============================================================================================================================================",
     ]
 
+    x_values, y_values, z_values = _export_number_columns(
+        rows, ("X_m", "Y_m", "Z_m")
+    ).T
+    dx = np.diff(x_values)
+    dy = np.diff(y_values)
+    dz = np.diff(z_values)
+    segment_length_m = np.sqrt(dx * dx + dy * dy + dz * dz)
+    horizontal_offset_m = np.hypot(dx, dy)
+    has_length = segment_length_m > 1e-9
+    # Degenerate segments keep the previous direction, starting from vertical.
+    inc_deg = _forward_filled_from_zero(
+        np.where(
+            has_length,
+            np.degrees(np.arctan2(horizontal_offset_m, dz)),
+            np.nan,
+        )
+    )
+    grid_azi_deg = _forward_filled_from_zero(
+        np.where(
+            horizontal_offset_m > 1e-9,
+            np.degrees(np.arctan2(dx, dy)) % 360.0,
+            np.nan,
+        )
+    )
+    dogleg_deg = np.degrees(
+        dogleg_angle_rad(inc_deg[:-1], grid_azi_deg[:-1], inc_deg[1:], grid_azi_deg[1:])
+    )
+    dls_deg_per_30m = np.zeros_like(x_values)
+    dls_deg_per_30m[1:] = np.where(
+        has_length,
+        dogleg_deg * 30.0 / np.where(has_length, segment_length_m, 1.0),
+        0.0,
+    )
+    true_azi_deg = grid_azi_deg.copy()
     convergence = meridian_convergence_series_deg(
         rows["X_m"],
         rows["Y_m"],
         source_crs,
     )
-    cumulative_md = 0.0
-    prev_inc_deg = 0.0
-    prev_azi_deg = 0.0
-    prev_x = surface_x
-    prev_y = surface_y
-    prev_z = surface_z
-    for index, row in rows.iterrows():
-        x_value = _station_float(row, "X_m")
-        y_value = _station_float(row, "Y_m")
-        z_value = _station_float(row, "Z_m")
-        if int(index) == 0:
-            inc_deg = 0.0
-            grid_azi_deg = 0.0
-            dls_deg_per_30m = 0.0
-        else:
-            dx = x_value - prev_x
-            dy = y_value - prev_y
-            dz = z_value - prev_z
-            segment_length_m = math.sqrt(dx * dx + dy * dy + dz * dz)
-            cumulative_md += segment_length_m
-            horizontal_offset_m = math.hypot(dx, dy)
-            inc_deg = (
-                math.degrees(math.atan2(horizontal_offset_m, dz))
-                if segment_length_m > 1e-9
-                else prev_inc_deg
-            )
-            grid_azi_deg = (
-                math.degrees(math.atan2(dx, dy)) % 360.0
-                if horizontal_offset_m > 1e-9
-                else prev_azi_deg
-            )
-            dogleg_deg = math.degrees(
-                float(
-                    dogleg_angle_rad(
-                        prev_inc_deg,
-                        prev_azi_deg,
-                        inc_deg,
-                        grid_azi_deg,
-                    )
-                )
-            )
-            dls_deg_per_30m = (
-                dogleg_deg * 30.0 / segment_length_m
-                if segment_length_m > 1e-9
-                else 0.0
-            )
-        true_azi_deg = grid_azi_deg
-        if int(index) != 0 and convergence is not None:
-            convergence_value = float(convergence[int(index)])
-            if math.isfinite(convergence_value):
-                true_azi_deg = float((grid_azi_deg + convergence_value) % 360.0)
-        lines.append(
-            _format_dev_export_data_values(
-                cumulative_md,
-                x_value,
-                y_value,
-                -z_value,
-                z_value - surface_z,
-                x_value - surface_x,
-                y_value - surface_y,
-                true_azi_deg,
-                inc_deg,
-                dls_deg_per_30m,
-                grid_azi_deg,
-            )
-        )
-        prev_x = x_value
-        prev_y = y_value
-        prev_z = z_value
-        prev_inc_deg = inc_deg
-        prev_azi_deg = grid_azi_deg
+    if convergence is not None:
+        convergence_values = np.asarray(convergence, dtype=float)
+        corrected = np.isfinite(convergence_values)
+        corrected[0] = False
+        true_azi_deg[corrected] = (
+            grid_azi_deg[corrected] + convergence_values[corrected]
+        ) % 360.0
+    values = np.column_stack(
+        [
+            np.concatenate([[0.0], np.cumsum(segment_length_m)]),
+            x_values,
+            y_values,
+            -z_values,
+            z_values - surface_z,
+            x_values - surface_x,
+            y_values - surface_y,
+            true_azi_deg,
+            inc_deg,
+            dls_deg_per_30m,
+            grid_azi_deg,
+        ]
+    )
+    lines.append(_format_dev_export_data_block(values))
     return "\n".join(lines) + "\n"
 
 
-def _station_float(row: pd.Series, column: str) -> float:
-    if column not in row:
-        return 0.0
-    try:
-        value = float(row[column])
-    except (TypeError, ValueError):
-        return 0.0
-    if not math.isfinite(value):
-        return 0.0
-    return value
+def _forward_filled_from_zero(segment_values: np.ndarray) -> np.ndarray:
+    """Prepend 0 for the first station and carry values over NaN gaps."""
+    values = np.concatenate([[0.0], segment_values])
+    filled_index = np.where(np.isfinite(values), np.arange(values.size), 0)
+    return values[np.maximum.accumulate(filled_index)]
 
 
 def _welltrack_name_literal(name: str) -> str:
@@ -1770,29 +1916,45 @@ def _format_export_number(value: object) -> str:
     return f"{numeric_value:.6f}"
 
 
-def _format_padded_export_number(value: object, *, width: int) -> str:
-    text = _format_export_number(value)
-    if len(text) >= width:
-        return text
-    return text.rjust(width)
+def _export_number_columns(frame: pd.DataFrame, columns: Iterable[str]) -> np.ndarray:
+    """Numeric (N, k) block; missing, unparsable and non-finite values are 0."""
+    block = np.column_stack(
+        [
+            (
+                pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=float)
+                if column in frame.columns
+                else np.zeros(len(frame.index))
+            )
+            for column in columns
+        ]
+    )
+    block[~np.isfinite(block)] = 0.0
+    return block
 
 
-def _format_dev_export_data_values(*values: object) -> str:
-    if len(values) != len(_DEV_EXPORT_COLUMNS):
-        raise ValueError(
-            f"expected {len(_DEV_EXPORT_COLUMNS)} .dev values, got {len(values)}"
-        )
-    parts = [
-        _format_padded_export_number(value, width=width)
-        for value, width in zip(values, _DEV_EXPORT_COLUMN_WIDTHS, strict=True)
-    ]
-    return _DEV_EXPORT_DATA_ROW_PREFIX + " ".join(parts)
+def _format_export_rows(values: np.ndarray, row_format: str) -> str:
+    """Render an (N, k) block with one ``%`` pass over all of its numbers.
 
+    Numbers are normalized like ``_format_export_number``: non-finite values
+    print as 0, as do magnitudes below 5e-10.
+    """
+    if not len(values):
+        return ""
+    numbers = np.array(values, dtype=float)
+    numbers[~np.isfinite(numbers) | (np.abs(numbers) < 5e-10)] = 0.0
+    return "\n".join([row_format] * len(numbers)) % tuple(numbers.ravel().tolist())
 
-def _format_dev_export_data_row(row: pd.Series) -> str:
-    return _format_dev_export_data_values(
-        *(row[column] for column in _DEV_EXPORT_COLUMNS)
-    )
+
+def _format_dev_export_data_block(values: np.ndarray) -> str:
+    return _format_export_rows(values, _DEV_EXPORT_ROW_FORMAT)
+
+
+def _welltrack_block_text(name: str, values: np.ndarray) -> str:
+    lines = [f"WELLTRACK {_welltrack_name_literal(name)}"]
+    if len(values):
+        lines.append(_format_export_rows(values, _WELLTRACK_ROW_FORMAT))
+    lines.append("/")
+    return "\n".join(lines)
 
 
 def _unique_export_file_name(
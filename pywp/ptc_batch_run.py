@@ -9,6 +9,13 @@ from typing import Any
 import streamlit as st
 import pandas as pd
 
+from pywp.anticollision_rerun import StreamingAntiCollisionAnalysis
+from pywp.batch_cost_model import (
+    BatchParallelOverhead,
+    estimate_batch_costs,
+    longest_first_order,
+    runtime_history_by_name,
+)
 from pywp.eclipse_welltrack import WelltrackRecord
 from pywp.models import OPTIMIZATION_ANTI_COLLISION_AVOIDANCE, TrajectoryConfig
 from pywp.pilot_wells import (
@@ -51,6 +58,7 @@ __all__ = [
     "LOG_VERBOSE",
     "batch_selection_status",
     "run_batch_if_clicked",
+    "merge_anticollision_stream_caches",
     "store_merged_batch_results",
     "sync_selection_state",
 ]
@@ -99,6 +107,10 @@ class BatchRunHooks:
     focus_all_wells_trajectory_results: Callable[[], None]
     manual_override_signature: Callable[[], tuple[object, ...]]
     manual_override_signature_key: str
+    build_anticollision_stream: (
+        Callable[[list[WelltrackRecord]], StreamingAntiCollisionAnalysis | None]
+        | None
+    ) = None
 
 
 def sync_selection_state(
@@ -364,6 +376,22 @@ def store_merged_batch_results(
     )
 
 
+def merge_anticollision_stream_caches(
+    state: MutableMapping[str, object],
+    *,
+    well_cache: Mapping[str, object],
+    pair_cache: Mapping[tuple[str, str], object],
+) -> None:
+    """Seed the anti-collision cache with cones and pairs built during a batch."""
+    cache = dict(state.get("wt_anticollision_analysis_cache") or {})
+    for key, entries in (("well_cache", well_cache), ("pair_cache", pair_cache)):
+        previous = cache.get(key)
+        merged = dict(previous) if isinstance(previous, Mapping) else {}
+        merged.update(entries)
+        cache[key] = merged
+    state["wt_anticollision_analysis_cache"] = cache
+
+
 def run_batch_if_clicked(
     *,
     requests: Sequence[BatchRunRequest],
@@ -421,6 +449,15 @@ def run_batch_if_clicked(
         str(item.name): item for item in (state.get("wt_successes") or ())
     }
     reference_wells_for_run = hooks.reference_wells_from_state()
+    predicted_cost_s_by_name = {
+        name: float(estimate.predicted_s)
+        for name, estimate in estimate_batch_costs(
+            records_for_run,
+            history_runtime_s_by_name=runtime_history_by_name(
+                state.get("wt_successes") or ()
+            ),
+        ).items()
+    }
     prepared_snapshot = dict(state.get("wt_prepared_recommendation_snapshot") or {})
     prepared_override_names = {
         str(name) for name in (state.get("wt_prepared_well_overrides") or {}).keys()
@@ -590,14 +627,54 @@ def run_batch_if_clicked(
             ):
                 append_log(
                     "Параллельный расчёт частично: независимые скважины и пилоты "
-                    "считаются параллельно, боковые стволы — после готовности "
-                    "пилота."
+                    "считаются параллельно, каждый боковой ствол запускается "
+                    "сразу после готовности своего пилота."
+                )
+            if parallel_requested and dynamic_cluster_context is None:
+                launch_order = [
+                    name
+                    for name in longest_first_order(
+                        selected_execution_order, predicted_cost_s_by_name
+                    )
+                    if name in predicted_cost_s_by_name
+                ]
+                append_log(
+                    "Порядок запуска по прогнозу времени расчёта: "
+                    + ", ".join(
+                        f"{name} (~{predicted_cost_s_by_name[name]:.1f} с)"
+                        for name in launch_order
+                    )
+                    + ".",
+                    verbose_only=True,
+                )
+                append_log(
+                    "Стадии решателя выполняются в отдельных процессах: "
+                    "прогресс обновляется по мере завершения скважин.",
+                    verbose_only=True,
                 )
-            elif parallel_requested and dynamic_cluster_context is not None:
+            if parallel_requested and dynamic_cluster_context is not None:
                 append_log(
                     "Параллельный расчёт отключён: активен пошаговый пересчёт "
                     "по кластеру (скважины зависят друг от друга)."
                 )
+            anticollision_stream = (
+                hooks.build_anticollision_stream(records_for_run)
+                if hooks.build_anticollision_stream is not None
+                and parallel_requested
+                and dynamic_cluster_context is None
+                else None
+            )
+
+            def log_stream_conflicts() -> None:
+                if anticollision_stream is None:
+                    return
+                for conflict in anticollision_stream.pop_conflicts():
+                    append_log(
+                        "Anti-collision (предварительно): пересечение конусов "
+                        f"{conflict.well_a} ↔ {conflict.well_b}, "
+                        f"минимальный SF {conflict.worst_separation_factor:.2f}."
+                    )
+
             if pad_layout_active:
                 append_log(
                     "Активна раскладка устьев по кустам: перед расчетом применены "
@@ -666,6 +743,7 @@ def run_batch_if_clicked(
                     int(round(end_fraction * 100.0)),
                     text=f"{index}/{total}: {name} · завершено",
                 )
+                log_stream_conflicts()
                 status = str(row.get("Статус", "—"))
                 raw_problem_text = str(row.get("Проблема", "")).strip()
                 problem_text = (
@@ -694,25 +772,79 @@ def run_batch_if_clicked(
                 else:
                     append_log(f"{name}: {status}.")
 
-            summary_rows, successes = batch.evaluate(
-                records=records_for_run,
-                selected_names=selected_set,
-                selected_order=selected_execution_order,
-                config=request.config,
-                config_by_name=config_by_name,
-                optimization_context_by_name=optimization_context_by_name,
-                sidetrack_window_overrides_by_name=(
-                    request.sidetrack_window_overrides_by_name
-                ),
-                reference_wells=reference_wells_for_run,
-                dynamic_cluster_context=dynamic_cluster_context,
-                progress_callback=on_progress,
-                solver_progress_callback=on_solver_progress,
-                record_done_callback=on_record_done,
-                parallel_workers=int(request.parallel_workers),
-            )
+            try:
+                summary_rows, successes = batch.evaluate(
+                    records=records_for_run,
+                    selected_names=selected_set,
+                    selected_order=selected_execution_order,
+                    config=request.config,
+                    config_by_name=config_by_name,
+                    optimization_context_by_name=optimization_context_by_name,
+                    sidetrack_window_overrides_by_name=(
+                        request.sidetrack_window_overrides_by_name
+                    ),
+                    reference_wells=reference_wells_for_run,
+                    dynamic_cluster_context=dynamic_cluster_context,
+                    progress_callback=on_progress,
+                    solver_progress_callback=on_solver_progress,
+                    record_done_callback=on_record_done,
+                    parallel_workers=int(request.parallel_workers),
+                    predicted_cost_s_by_name=predicted_cost_s_by_name,
+                    success_callback=(
+                        anticollision_stream.submit
+                        if anticollision_stream is not None
+                        else None
+                    ),
+                )
+            finally:
+                stream_caches = (
+                    anticollision_stream.finish()
+                    if anticollision_stream is not None
+                    else None
+                )
+            if stream_caches is not None:
+                log_stream_conflicts()
+                stream_failed_names = (
+                    anticollision_stream.failed_well_names
+                    if anticollision_stream is not None
+                    else ()
+                )
+                if stream_failed_names:
+                    append_log(
+                        "Anti-collision (предварительно): не удалось обработать "
+                        f"скважины {', '.join(stream_failed_names)}; они будут "
+                        "учтены в полном расчёте anti-collision."
+                    )
+                merge_anticollision_stream_caches(
+                    state,
+                    well_cache=stream_caches[0],
+                    pair_cache=stream_caches[1],
+                )
             batch_metadata = batch.last_evaluation_metadata
+            parallel_worker_count = int(
+                getattr(batch_metadata, "parallel_worker_count", 0) or 0
+            )
+            if parallel_worker_count > 1:
+                previous_overhead = state.get("wt_batch_parallel_overhead")
+                state["wt_batch_parallel_overhead"] = (
+                    previous_overhead
+                    if isinstance(previous_overhead, BatchParallelOverhead)
+                    else BatchParallelOverhead()
+                ).updated(
+                    wall_s=float(batch_metadata.parallel_wall_s),
+                    task_runtimes_s=runtime_history_by_name(successes).values(),
+                    workers=parallel_worker_count,
+                )
             skipped_policy_count = int(len(batch_metadata.skipped_selected_names))
+            critical_path_names = tuple(
+                getattr(batch_metadata, "critical_path_well_names", ()) or ()
+            )
+            if len(critical_path_names) > 1:
+                append_log(
+                    "Критический путь зависимостей: "
+                    + " -> ".join(str(name) for name in critical_path_names)
+                    + f" ({float(batch_metadata.critical_path_runtime_s):.2f} с)."
+                )
             if dynamic_cluster_context is not None:
                 skipped_names = tuple(
                     str(name)
@@ -41,14 +41,14 @@ from pywp.actual_fund_analysis import (
     ZONE_BUILD2,
     ZONE_HOLD,
     ZONE_HORIZONTAL,
+    ActualFundDepthClusterIndex,
     ActualFundKopDepthFunction,
     ActualFundWellAnalysis,
+    ActualFundWellMetrics,
     actual_fund_depth_rows,
     actual_fund_metrics_rows,
     actual_fund_pad_rows,
-    build_actual_fund_kop_depth_function,
     build_actual_fund_well_analyses,
-    summarize_actual_fund_by_depth,
 )
 from pywp.anticollision import (
     AntiCollisionAnalysis,
@@ -94,8 +94,14 @@ from pywp.anticollision_rerun import (
     recommendation_intervals_for_moving_well as recommendation_intervals_for_moving_well_shared,
 )
 from pywp.anticollision_rerun import (
+    StreamingAntiCollisionAnalysis,
     reference_wells_in_anti_collision_scope,
 )
+from pywp.anticollision_disk_cache import (
+    AntiCollisionDiskCache,
+    default_anti_collision_disk_cache,
+    uncertainty_model_digest,
+)
 from pywp.constants import SMALL
 from pywp.coordinate_integration import (
     DEFAULT_CRS,
@@ -184,9 +190,11 @@ from pywp.uncertainty import (
     DEFAULT_UNCERTAINTY_PRESET,
     PlanningUncertaintyModel,
     normalize_uncertainty_preset,
+    planning_uncertainty_model_for_preset,
     uncertainty_preset_label,
     uncertainty_ribbon_polygon,
 )
+from pywp.visualization import is_high_volume_figure, line_trace, plot_stations
 from pywp.well_pad import (
     PAD_SURFACE_ANCHOR_CENTER,
     PAD_SURFACE_ANCHOR_FIRST,
@@ -246,12 +254,6 @@ WT_3D_FAST_REFERENCE_TARGET_POINTS = 72
 WT_3D_FAST_CALC_TARGET_POINTS = 180
 WT_3D_FAST_REFERENCE_CONE_WELL_LIMIT = 6
 WT_3D_REFERENCE_CONE_FOCUS_DISTANCE_M = REFERENCE_ANTI_COLLISION_SCOPE_DISTANCE_M
-WT_THREE_MAX_HOVER_POINTS_PER_TRACE = (
-    ptc_three_payload.WT_THREE_MAX_HOVER_POINTS_PER_TRACE
-)
-WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE = (
-    ptc_three_payload.WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE
-)
 WT_THREE_MAX_LABELS = ptc_three_payload.WT_THREE_MAX_LABELS
 WT_THREE_MAX_REFERENCE_LABELS = ptc_three_payload.WT_THREE_MAX_REFERENCE_LABELS
 WT_PAD_FOCUS_ALL = ptc_pad_state.WT_PAD_FOCUS_ALL
@@ -649,34 +651,6 @@ def _resolve_3d_render_mode(
     return WT_3D_RENDER_FAST
 
 
-def _decimate_hover_payload(
-    *,
-    points: list[list[float]],
-    hover_items: list[dict[str, object]],
-    max_points: int,
-) -> tuple[list[list[float]], list[dict[str, object]]]:
-    return ptc_three_payload.decimate_hover_payload(
-        points=points,
-        hover_items=hover_items,
-        max_points=max_points,
-    )
-
-
-def _decimated_station_frame(
-    stations: pd.DataFrame, *, target_points: int
-) -> pd.DataFrame:
-    if target_points <= 2 or len(stations.index) <= target_points:
-        return stations
-    indices = np.linspace(
-        0,
-        len(stations.index) - 1,
-        num=int(target_points),
-        dtype=int,
-    )
-    unique_indices = np.unique(indices)
-    return stations.iloc[unique_indices].reset_index(drop=True)
-
-
 def _nan_separated_xyz_segments(
     polylines_xyz: Iterable[tuple[np.ndarray, np.ndarray, np.ndarray]],
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -1204,6 +1178,7 @@ def _all_wells_three_payload(
     pilot_study_points_by_name: Mapping[str, tuple[Point3D, ...]] | None = None,
     focus_well_names: tuple[str, ...] = (),
     render_mode: str = WT_3D_RENDER_FAST,
+    fragment_cache: ptc_three_builders.ThreePayloadFragmentCache | None = None,
 ) -> dict[str, object]:
     resolved_render_mode = _resolve_3d_render_mode(
         requested_mode=render_mode,
@@ -1220,6 +1195,7 @@ def _all_wells_three_payload(
         focus_well_names=focus_well_names,
         render_mode=resolved_render_mode,
         fallback_color=_well_color,
+        fragment_cache=fragment_cache,
     )
 
 
@@ -1235,6 +1211,7 @@ def _all_wells_anticollision_three_payload(
     focus_well_names: tuple[str, ...] = (),
     render_mode: str = WT_3D_RENDER_FAST,
     show_sidetrack_relative_cones: bool = False,
+    fragment_cache: ptc_three_builders.ThreePayloadFragmentCache | None = None,
 ) -> dict[str, object]:
     analysis_reference_wells = tuple(
         well for well in analysis.wells if bool(well.is_reference_only)
@@ -1262,6 +1239,7 @@ def _all_wells_anticollision_three_payload(
         focus_well_names=focus_well_names,
         render_mode=resolved_render_mode,
         show_sidetrack_relative_cones=bool(show_sidetrack_relative_cones),
+        fragment_cache=fragment_cache,
     )
 
 
@@ -1970,6 +1948,17 @@ def _cached_anti_collision_view_model(
             previous_well_cache = None
         if not isinstance(previous_pair_cache, Mapping):
             previous_pair_cache = None
+        disk_cache = default_anti_collision_disk_cache()
+        model_digest = uncertainty_model_digest(uncertainty_model)
+        if disk_cache is not None:
+            previous_well_cache, previous_pair_cache = _merge_disk_anti_collision_cache(
+                disk_cache,
+                well_signature_by_name=well_signature_by_name,
+                model_digest=model_digest,
+                previous_well_cache=previous_well_cache,
+                previous_pair_cache=previous_pair_cache,
+                emit=_emit,
+            )
         analysis, well_cache, pair_cache, incremental_stats = (
             _build_incremental_anti_collision_analysis(
                 successes,
@@ -2008,6 +1997,14 @@ def _cached_anti_collision_view_model(
                     f"пар {incremental_stats.recalculated_pair_count}."
                 ),
             )
+        if disk_cache is not None:
+            disk_cache.store(
+                well_cache=well_cache,
+                pair_cache=pair_cache,
+                well_signature_by_name=well_signature_by_name,
+                model_digest=model_digest,
+            )
+            disk_cache.evict_if_needed()
         _emit(72, "Построение рекомендаций anti-collision.")
         recommendations = build_anti_collision_recommendations(
             analysis,
@@ -2058,6 +2055,50 @@ def _cached_anti_collision_view_model(
     return analysis, recommendations, clusters
 
 
+def _merge_disk_anti_collision_cache(
+    disk_cache: AntiCollisionDiskCache,
+    *,
+    well_signature_by_name: Mapping[str, str],
+    model_digest: str,
+    previous_well_cache: Mapping[str, tuple[str, AntiCollisionWell]] | None,
+    previous_pair_cache: (
+        Mapping[tuple[str, str], AntiCollisionPairCacheEntry] | None
+    ),
+    emit: Callable[[int, str], None],
+) -> tuple[
+    dict[str, tuple[str, AntiCollisionWell]] | None,
+    dict[tuple[str, str], AntiCollisionPairCacheEntry] | None,
+]:
+    well_cache = dict(previous_well_cache or {})
+    pair_cache = dict(previous_pair_cache or {})
+    missing_signatures = {
+        str(name): str(signature)
+        for name, signature in well_signature_by_name.items()
+        if str((well_cache.get(str(name)) or ("",))[0]) != str(signature)
+    }
+    disk_wells = disk_cache.load_wells(missing_signatures, model_digest=model_digest)
+    well_cache.update(disk_wells)
+    disk_pairs = disk_cache.load_pairs(
+        well_signature_by_name,
+        model_digest=model_digest,
+        known_pair_keys=pair_cache.keys(),
+    )
+    pair_cache.update(disk_pairs)
+    if disk_wells or disk_pairs:
+        emit(
+            12,
+            (
+                "Дисковый кэш anti-collision: "
+                f"скважин {len(disk_wells)}, пар {len(disk_pairs)}."
+            ),
+        )
+    # Nothing cached in session or on disk still means a cold start.
+    return (
+        well_cache if previous_well_cache is not None or disk_wells else None,
+        pair_cache if previous_pair_cache is not None or disk_pairs else None,
+    )
+
+
 def _current_anti_collision_cache_snapshot(
     *,
     successes: list[SuccessfulWellPlan],
@@ -2894,6 +2935,10 @@ def _all_wells_plan_figure(
     color_map = name_to_color or {
         str(item.name): _well_color(index) for index, item in enumerate(successes)
     }
+    high_volume = is_high_volume_figure(
+        *(item.stations for item in successes),
+        *(reference_well.stations for reference_well in reference_wells),
+    )
     for index, item in enumerate(successes):
         line_color = color_map.get(str(item.name), _well_color(index))
         line_dash = "solid"
@@ -2904,19 +2949,21 @@ def _all_wells_plan_figure(
         if not focus_set or str(item.name) in focus_set:
             x_focus_arrays.append(stations["X_m"].to_numpy(dtype=float))
             y_focus_arrays.append(stations["Y_m"].to_numpy(dtype=float))
+        plot_df = plot_stations(stations, high_volume)
         fig.add_trace(
-            go.Scatter(
-                x=stations["X_m"],
-                y=stations["Y_m"],
+            line_trace(
+                high_volume,
+                x=plot_df["X_m"],
+                y=plot_df["Y_m"],
                 mode="lines",
                 name=name,
                 line={"width": 1.5, "color": line_color, "dash": line_dash},
                 customdata=np.column_stack(
                     [
-                        stations["Z_m"].to_numpy(dtype=float),
-                        stations["MD_m"].to_numpy(dtype=float),
+                        plot_df["Z_m"].to_numpy(dtype=float),
+                        plot_df["MD_m"].to_numpy(dtype=float),
                         dls_to_pi(
-                            stations["DLS_deg_per_30m"]
+                            plot_df["DLS_deg_per_30m"]
                             .fillna(0.0)
                             .to_numpy(dtype=float)
                         ),
@@ -2976,19 +3023,19 @@ def _all_wells_plan_figure(
             str(reference_well.kind),
             "#A0A0A0",
         )
-        x_values = stations["X_m"].to_numpy(dtype=float)
-        y_values = stations["Y_m"].to_numpy(dtype=float)
-        x_arrays.append(x_values)
-        y_arrays.append(y_values)
+        x_arrays.append(stations["X_m"].to_numpy(dtype=float))
+        y_arrays.append(stations["Y_m"].to_numpy(dtype=float))
+        plot_df = plot_stations(stations, high_volume)
         fig.add_trace(
-            go.Scatter(
-                x=x_values,
-                y=y_values,
+            line_trace(
+                high_volume,
+                x=plot_df["X_m"].to_numpy(dtype=float),
+                y=plot_df["Y_m"].to_numpy(dtype=float),
                 mode="lines",
                 name=reference_well_display_label(reference_well),
                 showlegend=False,
                 line={"width": 2, "color": line_color},
-                customdata=np.column_stack([stations["MD_m"].to_numpy(dtype=float)]),
+                customdata=np.column_stack([plot_df["MD_m"].to_numpy(dtype=float)]),
                 hovertemplate=(
                     "Тип: "
                     + REFERENCE_WELL_KIND_LABELS.get(
@@ -3152,6 +3199,20 @@ def _all_wells_anticollision_plan_figure(
     focus_set = {str(name) for name in focus_well_names if str(name).strip()}
     well_lookup = {str(well.name): well for well in analysis.wells}
     target_color_map = dict(name_to_color or {})
+    analysis_reference_wells = _analysis_reference_wells(analysis)
+    display_only_reference_wells = _display_only_reference_wells_for_analysis(
+        reference_wells=reference_wells,
+        analysis_reference_wells=analysis_reference_wells,
+    )
+    high_volume = is_high_volume_figure(
+        *(well.stations for well in analysis.wells),
+        *(
+            success.stations
+            for success in (previous_successes_by_name or {}).values()
+            if str(success.name) in well_lookup
+        ),
+        *(reference_well.stations for reference_well in display_only_reference_wells),
+    )
 
     for well in analysis.wells:
         well_label = (
@@ -3184,14 +3245,12 @@ def _all_wells_anticollision_plan_figure(
                 x_focus_arrays.append(ribbon[:, 0])
                 y_focus_arrays.append(ribbon[:, 1])
 
-        stations = well.stations
-        x_values = stations["X_m"].to_numpy(dtype=float)
-        y_values = stations["Y_m"].to_numpy(dtype=float)
-
+        plot_df = plot_stations(well.stations, high_volume)
         fig.add_trace(
-            go.Scatter(
-                x=x_values,
-                y=y_values,
+            line_trace(
+                high_volume,
+                x=plot_df["X_m"].to_numpy(dtype=float),
+                y=plot_df["Y_m"].to_numpy(dtype=float),
                 mode="lines",
                 name=well_label,
                 legendgroup=str(well.name),
@@ -3203,7 +3262,7 @@ def _all_wells_anticollision_plan_figure(
                     "MD: %{customdata[0]:.2f} m"
                     "<extra>%{fullData.name}</extra>"
                 ),
-                customdata=np.column_stack([[]]),
+                customdata=np.column_stack([plot_df["MD_m"].to_numpy(dtype=float)]),
             )
         )
         previous_success = (previous_successes_by_name or {}).get(str(well.name))
@@ -3211,10 +3270,12 @@ def _all_wells_anticollision_plan_figure(
             previous_stations = previous_success.stations
             previous_x = previous_stations["X_m"].to_numpy(dtype=float)
             previous_y = previous_stations["Y_m"].to_numpy(dtype=float)
+            previous_plot_df = plot_stations(previous_stations, high_volume)
             fig.add_trace(
-                go.Scatter(
-                    x=previous_x,
-                    y=previous_y,
+                line_trace(
+                    high_volume,
+                    x=previous_plot_df["X_m"].to_numpy(dtype=float),
+                    y=previous_plot_df["Y_m"].to_numpy(dtype=float),
                     mode="lines",
                     name=f"{well.name}: до пересчёта",
                     legendgroup=str(well.name),
@@ -3225,7 +3286,7 @@ def _all_wells_anticollision_plan_figure(
                         "dash": "dot",
                     },
                     customdata=np.column_stack(
-                        [previous_stations["MD_m"].to_numpy(dtype=float)]
+                        [previous_plot_df["MD_m"].to_numpy(dtype=float)]
                     ),
                     hovertemplate=(
                         "X: %{x:.2f} m<br>"
@@ -3283,22 +3344,19 @@ def _all_wells_anticollision_plan_figure(
                     np.array([well.surface.y, well.t1.y, well.t3.y], dtype=float)
                 )
 
-    analysis_reference_wells = _analysis_reference_wells(analysis)
-    display_only_reference_wells = _display_only_reference_wells_for_analysis(
-        reference_wells=reference_wells,
-        analysis_reference_wells=analysis_reference_wells,
-    )
     for reference_well in display_only_reference_wells:
         stations = reference_well.stations
         if stations.empty or not {"X_m", "Y_m", "MD_m"}.issubset(stations.columns):
             continue
         x_values = stations["X_m"].to_numpy(dtype=float)
         y_values = stations["Y_m"].to_numpy(dtype=float)
-        md_values = stations["MD_m"].to_numpy(dtype=float)
+        plot_df = plot_stations(stations, high_volume)
+        md_values = plot_df["MD_m"].to_numpy(dtype=float)
         fig.add_trace(
-            go.Scatter(
-                x=x_values,
-                y=y_values,
+            line_trace(
+                high_volume,
+                x=plot_df["X_m"].to_numpy(dtype=float),
+                y=plot_df["Y_m"].to_numpy(dtype=float),
                 mode="lines",
                 name=reference_well_display_label(reference_well),
                 legendgroup=str(reference_well.name),
@@ -7915,6 +7973,27 @@ def _actual_fund_depth_cluster_color(index: int) -> str:
     return palette[index % len(palette)]
 
 
+_ACTUAL_FUND_DEPTH_CLUSTER_INDEX_KEY = "wt_actual_fund_depth_cluster_index"
+
+
+def _actual_fund_depth_cluster_index(
+    metrics: Iterable[ActualFundWellMetrics],
+) -> ActualFundDepthClusterIndex:
+    """Depth cluster index of the actual fund, synced in place across reruns.
+
+    The index lives in session state; wells that entered or left the fund
+    since the previous render are applied via ``add``/``remove`` instead of
+    re-clustering the whole fund.
+    """
+    index = st.session_state.get(_ACTUAL_FUND_DEPTH_CLUSTER_INDEX_KEY)
+    if isinstance(index, ActualFundDepthClusterIndex):
+        index.sync(metrics)
+        return index
+    index = ActualFundDepthClusterIndex(metrics)
+    st.session_state[_ACTUAL_FUND_DEPTH_CLUSTER_INDEX_KEY] = index
+    return index
+
+
 def _actual_fund_kop_depth_figure(
     metrics: tuple[object, ...],
 ) -> go.Figure | None:
@@ -7928,7 +8007,8 @@ def _actual_fund_kop_depth_figure(
     if not eligible_metrics:
         return None
 
-    clusters = summarize_actual_fund_by_depth(eligible_metrics)
+    depth_cluster_index = _actual_fund_depth_cluster_index(metrics)
+    clusters = depth_cluster_index.summaries()
     cluster_by_well: dict[str, str] = {}
     for cluster in clusters:
         for well_name in cluster.well_names:
@@ -7976,7 +8056,7 @@ def _actual_fund_kop_depth_figure(
             )
         )
 
-    kop_function = build_actual_fund_kop_depth_function(eligible_metrics)
+    kop_function = depth_cluster_index.kop_depth_function()
     if kop_function is not None:
         anchor_depths = np.asarray(kop_function.anchor_depths_tvd_m, dtype=float)
         anchor_kops = np.asarray(kop_function.anchor_kop_md_m, dtype=float)
@@ -8425,8 +8505,9 @@ def _render_actual_fund_analysis_panel(
     pad_count = len(
         {str(item.pad_group) for item in eligible_metrics if str(item.pad_group) != "—"}
     )
-    depth_clusters = summarize_actual_fund_by_depth(eligible_metrics)
-    kop_depth_function = build_actual_fund_kop_depth_function(eligible_metrics)
+    depth_cluster_index = _actual_fund_depth_cluster_index(metrics)
+    depth_clusters = depth_cluster_index.summaries()
+    kop_depth_function = depth_cluster_index.kop_depth_function()
     eligible_kop_values = [
         float(item.kop_md_m) for item in eligible_metrics if item.kop_md_m is not None
     ]
@@ -9942,6 +10023,44 @@ def _store_merged_batch_results(
     )
 
 
+def _build_anticollision_stream(
+    records: list[WelltrackRecord],
+) -> StreamingAntiCollisionAnalysis:
+    uncertainty_model = planning_uncertainty_model_for_preset(
+        normalize_uncertainty_preset(
+            st.session_state.get(
+                "wt_anticollision_uncertainty_preset",
+                DEFAULT_UNCERTAINTY_PRESET,
+            )
+        )
+    )
+    color_map = _well_color_map(records) if records else {}
+
+    def _well_signature(success: SuccessfulWellPlan) -> str:
+        return _anti_collision_well_signatures(
+            successes=[success],
+            model=uncertainty_model,
+            name_to_color=color_map,
+            reference_wells=(),
+        )[str(success.name)]
+
+    cache = st.session_state.get("wt_anticollision_analysis_cache")
+    cache = cache if isinstance(cache, Mapping) else {}
+    previous_well_cache = cache.get("well_cache")
+    previous_pair_cache = cache.get("pair_cache")
+    return StreamingAntiCollisionAnalysis(
+        model=uncertainty_model,
+        name_to_color=color_map,
+        well_signature=_well_signature,
+        previous_well_cache=(
+            previous_well_cache if isinstance(previous_well_cache, Mapping) else None
+        ),
+        previous_pair_cache=(
+            previous_pair_cache if isinstance(previous_pair_cache, Mapping) else None
+        ),
+    )
+
+
 def _batch_run_hooks() -> ptc_batch_run.BatchRunHooks:
     return ptc_batch_run.BatchRunHooks(
         selected_execution_order=_selected_execution_order,
@@ -9961,6 +10080,7 @@ def _batch_run_hooks() -> ptc_batch_run.BatchRunHooks:
         focus_all_wells_trajectory_results=_focus_all_wells_trajectory_results,
         manual_override_signature=_manual_well_calc_override_signature,
         manual_override_signature_key=WT_LAST_WELL_CALC_OVERRIDE_SIGNATURE_KEY,
+        build_anticollision_stream=_build_anticollision_stream,
     )
 
 
@@ -7,11 +7,14 @@ from streamlit.errors import StreamlitAPIException
 from pywp import ptc_core as wt
 from pywp import ptc_reference_state as reference_state
 from pywp import ptc_welltrack_io
+from pywp.project_store import ProjectStoreError, open_project_store, save_project_store
+from pywp.reference_dev_cache import default_reference_dev_disk_cache
 from pywp.reference_trajectories import (
     parse_reference_trajectory_dev_directories,
     parse_reference_trajectory_welltrack_text,
 )
 from pywp.pilot_wells import is_zbs_record, parent_name_for_zbs, well_name_key
+from pywp.welltrack_batch import merge_batch_results
 
 __all__ = ["render_reference_section"]
 
@@ -45,6 +48,7 @@ _REFERENCE_DEV_SOURCE_COUNT_KEY = "wt_reference_import_dev_source_count"
 _REFERENCE_WELLTRACK_SOURCE_COUNT_KEY = (
     "wt_reference_import_welltrack_source_count"
 )
+_PROJECT_STORE_PATH_KEY = "ptc_project_store_path"
 _REFERENCE_DEV_SOURCE_HELP = (
     "Импортируются все `.dev` файлы из папок. "
     "Имя берётся из файла без `.dev`, координаты - из колонок `MD X Y Z`."
@@ -547,6 +551,7 @@ def _parse_reference_sources(
     parsed_by_kind: dict[str, tuple[object, ...]] = {
         kind: () for kind in _REFERENCE_FUND_OPTIONS
     }
+    dev_disk_cache = default_reference_dev_disk_cache()
     pending_mixed_sources = _pending_mixed_legacy_reference_sources()
     if pending_mixed_sources is not None:
         parsed_lists_by_kind: dict[str, list[object]] = {
@@ -560,6 +565,7 @@ def _parse_reference_sources(
                 parse_reference_trajectory_dev_directories(
                     source_paths,
                     kind=kind,
+                    disk_cache=dev_disk_cache,
                 )
             )
         for kind, source_paths in welltrack_sources_by_kind.items():
@@ -595,6 +601,7 @@ def _parse_reference_sources(
                 parse_reference_trajectory_dev_directories(
                     source_paths,
                     kind=kind,
+                    disk_cache=dev_disk_cache,
                 )
             )
         return parsed_by_kind
@@ -773,6 +780,132 @@ def _render_combined_reference_import_block() -> None:
         "Сейчас загружено: "
         f"{actual_loaded} фактических, {approved_loaded} утверждённых проектных."
     )
+    _render_project_store_block(mode=mode, uploaded_files=uploaded_files)
+
+
+def _render_project_store_block(*, mode: str, uploaded_files: list[object]) -> None:
+    with st.expander("Проект на диске", expanded=False):
+        st.caption(
+            "Фонд и рассчитанные планы сохраняются в колоночном хранилище и "
+            "открываются без повторного разбора `.dev`/WELLTRACK файлов."
+        )
+        project_path = str(
+            st.text_input(
+                "Папка проекта",
+                key=_PROJECT_STORE_PATH_KEY,
+                placeholder="Например: D:/projects/field_a.pywp",
+            )
+            or ""
+        ).strip()
+        open_col, save_col = st.columns(2, gap="small")
+        open_clicked = open_col.button(
+            "Открыть проект",
+            key="ptc_project_store_open",
+            icon=":material/folder_open:",
+            use_container_width=True,
+        )
+        save_clicked = save_col.button(
+            "Сохранить проект",
+            key="ptc_project_store_save",
+            icon=":material/save:",
+            use_container_width=True,
+        )
+        if not (open_clicked or save_clicked):
+            return
+        if not project_path:
+            st.warning("Укажите папку проекта.")
+            return
+        if save_clicked:
+            _save_project_store(project_path)
+            return
+        if _open_project_store(
+            project_path,
+            mode=mode,
+            uploaded_files=uploaded_files,
+        ):
+            st.rerun()
+
+
+def _save_project_store(project_path: str) -> None:
+    successes = list(st.session_state.get("wt_successes") or ())
+    plan_names = {str(success.name) for success in successes}
+    plan_rows = [
+        dict(row)
+        for row in (st.session_state.get("wt_summary_rows") or ())
+        if str(row.get("Скважина", "")).strip() in plan_names
+    ]
+    reference_wells = reference_state.reference_wells_from_state()
+    try:
+        save_project_store(
+            project_path,
+            reference_wells=reference_wells,
+            plans=successes,
+            plan_summary_rows=plan_rows,
+        )
+    except (OSError, ProjectStoreError) as exc:
+        st.error(f"Не удалось сохранить проект: {exc}")
+        return
+    st.success(
+        f"Проект сохранён: {len(reference_wells)} скважин фонда, "
+        f"{len(successes)} рассчитанных планов."
+    )
+
+
+def _open_project_store(
+    project_path: str,
+    *,
+    mode: str,
+    uploaded_files: list[object],
+) -> bool:
+    plans: list[object] = []
+    plan_rows: tuple[dict[str, object], ...] = ()
+    try:
+        store = open_project_store(project_path)
+        # The reference state and every consumer downstream hold concrete
+        # wells, so opening a project still materializes all of them here;
+        # only the source parsing is skipped.
+        parsed_by_kind = {
+            kind: tuple(store.wells(kind=kind)) for kind in _REFERENCE_FUND_OPTIONS
+        }
+        plans = list(store.plans())
+        plan_rows = store.plan_summary_rows
+    except (OSError, ValueError) as exc:
+        st.warning(
+            f"Не удалось открыть проект: {exc} Фонд загружается из источников, "
+            "указанных выше."
+        )
+        try:
+            parsed_by_kind = _parse_reference_sources(
+                mode=mode,
+                uploaded_files=uploaded_files,
+            )
+        except wt.WelltrackParseError as parse_exc:
+            st.error(str(parse_exc))
+            return False
+    for kind in _REFERENCE_FUND_OPTIONS:
+        reference_state.set_reference_wells_for_kind(
+            kind=kind,
+            wells=parsed_by_kind[kind],
+        )
+        _after_reference_data_change(kind)
+    records = list(st.session_state.get("wt_records") or ())
+    if plans and not records:
+        st.info(
+            f"Планы проекта ({len(plans)}) не восстановлены: сначала загрузите "
+            "цели WELLTRACK и откройте проект ещё раз."
+        )
+        return False
+    if plans:
+        merged_rows, merged_successes = merge_batch_results(
+            records=records,
+            existing_rows=st.session_state.get("wt_summary_rows"),
+            existing_successes=st.session_state.get("wt_successes"),
+            new_rows=plan_rows,
+            new_successes=plans,
+        )
+        st.session_state["wt_summary_rows"] = merged_rows
+        st.session_state["wt_successes"] = merged_successes
+    return True
 
 
 def render_reference_section() -> None:
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import asdict, is_dataclass
 from collections.abc import Callable, Mapping, MutableMapping
+import hashlib
 import sys
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from streamlit.errors import StreamlitAPIException
@@ -12,6 +14,7 @@ from pywp import ptc_batch_results
 from pywp import ptc_core as wt
 from pywp import ptc_anticollision_params
 from pywp import ptc_reference_state as reference_state
+from pywp import ptc_three_builders
 from pywp.anticollision import (
     AntiCollisionAnalysis,
     AntiCollisionWellSegment,
@@ -119,6 +122,44 @@ def _dataframe_identity_signature(frame: object) -> tuple[int | None, int]:
     return (id(frame), int(len(frame)))
 
 
+def _dataframe_content_digest(frame: object) -> str | None:
+    if not isinstance(frame, pd.DataFrame):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(frame.shape).encode("utf-8"))
+    for column in frame.columns:
+        digest.update(str(column).encode("utf-8"))
+        values = frame[column].to_numpy()
+        if values.dtype.kind in "biufc":
+            digest.update(str(values.dtype).encode("utf-8"))
+            digest.update(np.ascontiguousarray(values).tobytes())
+        else:
+            digest.update(repr(values.tolist()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _success_fragment_signature(success: object) -> tuple[object, ...]:
+    """Content signature of a plan, so equal plans share 3D fragments."""
+    return (
+        str(getattr(success, "name", "")),
+        _dataframe_content_digest(getattr(success, "stations", None)),
+        _point_signature(getattr(success, "surface", None)),
+        _point_signature(getattr(success, "t1", None)),
+        _point_signature(getattr(success, "t3", None)),
+        successful_well_has_md_warning(success),
+        _target_pairs_signature(getattr(success, "target_pairs", ()) or ()),
+    )
+
+
+def _reference_well_fragment_signature(reference_well: object) -> tuple[object, ...]:
+    return (
+        str(getattr(reference_well, "name", "")),
+        str(getattr(reference_well, "kind", "")),
+        _dataframe_content_digest(getattr(reference_well, "stations", None)),
+        _point_signature(getattr(reference_well, "surface", None)),
+    )
+
+
 def _record_render_signature(record: object) -> tuple[object, ...]:
     points = tuple(getattr(record, "points", ()) or ())
     return (
@@ -199,6 +240,28 @@ def _results_three_payload_cache() -> dict[str, dict[str, object]]:
     return cache
 
 
+def _results_three_fragment_cache(
+    cache_key: str,
+) -> ptc_three_builders.ThreePayloadFragmentCache | None:
+    session_state = getattr(st, "session_state", None)
+    if not isinstance(session_state, MutableMapping):
+        return None
+    caches = session_state.get("wt_results_three_fragment_caches")
+    if not isinstance(caches, dict):
+        caches = {}
+        session_state["wt_results_three_fragment_caches"] = caches
+    cache = caches.get(str(cache_key))
+    if not isinstance(cache, ptc_three_builders.ThreePayloadFragmentCache):
+        cache = ptc_three_builders.ThreePayloadFragmentCache(
+            object_signatures={
+                "success": _success_fragment_signature,
+                "reference_well": _reference_well_fragment_signature,
+            }
+        )
+        caches[str(cache_key)] = cache
+    return cache
+
+
 def _pad_render_state_signature() -> tuple[object, ...]:
     session_state = getattr(st, "session_state", None)
     if not isinstance(session_state, MutableMapping):
@@ -1257,6 +1320,7 @@ def _render_anticollision_visual_overview(
             focus_well_names=focus_names or visible_focus_names,
             render_mode=wt.WT_3D_RENDER_DETAIL,
             show_sidetrack_relative_cones=False,
+            fragment_cache=_results_three_fragment_cache("anticollision_overview"),
         ),
     )
     anticollision_overrides_signature = (
@@ -1418,6 +1482,7 @@ def _render_target_edit_overview(
             pilot_study_points_by_name=resolved_pilot_study_points_by_name,
             focus_well_names=tuple(focus_pad_well_names),
             render_mode=wt.WT_3D_RENDER_FAST,
+            fragment_cache=_results_three_fragment_cache("trajectory_overview"),
         ),
     )
     trajectory_overrides_signature = (
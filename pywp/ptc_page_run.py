@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Mapping, MutableMapping
+import os
+from collections.abc import Iterable, Mapping, MutableMapping
 
 import streamlit as st
 from streamlit.errors import StreamlitAPIException
 
 from pywp import ptc_core as wt
 from pywp import ptc_reference_state
+from pywp.batch_cost_model import (
+    BatchParallelOverhead,
+    estimate_batch_costs,
+    recommended_parallel_workers,
+    runtime_history_by_name,
+)
 from pywp.pilot_wells import (
     SidetrackWindowOverride,
     is_pilot_name,
@@ -31,8 +38,7 @@ from pywp.ptc_sidetrack_state import (
 
 __all__ = ["render_run_section"]
 
-_BATCH_AUTO_PARALLEL_DISABLED_MAX_WELLS = 7
-_BATCH_AUTO_PARALLEL_FOUR_WORKERS_MIN_WELLS = 16
+_BATCH_AUTO_PARALLEL_MAX_WORKERS = 4
 
 
 def _rerun_fragment() -> None:
@@ -46,13 +52,37 @@ def _rerun_app() -> None:
     st.rerun()
 
 
-def _auto_batch_parallel_workers(selected_well_count: int) -> int:
-    well_count = int(max(selected_well_count, 0))
-    if well_count <= _BATCH_AUTO_PARALLEL_DISABLED_MAX_WELLS:
+def _auto_batch_parallel_workers(
+    *,
+    records: Iterable[object],
+    selected_names: Iterable[str],
+    state: Mapping[str, object],
+) -> int:
+    """Worker count from predicted per-well cost versus measured pool overhead."""
+    selected_keys = {well_name_key(name) for name in selected_names}
+    if not selected_keys:
         return 0
-    if well_count >= _BATCH_AUTO_PARALLEL_FOUR_WORKERS_MIN_WELLS:
-        return 4
-    return 2
+    selected_records = [
+        record
+        for record in records
+        if well_name_key(record.name) in selected_keys
+        or (
+            is_pilot_name(record.name)
+            and pilot_parent_key_for_record(record) in selected_keys
+        )
+    ]
+    estimates = estimate_batch_costs(
+        selected_records,
+        history_runtime_s_by_name=runtime_history_by_name(
+            state.get("wt_successes") or ()
+        ),
+    )
+    overhead = state.get("wt_batch_parallel_overhead")
+    return recommended_parallel_workers(
+        [estimate.predicted_s for estimate in estimates.values()],
+        max_workers=min(_BATCH_AUTO_PARALLEL_MAX_WORKERS, os.cpu_count() or 1),
+        overhead=overhead if isinstance(overhead, BatchParallelOverhead) else None,
+    )
 
 
 @st.fragment
@@ -147,7 +177,9 @@ def render_run_section(*, records: list[object]) -> None:
             if str(name).strip()
         ]
         _parallel_workers = _auto_batch_parallel_workers(
-            len(selected_names_for_parallel)
+            records=records,
+            selected_names=selected_names_for_parallel,
+            state=st.session_state,
         )
 
         run_clicked = st.form_submit_button(
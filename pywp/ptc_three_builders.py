@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from typing import Callable
+from functools import partial
+from typing import Callable, Hashable
 
 import numpy as np
 import pandas as pd
@@ -35,6 +36,7 @@ from pywp.uncertainty import (
 from pywp.welltrack_batch import SuccessfulWellPlan
 
 __all__ = [
+    "ThreePayloadFragmentCache",
     "single_well_three_payload",
     "single_well_target_only_three_payload",
     "all_wells_three_payload",
@@ -54,12 +56,6 @@ REFERENCE_PAD_GROUP_DISTANCE_M = 300.0
 WT_3D_RENDER_FAST = "Быстро"
 WT_3D_FAST_REFERENCE_TARGET_POINTS = 72
 WT_3D_FAST_CALC_TARGET_POINTS = 180
-WT_THREE_MAX_HOVER_POINTS_PER_TRACE = (
-    ptc_three_payload.WT_THREE_MAX_HOVER_POINTS_PER_TRACE
-)
-WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE = (
-    ptc_three_payload.WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE
-)
 
 
 @dataclass(frozen=True)
@@ -70,6 +66,157 @@ class _ReferencePadLabel:
     z: float
 
 
+_FRAGMENT_COLLECTIONS = ("lines", "meshes", "points", "labels")
+
+
+@dataclass(frozen=True)
+class _PayloadFragment:
+    items: Mapping[str, tuple[dict[str, object], ...]]
+    legend: tuple[dict[str, object], ...]
+    xyz: tuple[np.ndarray, np.ndarray, np.ndarray] | None
+
+
+class ThreePayloadFragmentCache:
+    """Prebuilt per-well blocks of a 3D payload, reused between rebuilds.
+
+    A block is keyed by the render signature of its source objects plus
+    every builder input that shapes it. Camera focus only decides which
+    blocks feed the focus bounds, so switching the focus well reuses every
+    block. Blocks not used by the latest build are dropped by ``prune``.
+    """
+
+    def __init__(
+        self,
+        object_signatures: Mapping[str, Callable[[object], Hashable]] | None = None,
+    ) -> None:
+        self._object_signatures = dict(object_signatures or {})
+        self._entries: dict[Hashable, tuple[tuple[object, ...], _PayloadFragment]] = {}
+        self._used_keys: set[Hashable] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def fragment(
+        self,
+        kind: str,
+        sources: tuple[object, ...],
+        params: Hashable,
+        build: Callable[..., None],
+    ) -> _PayloadFragment:
+        content_signature = self._object_signatures.get(str(kind))
+        signature = content_signature or _object_identity_signature
+        key = (
+            str(kind),
+            tuple(signature(source) for source in sources),
+            params,
+        )
+        self._used_keys.add(key)
+        entry = self._entries.get(key)
+        # Identity signatures are ``id()`` based, so they also need the very
+        # same source objects; content signatures describe the sources fully.
+        if entry is not None and (
+            content_signature is not None
+            or all(
+                cached is source
+                for cached, source in zip(entry[0], sources, strict=True)
+            )
+        ):
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        fragment = _build_payload_fragment(build)
+        self._entries[key] = (
+            () if content_signature is not None else tuple(sources),
+            fragment,
+        )
+        return fragment
+
+    def prune(self) -> None:
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if key in self._used_keys
+        }
+        self._used_keys = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _object_identity_signature(source: object) -> Hashable:
+    return (type(source).__qualname__, id(source))
+
+
+def _build_payload_fragment(
+    build: Callable[..., None],
+) -> _PayloadFragment:
+    fragment_payload: dict[str, object] = {
+        **{collection: [] for collection in _FRAGMENT_COLLECTIONS},
+        "legend": [],
+    }
+    x_arrays: list[np.ndarray] = []
+    y_arrays: list[np.ndarray] = []
+    z_arrays: list[np.ndarray] = []
+    build(fragment_payload, x_arrays=x_arrays, y_arrays=y_arrays, z_arrays=z_arrays)
+    return _PayloadFragment(
+        items={
+            collection: tuple(fragment_payload[collection])
+            for collection in _FRAGMENT_COLLECTIONS
+        },
+        legend=tuple(fragment_payload["legend"]),
+        xyz=(
+            (
+                np.concatenate(x_arrays),
+                np.concatenate(y_arrays),
+                np.concatenate(z_arrays),
+            )
+            if x_arrays
+            else None
+        ),
+    )
+
+
+def _payload_fragment(
+    fragment_cache: ThreePayloadFragmentCache | None,
+    kind: str,
+    sources: tuple[object, ...],
+    params: Hashable,
+    build: Callable[..., None],
+) -> _PayloadFragment:
+    if fragment_cache is None:
+        return _build_payload_fragment(build)
+    return fragment_cache.fragment(kind, sources, params, build)
+
+
+def _apply_payload_fragment(
+    payload: dict[str, object],
+    fragment: _PayloadFragment,
+    *,
+    x_arrays: list[np.ndarray],
+    y_arrays: list[np.ndarray],
+    z_arrays: list[np.ndarray],
+    focus_arrays: tuple[list[np.ndarray], list[np.ndarray], list[np.ndarray]] | None = None,
+) -> None:
+    for collection in _FRAGMENT_COLLECTIONS:
+        payload[collection].extend(dict(item) for item in fragment.items[collection])
+    for item in fragment.legend:
+        _append_unique_legend_item(
+            payload,
+            label=str(item.get("label", "")),
+            color=str(item.get("color", "")),
+            opacity=float(item.get("opacity", 1.0)),
+            symbol=str(item.get("symbol", "line")),
+        )
+    if fragment.xyz is None:
+        return
+    _append_arrays_from_xyz(x_arrays, y_arrays, z_arrays, *fragment.xyz)
+    if focus_arrays is not None:
+        _append_arrays_from_xyz(*focus_arrays, *fragment.xyz)
+
+
+def _point_key(point: object) -> tuple[float, float, float] | None:
+    if point is None:
+        return None
+    return (float(point.x), float(point.y), float(point.z))
+
+
 def single_well_three_payload(
     stations: pd.DataFrame,
     *,
@@ -366,6 +513,7 @@ def all_wells_three_payload(
     focus_well_names: tuple[str, ...] = (),
     render_mode: str = WT_3D_RENDER_FAST,
     fallback_color: Callable[[int], str] | None = None,
+    fragment_cache: ThreePayloadFragmentCache | None = None,
 ) -> dict[str, object]:
     payload = _base_payload(title="Все рассчитанные скважины (3D)")
     x_arrays: list[np.ndarray] = []
@@ -403,43 +551,28 @@ def all_wells_three_payload(
             if is_pilot
             else ()
         )
-        stations = _maybe_decimated_stations(
-            success.stations,
-            render_mode=render_mode,
-            target_points=WT_3D_FAST_CALC_TARGET_POINTS,
-        )
-        _append_station_line(
-            payload,
-            stations=stations,
-            name=well_name,
-            color=color,
-            width_role="line",
-            dash="solid",
-            hover_name=well_name,
-            x_arrays=x_arrays,
-            y_arrays=y_arrays,
-            z_arrays=z_arrays,
-            focus_arrays=(x_focus_arrays, y_focus_arrays, z_focus_arrays)
-            if _include_name_in_focus(well_name, focus_set)
-            else None,
+        fragment = _payload_fragment(
+            fragment_cache,
+            "success",
+            (success,),
+            (
+                color,
+                display_name,
+                tuple(_point_key(point) for point in pilot_study_points),
+                str(render_mode).strip(),
+            ),
+            partial(
+                _append_success_block,
+                success=success,
+                color=color,
+                display_name=display_name,
+                pilot_study_points=pilot_study_points,
+                render_mode=render_mode,
+            ),
         )
-        _append_target_markers(
+        _apply_payload_fragment(
             payload,
-            name=f"{well_name}: цели",
-            surface=success.surface,
-            t1=success.t1,
-            t3=success.t3,
-            target_pairs=tuple(getattr(success, "target_pairs", ()) or ()),
-            target_points=pilot_study_points,
-            target_labels=_pilot_study_label_texts(
-                well_name,
-                len(pilot_study_points),
-            )
-            if is_pilot
-            else (),
-            color=color,
-            size=5.0,
-            symbol="circle",
+            fragment,
             x_arrays=x_arrays,
             y_arrays=y_arrays,
             z_arrays=z_arrays,
@@ -447,15 +580,6 @@ def all_wells_three_payload(
             if _include_name_in_focus(well_name, focus_set)
             else None,
         )
-        payload["labels"].append(_well_name_label(display_name, success.t3, color))
-        if pilot_study_points:
-            _append_pilot_study_labels(
-                payload,
-                pilot_name=well_name,
-                study_points=pilot_study_points,
-                color=color,
-            )
-        _append_unique_legend_item(payload, label=well_name, color=color, opacity=1.0)
 
     _append_reference_wells(
         payload,
@@ -465,6 +589,7 @@ def all_wells_three_payload(
         y_arrays=y_arrays,
         z_arrays=z_arrays,
         highlighted_names=highlighted_reference_well_names,
+        fragment_cache=fragment_cache,
     )
     default_reference_label_keys = (
         {
@@ -534,9 +659,207 @@ def all_wells_three_payload(
         y_arrays=y_focus_arrays or y_arrays,
         z_arrays=z_focus_arrays or z_arrays,
     )
+    if fragment_cache is not None:
+        fragment_cache.prune()
     return ptc_three_payload.optimize_three_payload(payload)
 
 
+def _append_success_block(
+    payload: dict[str, object],
+    *,
+    success: SuccessfulWellPlan,
+    color: str,
+    display_name: str,
+    pilot_study_points: tuple[Point3D, ...],
+    render_mode: str,
+    x_arrays: list[np.ndarray],
+    y_arrays: list[np.ndarray],
+    z_arrays: list[np.ndarray],
+) -> None:
+    well_name = str(success.name)
+    is_pilot = is_pilot_name(well_name)
+    stations = _maybe_decimated_stations(
+        success.stations,
+        render_mode=render_mode,
+        target_points=WT_3D_FAST_CALC_TARGET_POINTS,
+    )
+    _append_station_line(
+        payload,
+        stations=stations,
+        name=well_name,
+        color=color,
+        width_role="line",
+        dash="solid",
+        hover_name=well_name,
+        x_arrays=x_arrays,
+        y_arrays=y_arrays,
+        z_arrays=z_arrays,
+    )
+    _append_target_markers(
+        payload,
+        name=f"{well_name}: цели",
+        surface=success.surface,
+        t1=success.t1,
+        t3=success.t3,
+        target_pairs=tuple(getattr(success, "target_pairs", ()) or ()),
+        target_points=pilot_study_points,
+        target_labels=_pilot_study_label_texts(
+            well_name,
+            len(pilot_study_points),
+        )
+        if is_pilot
+        else (),
+        color=color,
+        size=5.0,
+        symbol="circle",
+        x_arrays=x_arrays,
+        y_arrays=y_arrays,
+        z_arrays=z_arrays,
+    )
+    payload["labels"].append(_well_name_label(display_name, success.t3, color))
+    if pilot_study_points:
+        _append_pilot_study_labels(
+            payload,
+            pilot_name=well_name,
+            study_points=pilot_study_points,
+            color=color,
+        )
+    _append_unique_legend_item(payload, label=well_name, color=color, opacity=1.0)
+
+
+def _append_anticollision_well_block(
+    payload: dict[str, object],
+    *,
+    well: object,
+    overlay: WellUncertaintyOverlay,
+    display_name: str,
+    is_focus_reference: bool,
+    previous_success: SuccessfulWellPlan | None,
+    pilot_points: tuple[Point3D, ...],
+    render_mode: str,
+    x_arrays: list[np.ndarray],
+    y_arrays: list[np.ndarray],
+    z_arrays: list[np.ndarray],
+) -> None:
+    well_name = str(well.name)
+    is_reference_only = bool(well.is_reference_only)
+    is_pilot = is_pilot_name(well_name)
+    well_label = _analysis_well_label(well)
+    tube_mesh = (
+        build_uncertainty_tube_mesh(overlay)
+        if (
+            str(render_mode).strip() != WT_3D_RENDER_FAST
+            or not is_reference_only
+            or is_focus_reference
+        )
+        else None
+    )
+    if tube_mesh is not None:
+        _append_mesh(
+            payload,
+            vertices_xyz=tube_mesh.vertices_xyz,
+            faces_ijk=np.column_stack([tube_mesh.i, tube_mesh.j, tube_mesh.k]),
+            name=f"{well_label} cone",
+            color=str(well.color),
+            opacity=0.10,
+            role="cone",
+            x_arrays=x_arrays,
+            y_arrays=y_arrays,
+            z_arrays=z_arrays,
+            lod=_uncertainty_tube_lod_payload(overlay),
+            tube=_uncertainty_tube_shape(overlay),
+        )
+    if overlay.samples and (
+        str(render_mode).strip() != WT_3D_RENDER_FAST or not is_reference_only
+    ):
+        terminal_ring = np.asarray(overlay.samples[-1].ring_xyz, dtype=float)
+        _append_line_segments(
+            payload,
+            segments=[_points_from_xyz_array(terminal_ring)],
+            name=f"{well_label}: граница конуса",
+            color=_lighten_hex(str(well.color), 0.55),
+            opacity=0.72,
+            dash="solid",
+            role="cone_tip",
+        )
+        _append_arrays(x_arrays, y_arrays, z_arrays, terminal_ring)
+
+    stations = _maybe_decimated_stations(
+        well.stations,
+        render_mode=render_mode,
+        target_points=(
+            WT_3D_FAST_REFERENCE_TARGET_POINTS
+            if is_reference_only
+            else WT_3D_FAST_CALC_TARGET_POINTS
+        ),
+    )
+    _append_station_line(
+        payload,
+        stations=stations,
+        name=well_label,
+        color=str(well.color),
+        width_role="line",
+        hover_name=_reference_hover_name(well) if is_reference_only else well_label,
+        hover_role="reference_hover" if is_reference_only else "trajectory_hover",
+        x_arrays=x_arrays,
+        y_arrays=y_arrays,
+        z_arrays=z_arrays,
+    )
+    if not is_reference_only:
+        _append_unique_legend_item(
+            payload,
+            label=well_label,
+            color=str(well.color),
+            opacity=1.0,
+        )
+    if previous_success is not None and not previous_success.stations.empty:
+        _append_station_line(
+            payload,
+            stations=previous_success.stations,
+            name=f"{well_name}: до пересчёта",
+            color=str(well.color),
+            opacity=0.78,
+            width_role="line",
+            dash="dot",
+            hover_name=f"{well_name}: до пересчёта",
+            x_arrays=x_arrays,
+            y_arrays=y_arrays,
+            z_arrays=z_arrays,
+        )
+    if (well.t1 is not None) and (well.t3 is not None) and not is_reference_only:
+        _append_target_markers(
+            payload,
+            name=f"{well_label}: цели",
+            surface=well.surface,
+            t1=well.t1,
+            t3=well.t3,
+            target_pairs=tuple(getattr(well, "target_pairs", ()) or ()),
+            target_points=pilot_points,
+            target_labels=_pilot_study_label_texts(
+                well_name,
+                len(pilot_points),
+            )
+            if is_pilot
+            else (),
+            color=str(well.color),
+            size=5.0,
+            symbol="circle",
+            x_arrays=x_arrays,
+            y_arrays=y_arrays,
+            z_arrays=z_arrays,
+        )
+        if pilot_points:
+            _append_pilot_study_labels(
+                payload,
+                pilot_name=well_name,
+                study_points=pilot_points,
+                color=str(well.color),
+            )
+        payload["labels"].append(
+            _well_name_label(display_name, well.t3, str(well.color))
+        )
+
+
 def _include_target_only_in_focus(
     *,
     well_name: str,
@@ -567,6 +890,7 @@ def anticollision_three_payload(
     focus_well_names: tuple[str, ...] = (),
     render_mode: str = WT_3D_RENDER_FAST,
     show_sidetrack_relative_cones: bool = False,
+    fragment_cache: ThreePayloadFragmentCache | None = None,
 ) -> dict[str, object]:
     payload = _base_payload(title="Anti-collision: 3D конусы неопределённости")
     payload["anti_collision_layer_state"] = {
@@ -589,6 +913,12 @@ def anticollision_three_payload(
         well for well in analysis.wells if bool(well.is_reference_only)
     )
     collision_display_overlays = collision_display_overlays_by_well(analysis)
+    # Collision overlays are rebuilt from the corridors touching a well, so
+    # those corridors, not the whole analysis, key the well's fragment.
+    corridors_by_well: dict[str, list[object]] = {}
+    for corridor in analysis.corridors:
+        corridors_by_well.setdefault(str(corridor.well_a), []).append(corridor)
+        corridors_by_well.setdefault(str(corridor.well_b), []).append(corridor)
     focus_reference_names = (
         _anticollision_reference_cone_focus_names(analysis)
         if str(render_mode).strip() == WT_3D_RENDER_FAST
@@ -618,142 +948,52 @@ def anticollision_three_payload(
         ):
             aggregated_reference_wells.append(well)
             continue
-        well_label = _analysis_well_label(well)
         include_in_focus = (not focus_set and not is_reference_only) or (
             bool(focus_set) and well_name in focus_set
         )
-        focus_arrays = (
-            (x_focus_arrays, y_focus_arrays, z_focus_arrays)
-            if include_in_focus
-            else None
-        )
-        tube_mesh = (
-            build_uncertainty_tube_mesh(overlay)
-            if (
-                str(render_mode).strip() != WT_3D_RENDER_FAST
-                or not is_reference_only
-                or is_focus_reference
+        previous_success = (previous_successes_by_name or {}).get(well_name)
+        pilot_points = (
+            _pilot_study_points_for_well(
+                well_name,
+                pilot_points_map,
+                fallback_points=(well.t1, well.t3),
             )
-            else None
+            if is_pilot and well.t1 is not None and well.t3 is not None
+            else ()
         )
-        if tube_mesh is not None:
-            _append_mesh(
-                payload,
-                vertices_xyz=tube_mesh.vertices_xyz,
-                faces_ijk=np.column_stack([tube_mesh.i, tube_mesh.j, tube_mesh.k]),
-                name=f"{well_label} cone",
-                color=str(well.color),
-                opacity=0.10,
-                role="cone",
-                x_arrays=x_arrays,
-                y_arrays=y_arrays,
-                z_arrays=z_arrays,
-                focus_arrays=focus_arrays,
-            )
-        if overlay.samples and (
-            str(render_mode).strip() != WT_3D_RENDER_FAST or not is_reference_only
-        ):
-            terminal_ring = np.asarray(overlay.samples[-1].ring_xyz, dtype=float)
-            _append_line_segments(
-                payload,
-                segments=[_points_from_xyz_array(terminal_ring)],
-                name=f"{well_label}: граница конуса",
-                color=_lighten_hex(str(well.color), 0.55),
-                opacity=0.72,
-                dash="solid",
-                role="cone_tip",
-            )
-            _append_arrays(x_arrays, y_arrays, z_arrays, terminal_ring)
-            if focus_arrays is not None:
-                _append_arrays(*focus_arrays, terminal_ring)
-
-        stations = _maybe_decimated_stations(
-            well.stations,
-            render_mode=render_mode,
-            target_points=(
-                WT_3D_FAST_REFERENCE_TARGET_POINTS
-                if is_reference_only
-                else WT_3D_FAST_CALC_TARGET_POINTS
+        fragment = _payload_fragment(
+            fragment_cache,
+            "analysis_well",
+            (well, previous_success, *corridors_by_well.get(well_name, ())),
+            (
+                display_name,
+                tuple(_point_key(point) for point in pilot_points),
+                is_focus_reference,
+                str(render_mode).strip(),
+            ),
+            partial(
+                _append_anticollision_well_block,
+                well=well,
+                overlay=overlay,
+                display_name=display_name,
+                is_focus_reference=is_focus_reference,
+                previous_success=previous_success,
+                pilot_points=pilot_points,
+                render_mode=render_mode,
             ),
         )
-        _append_station_line(
+        _apply_payload_fragment(
             payload,
-            stations=stations,
-            name=well_label,
-            color=str(well.color),
-            width_role="line",
-            hover_name=_reference_hover_name(well) if is_reference_only else well_label,
-            hover_role="reference_hover" if is_reference_only else "trajectory_hover",
+            fragment,
             x_arrays=x_arrays,
             y_arrays=y_arrays,
             z_arrays=z_arrays,
-            focus_arrays=focus_arrays,
+            focus_arrays=(
+                (x_focus_arrays, y_focus_arrays, z_focus_arrays)
+                if include_in_focus
+                else None
+            ),
         )
-        if not is_reference_only:
-            _append_unique_legend_item(
-                payload,
-                label=well_label,
-                color=str(well.color),
-                opacity=1.0,
-            )
-        previous_success = (previous_successes_by_name or {}).get(well_name)
-        if previous_success is not None and not previous_success.stations.empty:
-            _append_station_line(
-                payload,
-                stations=previous_success.stations,
-                name=f"{well_name}: до пересчёта",
-                color=str(well.color),
-                opacity=0.78,
-                width_role="line",
-                dash="dot",
-                hover_name=f"{well_name}: до пересчёта",
-                x_arrays=x_arrays,
-                y_arrays=y_arrays,
-                z_arrays=z_arrays,
-                focus_arrays=focus_arrays,
-            )
-        if (well.t1 is not None) and (well.t3 is not None) and not is_reference_only:
-            pilot_points = (
-                _pilot_study_points_for_well(
-                    well_name,
-                    pilot_points_map,
-                    fallback_points=(well.t1, well.t3),
-                )
-                if is_pilot
-                else ()
-            )
-            _append_target_markers(
-                payload,
-                name=f"{well_label}: цели",
-                surface=well.surface,
-                t1=well.t1,
-                t3=well.t3,
-                target_pairs=tuple(getattr(well, "target_pairs", ()) or ()),
-                target_points=pilot_points,
-                target_labels=_pilot_study_label_texts(
-                    well_name,
-                    len(pilot_points),
-                )
-                if is_pilot
-                else (),
-                color=str(well.color),
-                size=5.0,
-                symbol="circle",
-                x_arrays=x_arrays,
-                y_arrays=y_arrays,
-                z_arrays=z_arrays,
-                focus_arrays=focus_arrays,
-            )
-            if pilot_points:
-                _append_pilot_study_labels(
-                    payload,
-                    pilot_name=well_name,
-                    study_points=pilot_points,
-                    color=str(well.color),
-                )
-            payload["labels"].append(
-                _well_name_label(display_name, well.t3, str(well.color))
-            )
 
     for target_only in target_only_wells or ():
         well_name = str(getattr(target_only, "name"))
@@ -809,6 +1049,7 @@ def anticollision_three_payload(
             x_arrays=x_arrays,
             y_arrays=y_arrays,
             z_arrays=z_arrays,
+            fragment_cache=fragment_cache,
         )
     _append_reference_legend(payload, analysis_reference_objects)
     analysis_reference_wells = _analysis_reference_wells(analysis)
@@ -824,6 +1065,7 @@ def anticollision_three_payload(
             x_arrays=x_arrays,
             y_arrays=y_arrays,
             z_arrays=z_arrays,
+            fragment_cache=fragment_cache,
         )
     _append_reference_name_labels(payload, analysis_reference_wells)
     _append_reference_pad_labels(payload, analysis_reference_wells)
@@ -949,6 +1191,8 @@ def anticollision_three_payload(
         y_arrays=y_focus_arrays or y_arrays,
         z_arrays=z_focus_arrays or z_arrays,
     )
+    if fragment_cache is not None:
+        fragment_cache.prune()
     overlap_volumes = ptc_three_overrides.overlap_volume_payloads(analysis)
     optimized = ptc_three_payload.optimize_three_payload(payload)
     if overlap_volumes:
@@ -1010,6 +1254,10 @@ def _append_station_line(
             dash=dash,
             role=width_role,
         )
+        if width_role == "line" and str(dash or "solid") == "solid":
+            lod = _polyline_lod_payload(x_values, y_values, z_values)
+            if lod:
+                payload["lines"][-1]["lod"] = lod
     _append_arrays_from_xyz(x_arrays, y_arrays, z_arrays, x_values, y_values, z_values)
     if focus_arrays is not None:
         _append_arrays_from_xyz(*focus_arrays, x_values, y_values, z_values)
@@ -1023,6 +1271,70 @@ def _append_station_line(
         )
 
 
+def _polyline_lod_payload(
+    x_values: np.ndarray,
+    y_values: np.ndarray,
+    z_values: np.ndarray,
+) -> list[dict[str, object]]:
+    significance = ptc_three_payload.polyline_vertex_significance(
+        np.column_stack([x_values, y_values, z_values])
+    )
+    return [
+        {
+            "tolerance_m": float(tolerance_m),
+            "segments": _split_finite_segments(
+                x_values=x_values[indices],
+                y_values=y_values[indices],
+                z_values=z_values[indices],
+            ),
+        }
+        for tolerance_m, indices in ptc_three_payload.polyline_lod_levels(
+            significance
+        )
+    ]
+
+
+def _uncertainty_tube_lod_payload(
+    overlay: WellUncertaintyOverlay,
+) -> list[dict[str, object]]:
+    """Coarser cone levels as kept-ring lists over the full-resolution vertices.
+
+    Rings are dropped where the cone is well approximated by blending its
+    neighbouring rings along MD, so only bends and fast-growing sections
+    keep their ring density. The viewer stitches consecutive kept rings and
+    the end caps into faces, so a level costs one index per kept ring
+    instead of a face list.
+    """
+    if len(overlay.samples) < 3:
+        return []
+    rings = np.stack(
+        [np.asarray(sample.ring_xyz[:-1], dtype=float) for sample in overlay.samples]
+    )
+    significance = ptc_three_payload.polyline_vertex_significance(
+        rings,
+        params=np.array([float(sample.md_m) for sample in overlay.samples]),
+    )
+    tube = _uncertainty_tube_shape(overlay)
+    return [
+        {
+            "tolerance_m": float(tolerance_m),
+            "tubes": [{**tube, "rings": [int(index) for index in indices]}],
+        }
+        for tolerance_m, indices in ptc_three_payload.polyline_lod_levels(
+            significance
+        )
+    ]
+
+
+def _uncertainty_tube_shape(overlay: WellUncertaintyOverlay) -> dict[str, int]:
+    """Ring layout of ``build_uncertainty_tube_mesh`` vertices for LOD levels."""
+    return {
+        "vertex_offset": 0,
+        "points_per_ring": int(len(overlay.samples[0].ring_xyz) - 1),
+        "ring_count": int(len(overlay.samples)),
+    }
+
+
 def _append_line_segments(
     payload: dict[str, object],
     *,
@@ -1060,21 +1372,26 @@ def _append_mesh(
     y_arrays: list[np.ndarray],
     z_arrays: list[np.ndarray],
     focus_arrays: tuple[list[np.ndarray], list[np.ndarray], list[np.ndarray]] | None = None,
+    lod: list[dict[str, object]] | None = None,
+    tube: dict[str, int] | None = None,
 ) -> None:
     vertices = np.asarray(vertices_xyz, dtype=float)
-    faces = np.asarray(faces_ijk, dtype=int)
+    faces = np.asarray(faces_ijk, dtype=np.int32)
     if vertices.ndim != 2 or vertices.shape[1] != 3 or faces.ndim != 2 or faces.shape[1] != 3:
         return
-    payload["meshes"].append(
-        {
-            "name": str(name),
-            "vertices": _points_from_xyz_array(vertices),
-            "faces": [[int(a), int(b), int(c)] for a, b, c in faces.tolist()],
-            "color": str(color),
-            "opacity": float(opacity),
-            "role": str(role or "mesh"),
-        }
-    )
+    item: dict[str, object] = {
+        "name": str(name),
+        "vertices": vertices[np.all(np.isfinite(vertices), axis=1)],
+        "faces": faces,
+        "color": str(color),
+        "opacity": float(opacity),
+        "role": str(role or "mesh"),
+    }
+    if lod:
+        item["lod"] = list(lod)
+    if tube is not None:
+        item["tube"] = dict(tube)
+    payload["meshes"].append(item)
     _append_arrays(x_arrays, y_arrays, z_arrays, vertices)
     if focus_arrays is not None:
         _append_arrays(*focus_arrays, vertices)
@@ -1104,6 +1421,8 @@ def _append_uncertainty_overlay(
             x_arrays=x_arrays,
             y_arrays=y_arrays,
             z_arrays=z_arrays,
+            lod=_uncertainty_tube_lod_payload(overlay),
+            tube=_uncertainty_tube_shape(overlay),
         )
         _append_unique_legend_item(payload, label=legend_label, color=color, opacity=0.14)
     if overlay.samples:
@@ -1166,6 +1485,8 @@ def _append_sidetrack_relative_cone_overlays(
                 y_arrays=y_arrays,
                 z_arrays=z_arrays,
                 focus_arrays=pair_focus_arrays,
+                lod=_uncertainty_tube_lod_payload(overlay),
+                tube=_uncertainty_tube_shape(overlay),
             )
             if overlay.samples:
                 terminal_ring = np.asarray(overlay.samples[-1].ring_xyz, dtype=float)
@@ -1423,6 +1744,7 @@ def _append_reference_wells(
     y_arrays: list[np.ndarray],
     z_arrays: list[np.ndarray],
     highlighted_names: frozenset[str] = frozenset(),
+    fragment_cache: ThreePayloadFragmentCache | None = None,
 ) -> None:
     reference_tuple = tuple(reference_wells)
     if str(render_mode).strip() == WT_3D_RENDER_FAST:
@@ -1436,50 +1758,34 @@ def _append_reference_wells(
             for well in reference_tuple
             if well_name_key(getattr(well, "name", "")) not in highlighted_names
         )
-        for reference_well in highlighted_reference_wells:
-            stations = getattr(reference_well, "stations")
-            if stations.empty:
-                continue
-            kind = _reference_kind_value(reference_well)
-            color = REFERENCE_WELL_KIND_COLORS.get(kind, "#A0A0A0")
-            _append_station_line(
-                payload,
-                stations=stations,
-                name=reference_well_display_label(reference_well),
-                color=color,
-                width_role="line",
-                hover_name=_reference_hover_name(reference_well),
-                hover_role="reference_hover",
-                x_arrays=x_arrays,
-                y_arrays=y_arrays,
-                z_arrays=z_arrays,
-            )
+    else:
+        highlighted_reference_wells = reference_tuple
+        combined_reference_wells = ()
+    for reference_well in highlighted_reference_wells:
+        if getattr(reference_well, "stations").empty:
+            continue
+        _apply_payload_fragment(
+            payload,
+            _payload_fragment(
+                fragment_cache,
+                "reference_well",
+                (reference_well,),
+                "line",
+                partial(_append_reference_station_line, reference_well=reference_well),
+            ),
+            x_arrays=x_arrays,
+            y_arrays=y_arrays,
+            z_arrays=z_arrays,
+        )
+    if str(render_mode).strip() == WT_3D_RENDER_FAST:
         _append_combined_reference_wells(
             payload,
             reference_wells=combined_reference_wells,
             x_arrays=x_arrays,
             y_arrays=y_arrays,
             z_arrays=z_arrays,
+            fragment_cache=fragment_cache,
         )
-    else:
-        for reference_well in reference_tuple:
-            stations = getattr(reference_well, "stations")
-            if stations.empty:
-                continue
-            kind = _reference_kind_value(reference_well)
-            color = REFERENCE_WELL_KIND_COLORS.get(kind, "#A0A0A0")
-            _append_station_line(
-                payload,
-                stations=stations,
-                name=reference_well_display_label(reference_well),
-                color=color,
-                width_role="line",
-                hover_name=_reference_hover_name(reference_well),
-                hover_role="reference_hover",
-                x_arrays=x_arrays,
-                y_arrays=y_arrays,
-                z_arrays=z_arrays,
-            )
     _append_reference_legend(payload, reference_tuple)
     if str(render_mode).strip() != WT_3D_RENDER_FAST:
         _append_reference_name_labels(payload, reference_tuple)
@@ -1522,6 +1828,29 @@ def _overview_highlight_reference_well_names(
     return frozenset(highlighted_keys)
 
 
+def _append_reference_station_line(
+    payload: dict[str, object],
+    *,
+    reference_well: object,
+    x_arrays: list[np.ndarray],
+    y_arrays: list[np.ndarray],
+    z_arrays: list[np.ndarray],
+) -> None:
+    kind = _reference_kind_value(reference_well)
+    _append_station_line(
+        payload,
+        stations=getattr(reference_well, "stations"),
+        name=reference_well_display_label(reference_well),
+        color=REFERENCE_WELL_KIND_COLORS.get(kind, "#A0A0A0"),
+        width_role="line",
+        hover_name=_reference_hover_name(reference_well),
+        hover_role="reference_hover",
+        x_arrays=x_arrays,
+        y_arrays=y_arrays,
+        z_arrays=z_arrays,
+    )
+
+
 def _append_combined_reference_wells(
     payload: dict[str, object],
     *,
@@ -1529,59 +1858,83 @@ def _append_combined_reference_wells(
     x_arrays: list[np.ndarray],
     y_arrays: list[np.ndarray],
     z_arrays: list[np.ndarray],
+    fragment_cache: ThreePayloadFragmentCache | None = None,
 ) -> None:
+    """Decimated reference wells drawn as one summary line per kind.
+
+    Each well contributes its own cached block; payload optimization merges
+    the same-named per-well lines into the summary line.
+    """
     reference_tuple = tuple(reference_wells)
     for kind in (REFERENCE_WELL_ACTUAL, REFERENCE_WELL_APPROVED):
-        label = REFERENCE_WELL_KIND_LABELS.get(str(kind), str(kind))
-        matching = [
-            well
-            for well in reference_tuple
-            if _reference_kind_value(well) == str(kind)
-            and not getattr(well, "stations").empty
-        ]
-        if not matching:
-            continue
-        segments: list[list[list[float]]] = []
-        for well in matching:
-            stations = _decimated_station_frame(
-                getattr(well, "stations"),
-                target_points=WT_3D_FAST_REFERENCE_TARGET_POINTS,
-            )
-            x_values = stations["X_m"].to_numpy(dtype=float)
-            y_values = stations["Y_m"].to_numpy(dtype=float)
-            z_values = stations["Z_m"].to_numpy(dtype=float)
-            segments.extend(
-                _split_finite_segments(
-                    x_values=x_values,
-                    y_values=y_values,
-                    z_values=z_values,
-                )
-            )
-            _append_arrays_from_xyz(
-                x_arrays,
-                y_arrays,
-                z_arrays,
-                x_values,
-                y_values,
-                z_values,
-            )
-            _append_station_hover_points(
+        for well in reference_tuple:
+            if (
+                _reference_kind_value(well) != str(kind)
+                or getattr(well, "stations").empty
+            ):
+                continue
+            _apply_payload_fragment(
                 payload,
-                stations=stations,
-                name=_reference_hover_name(well),
-                color=REFERENCE_WELL_KIND_COLORS.get(str(kind), "#A0A0A0"),
-                hover_role="reference_hover",
-                payload_name=f"{label}: hover",
+                _payload_fragment(
+                    fragment_cache,
+                    "reference_well",
+                    (well,),
+                    "combined",
+                    partial(_append_combined_reference_well, reference_well=well),
+                ),
+                x_arrays=x_arrays,
+                y_arrays=y_arrays,
+                z_arrays=z_arrays,
             )
-        _append_line_segments(
-            payload,
-            segments=segments,
-            name=f"{label} (сводно)",
-            color=REFERENCE_WELL_KIND_COLORS.get(str(kind), "#A0A0A0"),
-            opacity=1.0,
-            dash="solid",
-            role="line",
-        )
+
+
+def _append_combined_reference_well(
+    payload: dict[str, object],
+    *,
+    reference_well: object,
+    x_arrays: list[np.ndarray],
+    y_arrays: list[np.ndarray],
+    z_arrays: list[np.ndarray],
+) -> None:
+    kind = _reference_kind_value(reference_well)
+    label = REFERENCE_WELL_KIND_LABELS.get(str(kind), str(kind))
+    color = REFERENCE_WELL_KIND_COLORS.get(str(kind), "#A0A0A0")
+    stations = _decimated_station_frame(
+        getattr(reference_well, "stations"),
+        target_points=WT_3D_FAST_REFERENCE_TARGET_POINTS,
+    )
+    x_values = stations["X_m"].to_numpy(dtype=float)
+    y_values = stations["Y_m"].to_numpy(dtype=float)
+    z_values = stations["Z_m"].to_numpy(dtype=float)
+    _append_arrays_from_xyz(
+        x_arrays,
+        y_arrays,
+        z_arrays,
+        x_values,
+        y_values,
+        z_values,
+    )
+    _append_station_hover_points(
+        payload,
+        stations=stations,
+        name=_reference_hover_name(reference_well),
+        color=color,
+        hover_role="reference_hover",
+        payload_name=f"{label}: hover",
+    )
+    _append_line_segments(
+        payload,
+        segments=_split_finite_segments(
+            x_values=x_values,
+            y_values=y_values,
+            z_values=z_values,
+        ),
+        name=f"{label} (сводно)",
+        color=color,
+        opacity=1.0,
+        dash="solid",
+        role="line",
+    )
 
 
 def _append_station_hover_points(
@@ -1593,38 +1946,35 @@ def _append_station_hover_points(
     hover_role: str,
     payload_name: str | None = None,
 ) -> None:
+    """Full-resolution hover stations as columnar arrays.
+
+    The viewer builds its picking index from the point block and looks
+    tooltip fields up by station index, so no per-station dicts are built.
+    """
     if stations.empty or not {"X_m", "Y_m", "Z_m"}.issubset(stations.columns):
         return
-    hover_points = _points_from_xyz_arrays(
-        stations["X_m"].to_numpy(dtype=float),
-        stations["Y_m"].to_numpy(dtype=float),
-        stations["Z_m"].to_numpy(dtype=float),
-    )
-    hover_items = _hover_items_from_stations(
-        stations,
-        fallback_name=str(name),
+    xyz = np.column_stack(
+        [
+            stations["X_m"].to_numpy(dtype=float),
+            stations["Y_m"].to_numpy(dtype=float),
+            stations["Z_m"].to_numpy(dtype=float),
+        ]
     )
-    if not hover_points or not hover_items:
+    finite_mask = np.all(np.isfinite(xyz), axis=1)
+    if not finite_mask.any():
         return
-    max_points = (
-        WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE
-        if hover_role == "reference_hover"
-        else WT_THREE_MAX_HOVER_POINTS_PER_TRACE
-    )
-    hover_points, hover_items = ptc_three_payload.decimate_hover_payload(
-        points=hover_points,
-        hover_items=hover_items,
-        max_points=max_points,
-    )
     payload["points"].append(
         {
             "name": str(payload_name or name),
-            "points": hover_points,
+            "points": xyz[finite_mask],
             "color": color,
             "opacity": 0.001,
             "size": 8.5,
             "symbol": "circle",
-            "hover": hover_items,
+            "hover_columns": _hover_columns_from_stations(
+                stations.loc[finite_mask],
+                fallback_name=str(name),
+            ),
             "hover_only": True,
             "role": hover_role,
         }
@@ -1724,40 +2074,30 @@ def _append_unique_legend_item(
     payload["legend"] = legend
 
 
-def _hover_items_from_stations(
+def _hover_columns_from_stations(
     stations: pd.DataFrame,
     *,
     fallback_name: str,
-) -> list[dict[str, object]]:
-    if stations.empty:
-        return []
-    md_values = _numeric_column_or_nan(stations, "MD_m")
-    dls_values = _numeric_column_or_nan(stations, "DLS_deg_per_30m")
-    inc_values = _numeric_column_or_nan(stations, "INC_deg")
-    segment_values = (
-        stations["segment"].astype(str).to_numpy(dtype=object)
-        if "segment" in stations.columns
-        else np.full(len(stations), "", dtype=object)
-    )
-    items: list[dict[str, object]] = []
-    for md_value, dls_value, inc_value, segment_value in zip(
-        md_values,
-        dls_values,
-        inc_values,
-        segment_values,
-        strict=False,
-    ):
-        item: dict[str, object] = {"name": str(fallback_name)}
-        if np.isfinite(float(md_value)):
-            item["md"] = float(md_value)
-        if np.isfinite(float(dls_value)):
-            item["dls"] = float(dls_value)
-        if np.isfinite(float(inc_value)):
-            item["inc"] = float(inc_value)
-        if str(segment_value).strip():
-            item["segment"] = str(segment_value).strip()
-        items.append(item)
-    return items
+) -> dict[str, object]:
+    columns: dict[str, object] = {
+        "name": {
+            "labels": [str(fallback_name)],
+            "codes": np.zeros(len(stations), dtype=np.int32),
+        },
+        "md": _numeric_column_or_nan(stations, "MD_m"),
+        "inc": _numeric_column_or_nan(stations, "INC_deg"),
+        "azi": _numeric_column_or_nan(stations, "AZI_deg"),
+        "dls": _numeric_column_or_nan(stations, "DLS_deg_per_30m"),
+    }
+    if "segment" in stations.columns:
+        segment_values = stations["segment"].astype(str).str.strip()
+        codes, labels = pd.factorize(segment_values.where(segment_values != ""))
+        if len(labels):
+            columns["segment"] = {
+                "labels": [str(label) for label in labels],
+                "codes": codes.astype(np.int32),
+            }
+    return columns
 
 
 def _target_hover_item(
@@ -1876,11 +2216,26 @@ def _maybe_decimated_stations(
 
 
 def _decimated_station_frame(stations: pd.DataFrame, *, target_points: int) -> pd.DataFrame:
+    """Keep the ``target_points`` most significant RDP stations.
+
+    Unlike even index decimation this spends the budget on build and turn
+    sections and leaves straight holds and laterals with a few stations.
+    """
     if target_points <= 2 or len(stations.index) <= target_points:
         return stations
-    indices = np.linspace(0, len(stations.index) - 1, num=int(target_points), dtype=int)
-    unique_indices = np.unique(indices)
-    return stations.iloc[unique_indices].reset_index(drop=True)
+    if not {"X_m", "Y_m", "Z_m"}.issubset(stations.columns):
+        indices = np.linspace(
+            0, len(stations.index) - 1, num=int(target_points), dtype=int
+        )
+        return stations.iloc[np.unique(indices)].reset_index(drop=True)
+    significance = ptc_three_payload.polyline_vertex_significance(
+        stations[["X_m", "Y_m", "Z_m"]].to_numpy(dtype=float)
+    )
+    indices = ptc_three_payload.simplified_polyline_indices(
+        significance,
+        max_points=int(target_points),
+    )
+    return stations.iloc[indices].reset_index(drop=True)
 
 
 def _bounds_from_arrays(
@@ -1996,23 +2351,26 @@ def _points_from_xyz_arrays(
     y_values: np.ndarray,
     z_values: np.ndarray,
 ) -> list[list[float]]:
-    return [
-        [float(x_value), float(y_value), float(z_value)]
-        for x_value, y_value, z_value in zip(x_values, y_values, z_values, strict=False)
-        if (
-            np.isfinite(float(x_value))
-            and np.isfinite(float(y_value))
-            and np.isfinite(float(z_value))
+    x_array = np.asarray(x_values, dtype=float).ravel()
+    y_array = np.asarray(y_values, dtype=float).ravel()
+    z_array = np.asarray(z_values, dtype=float).ravel()
+    point_count = min(len(x_array), len(y_array), len(z_array))
+    return _points_from_xyz_array(
+        np.column_stack(
+            [x_array[:point_count], y_array[:point_count], z_array[:point_count]]
         )
-    ]
+    )
 
 
 def _points_from_xyz_array(xyz: np.ndarray) -> list[list[float]]:
-    return [
-        [float(row[0]), float(row[1]), float(row[2])]
-        for row in np.asarray(xyz, dtype=float)
-        if np.all(np.isfinite(row))
-    ]
+    values = np.asarray(xyz, dtype=float)
+    if values.ndim != 2 or values.shape[1] < 3:
+        return [
+            [float(row[0]), float(row[1]), float(row[2])]
+            for row in values
+            if np.all(np.isfinite(row))
+        ]
+    return values[np.all(np.isfinite(values), axis=1), :3].tolist()
 
 
 def _numeric_column_or_nan(stations: pd.DataFrame, column: str) -> np.ndarray:
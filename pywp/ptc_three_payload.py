@@ -5,24 +5,38 @@ from collections.abc import Iterable, Mapping
 import numpy as np
 
 __all__ = [
-    "WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE",
-    "WT_THREE_MAX_HOVER_POINTS_PER_TRACE",
+    "HOVER_NUMERIC_COLUMNS",
     "WT_THREE_MAX_LABELS",
     "WT_THREE_MAX_REFERENCE_LABELS",
-    "decimate_hover_payload",
+    "WT_THREE_LOD_TOLERANCES_M",
+    "hover_item_from_columns",
     "merge_raw_bounds",
     "merge_three_line_payloads",
     "merge_three_mesh_payloads",
     "merge_three_point_payloads",
     "optimize_three_payload",
+    "polyline_lod_levels",
+    "polyline_vertex_significance",
     "raw_bounds_from_xyz_arrays",
+    "simplified_polyline_indices",
 ]
 
-WT_THREE_MAX_HOVER_POINTS_PER_TRACE = 96
-WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE = 72
 WT_THREE_MAX_LABELS = 48
 WT_THREE_MAX_REFERENCE_LABELS = 12
 _PRIMARY_LABEL_ROLES = frozenset({"well_label", "reference_label"})
+# Columnar hover traces carry one value per station for these fields; names
+# and segments are label tables with per-station codes (-1 means none).
+HOVER_NUMERIC_COLUMNS = ("md", "inc", "azi", "dls")
+_HOVER_CATEGORY_COLUMNS = ("name", "segment")
+# Simplification tolerances (m) of the coarser viewer LOD levels; the viewer
+# switches to a level once its tolerance drops below about a screen pixel.
+WT_THREE_LOD_TOLERANCES_M = (2.0, 8.0, 32.0)
+# A coarser level is only worth shipping if it keeps at most this share of
+# the points of the previous level.
+_LOD_MAX_POINT_SHARE = 0.75
+# Deviations below a millimetre are treated as exactly straight.
+_SIGNIFICANCE_FLOOR_M = 1e-3
+_SMALL_LENGTH_SQ = 1e-18
 
 
 def _float_or_default(value: object, default: float) -> float:
@@ -35,21 +49,138 @@ def _float_or_default(value: object, default: float) -> float:
     return result
 
 
-def decimate_hover_payload(
+def polyline_vertex_significance(
+    points: np.ndarray,
     *,
-    points: list[list[float]],
-    hover_items: list[dict[str, object]],
-    max_points: int,
-) -> tuple[list[list[float]], list[dict[str, object]]]:
-    if max_points <= 1 or len(points) <= max_points:
-        return points, hover_items
-    indices = np.unique(
-        np.linspace(0, len(points) - 1, num=int(max_points), dtype=int)
-    ).tolist()
-    return (
-        [points[index] for index in indices],
-        [hover_items[index] for index in indices],
+    params: np.ndarray | None = None,
+) -> np.ndarray:
+    """Ramer-Douglas-Peucker significance of every polyline vertex (m).
+
+    RDP with tolerance ``t`` keeps exactly the vertices whose significance
+    exceeds ``t``, so one pass serves every tolerance and point budget.
+    Endpoints and non-finite vertices (with their neighbours) are always
+    kept. ``points`` is ``(n, 3)`` or ``(n, m, 3)`` for a sequence of rings;
+    with ``params`` (e.g. MD) a vertex is compared with the interpolation of
+    its span at that parameter rather than with the nearest chord point.
+    All spans of one recursion depth are split together.
+    """
+    values = np.asarray(points, dtype=float)
+    if values.ndim == 2:
+        values = values[:, None, :]
+    count = int(values.shape[0])
+    significance = np.zeros(count, dtype=float)
+    if count == 0:
+        return significance
+    parameter = None if params is None else np.asarray(params, dtype=float)
+    finite = np.all(np.isfinite(values), axis=(1, 2))
+    forced = ~finite
+    forced[[0, -1]] = True
+    forced[:-1] |= ~finite[1:]
+    forced[1:] |= ~finite[:-1]
+    significance[forced] = np.inf
+    ceiling = np.full(count, np.inf, dtype=float)
+    kept = np.flatnonzero(forced)
+    pending = np.flatnonzero(~forced)
+    while pending.size:
+        span = np.searchsorted(kept, pending) - 1
+        deviation = _span_deviation(
+            values,
+            pending,
+            start=kept[span],
+            end=kept[span + 1],
+            parameter=parameter,
+        )
+        best = np.full(kept.size, -1.0, dtype=float)
+        np.maximum.at(best, span, deviation)
+        span_best = best[span]
+        # Capping by the enclosing split keeps levels nested: a vertex never
+        # outlives the vertex that created its span.
+        capped = np.minimum(deviation, ceiling[pending])
+        settled = span_best <= _SIGNIFICANCE_FLOOR_M
+        significance[pending[settled]] = capped[settled]
+        candidates = np.flatnonzero(~settled & (deviation >= span_best))
+        _, first = np.unique(span[candidates], return_index=True)
+        split = pending[candidates[first]]
+        significance[split] = capped[candidates[first]]
+        ceiling[pending] = np.minimum(span_best, ceiling[pending])
+        kept = np.union1d(kept, split)
+        remaining = ~settled
+        remaining[candidates[first]] = False
+        pending = pending[remaining]
+    return significance
+
+
+def _span_deviation(
+    values: np.ndarray,
+    indices: np.ndarray,
+    *,
+    start: np.ndarray,
+    end: np.ndarray,
+    parameter: np.ndarray | None,
+) -> np.ndarray:
+    origin = values[start]
+    chord = values[end] - origin
+    offset = values[indices] - origin
+    if parameter is None:
+        length_sq = np.sum(chord * chord, axis=-1)
+        fraction = np.divide(
+            np.sum(offset * chord, axis=-1),
+            length_sq,
+            out=np.zeros_like(length_sq),
+            where=length_sq > _SMALL_LENGTH_SQ,
+        )
+    else:
+        span_length = parameter[end] - parameter[start]
+        fraction = np.divide(
+            parameter[indices] - parameter[start],
+            span_length,
+            out=np.zeros_like(span_length),
+            where=np.abs(span_length) > 0.0,
+        )[:, None]
+    fraction = np.clip(fraction, 0.0, 1.0)
+    residual = offset - fraction[..., None] * chord
+    return np.max(np.sqrt(np.sum(residual * residual, axis=-1)), axis=1)
+
+
+def simplified_polyline_indices(
+    significance: np.ndarray,
+    *,
+    tolerance_m: float | None = None,
+    max_points: int | None = None,
+) -> np.ndarray:
+    """Sorted indices of the RDP vertices for a tolerance and/or point budget."""
+    values = np.asarray(significance, dtype=float)
+    indices = (
+        np.arange(values.size)
+        if tolerance_m is None
+        else np.flatnonzero(values > float(tolerance_m))
     )
+    if max_points is not None and indices.size > max(int(max_points), 2):
+        order = np.argsort(-values[indices], kind="stable")
+        indices = np.sort(indices[order[: max(int(max_points), 2)]])
+    return indices
+
+
+def polyline_lod_levels(
+    significance: np.ndarray,
+    *,
+    tolerances_m: Iterable[float] = WT_THREE_LOD_TOLERANCES_M,
+) -> list[tuple[float, np.ndarray]]:
+    """Vertex subsets of increasingly coarse LOD levels, finest first.
+
+    A level is listed only when it drops a noticeable share of the points
+    of the previous one, so straight laterals collapse to a few vertices
+    while build sections keep their full fidelity in every level.
+    """
+    values = np.asarray(significance, dtype=float)
+    levels: list[tuple[float, np.ndarray]] = []
+    previous_count = int(values.size)
+    for tolerance_m in sorted(float(item) for item in tolerances_m):
+        indices = simplified_polyline_indices(values, tolerance_m=tolerance_m)
+        if 2 <= indices.size <= previous_count * _LOD_MAX_POINT_SHARE:
+            levels.append((tolerance_m, indices))
+            previous_count = int(indices.size)
+    return levels
 
 
 def optimize_three_payload(payload: dict[str, object]) -> dict[str, object]:
@@ -88,6 +219,10 @@ def merge_three_line_payloads(
     items: list[dict[str, object]],
 ) -> list[dict[str, object]]:
     grouped: dict[tuple[str, str, float, str, str], list[list[list[float]]]] = {}
+    grouped_lod: dict[
+        tuple[str, str, float, str, str],
+        list[tuple[list[list[list[float]]], dict[float, list[list[list[float]]]]]],
+    ] = {}
     ordered_keys: list[tuple[str, str, float, str, str]] = []
     for item in items:
         name = str(item.get("name") or "")
@@ -98,40 +233,96 @@ def merge_three_line_payloads(
         key = (name, color, opacity, dash, role)
         if key not in grouped:
             grouped[key] = []
+            grouped_lod[key] = []
             ordered_keys.append(key)
-        grouped[key].extend(
-            [
-                segment
-                for segment in (item.get("segments") or [])
-                if isinstance(segment, list) and len(segment) >= 2
-            ]
+        segments = _valid_segments(item.get("segments"))
+        grouped[key].extend(segments)
+        grouped_lod[key].append(
+            (
+                segments,
+                {
+                    tolerance_m: _valid_segments(level.get("segments"))
+                    for tolerance_m, level in _lod_levels_by_tolerance(item)
+                },
+            )
         )
 
     merged: list[dict[str, object]] = []
     for name, color, opacity, dash, role in ordered_keys:
-        segments = grouped[(name, color, opacity, dash, role)]
+        key = (name, color, opacity, dash, role)
+        segments = grouped[key]
         if not segments:
             continue
-        merged.append(
+        merged_item: dict[str, object] = {
+            "name": name,
+            "segments": segments,
+            "color": color,
+            "opacity": float(opacity),
+            "dash": dash,
+            "role": role,
+        }
+        lod = [
             {
-                "name": name,
-                "segments": segments,
-                "color": color,
-                "opacity": float(opacity),
-                "dash": dash,
-                "role": role,
+                "tolerance_m": tolerance_m,
+                "segments": [
+                    segment for part in level_parts for segment in part
+                ],
             }
-        )
+            for tolerance_m, level_parts in _merged_lod_parts(grouped_lod[key])
+        ]
+        if lod:
+            merged_item["lod"] = lod
+        merged.append(merged_item)
     return merged
 
 
+def _valid_segments(raw_segments: object) -> list[list[list[float]]]:
+    return [
+        segment
+        for segment in (raw_segments or [])
+        if isinstance(segment, list) and len(segment) >= 2
+    ]
+
+
+def _lod_levels_by_tolerance(
+    item: Mapping[str, object],
+) -> list[tuple[float, Mapping[str, object]]]:
+    levels: list[tuple[float, Mapping[str, object]]] = []
+    for level in item.get("lod") or []:
+        if not isinstance(level, Mapping):
+            continue
+        tolerance_m = _float_or_default(level.get("tolerance_m"), 0.0)
+        if tolerance_m > 0.0:
+            levels.append((tolerance_m, level))
+    return levels
+
+
+def _merged_lod_parts(
+    parts: list[tuple[object, dict[float, object]]],
+) -> list[tuple[float, list[object]]]:
+    """Per-tolerance parts of a merged item's LOD levels.
+
+    Items without a level for some tolerance contribute their closest finer
+    level, or their full-resolution geometry.
+    """
+    tolerances = sorted({tolerance for _, levels in parts for tolerance in levels})
+    merged_levels: list[tuple[float, list[object]]] = []
+    for tolerance_m in tolerances:
+        level_parts: list[object] = []
+        for base, levels in parts:
+            finer = [item for item in levels if item <= tolerance_m]
+            level_parts.append(levels[max(finer)] if finer else base)
+        merged_levels.append((float(tolerance_m), level_parts))
+    return merged_levels
+
+
 def merge_three_point_payloads(
     items: list[dict[str, object]],
 ) -> list[dict[str, object]]:
     grouped: dict[
-        tuple[str, str, float, float, str, bool, str], dict[str, object]
+        tuple[str, str, float, float, str, bool, str, bool], dict[str, object]
     ] = {}
-    ordered_keys: list[tuple[str, str, float, float, str, bool, str]] = []
+    ordered_keys: list[tuple[str, str, float, float, str, bool, str, bool]] = []
     for item in items:
         name = str(item.get("name") or "")
         color = str(item.get("color") or "#0F172A")
@@ -140,7 +331,9 @@ def merge_three_point_payloads(
         symbol = str(item.get("symbol") or "circle")
         hover_only = bool(item.get("hover_only"))
         role = str(item.get("role") or "point")
-        key = (name, color, opacity, size, symbol, hover_only, role)
+        raw_columns = item.get("hover_columns")
+        columnar = isinstance(raw_columns, Mapping)
+        key = (name, color, opacity, size, symbol, hover_only, role, columnar)
         if key not in grouped:
             grouped[key] = {
                 "name": name,
@@ -155,6 +348,12 @@ def merge_three_point_payloads(
             }
             ordered_keys.append(key)
 
+        if columnar:
+            points = np.asarray(item.get("points"), dtype=float).reshape(-1, 3)
+            if len(points):
+                grouped[key]["points"].append(points)
+                grouped[key]["hover"].append(raw_columns)
+            continue
         raw_hover = list(item.get("hover") or [])
         for point_index, point in enumerate(item.get("points") or []):
             if not isinstance(point, list) or len(point) != 3:
@@ -171,26 +370,127 @@ def merge_three_point_payloads(
         points = list(entry["points"])
         if not points:
             continue
-        merged.append(
-            {
-                "name": str(entry["name"]),
-                "points": points,
-                "hover": list(entry["hover"]),
-                "color": str(entry["color"]),
-                "opacity": float(entry["opacity"]),
-                "size": float(entry["size"]),
-                "symbol": str(entry["symbol"]),
-                "hover_only": bool(entry["hover_only"]),
-                "role": str(entry["role"]),
-            }
+        merged_item: dict[str, object] = {
+            "name": str(entry["name"]),
+            "points": points,
+            "hover": list(entry["hover"]),
+            "color": str(entry["color"]),
+            "opacity": float(entry["opacity"]),
+            "size": float(entry["size"]),
+            "symbol": str(entry["symbol"]),
+            "hover_only": bool(entry["hover_only"]),
+            "role": str(entry["role"]),
+        }
+        if key[-1]:
+            del merged_item["hover"]
+            merged_item["points"] = np.concatenate(points)
+            merged_item["hover_columns"] = _merged_hover_columns(
+                list(entry["hover"]),
+                [len(block) for block in points],
+            )
+        merged.append(merged_item)
+    return merged
+
+
+def hover_item_from_columns(
+    columns: Mapping[str, object],
+    index: int,
+) -> dict[str, object]:
+    """Tooltip fields of one station of a columnar hover trace.
+
+    Mirrors the viewer lookup: missing numbers and empty labels are left out.
+    """
+    item: dict[str, object] = {}
+    for column in _HOVER_CATEGORY_COLUMNS:
+        category = columns.get(column)
+        if not isinstance(category, Mapping):
+            continue
+        code = int(np.asarray(category.get("codes"))[index])
+        labels = list(category.get("labels") or [])
+        if 0 <= code < len(labels):
+            item[column] = str(labels[code])
+    for column in HOVER_NUMERIC_COLUMNS:
+        if column not in columns:
+            continue
+        value = float(np.asarray(columns[column], dtype=float)[index])
+        if np.isfinite(value):
+            item[column] = value
+    return item
+
+
+def _merged_hover_columns(
+    parts: list[Mapping[str, object]],
+    lengths: list[int],
+) -> dict[str, object]:
+    """Concatenate columnar hover blocks; label tables are unified and recoded."""
+    merged: dict[str, object] = {}
+    for column in HOVER_NUMERIC_COLUMNS:
+        if not any(column in part for part in parts):
+            continue
+        merged[column] = np.concatenate(
+            [
+                np.asarray(part[column], dtype=float)
+                if column in part
+                else np.full(length, np.nan, dtype=float)
+                for part, length in zip(parts, lengths, strict=True)
+            ]
         )
+    for column in _HOVER_CATEGORY_COLUMNS:
+        labels: dict[str, int] = {}
+        code_blocks: list[np.ndarray] = []
+        for part, length in zip(parts, lengths, strict=True):
+            category = part.get(column)
+            if not isinstance(category, Mapping):
+                code_blocks.append(np.full(length, -1, dtype=np.int32))
+                continue
+            recode = np.asarray(
+                [
+                    labels.setdefault(str(label), len(labels))
+                    for label in (category.get("labels") or [])
+                ],
+                dtype=np.int32,
+            )
+            codes = np.asarray(category.get("codes"), dtype=np.int32)
+            if not recode.size:
+                code_blocks.append(np.full(length, -1, dtype=np.int32))
+                continue
+            code_blocks.append(
+                np.where(codes >= 0, recode[np.clip(codes, 0, None)], -1).astype(
+                    np.int32
+                )
+            )
+        if labels:
+            merged[column] = {
+                "labels": list(labels),
+                "codes": np.concatenate(code_blocks),
+            }
     return merged
 
 
 def merge_three_mesh_payloads(
     items: list[dict[str, object]],
 ) -> list[dict[str, object]]:
-    grouped: dict[tuple[str, str, float, str], dict[str, object]] = {}
+    """Merge same-style meshes into one vertex buffer per style.
+
+    Vertex and face blocks are concatenated as arrays and every block's
+    faces are shifted by its vertex offset in one pass. Merged
+    ``vertices``/``faces`` stay NumPy arrays so the viewer transport packs
+    them without a round-trip through nested lists. LOD levels keep their
+    kept-ring ``tubes`` with shifted vertex offsets; blocks without a level
+    fall back to all rings of their ``tube`` or, for non-tube meshes, to
+    their faces.
+    """
+    grouped: dict[
+        tuple[str, str, float, str],
+        list[
+            tuple[
+                np.ndarray,
+                np.ndarray,
+                dict[float, dict[str, object]],
+                dict[str, int] | None,
+            ]
+        ],
+    ] = {}
     ordered_keys: list[tuple[str, str, float, str]] = []
     passthrough_items: list[dict[str, object]] = []
     for item in items:
@@ -204,49 +504,196 @@ def merge_three_mesh_payloads(
 
         key = (name, color, opacity, role)
         if key not in grouped:
-            grouped[key] = {
-                "name": name,
-                "vertices": [],
-                "faces": [],
-                "color": color,
-                "opacity": float(opacity),
-                "role": role,
-            }
+            grouped[key] = []
             ordered_keys.append(key)
 
-        merged = grouped[key]
-        vertices = [
-            vertex
-            for vertex in (item.get("vertices") or [])
-            if isinstance(vertex, list) and len(vertex) == 3
-        ]
-        faces = [
-            face
-            for face in (item.get("faces") or [])
-            if isinstance(face, list) and len(face) == 3
+        vertices = _triple_rows(item.get("vertices"), dtype=float)
+        faces = _triple_rows(item.get("faces"), dtype=np.int64)
+        if not len(vertices) or not len(faces):
+            continue
+        tubes = _valid_lod_tubes([item.get("tube")], vertex_count=len(vertices))
+        grouped[key].append(
+            (
+                vertices,
+                faces,
+                _mesh_lod_levels(item, vertex_count=len(vertices)),
+                tubes[0] if tubes else None,
+            )
+        )
+
+    merged_items: list[dict[str, object]] = []
+    for key in ordered_keys:
+        parts = grouped[key]
+        if not parts:
+            continue
+        name, color, opacity, role = key
+        vertex_offsets = np.cumsum(
+            [0, *(len(vertices) for vertices, _, _, _ in parts)]
+        )
+        merged_item: dict[str, object] = {
+            "name": name,
+            "vertices": np.concatenate([vertices for vertices, _, _, _ in parts]),
+            "faces": _offset_face_blocks(
+                [faces for _, faces, _, _ in parts], vertex_offsets
+            ),
+            "color": color,
+            "opacity": float(opacity),
+            "role": role,
+        }
+        lod = [
+            _merged_mesh_lod_level(
+                tolerance_m,
+                level_parts=level_parts,
+                parts=parts,
+                vertex_offsets=vertex_offsets,
+            )
+            for tolerance_m, level_parts in _merged_lod_parts(
+                [(None, levels) for _, _, levels, _ in parts]
+            )
         ]
-        if not vertices or not faces:
+        if lod:
+            merged_item["lod"] = lod
+        merged_items.append(merged_item)
+    return [*merged_items, *passthrough_items]
+
+
+def _mesh_lod_levels(
+    item: Mapping[str, object],
+    *,
+    vertex_count: int,
+) -> dict[float, dict[str, object]]:
+    levels: dict[float, dict[str, object]] = {}
+    for tolerance_m, level in _lod_levels_by_tolerance(item):
+        tubes = _valid_lod_tubes(level.get("tubes"), vertex_count=vertex_count)
+        faces = _triple_rows(level.get("faces"), dtype=np.int64)
+        if tubes or len(faces):
+            levels[tolerance_m] = {"tubes": tubes, "faces": faces}
+    return levels
+
+
+def _merged_mesh_lod_level(
+    tolerance_m: float,
+    *,
+    level_parts: list[object],
+    parts: list[tuple[np.ndarray, np.ndarray, object, dict[str, int] | None]],
+    vertex_offsets: np.ndarray,
+) -> dict[str, object]:
+    tubes: list[dict[str, object]] = []
+    face_blocks: list[np.ndarray] = []
+    face_offsets: list[int] = []
+    for level, (_, faces, _, tube), offset in zip(
+        level_parts, parts, vertex_offsets, strict=False
+    ):
+        if isinstance(level, Mapping):
+            level_tubes = level["tubes"]
+            level_faces = level["faces"]
+        elif tube is not None:
+            level_tubes, level_faces = [tube], None
+        else:
+            level_tubes, level_faces = [], faces
+        tubes.extend(
+            {**item, "vertex_offset": int(item["vertex_offset"]) + int(offset)}
+            for item in level_tubes
+        )
+        if level_faces is not None and len(level_faces):
+            face_blocks.append(level_faces)
+            face_offsets.append(int(offset))
+    merged_level: dict[str, object] = {"tolerance_m": tolerance_m, "tubes": tubes}
+    if face_blocks:
+        merged_level["faces"] = _offset_face_blocks(
+            face_blocks, np.asarray(face_offsets, dtype=np.int64)
+        )
+    return merged_level
+
+
+def _valid_lod_tubes(
+    raw_tubes: object,
+    *,
+    vertex_count: int,
+) -> list[dict[str, object]]:
+    """Tube ring layouts that fit a mesh with ``vertex_count`` vertices.
+
+    A tube is ``ring_count`` rings of ``points_per_ring`` vertices starting
+    at ``vertex_offset`` followed by the two cap centres; ``rings`` lists
+    the kept rings (all of them when absent) and must keep both ends.
+    """
+    tubes: list[dict[str, object]] = []
+    for raw in raw_tubes if isinstance(raw_tubes, list) else []:
+        if not isinstance(raw, Mapping):
+            continue
+        try:
+            offset = int(raw.get("vertex_offset", 0))
+            points_per_ring = int(raw.get("points_per_ring", 0))
+            ring_count = int(raw.get("ring_count", 0))
+            rings = (
+                None
+                if raw.get("rings") is None
+                else [int(index) for index in raw["rings"]]
+            )
+        except (TypeError, ValueError):
             continue
+        if (
+            offset < 0
+            or points_per_ring < 3
+            or ring_count < 2
+            or offset + ring_count * points_per_ring + 2 > vertex_count
+        ):
+            continue
+        tube: dict[str, object] = {
+            "vertex_offset": offset,
+            "points_per_ring": points_per_ring,
+            "ring_count": ring_count,
+        }
+        if rings is not None:
+            if (
+                len(rings) < 2
+                or rings[0] != 0
+                or rings[-1] != ring_count - 1
+                or any(later <= earlier for earlier, later in zip(rings, rings[1:]))
+            ):
+                continue
+            tube["rings"] = rings
+        tubes.append(tube)
+    return tubes
+
+
+def _triple_rows(raw_rows: object, *, dtype: type) -> np.ndarray:
+    """Rows of length three as an ``(n, 3)`` array.
 
-        vertex_offset = len(merged["vertices"])
-        merged["vertices"].extend(vertices)
-        merged["faces"].extend(
+    Builders hand over well-formed arrays, which pass through without a
+    copy; nested lists convert in one call and ragged input falls back to a
+    per-row filter.
+    """
+    if raw_rows is None or (not isinstance(raw_rows, np.ndarray) and not raw_rows):
+        return np.empty((0, 3), dtype=dtype)
+    try:
+        rows = np.asarray(raw_rows, dtype=dtype)
+    except (TypeError, ValueError):
+        rows = None
+    if rows is not None and rows.ndim == 2 and rows.shape[1] == 3:
+        return rows
+    try:
+        rows = np.asarray(
             [
-                [
-                    int(face[0]) + vertex_offset,
-                    int(face[1]) + vertex_offset,
-                    int(face[2]) + vertex_offset,
-                ]
-                for face in faces
-            ]
+                row
+                for row in raw_rows
+                if isinstance(row, (list, tuple, np.ndarray)) and len(row) == 3
+            ],
+            dtype=dtype,
         )
+    except (TypeError, ValueError):
+        return np.empty((0, 3), dtype=dtype)
+    return rows.reshape(-1, 3)
 
-    merged_items = [
-        grouped[key]
-        for key in ordered_keys
-        if grouped[key]["vertices"] and grouped[key]["faces"]
-    ]
-    return [*merged_items, *passthrough_items]
+
+def _offset_face_blocks(
+    face_blocks: list[np.ndarray],
+    vertex_offsets: np.ndarray,
+) -> np.ndarray:
+    face_counts = [len(faces) for faces in face_blocks]
+    return np.concatenate(face_blocks) + np.repeat(
+        vertex_offsets[: len(face_blocks)], face_counts
+    )[:, None]
 
 
 def raw_bounds_from_xyz_arrays(
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from pywp.disk_cache import PickleDiskStore, disk_cache_settings_from_env
+from pywp.reference_trajectories import ImportedTrajectoryWell
+
+__all__ = [
+    "REFERENCE_DEV_CACHE_DIR_ENV",
+    "REFERENCE_DEV_CACHE_MAX_MB_ENV",
+    "ReferenceDevDiskCache",
+    "default_reference_dev_disk_cache",
+]
+
+REFERENCE_DEV_CACHE_DIR_ENV = "PYWP_REFERENCE_DEV_CACHE_DIR"
+REFERENCE_DEV_CACHE_MAX_MB_ENV = "PYWP_REFERENCE_DEV_CACHE_MAX_MB"
+DEFAULT_REFERENCE_DEV_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Bump when ImportedTrajectoryWell or the .dev parser output changes shape:
+# old files then simply stop matching and age out through eviction.
+_CACHE_FORMAT_VERSION = "1"
+_WELLS_DIR = "wells"
+
+
+class ReferenceDevDiskCache(PickleDiskStore):
+    """On-disk store of parsed ``.dev`` reference wells.
+
+    Entries are addressed by the resolved file path, its modification time
+    and size plus the well kind, so an edited or replaced file never hits a
+    stale well. The least recently used files are evicted once the store
+    grows beyond ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int = DEFAULT_REFERENCE_DEV_CACHE_MAX_BYTES,
+    ) -> None:
+        super().__init__(
+            root,
+            max_bytes=max_bytes,
+            format_version=_CACHE_FORMAT_VERSION,
+        )
+
+    def load(self, path: str | Path, *, kind: str) -> ImportedTrajectoryWell | None:
+        entry_path = self._entry_path_for_source(path, kind=kind)
+        if entry_path is None:
+            return None
+        value = self._load(entry_path, ImportedTrajectoryWell)
+        if value is None:
+            return None
+        if str(value.kind) != str(kind) or str(value.name) != Path(path).stem:
+            entry_path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def store(self, path: str | Path, well: ImportedTrajectoryWell) -> bool:
+        """Persist a parsed well unless the same file version is stored."""
+        entry_path = self._entry_path_for_source(path, kind=str(well.kind))
+        if entry_path is None:
+            return False
+        return self._write(entry_path, well)
+
+    def _entry_path_for_source(self, path: str | Path, *, kind: str) -> Path | None:
+        source_path = Path(path)
+        try:
+            stat = source_path.stat()
+            resolved = source_path.resolve()
+        except OSError:
+            return None
+        return self._entry_path(
+            _WELLS_DIR,
+            os.path.normcase(str(resolved)),
+            str(int(stat.st_mtime_ns)),
+            str(int(stat.st_size)),
+            str(kind),
+        )
+
+
+def default_reference_dev_disk_cache() -> ReferenceDevDiskCache | None:
+    """Cache under ``$PYWP_REFERENCE_DEV_CACHE_DIR`` or ``~/.cache/pywp``.
+
+    Setting the directory variable to an empty string disables the store.
+    """
+    settings = disk_cache_settings_from_env(
+        dir_env=REFERENCE_DEV_CACHE_DIR_ENV,
+        max_mb_env=REFERENCE_DEV_CACHE_MAX_MB_ENV,
+        default_dir_name="reference_dev",
+        default_max_bytes=DEFAULT_REFERENCE_DEV_CACHE_MAX_BYTES,
+    )
+    if settings is None:
+        return None
+    root, max_bytes = settings
+    return ReferenceDevDiskCache(root, max_bytes=max_bytes)
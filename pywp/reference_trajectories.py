@@ -3,25 +3,33 @@ from __future__ import annotations
 import math
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import StringIO
 from pathlib import Path
-from typing import Iterable, Mapping
+from pickle import PicklingError
+from typing import TYPE_CHECKING, Iterable, Mapping
 
 import numpy as np
 import pandas as pd
 
 from pywp.constants import SMALL
 from pywp.eclipse_welltrack import (
+    WelltrackArrays,
     WelltrackParseError,
     WelltrackRecord,
     decode_welltrack_bytes,
-    parse_welltrack_text,
+    parse_welltrack_arrays,
 )
 from pywp.mcm import add_dls
 from pywp.models import Point3D
+from pywp.parallel import process_pool_context
 from pywp.path_utils import normalize_user_path_text
 from pywp.pydantic_base import FrozenArbitraryModel
 
+if TYPE_CHECKING:
+    from pywp.reference_dev_cache import ReferenceDevDiskCache
+
 REFERENCE_WELL_ACTUAL = "actual"
 REFERENCE_WELL_APPROVED = "approved"
 
@@ -35,6 +43,27 @@ REFERENCE_WELL_KIND_COLORS: dict[str, str] = {
     REFERENCE_WELL_APPROVED: "#C62828",
 }
 
+# Full .dev export row layout; Z is the raw (positive down) .dev column.
+_DEV_EXPORT_COLUMNS = (
+    "MD",
+    "X",
+    "Y",
+    "Z",
+    "TVD",
+    "DX",
+    "DY",
+    "AZIM_TN",
+    "INCL",
+    "DLS",
+    "AZIM_GN",
+)
+
+# Process pools only pay off once a folder holds this many .dev files.
+_DEV_PARALLEL_MIN_FILES = 64
+_DEV_PARALLEL_MAX_WORKERS = 8
+
+_DEV_SEPARATOR_TABLE = str.maketrans({"\t": " ", ";": " "})
+
 _REFERENCE_KIND_ALIASES: dict[str, str] = {
     "actual": REFERENCE_WELL_ACTUAL,
     "factual": REFERENCE_WELL_ACTUAL,
@@ -259,8 +288,8 @@ def parse_reference_trajectory_welltrack_text(
     source = str(text or "")
     if not source.strip():
         raise WelltrackParseError("Текст WELLTRACK для дополнительных скважин пуст.")
-    return reference_welltrack_records_to_wells(
-        parse_welltrack_text(source),
+    return reference_welltrack_arrays_to_wells(
+        parse_welltrack_arrays(source),
         kind=kind,
     )
 
@@ -277,79 +306,26 @@ def parse_reference_trajectory_dev_text(
     if not normalized_name:
         raise WelltrackParseError(".dev: имя скважины не задано.")
 
-    xs: list[float] = []
-    ys: list[float] = []
-    zs: list[float] = []
-    mds: list[float] = []
-    dev_export_rows_payload: list[dict[str, float]] = []
-    has_full_dev_rows = True
-    for line_no, raw_line in enumerate(source.splitlines(), start=1):
-        line = str(raw_line).strip()
-        if not line or line.startswith("#"):
-            continue
-        tokens = _split_dev_text_line(line)
-        if not tokens:
-            continue
-        try:
-            md = _parse_dev_float(tokens[0])
-        except ValueError:
-            continue
-        if len(tokens) < 4:
-            raise WelltrackParseError(
-                f".dev '{normalized_name}': строка {line_no} содержит MD, "
-                "но не содержит обязательные X Y Z."
-            )
-        try:
-            x = _parse_dev_float(tokens[1])
-            y = _parse_dev_float(tokens[2])
-            z = -_parse_dev_float(tokens[3])
-        except ValueError as exc:
-            raise WelltrackParseError(
-                f".dev '{normalized_name}': не удалось прочитать X Y Z "
-                f"в строке {line_no}."
-            ) from exc
-        mds.append(md)
-        xs.append(x)
-        ys.append(y)
-        zs.append(z)
-        if len(tokens) >= 11:
-            try:
-                dev_export_rows_payload.append(
-                    {
-                        "MD": md,
-                        "X": x,
-                        "Y": y,
-                        "Z": _parse_dev_float(tokens[3]),
-                        "TVD": _parse_dev_float(tokens[4]),
-                        "DX": _parse_dev_float(tokens[5]),
-                        "DY": _parse_dev_float(tokens[6]),
-                        "AZIM_TN": _parse_dev_float(tokens[7]),
-                        "INCL": _parse_dev_float(tokens[8]),
-                        "DLS": _parse_dev_float(tokens[9]),
-                        "AZIM_GN": _parse_dev_float(tokens[10]),
-                    }
-                )
-            except ValueError:
-                has_full_dev_rows = False
-        else:
-            has_full_dev_rows = False
+    values = _dev_row_values_bulk(source)
+    if values is None:
+        values = _dev_row_values_line_by_line(source, well_name=normalized_name)
 
-    if len(mds) < 2:
+    if values.shape[0] < 2:
         raise WelltrackParseError(
             f".dev '{normalized_name}': требуется минимум 2 числовые "
             "станции."
         )
     stations = build_reference_trajectory_stations(
-        xs=xs,
-        ys=ys,
-        zs=zs,
-        mds=mds,
+        xs=values[:, 1],
+        ys=values[:, 2],
+        zs=-values[:, 3],
+        mds=values[:, 0],
     )
     dev_export_rows = None
-    if has_full_dev_rows and len(dev_export_rows_payload) == len(mds):
-        dev_export_rows = pd.DataFrame(dev_export_rows_payload).sort_values(
-            "MD", kind="mergesort"
-        )
+    if values.shape[1] == len(_DEV_EXPORT_COLUMNS):
+        dev_export_rows = pd.DataFrame(
+            values, columns=list(_DEV_EXPORT_COLUMNS)
+        ).sort_values("MD", kind="mergesort")
         dev_export_rows = dev_export_rows.drop_duplicates(
             subset=["MD"], keep="first"
         ).reset_index(drop=True)
@@ -391,7 +367,15 @@ def parse_reference_trajectory_dev_directories(
     directories: Iterable[str | Path],
     *,
     kind: str,
+    parallel_workers: int | None = None,
+    disk_cache: ReferenceDevDiskCache | None = None,
 ) -> list[ImportedTrajectoryWell]:
+    """Parse every ``.dev`` file of the folders in natural file order.
+
+    Files already stored in ``disk_cache`` under the same path, modification
+    time and size are not read again; the rest are parsed on a process pool
+    (see ``_parse_dev_files``) and stored back.
+    """
     normalized_kind = normalize_reference_well_kind(kind)
     source_dirs = [
         Path(normalize_user_path_text(directory)).expanduser()
@@ -436,7 +420,6 @@ def parse_reference_trajectory_dev_directories(
             f"В папках {joined_dirs} не найдено .dev файлов."
         )
 
-    wells: list[ImportedTrajectoryWell] = []
     seen_names: dict[str, Path] = {}
     for dev_file in dev_files:
         well_name = dev_file.stem
@@ -449,47 +432,141 @@ def parse_reference_trajectory_dev_directories(
                 f"`{well_name}`: `{previous_path}` и `{dev_file}`."
             )
         seen_names[well_key] = dev_file
-        wells.append(
-            parse_reference_trajectory_dev_file(
-                dev_file,
-                kind=normalized_kind,
-            )
+
+    wells_by_index: dict[int, ImportedTrajectoryWell] = {}
+    if disk_cache is not None:
+        for index, dev_file in enumerate(dev_files):
+            cached_well = disk_cache.load(dev_file, kind=normalized_kind)
+            if cached_well is not None:
+                wells_by_index[index] = cached_well
+    pending_indices = [
+        index for index in range(len(dev_files)) if index not in wells_by_index
+    ]
+    parsed_wells = _parse_dev_files(
+        [dev_files[index] for index in pending_indices],
+        kind=normalized_kind,
+        parallel_workers=parallel_workers,
+    )
+    for index, well in zip(pending_indices, parsed_wells):
+        wells_by_index[index] = well
+    if disk_cache is not None and pending_indices:
+        for index in pending_indices:
+            disk_cache.store(dev_files[index], wells_by_index[index])
+        disk_cache.evict_if_needed()
+    return [wells_by_index[index] for index in range(len(dev_files))]
+
+
+def _parse_dev_files(
+    dev_files: list[Path],
+    *,
+    kind: str,
+    parallel_workers: int | None,
+) -> list[ImportedTrajectoryWell]:
+    """Parse ``.dev`` files in order, on a process pool for large folders.
+
+    ``parallel_workers=None`` picks the pool size from the CPU count once
+    there are enough files to pay for the pool start; ``0`` or ``1`` keeps
+    the parse in-process. Parse errors surface for the first broken file in
+    folder order, exactly like the serial parse.
+    """
+
+    def parse_serial() -> list[ImportedTrajectoryWell]:
+        return [
+            parse_reference_trajectory_dev_file(dev_file, kind=kind)
+            for dev_file in dev_files
+        ]
+
+    if parallel_workers is None:
+        workers = (
+            min(os.cpu_count() or 1, _DEV_PARALLEL_MAX_WORKERS)
+            if len(dev_files) >= _DEV_PARALLEL_MIN_FILES
+            else 0
         )
-    return wells
+    else:
+        workers = int(max(parallel_workers, 0))
+    if workers <= 1 or len(dev_files) <= 1:
+        return parse_serial()
+
+    workers = min(workers, len(dev_files))
+    chunksize = max(len(dev_files) // (workers * 4), 1)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=process_pool_context(),
+        ) as executor:
+            return list(
+                executor.map(
+                    _parse_dev_file_job,
+                    [str(dev_file) for dev_file in dev_files],
+                    [kind] * len(dev_files),
+                    chunksize=chunksize,
+                )
+            )
+    except WelltrackParseError:
+        raise
+    except (BrokenProcessPool, PicklingError, OSError, RuntimeError):
+        return parse_serial()
+
+
+def _parse_dev_file_job(path: str, kind: str) -> ImportedTrajectoryWell:
+    return parse_reference_trajectory_dev_file(path, kind=kind)
 
 
 def reference_welltrack_records_to_wells(
     records: Iterable[WelltrackRecord],
     *,
     kind: str,
+) -> list[ImportedTrajectoryWell]:
+    return reference_welltrack_arrays_to_wells(
+        (
+            WelltrackArrays(
+                name=str(record.name),
+                xyz_md=np.asarray(
+                    [
+                        [float(point.x), float(point.y), float(point.z), float(point.md)]
+                        for point in record.points
+                    ],
+                    dtype=float,
+                ).reshape(-1, 4),
+            )
+            for record in records
+        ),
+        kind=kind,
+    )
+
+
+def reference_welltrack_arrays_to_wells(
+    items: Iterable[WelltrackArrays],
+    *,
+    kind: str,
 ) -> list[ImportedTrajectoryWell]:
     normalized_kind = normalize_reference_well_kind(kind)
-    ordered_records = list(records)
-    if not ordered_records:
+    ordered_items = list(items)
+    if not ordered_items:
         raise WelltrackParseError("WELLTRACK дополнительных скважин пуст.")
 
     wells: list[ImportedTrajectoryWell] = []
-    for record in ordered_records:
-        points = tuple(record.points)
-        if len(points) < 2:
+    for item in ordered_items:
+        xyz_md = np.asarray(item.xyz_md, dtype=float)
+        if len(xyz_md) < 2:
             raise WelltrackParseError(
                 "WELLTRACK дополнительных скважин: для "
-                f"'{record.name}' требуется минимум 2 точки траектории."
+                f"'{item.name}' требуется минимум 2 точки траектории."
             )
         try:
             stations = build_reference_trajectory_stations(
-                xs=[float(point.x) for point in points],
-                ys=[float(point.y) for point in points],
-                zs=[float(point.z) for point in points],
-                mds=[float(point.md) for point in points],
+                xs=xyz_md[:, 0],
+                ys=xyz_md[:, 1],
+                zs=xyz_md[:, 2],
+                mds=xyz_md[:, 3],
             )
         except WelltrackParseError as exc:
             raise WelltrackParseError(
-                f"WELLTRACK дополнительных скважин '{record.name}': {exc}"
+                f"WELLTRACK дополнительных скважин '{item.name}': {exc}"
             ) from exc
         wells.append(
             ImportedTrajectoryWell(
-                name=str(record.name),
+                name=str(item.name),
                 kind=normalized_kind,
                 stations=stations,
                 surface=Point3D(
@@ -505,10 +582,10 @@ def reference_welltrack_records_to_wells(
 
 def build_reference_trajectory_stations(
     *,
-    xs: list[float],
-    ys: list[float],
-    zs: list[float],
-    mds: list[float],
+    xs: np.ndarray | list[float],
+    ys: np.ndarray | list[float],
+    zs: np.ndarray | list[float],
+    mds: np.ndarray | list[float],
 ) -> pd.DataFrame:
     x_values = np.asarray(xs, dtype=float)
     y_values = np.asarray(ys, dtype=float)
@@ -644,31 +721,19 @@ def _infer_reference_azimuth_deg(stations: pd.DataFrame) -> float:
 
 
 def _local_derivative(md_values: np.ndarray, values: np.ndarray) -> np.ndarray:
-    result = np.zeros_like(values, dtype=float)
-    if len(values) == 2:
-        delta_md = float(md_values[1] - md_values[0])
-        slope = (
-            0.0 if abs(delta_md) <= 1e-12 else float(values[1] - values[0]) / delta_md
-        )
-        result[:] = slope
-        return result
-    for index in range(len(values)):
-        if index == 0:
-            left = 0
-            right = 1
-        elif index == len(values) - 1:
-            left = len(values) - 2
-            right = len(values) - 1
-        else:
-            left = index - 1
-            right = index + 1
-        delta_md = float(md_values[right] - md_values[left])
-        result[index] = (
-            0.0
-            if abs(delta_md) <= 1e-12
-            else float(values[right] - values[left]) / delta_md
-        )
-    return result
+    """Central differences inside the survey, one-sided at both ends."""
+    count = len(values)
+    if count < 2:
+        return np.zeros_like(values, dtype=float)
+    indices = np.arange(count)
+    left = np.clip(indices - 1, 0, count - 2)
+    right = np.clip(indices + 1, 1, count - 1)
+    md = np.asarray(md_values, dtype=float)
+    value = np.asarray(values, dtype=float)
+    delta_md = md[right] - md[left]
+    delta_values = value[right] - value[left]
+    flat = np.abs(delta_md) <= 1e-12
+    return np.where(flat, 0.0, delta_values / np.where(flat, 1.0, delta_md))
 
 
 def _split_reference_text_line(line: str) -> list[str]:
@@ -677,7 +742,9 @@ def _split_reference_text_line(line: str) -> list[str]:
 
 def _split_dev_text_line(line: str) -> list[str]:
     text = str(line).strip()
-    tokens = [token for token in re.split(r"[\t; ]+", text) if token]
+    tokens = [
+        token for token in text.translate(_DEV_SEPARATOR_TABLE).split(" ") if token
+    ]
     if len(tokens) > 1:
         return tokens
     return [token for token in text.split(",") if token]
@@ -687,6 +754,103 @@ def _parse_dev_float(value: str) -> float:
     return float(str(value).strip().replace(",", "."))
 
 
+def _dev_data_section(source: str) -> str | None:
+    """Text from the first .dev row whose first token is a number on."""
+    position = 0
+    length = len(source)
+    while position < length:
+        end = source.find("\n", position)
+        if end < 0:
+            end = length
+        line = source[position:end].strip()
+        if line and not line.startswith("#"):
+            tokens = _split_dev_text_line(line)
+            if tokens:
+                try:
+                    _parse_dev_float(tokens[0])
+                except ValueError:
+                    pass
+                else:
+                    return source[position:]
+        position = end + 1
+    return None
+
+
+def _dev_row_values_bulk(source: str) -> np.ndarray | None:
+    """Parse the numeric block of a regular .dev file in one C-level pass.
+
+    Returns an ``(n, 11)`` array when every row carries the full export
+    columns and an ``(n, 4)`` MD/X/Y/Z array otherwise. Anything irregular
+    (comments or text inside the block, ragged or short rows, unreadable
+    numbers) returns ``None`` and goes to the line scan, which reports
+    problems with the same messages and line numbers as before.
+    """
+    data = _dev_data_section(source)
+    if data is None:
+        return np.empty((0, 4), dtype=float)
+    if "#" in data:
+        return None
+    try:
+        frame = pd.read_csv(
+            StringIO(data.translate(_DEV_SEPARATOR_TABLE).replace(",", ".")),
+            sep=r"\s+",
+            header=None,
+            dtype=float,
+            engine="c",
+        )
+    except (ValueError, pd.errors.ParserError, pd.errors.EmptyDataError):
+        return None
+    if frame.shape[1] < 4:
+        return None
+    width = len(_DEV_EXPORT_COLUMNS) if frame.shape[1] >= len(_DEV_EXPORT_COLUMNS) else 4
+    values = frame.to_numpy(dtype=float)[:, :width]
+    if np.isnan(values).any():
+        return None
+    return np.ascontiguousarray(values)
+
+
+def _dev_row_values_line_by_line(source: str, *, well_name: str) -> np.ndarray:
+    values: list[list[float]] = []
+    has_full_dev_rows = True
+    for line_no, raw_line in enumerate(source.splitlines(), start=1):
+        line = str(raw_line).strip()
+        if not line or line.startswith("#"):
+            continue
+        tokens = _split_dev_text_line(line)
+        if not tokens:
+            continue
+        try:
+            md = _parse_dev_float(tokens[0])
+        except ValueError:
+            continue
+        if len(tokens) < 4:
+            raise WelltrackParseError(
+                f".dev '{well_name}': строка {line_no} содержит MD, "
+                "но не содержит обязательные X Y Z."
+            )
+        try:
+            row = [md] + [_parse_dev_float(token) for token in tokens[1:4]]
+        except ValueError as exc:
+            raise WelltrackParseError(
+                f".dev '{well_name}': не удалось прочитать X Y Z "
+                f"в строке {line_no}."
+            ) from exc
+        if has_full_dev_rows and len(tokens) >= len(_DEV_EXPORT_COLUMNS):
+            try:
+                row.extend(
+                    _parse_dev_float(token)
+                    for token in tokens[4 : len(_DEV_EXPORT_COLUMNS)]
+                )
+            except ValueError:
+                has_full_dev_rows = False
+        else:
+            has_full_dev_rows = False
+        values.append(row)
+    if not has_full_dev_rows:
+        values = [row[:4] for row in values]
+    return np.asarray(values, dtype=float).reshape(len(values), -1)
+
+
 def _natural_path_sort_key(path: Path) -> tuple[tuple[int, object], ...]:
     return tuple(
         (0, int(part)) if part.isdigit() else (1, part)
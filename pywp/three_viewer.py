@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import base64
 import json
 import hashlib
 from functools import lru_cache
 from pathlib import Path
 from typing import Mapping
 
+import numpy as np
+import streamlit as st
 import streamlit.components.v1 as components
 
 _ASSETS_DIR = Path(__file__).resolve().parent / "three_viewer_assets"
@@ -16,6 +19,12 @@ _viewer_component = components.declare_component(
     path=str(_ASSETS_DIR),
 )
 _SERIALIZED_PAYLOAD_CACHE: list[dict[str, object]] = []
+THREE_PAYLOAD_TRANSPORT_JSON = "json"
+THREE_PAYLOAD_TRANSPORT_BINARY = "binary"
+_SCENE_COLLECTIONS = ("lines", "meshes", "points", "labels")
+_SCENE_DELTA_STATE_KEY = "pywp_three_scene_delta_state"
+_RESYNC_EVENT = "pywp:resync"
+_ACK_EVENT = "pywp:ack"
 
 
 @lru_cache(maxsize=1)
@@ -76,50 +85,378 @@ def _viewer_runtime_digest() -> str:
     return digest.hexdigest()
 
 
-def _serialized_payload(
+def _base64_array(values: np.ndarray) -> str:
+    return base64.b64encode(np.ascontiguousarray(values).tobytes()).decode("ascii")
+
+
+def _binary_mesh_item(item: Mapping[str, object]) -> Mapping[str, object]:
+    """Mesh payload with vertices/faces packed as little-endian typed arrays.
+
+    Vertices are stored as float32 offsets from a float64 per-mesh origin so
+    that projected coordinates of 1e6-1e7 m keep millimetre precision; the
+    viewer decodes both blobs straight into a BufferGeometry.
+    """
+    if "vertices" not in item or "faces" not in item:
+        return item
+    try:
+        vertices = np.asarray(item["vertices"], dtype=float)
+        faces = np.asarray(item["faces"], dtype=np.int64)
+    except (TypeError, ValueError):
+        return item
+    if (
+        vertices.ndim != 2
+        or vertices.shape[1] != 3
+        or len(vertices) == 0
+        or faces.ndim != 2
+        or faces.shape[1] != 3
+        or len(faces) == 0
+        or not np.all(np.isfinite(vertices))
+        or int(faces.min()) < 0
+        or int(faces.max()) >= len(vertices)
+    ):
+        return item
+    origin = np.round(0.5 * (vertices.min(axis=0) + vertices.max(axis=0)), 3)
+    encoded = {
+        key: value for key, value in item.items() if key not in ("vertices", "faces")
+    }
+    encoded["vertex_origin"] = [float(value) for value in origin]
+    encoded["vertex_count"] = int(len(vertices))
+    encoded["face_count"] = int(len(faces))
+    encoded["vertices_f32"] = _base64_array((vertices - origin).astype("<f4"))
+    encoded.update(_binary_faces(faces, vertex_count=len(vertices)))
+    if item.get("lod"):
+        encoded["lod"] = _binary_mesh_lod(item["lod"], vertex_count=len(vertices))
+    return encoded
+
+
+def _binary_faces(faces: np.ndarray, *, vertex_count: int) -> dict[str, object]:
+    if vertex_count <= np.iinfo(np.uint16).max:
+        return {"faces_u16": _base64_array(faces.astype("<u2"))}
+    return {"faces_u32": _base64_array(faces.astype("<u4"))}
+
+
+def _binary_mesh_lod(levels: object, *, vertex_count: int) -> list[dict[str, object]]:
+    """LOD levels with their face lists packed like the base faces.
+
+    Kept-ring ``tubes`` are a few indices per level and stay plain JSON.
+    """
+    encoded_levels: list[dict[str, object]] = []
+    for level in levels if isinstance(levels, list) else []:
+        if not isinstance(level, Mapping):
+            continue
+        encoded_level = {
+            key: value for key, value in level.items() if key != "faces"
+        }
+        if level.get("faces") is not None and len(level["faces"]):
+            try:
+                faces = np.asarray(level["faces"], dtype=np.int64)
+            except (TypeError, ValueError):
+                continue
+            if (
+                faces.ndim != 2
+                or faces.shape[1] != 3
+                or int(faces.min()) < 0
+                or int(faces.max()) >= vertex_count
+            ):
+                continue
+            encoded_level["face_count"] = int(len(faces))
+            encoded_level.update(_binary_faces(faces, vertex_count=vertex_count))
+        elif not level.get("tubes"):
+            continue
+        encoded_levels.append(encoded_level)
+    return encoded_levels
+
+
+def _binary_hover_point_item(item: Mapping[str, object]) -> Mapping[str, object]:
+    """Columnar hover trace with positions and columns as typed arrays.
+
+    Positions use the same float32-offset-from-origin packing as meshes;
+    numeric columns become float32 (NaN marks a missing value) and label
+    codes int32.
+    """
+    columns = item.get("hover_columns")
+    if not isinstance(columns, Mapping):
+        return item
+    try:
+        points = np.asarray(item.get("points"), dtype=float)
+    except (TypeError, ValueError):
+        return item
+    if points.ndim != 2 or points.shape[1] != 3 or len(points) == 0:
+        return item
+    if not np.all(np.isfinite(points)):
+        return item
+    origin = np.round(0.5 * (points.min(axis=0) + points.max(axis=0)), 3)
+    encoded_columns: dict[str, object] = {}
+    for column, values in columns.items():
+        if isinstance(values, Mapping):
+            encoded_columns[str(column)] = {
+                "labels": [str(label) for label in values.get("labels") or []],
+                "codes_i32": _base64_array(
+                    np.asarray(values.get("codes"), dtype="<i4")
+                ),
+            }
+        else:
+            encoded_columns[str(column)] = _base64_array(
+                np.asarray(values, dtype="<f4")
+            )
+    encoded = {
+        key: value
+        for key, value in item.items()
+        if key not in ("points", "hover_columns")
+    }
+    encoded["point_origin"] = [float(value) for value in origin]
+    encoded["point_count"] = int(len(points))
+    encoded["points_f32"] = _base64_array((points - origin).astype("<f4"))
+    encoded["hover_columns"] = encoded_columns
+    return encoded
+
+
+def _transport_payload(
+    payload: Mapping[str, object],
+    *,
+    transport: str,
+) -> dict[str, object]:
+    payload_dict = dict(payload)
+    if transport == THREE_PAYLOAD_TRANSPORT_BINARY and payload_dict.get("meshes"):
+        payload_dict["meshes"] = [
+            _binary_mesh_item(item) if isinstance(item, Mapping) else item
+            for item in list(payload_dict.get("meshes") or [])
+        ]
+    if transport == THREE_PAYLOAD_TRANSPORT_BINARY and payload_dict.get("points"):
+        payload_dict["points"] = [
+            _binary_hover_point_item(item) if isinstance(item, Mapping) else item
+            for item in list(payload_dict.get("points") or [])
+        ]
+    return payload_dict
+
+
+def _scene_item_ids(collection: str, items: list[object]) -> list[str]:
+    """Stable per-item ids: collection, role and name (or label text/position).
+
+    Duplicates get an ordinal suffix, so editing one well keeps the ids of
+    every other well's objects unchanged between reruns.
+    """
+    seen: dict[str, int] = {}
+    ids: list[str] = []
+    for item in items:
+        base_id = f"{collection}:"
+        if isinstance(item, Mapping):
+            base_id += f"{item.get('role') or ''}:{item.get('name') or item.get('text') or ''}"
+            if collection == "labels":
+                base_id += f"@{item.get('position')}"
+        occurrence = seen.get(base_id, 0)
+        seen[base_id] = occurrence + 1
+        ids.append(base_id if occurrence == 0 else f"{base_id}#{occurrence}")
+    return ids
+
+
+def _json_default(value: object) -> object:
+    # Merged meshes and hover columns keep NumPy buffers; the JSON transport
+    # writes them as lists with null for missing numbers.
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f" and not np.all(np.isfinite(value)):
+            return np.where(np.isfinite(value), value, None).tolist()
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_text(value: object) -> str:
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=_json_default,
+    ).replace("</", "<\\/")
+
+
+def _item_digest(item_json: str) -> str:
+    return hashlib.blake2b(item_json.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _serialized_scene(
     payload: Mapping[str, object],
     *,
     stable_key: str,
     instance_token: int,
-) -> tuple[str, str, str]:
+    transport: str,
+) -> dict[str, object]:
     resolved_instance_token = int(instance_token)
+    resolved_transport = str(transport)
     for entry in reversed(_SERIALIZED_PAYLOAD_CACHE):
         if (
             entry.get("payload") is payload
             and entry.get("stable_key") == stable_key
             and int(entry.get("instance_token", 0)) == resolved_instance_token
+            and entry.get("transport") == resolved_transport
         ):
-            return (
-                str(entry.get("payload_json", "")),
-                str(entry.get("payload_digest", "")),
-                str(entry.get("edit_channel", "")),
-            )
+            return entry
     channel_digest = hashlib.blake2b(
         f"{stable_key}:{resolved_instance_token}".encode("utf-8"),
         digest_size=10,
     ).hexdigest()
     edit_channel = f"pywp_three_edit_{channel_digest}"
-    payload_dict = dict(payload)
+    payload_dict = _transport_payload(payload, transport=resolved_transport)
     payload_dict["edit_channel"] = edit_channel
-    payload_json = json.dumps(
-        payload_dict,
-        ensure_ascii=False,
-        separators=(",", ":"),
-    ).replace("</", "<\\/")
-    payload_digest = _payload_digest(payload_json)
-    _SERIALIZED_PAYLOAD_CACHE.append(
-        {
-            "payload": payload,
-            "stable_key": stable_key,
-            "instance_token": resolved_instance_token,
-            "edit_channel": edit_channel,
-            "payload_json": payload_json,
-            "payload_digest": payload_digest,
-        }
-    )
+    top_level = {
+        key: value
+        for key, value in payload_dict.items()
+        if key not in _SCENE_COLLECTIONS or not isinstance(value, list)
+    }
+    top_json = _json_text(top_level)
+    # Collections are serialized item by item so that scene deltas can reuse
+    # the exact item JSON and its digest.
+    scene_items: dict[str, list[tuple[str, str, str]]] = {}
+    scene_ids_json: dict[str, str] = {}
+    for collection in _SCENE_COLLECTIONS:
+        items = payload_dict.get(collection)
+        if collection in top_level or items is None:
+            continue
+        item_ids = _scene_item_ids(collection, list(items))
+        serialized_items: list[tuple[str, str, str]] = []
+        for scene_id, item in zip(item_ids, items):
+            if isinstance(item, Mapping):
+                item_json = _json_text({**item, "scene_id": scene_id})
+                serialized_items.append((scene_id, item_json, _item_digest(item_json)))
+            else:
+                serialized_items.append((scene_id, _json_text(item), ""))
+        scene_items[collection] = serialized_items
+        scene_ids_json[collection] = _json_text(item_ids)
+    collection_parts = [
+        f'"{collection}":[' + ",".join(item_json for _, item_json, _ in items) + "]"
+        for collection, items in scene_items.items()
+    ]
+    top_body = top_json[1:-1]
+    payload_json = "{" + ",".join(([top_body] if top_body else []) + collection_parts) + "}"
+    entry: dict[str, object] = {
+        "payload": payload,
+        "stable_key": stable_key,
+        "instance_token": resolved_instance_token,
+        "transport": resolved_transport,
+        "edit_channel": edit_channel,
+        "payload_json": payload_json,
+        "payload_digest": _payload_digest(payload_json),
+        "top_json": top_json,
+        "scene_items": scene_items,
+        "scene_ids_json": scene_ids_json,
+    }
+    _SERIALIZED_PAYLOAD_CACHE.append(entry)
     if len(_SERIALIZED_PAYLOAD_CACHE) > 4:
         del _SERIALIZED_PAYLOAD_CACHE[:-4]
-    return payload_json, payload_digest, edit_channel
+    return entry
+
+
+def _serialized_payload(
+    payload: Mapping[str, object],
+    *,
+    stable_key: str,
+    instance_token: int,
+    transport: str = THREE_PAYLOAD_TRANSPORT_BINARY,
+) -> tuple[str, str, str]:
+    entry = _serialized_scene(
+        payload,
+        stable_key=stable_key,
+        instance_token=instance_token,
+        transport=transport,
+    )
+    return (
+        str(entry.get("payload_json", "")),
+        str(entry.get("payload_digest", "")),
+        str(entry.get("edit_channel", "")),
+    )
+
+
+def _scene_item_digests(entry: Mapping[str, object]) -> dict[str, dict[str, str]]:
+    scene_items = entry.get("scene_items") or {}
+    return {
+        str(collection): {
+            scene_id: digest for scene_id, _, digest in items if digest
+        }
+        for collection, items in dict(scene_items).items()
+    }
+
+
+def _scene_delta_json(
+    entry: Mapping[str, object],
+    *,
+    base_digest: str,
+    base_item_digests: Mapping[str, Mapping[str, str]],
+) -> str:
+    """Scene delta against the payload the viewer already holds.
+
+    Top-level keys are always sent whole (they are small); every collection
+    carries its full id order plus only the items that are new or changed.
+    """
+    scene_items = dict(entry.get("scene_items") or {})
+    scene_ids_json = dict(entry.get("scene_ids_json") or {})
+    collection_parts: list[str] = []
+    for collection, items in scene_items.items():
+        base_digests = base_item_digests.get(collection, {})
+        changed_items = ",".join(
+            f"{_json_text(scene_id)}:{item_json}"
+            for scene_id, item_json, digest in items
+            if not digest or base_digests.get(scene_id) != digest
+        )
+        collection_parts.append(
+            f'"{collection}":{{"ids":{scene_ids_json.get(collection, "[]")},'
+            f'"items":{{{changed_items}}}}}'
+        )
+    return (
+        f'{{"base_digest":"{base_digest}",'
+        f'"top":{entry.get("top_json", "{}")},'
+        f'"collections":{{{",".join(collection_parts)}}}}}'
+    )
+
+
+def _scene_delta_states() -> dict[str, object]:
+    states = st.session_state.get(_SCENE_DELTA_STATE_KEY)
+    if not isinstance(states, dict):
+        states = {"bases": {}, "pending": {}, "handled_resync_nonces": []}
+        st.session_state[_SCENE_DELTA_STATE_KEY] = states
+    return states
+
+
+def _consume_resync_request(
+    states: dict[str, object],
+    *,
+    component_key: str,
+    value: object,
+) -> bool:
+    """Forget the delta base once the viewer reports it cannot apply deltas."""
+    if not isinstance(value, Mapping) or str(value.get("type") or "") != _RESYNC_EVENT:
+        return False
+    nonce = str(value.get("nonce") or "")
+    handled = list(states.get("handled_resync_nonces") or [])
+    if not nonce or nonce in handled:
+        return False
+    states["handled_resync_nonces"] = [*handled[-15:], nonce]
+    for registry_key in ("bases", "pending"):
+        registry = states.setdefault(registry_key, {})
+        if isinstance(registry, dict):
+            registry.pop(component_key, None)
+    return True
+
+
+def _consume_ack(
+    states: dict[str, object],
+    *,
+    component_key: str,
+    value: object,
+) -> bool:
+    """Promote the pending payload to the delta base once the viewer applied it."""
+    if not isinstance(value, Mapping) or str(value.get("type") or "") != _ACK_EVENT:
+        return False
+    pending = states.setdefault("pending", {})
+    if not isinstance(pending, dict):
+        return False
+    candidate = pending.get(component_key)
+    if not isinstance(candidate, Mapping) or str(
+        candidate.get("payload_digest") or ""
+    ) != str(value.get("payload_digest") or ""):
+        return False
+    states.setdefault("bases", {})[component_key] = pending.pop(component_key)
+    return True
 
 
 def render_local_three_scene(
@@ -128,24 +465,70 @@ def render_local_three_scene(
     height: int,
     instance_token: int = 0,
     key: str | None = None,
+    transport: str = THREE_PAYLOAD_TRANSPORT_BINARY,
+    incremental: bool = True,
 ) -> object:
     stable_key = str(key or payload.get("title") or "scene")
-    payload_json, payload_digest, edit_channel = _serialized_payload(
+    component_key = f"three-viewer-runtime-{stable_key}"
+    entry = _serialized_scene(
         payload,
         stable_key=stable_key,
         instance_token=int(instance_token),
+        transport=str(transport),
     )
-    return _viewer_component(
-        payload_json=payload_json,
+    payload_json = str(entry.get("payload_json", ""))
+    payload_digest = str(entry.get("payload_digest", ""))
+    runtime_digest = _viewer_runtime_digest()
+    delta_json = ""
+    delta_base_digest = ""
+    states = _scene_delta_states()
+    if incremental:
+        previous_value = st.session_state.get(component_key)
+        _consume_resync_request(
+            states,
+            component_key=component_key,
+            value=previous_value,
+        )
+        _consume_ack(states, component_key=component_key, value=previous_value)
+        base = states.setdefault("bases", {}).get(component_key)
+        if isinstance(base, Mapping) and base.get("runtime_digest") == runtime_digest:
+            delta_base_digest = str(base.get("payload_digest") or "")
+            delta_json = _scene_delta_json(
+                entry,
+                base_digest=delta_base_digest,
+                base_item_digests=dict(base.get("item_digests") or {}),
+            )
+        # The payload sent now becomes the base of the next delta only once
+        # the viewer acknowledges it, so a lost update never leaves the
+        # server diffing against a scene the viewer does not hold.
+        if delta_base_digest != payload_digest:
+            states.setdefault("pending", {})[component_key] = {
+                "payload_digest": payload_digest,
+                "runtime_digest": runtime_digest,
+                "item_digests": _scene_item_digests(entry),
+            }
+    value = _viewer_component(
+        payload_json="" if delta_json else payload_json,
         payload_digest=payload_digest,
-        runtime_digest=_viewer_runtime_digest(),
+        delta_json=delta_json,
+        delta_base_digest=delta_base_digest,
+        runtime_digest=runtime_digest,
         has_anticollision_payload=bool(
             payload.get("anti_collision_layer_state")
             or payload.get("collisions")
         ),
-        channel=edit_channel,
+        channel=str(entry.get("edit_channel", "")),
+        request_ack=bool(incremental),
         height=int(height),
         instance_token=int(instance_token),
         default=None,
-        key=f"three-viewer-runtime-{stable_key}",
+        key=component_key,
     )
+    if isinstance(value, Mapping) and str(value.get("type") or "") == _RESYNC_EVENT:
+        if _consume_resync_request(states, component_key=component_key, value=value):
+            st.rerun()
+        return None
+    if isinstance(value, Mapping) and str(value.get("type") or "") == _ACK_EVENT:
+        _consume_ack(states, component_key=component_key, value=value)
+        return None
+    return value
@@ -68,6 +68,7 @@ SUMMARY_TECH_HIDDEN_METRICS = frozenset(
         "t3_miss_dx_m",
         "t3_miss_dy_m",
         "t3_miss_dz_m",
+        "display_crs_approximation_error_m",
     }
 )
 
@@ -714,3 +715,10 @@ def render_result_tables(
             export_azi_true_deg=survey_export_azi_true_deg,
             export_azi_grid_deg=survey_export_azi_grid_deg,
         )
+        approximation_error_m = view.summary.get("display_crs_approximation_error_m")
+        if approximation_error_m is not None:
+            st.caption(
+                f"X/Y{fallback_xy_label_suffix} на экране пересчитаны локальной "
+                "полиномиальной аппроксимацией: отклонение от точного пересчёта "
+                f"не более {float(approximation_error_m) * 1000.0:.1f} мм."
+            )
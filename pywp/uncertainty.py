@@ -310,6 +310,23 @@ def local_uncertainty_axes_xyz(
     return tangent, inc_axis, azi_axis
 
 
+def _local_uncertainty_axes_xyz_many(
+    *,
+    inc_deg: np.ndarray,
+    azi_deg: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    inc_rad = np.asarray(inc_deg, dtype=float) * DEG2RAD
+    azi_rad = (np.asarray(azi_deg, dtype=float) % 360.0) * DEG2RAD
+    sin_inc = np.sin(inc_rad)
+    cos_inc = np.cos(inc_rad)
+    sin_azi = np.sin(azi_rad)
+    cos_azi = np.cos(azi_rad)
+    tangent = np.column_stack([sin_inc * sin_azi, sin_inc * cos_azi, cos_inc])
+    inc_axis = np.column_stack([cos_inc * sin_azi, cos_inc * cos_azi, -sin_inc])
+    azi_axis = np.column_stack([cos_azi, -sin_azi, np.zeros_like(azi_rad)])
+    return tangent, inc_axis, azi_axis
+
+
 def station_uncertainty_axes_m(
     *,
     md_m: float,
@@ -793,6 +810,86 @@ def _normal_plane_axis(
     return candidate / norm
 
 
+def _normal_plane_ellipse_axes_from_covariance_many(
+    *,
+    covariance_xyz: np.ndarray,
+    tangents: np.ndarray,
+    primary_axes: np.ndarray,
+    secondary_axes: np.ndarray,
+    confidence_scale: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Row-wise ``_normal_plane_ellipse_axes_from_covariance`` for N samples."""
+    tangent_unit = np.asarray(tangents, dtype=float).reshape(-1, 3)
+    tangent_norm = np.linalg.norm(tangent_unit, axis=1)
+    degenerate_tangent = tangent_norm <= 1e-12
+    tangent_unit = np.where(
+        degenerate_tangent[:, None],
+        np.array([0.0, 0.0, 1.0], dtype=float),
+        tangent_unit / np.where(degenerate_tangent, 1.0, tangent_norm)[:, None],
+    )
+
+    axis_1, valid_1 = _normal_plane_axes_many(primary_axes, tangent_unit)
+    axis_2, valid_2 = _normal_plane_axes_many(
+        secondary_axes, tangent_unit, orthogonal_to=axis_1
+    )
+    if not np.all(valid_2):
+        fallback_axis_2 = np.cross(tangent_unit, axis_1)
+        fallback_axis_2 = fallback_axis_2 / np.maximum(
+            np.linalg.norm(fallback_axis_2, axis=1), 1e-12
+        )[:, None]
+        axis_2 = np.where(valid_2[:, None], axis_2, fallback_axis_2)
+    if not np.all(valid_1):
+        axis_1[~valid_1], axis_2[~valid_1] = _stable_normal_plane_bases(
+            tangent_unit[~valid_1]
+        )
+
+    sample_count = len(tangent_unit)
+    covariance = np.asarray(covariance_xyz, dtype=float).reshape(sample_count, 3, 3)
+    finite = np.all(np.isfinite(covariance), axis=(1, 2))
+    covariance = np.where(finite[:, None, None], covariance, 0.0)
+    basis = np.stack([axis_1, axis_2], axis=2)
+    basis_t = np.swapaxes(basis, 1, 2)
+    projected = basis_t @ (0.5 * (covariance + np.swapaxes(covariance, 1, 2))) @ basis
+    projected = 0.5 * (projected + np.swapaxes(projected, 1, 2))
+    eigenvalues, eigenvectors = np.linalg.eigh(projected)
+    # eigh sorts ascending; the major axis goes first.
+    eigenvalues = np.clip(eigenvalues[:, ::-1], 0.0, None)
+    eigenvectors = eigenvectors[:, :, ::-1]
+    scale = float(max(confidence_scale, 0.0))
+    semi_major = np.where(finite, scale * np.sqrt(eigenvalues[:, 0]), 0.0)
+    semi_minor = np.where(finite, scale * np.sqrt(eigenvalues[:, 1]), 0.0)
+    axis_major = (basis @ eigenvectors[:, :, 0:1])[:, :, 0]
+    axis_minor = (basis @ eigenvectors[:, :, 1:2])[:, :, 0]
+    axis_major = axis_major / np.maximum(np.linalg.norm(axis_major, axis=1), 1e-12)[
+        :, None
+    ]
+    axis_minor = axis_minor / np.maximum(np.linalg.norm(axis_minor, axis=1), 1e-12)[
+        :, None
+    ]
+    axis_major = np.where(finite[:, None], axis_major, axis_1)
+    axis_minor = np.where(finite[:, None], axis_minor, axis_2)
+    return semi_major, semi_minor, axis_major, axis_minor
+
+
+def _normal_plane_axes_many(
+    axes: np.ndarray,
+    tangent_unit: np.ndarray,
+    orthogonal_to: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    candidate = np.asarray(axes, dtype=float)
+    candidate = (
+        candidate - np.sum(candidate * tangent_unit, axis=1)[:, None] * tangent_unit
+    )
+    if orthogonal_to is not None:
+        candidate = (
+            candidate
+            - np.sum(candidate * orthogonal_to, axis=1)[:, None] * orthogonal_to
+        )
+    norm = np.linalg.norm(candidate, axis=1)
+    valid = norm > 1e-12
+    return candidate / np.where(valid, norm, 1.0)[:, None], valid
+
+
 def build_uncertainty_overlay(
     *,
     stations: pd.DataFrame,
@@ -818,8 +915,6 @@ def build_uncertainty_overlay(
     )
     azi_values_rad = np.unwrap(np.deg2rad(azi_values_deg))
     angles = np.linspace(0.0, 2.0 * np.pi, int(model.ellipse_points), endpoint=False)
-    samples: list[UncertaintyEllipseSample] = []
-    previous_ring_open_xyz: np.ndarray | None = None
     sample_md_values = _display_sample_md_values(
         md_values=md_values,
         inc_values=inc_values,
@@ -834,110 +929,111 @@ def build_uncertainty_overlay(
         sample_md_m=np.asarray(sample_md_values, dtype=float),
         model=model,
     )
-    for sample_index, md_m in enumerate(sample_md_values):
-        state = _interpolate_station_state(
-            md_values=md_values,
-            inc_values=inc_values,
-            azi_values_rad=azi_values_rad,
-            x_values=x_values,
-            y_values=y_values,
-            z_values=z_values,
-            md_m=float(md_m),
-        )
-        station_index = int(np.argmin(np.abs(md_values - state["md_m"])))
-        md_m = float(state["md_m"])
-        inc_deg = float(state["inc_deg"])
-        azi_deg = float(state["azi_deg"])
-        tangent, inc_axis, azi_axis = local_uncertainty_axes_xyz(
-            inc_deg=inc_deg,
-            azi_deg=azi_deg,
-        )
-        if abs(float(inc_deg)) < float(model.near_vertical_isotropic_threshold_deg):
-            inc_axis, azi_axis = _stable_normal_plane_basis(tangent)
-        covariance_xyz = np.asarray(
-            covariance_samples.covariance_xyz[int(sample_index)], dtype=float
+    sample_md = np.clip(
+        np.asarray(sample_md_values, dtype=float),
+        float(md_values[0]),
+        float(md_values[-1]),
+    )
+    sample_inc_deg = np.interp(sample_md, md_values, inc_values)
+    sample_azi_deg = np.rad2deg(np.interp(sample_md, md_values, azi_values_rad)) % 360.0
+    centers_xyz = np.column_stack(
+        [
+            np.interp(sample_md, md_values, x_values),
+            np.interp(sample_md, md_values, y_values),
+            np.interp(sample_md, md_values, z_values),
+        ]
+    )
+    station_indices = _nearest_station_indices(md_values, sample_md)
+    tangents, inc_axes, azi_axes = _local_uncertainty_axes_xyz_many(
+        inc_deg=sample_inc_deg,
+        azi_deg=sample_azi_deg,
+    )
+    near_vertical = np.abs(sample_inc_deg) < float(
+        model.near_vertical_isotropic_threshold_deg
+    )
+    if np.any(near_vertical):
+        inc_axes[near_vertical], azi_axes[near_vertical] = (
+            _stable_normal_plane_bases(tangents[near_vertical])
         )
-        semi_inc_m, semi_azi_m, inc_axis, azi_axis = (
-            _normal_plane_ellipse_axes_from_covariance(
-                covariance_xyz=covariance_xyz,
-                tangent=tangent,
-                primary_axis=inc_axis,
-                secondary_axis=azi_axis,
-                confidence_scale=float(model.confidence_scale),
-            )
+    covariance_xyz = np.asarray(covariance_samples.covariance_xyz, dtype=float)
+    semi_inc_m, semi_azi_m, inc_axes, azi_axes = (
+        _normal_plane_ellipse_axes_from_covariance_many(
+            covariance_xyz=covariance_xyz,
+            tangents=tangents,
+            primary_axes=inc_axes,
+            secondary_axes=azi_axes,
+            confidence_scale=float(model.confidence_scale),
         )
-        if max(semi_inc_m, semi_azi_m) < float(model.min_display_radius_m):
-            continue
+    )
+    visible = np.flatnonzero(
+        np.maximum(semi_inc_m, semi_azi_m) >= float(model.min_display_radius_m)
+    )
+    if len(visible) == 0:
+        return WellUncertaintyOverlay(samples=(), model=model)
 
-        center = np.array(
-            [float(state["x_m"]), float(state["y_m"]), float(state["z_m"])], dtype=float
-        )
-        ring_open_xyz = (
-            center[None, :]
-            + np.cos(angles)[:, None] * (semi_inc_m * inc_axis[None, :])
-            + np.sin(angles)[:, None] * (semi_azi_m * azi_axis[None, :])
-        )
-        ring_open_xyz = _align_ring_for_continuity(
-            ring_open_xyz=ring_open_xyz,
-            previous_ring_open_xyz=previous_ring_open_xyz,
-        )
-        previous_ring_open_xyz = ring_open_xyz
-        ring_xyz = ring_open_xyz
-        ring_xyz = np.vstack([ring_xyz, ring_xyz[0]])
-        ring_plan_xy = ring_xyz[:, :2].copy()
-        ring_section_xz = np.column_stack(
-            [
-                _section_coordinate_xy(
-                    x_values=ring_xyz[:, 0],
-                    y_values=ring_xyz[:, 1],
-                    surface=surface,
-                    azimuth_deg=azimuth_deg,
-                ),
-                ring_xyz[:, 2],
-            ]
-        )
+    centers = centers_xyz[visible]
+    rings_open_xyz = (
+        centers[:, None, :]
+        + np.cos(angles)[None, :, None]
+        * (semi_inc_m[visible, None, None] * inc_axes[visible, None, :])
+        + np.sin(angles)[None, :, None]
+        * (semi_azi_m[visible, None, None] * azi_axes[visible, None, :])
+    )
+    rings_open_xyz = _align_ring_sequence_for_continuity(rings_open_xyz)
+    rings_xyz = np.concatenate([rings_open_xyz, rings_open_xyz[:, :1, :]], axis=1)
+    rings_section_x = _section_coordinate_xy(
+        x_values=rings_xyz[:, :, 0],
+        y_values=rings_xyz[:, :, 1],
+        surface=surface,
+        azimuth_deg=azimuth_deg,
+    )
+    centers_section_x = _section_coordinate_xy(
+        x_values=centers[:, 0],
+        y_values=centers[:, 1],
+        surface=surface,
+        azimuth_deg=azimuth_deg,
+    )
+    samples: list[UncertaintyEllipseSample] = []
+    for position, sample_index in enumerate(visible.tolist()):
+        center = centers[position]
+        ring_xyz = rings_xyz[position]
         samples.append(
             UncertaintyEllipseSample(
-                station_index=int(station_index),
-                md_m=md_m,
+                station_index=int(station_indices[sample_index]),
+                md_m=float(sample_md[sample_index]),
                 center_xyz=(float(center[0]), float(center[1]), float(center[2])),
                 center_plan_xy=(float(center[0]), float(center[1])),
                 center_section_xz=(
-                    float(
-                        _section_coordinate_xy(
-                            x_values=np.array([center[0]], dtype=float),
-                            y_values=np.array([center[1]], dtype=float),
-                            surface=surface,
-                            azimuth_deg=azimuth_deg,
-                        )[0]
-                    ),
+                    float(centers_section_x[position]),
                     float(center[2]),
                 ),
-                covariance_xyz=covariance_xyz,
+                covariance_xyz=np.asarray(covariance_xyz[sample_index], dtype=float),
                 covariance_xyz_random=np.asarray(
-                    covariance_samples.covariance_xyz_random[int(sample_index)],
+                    covariance_samples.covariance_xyz_random[sample_index],
                     dtype=float,
                 ),
                 covariance_xyz_systematic=np.asarray(
-                    covariance_samples.covariance_xyz_systematic[int(sample_index)],
+                    covariance_samples.covariance_xyz_systematic[sample_index],
                     dtype=float,
                 ),
                 covariance_xyz_global=np.asarray(
-                    covariance_samples.covariance_xyz_global[int(sample_index)],
+                    covariance_samples.covariance_xyz_global[sample_index],
                     dtype=float,
                 ),
                 global_source_vectors_xyz=tuple(
                     (
                         source_name,
-                        np.asarray(source_vectors[int(sample_index)], dtype=float),
+                        np.asarray(source_vectors[sample_index], dtype=float),
                     )
                     for source_name, source_vectors in covariance_samples.global_source_vectors_xyz
                 ),
                 ring_xyz=ring_xyz,
-                ring_plan_xy=ring_plan_xy,
-                ring_section_xz=ring_section_xz,
-                semi_axis_inc_m=float(semi_inc_m),
-                semi_axis_azi_m=float(semi_azi_m),
+                ring_plan_xy=ring_xyz[:, :2].copy(),
+                ring_section_xz=np.column_stack(
+                    [rings_section_x[position], ring_xyz[:, 2]]
+                ),
+                semi_axis_inc_m=float(semi_inc_m[sample_index]),
+                semi_axis_azi_m=float(semi_azi_m[sample_index]),
             )
         )
     return WellUncertaintyOverlay(samples=tuple(samples), model=model)
@@ -1100,50 +1196,60 @@ def _refine_sample_md_values(
     if len(sample_values) < 2:
         return sample_values
 
-    tangent_cache: dict[float, np.ndarray] = {}
-
-    def tangent_at(md_m: float) -> np.ndarray:
-        md_key = round(float(md_m), 6)
-        if md_key in tangent_cache:
-            return tangent_cache[md_key]
-        inc_deg = float(np.interp(md_key, md_values, inc_values))
-        azi_deg = float(
-            np.rad2deg(np.interp(md_key, md_values, azi_values_rad)) % 360.0
+    # Breadth-first bisection: every pass tests all open intervals at once and
+    # splits the ones whose tangent turns more than the threshold.
+    min_refined_step_m = float(model.min_refined_step_m)
+    threshold_deg = float(model.directional_refine_threshold_deg)
+    sample_md = np.asarray(sample_values, dtype=float)
+    refined: list[np.ndarray] = [sample_md[:1]]
+    md_left = sample_md[:-1]
+    md_right = sample_md[1:]
+    while len(md_left):
+        open_interval = (md_right - md_left) > 1e-6
+        md_left = md_left[open_interval]
+        md_right = md_right[open_interval]
+        accepted = (md_right - md_left) <= min_refined_step_m + 1e-9
+        to_test = ~accepted
+        if np.any(to_test):
+            accepted[to_test] = (
+                _tangent_angular_change_deg(
+                    md_values=md_values,
+                    inc_values=inc_values,
+                    azi_values_rad=azi_values_rad,
+                    md_left=md_left[to_test],
+                    md_right=md_right[to_test],
+                )
+                <= threshold_deg
+            )
+        midpoint = np.round(0.5 * (md_left + md_right), 6)
+        accepted |= (midpoint <= md_left + 1e-6) | (midpoint >= md_right - 1e-6)
+        refined.append(md_right[accepted])
+        split = ~accepted
+        md_left, md_right = (
+            np.concatenate([md_left[split], midpoint[split]]),
+            np.concatenate([midpoint[split], md_right[split]]),
         )
-        tangent = tangent_vector_xyz(inc_deg=inc_deg, azi_deg=azi_deg)
-        tangent_cache[md_key] = tangent
-        return tangent
-
-    def angular_change_deg(md_left: float, md_right: float) -> float:
-        tangent_left = tangent_at(md_left)
-        tangent_right = tangent_at(md_right)
-        cosine = float(np.clip(np.dot(tangent_left, tangent_right), -1.0, 1.0))
-        return float(np.degrees(np.arccos(cosine)))
-
-    refined: list[float] = [float(sample_values[0])]
-
-    def refine_interval(md_left: float, md_right: float) -> None:
-        interval_m = float(md_right - md_left)
-        if interval_m <= 1e-6:
-            return
-        if interval_m <= float(model.min_refined_step_m) + 1e-9:
-            refined.append(float(md_right))
-            return
-        if angular_change_deg(md_left, md_right) <= float(
-            model.directional_refine_threshold_deg
-        ):
-            refined.append(float(md_right))
-            return
-        midpoint = round(float(0.5 * (md_left + md_right)), 6)
-        if midpoint <= md_left + 1e-6 or midpoint >= md_right - 1e-6:
-            refined.append(float(md_right))
-            return
-        refine_interval(md_left, midpoint)
-        refine_interval(midpoint, md_right)
+    return sorted(
+        set(round(float(value), 6) for value in np.concatenate(refined).tolist())
+    )
 
-    for md_left, md_right in zip(sample_values, sample_values[1:]):
-        refine_interval(float(md_left), float(md_right))
-    return sorted(set(round(float(value), 6) for value in refined))
+
+def _tangent_angular_change_deg(
+    *,
+    md_values: np.ndarray,
+    inc_values: np.ndarray,
+    azi_values_rad: np.ndarray,
+    md_left: np.ndarray,
+    md_right: np.ndarray,
+) -> np.ndarray:
+    md_pair = np.concatenate([md_left, md_right])
+    tangents, _, _ = _local_uncertainty_axes_xyz_many(
+        inc_deg=np.interp(md_pair, md_values, inc_values),
+        azi_deg=np.rad2deg(np.interp(md_pair, md_values, azi_values_rad)) % 360.0,
+    )
+    count = len(md_left)
+    cosine = np.clip(np.sum(tangents[:count] * tangents[count:], axis=1), -1.0, 1.0)
+    return np.degrees(np.arccos(cosine))
 
 
 def _downsample_sample_md_values(
@@ -1188,30 +1294,15 @@ def _downsample_sample_md_values(
     return sorted(selected)
 
 
-def _interpolate_station_state(
-    *,
+def _nearest_station_indices(
     md_values: np.ndarray,
-    inc_values: np.ndarray,
-    azi_values_rad: np.ndarray,
-    x_values: np.ndarray,
-    y_values: np.ndarray,
-    z_values: np.ndarray,
-    md_m: float,
-) -> dict[str, float]:
-    _validate_md_values_for_interpolation(
-        md_values, context="uncertainty interpolation"
-    )
-    md_value = float(np.clip(md_m, float(md_values[0]), float(md_values[-1])))
-    return {
-        "md_m": md_value,
-        "inc_deg": float(np.interp(md_value, md_values, inc_values)),
-        "azi_deg": float(
-            np.rad2deg(np.interp(md_value, md_values, azi_values_rad)) % 360.0
-        ),
-        "x_m": float(np.interp(md_value, md_values, x_values)),
-        "y_m": float(np.interp(md_value, md_values, y_values)),
-        "z_m": float(np.interp(md_value, md_values, z_values)),
-    }
+    sample_md: np.ndarray,
+) -> np.ndarray:
+    """Index of the closest station per sample; ties go to the shallower one."""
+    right = np.clip(np.searchsorted(md_values, sample_md, side="left"), 0, len(md_values) - 1)
+    left = np.clip(right - 1, 0, len(md_values) - 1)
+    take_left = np.abs(sample_md - md_values[left]) <= np.abs(md_values[right] - sample_md)
+    return np.where(take_left, left, right)
 
 
 def _validated_inclination_deg(inc_deg: float) -> float:
@@ -1352,49 +1443,47 @@ def build_uncertainty_tube_mesh(
     if points_per_ring < 3:
         return None
 
-    vertices = np.vstack(rings)
-    triangles_i: list[int] = []
-    triangles_j: list[int] = []
-    triangles_k: list[int] = []
-
-    for ring_index in range(len(rings) - 1):
-        start_a = ring_index * points_per_ring
-        start_b = (ring_index + 1) * points_per_ring
-        for point_index in range(points_per_ring):
-            next_index = (point_index + 1) % points_per_ring
-            a0 = start_a + point_index
-            a1 = start_a + next_index
-            b0 = start_b + point_index
-            b1 = start_b + next_index
-            triangles_i.extend([a0, a0])
-            triangles_j.extend([a1, b1])
-            triangles_k.extend([b1, b0])
-
-    start_cap_center_index = int(len(vertices))
-    end_cap_center_index = start_cap_center_index + 1
     vertices = np.vstack(
         [
-            vertices,
+            np.vstack(rings),
             np.asarray(overlay.samples[0].center_xyz, dtype=float),
             np.asarray(overlay.samples[-1].center_xyz, dtype=float),
         ]
     )
-    for point_index in range(points_per_ring):
-        next_index = (point_index + 1) % points_per_ring
-        triangles_i.append(start_cap_center_index)
-        triangles_j.append(next_index)
-        triangles_k.append(point_index)
-
-        last_ring_start = (len(rings) - 1) * points_per_ring
-        triangles_i.append(end_cap_center_index)
-        triangles_j.append(last_ring_start + point_index)
-        triangles_k.append(last_ring_start + next_index)
+    ring_count = len(rings)
+    point_index = np.arange(points_per_ring, dtype=np.int32)
+    next_index = np.roll(point_index, -1)
+
+    # Side quads as two triangles (a0, a1, b1) and (a0, b1, b0), interleaved
+    # per point exactly as the viewer expects them.
+    ring_starts = (np.arange(ring_count - 1, dtype=np.int32) * points_per_ring)[
+        :, None
+    ]
+    a0 = ring_starts + point_index[None, :]
+    a1 = ring_starts + next_index[None, :]
+    b0 = a0 + points_per_ring
+    b1 = a1 + points_per_ring
+    side_i = np.stack([a0, a0], axis=2).ravel()
+    side_j = np.stack([a1, b1], axis=2).ravel()
+    side_k = np.stack([b1, b0], axis=2).ravel()
+
+    start_cap_center_index = ring_count * points_per_ring
+    last_ring_start = (ring_count - 1) * points_per_ring
+    cap_i = np.repeat(
+        np.array(
+            [[start_cap_center_index, start_cap_center_index + 1]], dtype=np.int32
+        ),
+        points_per_ring,
+        axis=0,
+    ).ravel()
+    cap_j = np.column_stack([next_index, last_ring_start + point_index]).ravel()
+    cap_k = np.column_stack([point_index, last_ring_start + next_index]).ravel()
 
     return UncertaintyTubeMesh(
-        vertices_xyz=np.asarray(vertices, dtype=float),
-        i=np.asarray(triangles_i, dtype=int),
-        j=np.asarray(triangles_j, dtype=int),
-        k=np.asarray(triangles_k, dtype=int),
+        vertices_xyz=vertices,
+        i=np.concatenate([side_i, cap_i]).astype(np.int32, copy=False),
+        j=np.concatenate([side_j, cap_j]).astype(np.int32, copy=False),
+        k=np.concatenate([side_k, cap_k]).astype(np.int32, copy=False),
     )
 
 
@@ -1507,29 +1596,73 @@ def _stable_normal_plane_basis(tangent: np.ndarray) -> tuple[np.ndarray, np.ndar
     return axis_1, axis_2
 
 
-def _align_ring_for_continuity(
-    *,
-    ring_open_xyz: np.ndarray,
-    previous_ring_open_xyz: np.ndarray | None,
-) -> np.ndarray:
-    if previous_ring_open_xyz is None:
-        return np.asarray(ring_open_xyz, dtype=float)
-
-    current = np.asarray(ring_open_xyz, dtype=float)
-    previous = np.asarray(previous_ring_open_xyz, dtype=float)
-    if current.shape != previous.shape or current.ndim != 2 or current.shape[0] < 3:
-        return current
-
-    best_ring = current
-    best_cost = float(np.mean(np.linalg.norm(current - previous, axis=1)))
-
-    for candidate_base in (current, current[::-1]):
-        for shift in range(current.shape[0]):
-            candidate = np.roll(candidate_base, shift=shift, axis=0)
-            candidate_cost = float(
-                np.mean(np.linalg.norm(candidate - previous, axis=1))
-            )
-            if candidate_cost + 1e-9 < best_cost:
-                best_ring = candidate
-                best_cost = candidate_cost
-    return best_ring
+def _stable_normal_plane_bases(
+    tangents: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise ``_stable_normal_plane_basis`` for an ``(N, 3)`` tangent array."""
+    tangent_unit = np.asarray(tangents, dtype=float).reshape(-1, 3)
+    tangent_norm = np.linalg.norm(tangent_unit, axis=1)
+    if np.any(tangent_norm <= 1e-12):
+        raise ValueError("tangent vector cannot be zero.")
+    tangent_unit = tangent_unit / tangent_norm[:, None]
+
+    reference = np.zeros_like(tangent_unit)
+    reference[:, 2] = 1.0
+    near_reference = np.abs(tangent_unit[:, 2]) > 0.98
+    reference[near_reference] = np.array([1.0, 0.0, 0.0], dtype=float)
+
+    axis_1 = np.cross(reference, tangent_unit)
+    axis_1_norm = np.linalg.norm(axis_1, axis=1)
+    degenerate = axis_1_norm <= 1e-12
+    if np.any(degenerate):
+        reference[degenerate] = np.array([0.0, 1.0, 0.0], dtype=float)
+        axis_1[degenerate] = np.cross(reference[degenerate], tangent_unit[degenerate])
+        axis_1_norm = np.linalg.norm(axis_1, axis=1)
+    axis_1 = axis_1 / axis_1_norm[:, None]
+    axis_2 = np.cross(tangent_unit, axis_1)
+    axis_2 = axis_2 / np.linalg.norm(axis_2, axis=1)[:, None]
+    return axis_1, axis_2
+
+
+def _align_ring_sequence_for_continuity(rings_open_xyz: np.ndarray) -> np.ndarray:
+    """Re-index consecutive rings so that point ``i`` stays on the same side.
+
+    Each ring may be rolled and/or reversed (a dihedral re-indexing) to
+    minimise the mean point distance to the previous aligned ring. The cost is
+    invariant under re-indexing both rings alike, so the best relative
+    re-indexing of every raw neighbour pair is found in one batched pass and
+    the per-ring orders follow by composing those permutations.
+    """
+    rings = np.asarray(rings_open_xyz, dtype=float)
+    if rings.ndim != 3 or rings.shape[0] < 2 or rings.shape[1] < 3:
+        return rings
+    point_count = int(rings.shape[1])
+    point_index = np.arange(point_count)
+    rolled = (point_index[None, :] - point_index[:, None]) % point_count
+    # Row 0 is the identity; rows mirror np.roll(ring, shift) and its reverse.
+    candidate_orders = np.vstack([rolled, point_count - 1 - rolled])
+
+    # distances[k, i, j]: point i of ring k to point j of ring k + 1.
+    offsets = rings[1:, None, :, :] - rings[:-1, :, None, :]
+    distances = np.sqrt(np.einsum("kijc,kijc->kij", offsets, offsets))
+    candidate_pairs = point_index[None, :] * point_count + candidate_orders
+    costs = np.mean(
+        np.take(
+            distances.reshape(len(distances), point_count * point_count),
+            candidate_pairs,
+            axis=1,
+        ),
+        axis=2,
+    )
+    best = np.argmin(costs, axis=1)
+    best_cost = costs[np.arange(len(best)), best]
+    best = np.where(best_cost + 1e-9 < costs[:, 0], best, 0)
+
+    ring_orders = np.empty((rings.shape[0], point_count), dtype=int)
+    ring_orders[0] = point_index
+    for ring_index, candidate_index in enumerate(best.tolist(), start=1):
+        ring_orders[ring_index] = candidate_orders[candidate_index][
+            ring_orders[ring_index - 1]
+        ]
+    return np.take_along_axis(rings, ring_orders[:, :, None], axis=1)
+
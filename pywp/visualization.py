@@ -11,6 +11,10 @@ from pywp.plot_axes import (
     nice_tick_step,
     reversed_axis_range,
 )
+from pywp.ptc_three_payload import (
+    polyline_vertex_significance,
+    simplified_polyline_indices,
+)
 from pywp.uncertainty import (
     WellUncertaintyOverlay,
     uncertainty_ribbon_polygon,
@@ -48,6 +52,59 @@ HOVER_TEMPLATE_XYZ_MD_DLS = (
     "ПИ: %{customdata[4]} deg/10m"
     "<extra>%{fullData.name}</extra>"
 )
+# Above this many stations across all inputs of one figure (every well of a
+# multi-well plot together) the line traces switch to WebGL and each keeps
+# only its most significant RDP stations.
+HIGH_VOLUME_STATION_THRESHOLD = 5000
+HIGH_VOLUME_MAX_POINTS_PER_TRACE = 1500
+
+
+def is_high_volume_figure(
+    *frames: pd.DataFrame | None,
+    high_volume: bool | None = None,
+) -> bool:
+    if high_volume is not None:
+        return bool(high_volume)
+    station_count = sum(len(frame) for frame in frames if frame is not None)
+    return station_count > HIGH_VOLUME_STATION_THRESHOLD
+
+
+def line_trace(high_volume: bool, **kwargs: object) -> go.Scatter | go.Scattergl:
+    if high_volume:
+        return go.Scattergl(**kwargs)
+    return go.Scatter(**kwargs)
+
+
+def decimated_station_indices(df: pd.DataFrame, *, max_points: int) -> np.ndarray:
+    """Curvature-aware subset of stations for 2D plots.
+
+    Stations are ranked by their Ramer-Douglas-Peucker significance in 3D,
+    the same ranking the 3D viewer uses for its LOD levels, so plan, section
+    and PI views keep the same bends. Segment boundaries are always kept.
+    """
+    count = len(df)
+    if count <= max(int(max_points), 2):
+        return np.arange(count)
+    significance = polyline_vertex_significance(
+        df[["X_m", "Y_m", "Z_m"]].to_numpy(dtype=float)
+    )
+    if "segment" in df.columns:
+        for start, end, _ in _segment_blocks(_segment_names(df)):
+            significance[[start, end - 1]] = np.inf
+    return simplified_polyline_indices(significance, max_points=int(max_points))
+
+
+def plot_stations(df: pd.DataFrame, high_volume: bool) -> pd.DataFrame:
+    """Stations to draw for one line trace of a possibly high-volume figure."""
+    if not high_volume or "Z_m" not in df.columns:
+        return df
+    indices = decimated_station_indices(
+        df,
+        max_points=HIGH_VOLUME_MAX_POINTS_PER_TRACE,
+    )
+    if len(indices) == len(df):
+        return df
+    return df.iloc[indices]
 
 
 def _t1_label_trace_2d(
@@ -92,16 +149,21 @@ def _pilot_study_points_dataframe(
     )
 
 
+def _segment_names(df: pd.DataFrame) -> np.ndarray:
+    return df["segment"].fillna("UNKNOWN").astype(str).str.upper().to_numpy()
+
+
 def _segment_blocks(segment_names: np.ndarray) -> list[tuple[int, int, str]]:
-    if len(segment_names) == 0:
+    count = len(segment_names)
+    if count == 0:
         return []
-    blocks: list[tuple[int, int, str]] = []
-    start = 0
-    for idx in range(1, len(segment_names) + 1):
-        if idx == len(segment_names) or segment_names[idx] != segment_names[start]:
-            blocks.append((start, idx, str(segment_names[start])))
-            start = idx
-    return blocks
+    names = np.asarray(segment_names)
+    starts = np.concatenate([[0], np.flatnonzero(names[1:] != names[:-1]) + 1])
+    ends = np.append(starts[1:], count)
+    return [
+        (int(start), int(end), str(names[start]))
+        for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+    ]
 
 
 def _inc_label_candidate_indices(df: pd.DataFrame) -> list[int]:
@@ -111,9 +173,7 @@ def _inc_label_candidate_indices(df: pd.DataFrame) -> list[int]:
 
     inc_values = df["INC_deg"].to_numpy(dtype=float)
     if "segment" in df.columns:
-        segment_names = (
-            df["segment"].fillna("UNKNOWN").astype(str).str.upper().to_numpy()
-        )
+        segment_names = _segment_names(df)
     else:
         segment_names = np.full(count, "TRAJECTORY", dtype=object)
 
@@ -159,43 +219,38 @@ def _select_inc_label_indices(df: pd.DataFrame, section_x: np.ndarray) -> list[i
     min_angle_step = 5
     max_labels = 8
 
-    selected: list[int] = []
-    seen_angles: set[int] = set()
-    for idx in candidates:
-        angle_int = int(np.rint(float(inc_values[idx])))
-        is_forced = idx in (0, count - 1)
+    # Candidate-to-candidate spacing and angle gaps are computed once; the
+    # greedy pass below only looks them up.
+    candidate_indices = np.asarray(candidates, dtype=int)
+    angles = np.rint(inc_values[candidate_indices]).astype(int)
+    candidate_x = section_x[candidate_indices]
+    candidate_z = z_values[candidate_indices]
+    spacing = np.hypot(
+        candidate_x[:, None] - candidate_x[None, :],
+        candidate_z[:, None] - candidate_z[None, :],
+    )
+    angle_gap = np.abs(angles[:, None] - angles[None, :])
+    crowded = (spacing < 0.7 * min_spacing) & (angle_gap <= 2)
+    forced = (candidate_indices == 0) | (candidate_indices == count - 1)
 
+    selected_positions: list[int] = []
+    seen_angles: set[int] = set()
+    for position in range(candidate_indices.size):
+        angle_int = int(angles[position])
         if angle_int in seen_angles:
             continue
-
-        if selected:
-            prev = selected[-1]
-            prev_angle = int(np.rint(float(inc_values[prev])))
-            spacing = float(
-                np.hypot(
-                    section_x[idx] - section_x[prev], z_values[idx] - z_values[prev]
-                )
-            )
-            if spacing < min_spacing and abs(angle_int - prev_angle) < min_angle_step:
-                if not is_forced:
-                    continue
-
-        crowding = False
-        for chosen in selected:
-            spacing = float(
-                np.hypot(
-                    section_x[idx] - section_x[chosen], z_values[idx] - z_values[chosen]
-                )
-            )
-            chosen_angle = int(np.rint(float(inc_values[chosen])))
-            if spacing < 0.7 * min_spacing and abs(angle_int - chosen_angle) <= 2:
-                crowding = True
-                break
-        if crowding and not is_forced:
-            continue
-
-        selected.append(idx)
+        if selected_positions and not forced[position]:
+            prev = selected_positions[-1]
+            if (
+                spacing[position, prev] < min_spacing
+                and angle_gap[position, prev] < min_angle_step
+            ):
+                continue
+            if np.any(crowded[position, selected_positions]):
+                continue
+        selected_positions.append(position)
         seen_angles.add(angle_int)
+    selected = [int(candidate_indices[position]) for position in selected_positions]
 
     if len(selected) <= max_labels:
         return selected
@@ -443,6 +498,7 @@ def plan_view_figure(
     pilot_name: str | None = None,
     pilot_stations: pd.DataFrame | None = None,
     pilot_study_points: tuple[Point3D, ...] = (),
+    high_volume: bool | None = None,
 ) -> go.Figure:
     pilot_points_df = _pilot_study_points_dataframe(
         pilot_name=pilot_name,
@@ -481,11 +537,21 @@ def plan_view_figure(
     x_tickvals = linear_tick_values(axis_range=x_range, step=xy_dtick)
     y_tickvals = linear_tick_values(axis_range=y_range, step=xy_dtick)
 
+    high_volume = is_high_volume_figure(
+        df,
+        plan_csb_df,
+        actual_df,
+        pilot_stations,
+        high_volume=high_volume,
+    )
+    plot_df = plot_stations(df, high_volume)
+
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
-            x=df["X_m"],
-            y=df["Y_m"],
+        line_trace(
+            high_volume,
+            x=plot_df["X_m"],
+            y=plot_df["Y_m"],
             mode="lines",
             name="Траектория",
             line={
@@ -493,7 +559,7 @@ def plan_view_figure(
                 "color": TRAJECTORY_COLOR_PRIMARY,
                 "dash": str(trajectory_line_dash),
             },
-            customdata=_station_hover_customdata(df),
+            customdata=_station_hover_customdata(plot_df),
             hovertemplate=HOVER_TEMPLATE_XYZ_MD_DLS,
         )
     )
@@ -504,47 +570,53 @@ def plan_view_figure(
             projection="plan",
         )
     if plan_csb_df is not None and len(plan_csb_df) > 0:
+        plot_plan_csb_df = plot_stations(plan_csb_df, high_volume)
         fig.add_trace(
-            go.Scatter(
-                x=plan_csb_df["X_m"],
-                y=plan_csb_df["Y_m"],
+            line_trace(
+                high_volume,
+                x=plot_plan_csb_df["X_m"],
+                y=plot_plan_csb_df["Y_m"],
                 mode="lines",
                 name="План ЦСБ",
                 line={"width": 3, "color": PLAN_CSB_COLOR},
                 customdata=_build_hover_customdata(
-                    x_values=plan_csb_df["X_m"].to_numpy(dtype=float),
-                    y_values=plan_csb_df["Y_m"].to_numpy(dtype=float),
-                    z_values=plan_csb_df["Z_m"].to_numpy(dtype=float),
+                    x_values=plot_plan_csb_df["X_m"].to_numpy(dtype=float),
+                    y_values=plot_plan_csb_df["Y_m"].to_numpy(dtype=float),
+                    z_values=plot_plan_csb_df["Z_m"].to_numpy(dtype=float),
                 ),
                 hovertemplate=HOVER_TEMPLATE_XYZ_MD_DLS,
             )
         )
     if actual_df is not None and len(actual_df) > 0:
+        plot_actual_df = plot_stations(actual_df, high_volume)
         fig.add_trace(
-            go.Scatter(
-                x=actual_df["X_m"],
-                y=actual_df["Y_m"],
+            line_trace(
+                high_volume,
+                x=plot_actual_df["X_m"],
+                y=plot_actual_df["Y_m"],
                 mode="lines",
                 name="Фактический профиль",
                 line={"width": 3, "color": ACTUAL_PROFILE_COLOR},
                 customdata=_build_hover_customdata(
-                    x_values=actual_df["X_m"].to_numpy(dtype=float),
-                    y_values=actual_df["Y_m"].to_numpy(dtype=float),
-                    z_values=actual_df["Z_m"].to_numpy(dtype=float),
+                    x_values=plot_actual_df["X_m"].to_numpy(dtype=float),
+                    y_values=plot_actual_df["Y_m"].to_numpy(dtype=float),
+                    z_values=plot_actual_df["Z_m"].to_numpy(dtype=float),
                 ),
                 hovertemplate=HOVER_TEMPLATE_XYZ_MD_DLS,
             )
         )
     if pilot_stations is not None and len(pilot_stations) > 0:
+        plot_pilot_stations = plot_stations(pilot_stations, high_volume)
         fig.add_trace(
-            go.Scatter(
-                x=pilot_stations["X_m"],
-                y=pilot_stations["Y_m"],
+            line_trace(
+                high_volume,
+                x=plot_pilot_stations["X_m"],
+                y=plot_pilot_stations["Y_m"],
                 mode="lines",
                 name=str(pilot_name or "Пилот"),
                 line={"width": 4, "color": TRAJECTORY_COLOR_PRIMARY},
                 opacity=0.95,
-                customdata=_station_hover_customdata(pilot_stations),
+                customdata=_station_hover_customdata(plot_pilot_stations),
                 hovertemplate=HOVER_TEMPLATE_XYZ_MD_DLS,
             )
         )
@@ -645,6 +717,7 @@ def section_view_figure(
     pilot_name: str | None = None,
     pilot_stations: pd.DataFrame | None = None,
     pilot_study_points: tuple[Point3D, ...] = (),
+    high_volume: bool | None = None,
 ) -> go.Figure:
     vs = _section_coordinate(df=df, surface=surface, azimuth_deg=azimuth_deg)
     pilot_points_df = _pilot_study_points_dataframe(
@@ -664,11 +737,25 @@ def section_view_figure(
         t_points, surface=surface, azimuth_deg=azimuth_deg
     )
 
+    high_volume = is_high_volume_figure(
+        df,
+        plan_csb_df,
+        actual_df,
+        pilot_stations,
+        high_volume=high_volume,
+    )
+    plot_df = plot_stations(df, high_volume)
+
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
-            x=vs,
-            y=df["Z_m"],
+        line_trace(
+            high_volume,
+            x=_section_coordinate(
+                df=plot_df,
+                surface=surface,
+                azimuth_deg=azimuth_deg,
+            ),
+            y=plot_df["Z_m"],
             mode="lines",
             name="Траектория",
             line={
@@ -676,67 +763,73 @@ def section_view_figure(
                 "color": TRAJECTORY_COLOR_PRIMARY,
                 "dash": str(trajectory_line_dash),
             },
-            customdata=_station_hover_customdata(df),
+            customdata=_station_hover_customdata(plot_df),
             hovertemplate=HOVER_TEMPLATE_XYZ_MD_DLS,
         )
     )
     if plan_csb_df is not None and len(plan_csb_df) > 0:
+        plot_plan_csb_df = plot_stations(plan_csb_df, high_volume)
         plan_csb_vs = _section_coordinate(
-            df=plan_csb_df,
+            df=plot_plan_csb_df,
             surface=surface,
             azimuth_deg=azimuth_deg,
         )
         fig.add_trace(
-            go.Scatter(
+            line_trace(
+                high_volume,
                 x=plan_csb_vs,
-                y=plan_csb_df["Z_m"],
+                y=plot_plan_csb_df["Z_m"],
                 mode="lines",
                 name="План ЦСБ",
                 line={"width": 3, "color": PLAN_CSB_COLOR},
                 customdata=_build_hover_customdata(
-                    x_values=plan_csb_df["X_m"].to_numpy(dtype=float),
-                    y_values=plan_csb_df["Y_m"].to_numpy(dtype=float),
-                    z_values=plan_csb_df["Z_m"].to_numpy(dtype=float),
+                    x_values=plot_plan_csb_df["X_m"].to_numpy(dtype=float),
+                    y_values=plot_plan_csb_df["Y_m"].to_numpy(dtype=float),
+                    z_values=plot_plan_csb_df["Z_m"].to_numpy(dtype=float),
                 ),
                 hovertemplate=HOVER_TEMPLATE_XYZ_MD_DLS,
             )
         )
     if actual_df is not None and len(actual_df) > 0:
+        plot_actual_df = plot_stations(actual_df, high_volume)
         actual_vs = _section_coordinate(
-            df=actual_df,
+            df=plot_actual_df,
             surface=surface,
             azimuth_deg=azimuth_deg,
         )
         fig.add_trace(
-            go.Scatter(
+            line_trace(
+                high_volume,
                 x=actual_vs,
-                y=actual_df["Z_m"],
+                y=plot_actual_df["Z_m"],
                 mode="lines",
                 name="Фактический профиль",
                 line={"width": 3, "color": ACTUAL_PROFILE_COLOR},
                 customdata=_build_hover_customdata(
-                    x_values=actual_df["X_m"].to_numpy(dtype=float),
-                    y_values=actual_df["Y_m"].to_numpy(dtype=float),
-                    z_values=actual_df["Z_m"].to_numpy(dtype=float),
+                    x_values=plot_actual_df["X_m"].to_numpy(dtype=float),
+                    y_values=plot_actual_df["Y_m"].to_numpy(dtype=float),
+                    z_values=plot_actual_df["Z_m"].to_numpy(dtype=float),
                 ),
                 hovertemplate=HOVER_TEMPLATE_XYZ_MD_DLS,
             )
         )
     if pilot_stations is not None and len(pilot_stations) > 0:
+        plot_pilot_stations = plot_stations(pilot_stations, high_volume)
         pilot_vs = _section_coordinate(
-            df=pilot_stations,
+            df=plot_pilot_stations,
             surface=surface,
             azimuth_deg=azimuth_deg,
         )
         fig.add_trace(
-            go.Scatter(
+            line_trace(
+                high_volume,
                 x=pilot_vs,
-                y=pilot_stations["Z_m"],
+                y=plot_pilot_stations["Z_m"],
                 mode="lines",
                 name=str(pilot_name or "Пилот"),
                 line={"width": 4, "color": TRAJECTORY_COLOR_PRIMARY},
                 opacity=0.95,
-                customdata=_station_hover_customdata(pilot_stations),
+                customdata=_station_hover_customdata(plot_pilot_stations),
                 hovertemplate=HOVER_TEMPLATE_XYZ_MD_DLS,
             )
         )
@@ -816,13 +909,19 @@ def section_view_figure(
 
 
 def dls_figure(
-    df: pd.DataFrame, dls_limits: dict[str, float], height: int = 560
+    df: pd.DataFrame,
+    dls_limits: dict[str, float],
+    height: int = 560,
+    high_volume: bool | None = None,
 ) -> go.Figure:
+    high_volume = is_high_volume_figure(df, high_volume=high_volume)
+    df = plot_stations(df, high_volume)
     fig = go.Figure()
     active_segments: set[str] | None = None
     if "segment" not in df.columns:
         fig.add_trace(
-            go.Scatter(
+            line_trace(
+                high_volume,
                 x=df["MD_m"],
                 y=dls_to_pi(df["DLS_deg_per_30m"].to_numpy(dtype=float)),
                 mode="lines+markers",
@@ -834,20 +933,16 @@ def dls_figure(
             )
         )
     else:
-        segments = df["segment"].fillna("UNKNOWN").astype(str).str.upper().to_numpy()
+        segments = _segment_names(df)
         active_segments = set(segments.tolist())
         legend_shown: set[str] = set()
-        start_idx = 0
-        for idx in range(1, len(df) + 1):
-            is_boundary = idx == len(df) or segments[idx] != segments[start_idx]
-            if not is_boundary:
-                continue
-
-            segment_name = segments[start_idx]
-            block = df.iloc[start_idx:idx]
+        blocks = _segment_blocks(segments)
+        for start_idx, end_idx, segment_name in blocks:
+            block = df.iloc[start_idx:end_idx]
             color = _segment_color(segment_name)
             fig.add_trace(
-                go.Scatter(
+                line_trace(
+                    high_volume,
                     x=block["MD_m"],
                     y=dls_to_pi(block["DLS_deg_per_30m"].to_numpy(dtype=float)),
                     mode="lines+markers",
@@ -861,23 +956,22 @@ def dls_figure(
                 )
             )
             legend_shown.add(segment_name)
-            start_idx = idx
 
         # Draw dashed links where segment traces break to keep PI transitions readable.
         md_values = df["MD_m"].to_numpy(dtype=float)
         dls_values = dls_to_pi(df["DLS_deg_per_30m"].to_numpy(dtype=float))
-        for idx in range(1, len(df)):
-            if segments[idx] == segments[idx - 1]:
-                continue
-            y0 = dls_values[idx - 1]
-            y1 = dls_values[idx]
-            if np.isnan(y0) or np.isnan(y1):
-                continue
+        boundaries = np.asarray([start for start, _, _ in blocks[1:]], dtype=int)
+        if boundaries.size:
+            boundaries = boundaries[
+                ~np.isnan(dls_values[boundaries - 1])
+                & ~np.isnan(dls_values[boundaries])
+            ]
+        for idx in boundaries.tolist():
             transition_df = df.iloc[idx - 1: idx + 1]
             fig.add_trace(
                 go.Scatter(
                     x=[md_values[idx - 1], md_values[idx]],
-                    y=[y0, y1],
+                    y=[dls_values[idx - 1], dls_values[idx]],
                     mode="lines",
                     name="Переход",
                     legendgroup="transition",
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 import logging
-from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
 from concurrent.futures.process import BrokenProcessPool
 from pickle import PicklingError
 from typing import Any, Callable, Iterable, Mapping
@@ -12,6 +18,7 @@ import numpy as np
 import pandas as pd
 from pydantic import field_validator
 
+from pywp.batch_cost_model import estimate_batch_costs, longest_first_order
 from pywp.eclipse_welltrack import (
     WelltrackRecord,
 )
@@ -48,7 +55,7 @@ from pywp.models import (
     TrajectoryConfig,
 )
 from pywp.multi_horizontal import extend_plan_with_multi_horizontal_targets
-from pywp.parallel import process_pool_context
+from pywp.parallel import PROCESS_POOL_ERRORS, process_pool_context
 from pywp.pilot_wells import (
     SidetrackWindowOverride,
     build_pilot_trajectory,
@@ -73,6 +80,7 @@ from pywp.welltrack_targets import ordinary_record_target_layout, record_point_l
 ProgressCallback = Callable[[int, int, str], None]
 SolverProgressCallback = Callable[[int, int, str, str, float], None]
 RecordDoneCallback = Callable[[int, int, str, dict[str, Any]], None]
+SuccessCallback = Callable[["SuccessfulWellPlan"], None]
 
 
 @dataclass(frozen=True)
@@ -320,6 +328,104 @@ class BatchEvaluationMetadata:
     cluster_resolved_early: bool = False
     cluster_blocked: bool = False
     cluster_blocking_reason: str | None = None
+    critical_path_well_names: tuple[str, ...] = ()
+    critical_path_runtime_s: float = 0.0
+    parallel_worker_count: int = 0
+    parallel_wall_s: float = 0.0
+
+
+@dataclass(frozen=True)
+class BatchDependencyGraph:
+    """Pilot -> parent dependencies between selected batch records.
+
+    ZBS records depend on the loaded actual fund, not on other batch records,
+    so they are always roots of the graph.
+    """
+
+    ordered_names: tuple[str, ...]
+    dependencies_by_name: Mapping[str, tuple[str, ...]]
+    dependents_by_name: Mapping[str, tuple[str, ...]]
+
+    @classmethod
+    def from_records(cls, records: Iterable[WelltrackRecord]) -> BatchDependencyGraph:
+        ordered = list(records)
+        name_by_key = {well_name_key(record.name): str(record.name) for record in ordered}
+        dependencies_by_name: dict[str, tuple[str, ...]] = {}
+        dependents: dict[str, list[str]] = {str(record.name): [] for record in ordered}
+        for record in ordered:
+            name = str(record.name)
+            dependencies: tuple[str, ...] = ()
+            if not is_pilot_record(record) and not is_zbs_record(record):
+                pilot_name = name_by_key.get(pilot_name_key_for_record(record))
+                if pilot_name is not None and pilot_name != name:
+                    dependencies = (pilot_name,)
+            dependencies_by_name[name] = dependencies
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+        return cls(
+            ordered_names=tuple(str(record.name) for record in ordered),
+            dependencies_by_name=dependencies_by_name,
+            dependents_by_name={
+                name: tuple(items) for name, items in dependents.items()
+            },
+        )
+
+    def roots(self) -> tuple[str, ...]:
+        return tuple(
+            name for name in self.ordered_names if not self.dependencies_by_name[name]
+        )
+
+    def chain_cost_s(self, cost_s_by_name: Mapping[str, float]) -> dict[str, float]:
+        """Own cost plus the most expensive chain of dependents per record."""
+        result: dict[str, float] = {}
+
+        def resolve(name: str) -> float:
+            if name not in result:
+                result[name] = float(cost_s_by_name.get(name, 0.0)) + max(
+                    (resolve(item) for item in self.dependents_by_name.get(name, ())),
+                    default=0.0,
+                )
+            return result[name]
+
+        for name in self.ordered_names:
+            resolve(name)
+        return result
+
+    def critical_path(
+        self,
+        runtime_s_by_name: Mapping[str, float],
+    ) -> tuple[tuple[str, ...], float]:
+        """Longest dependency chain by measured wall time per record."""
+        finish_s: dict[str, float] = {}
+        previous: dict[str, str | None] = {}
+
+        def resolve(name: str) -> float:
+            if name in finish_s:
+                return finish_s[name]
+            best_parent: str | None = None
+            best_start = 0.0
+            for dependency in self.dependencies_by_name.get(name, ()):
+                dependency_finish = resolve(dependency)
+                if best_parent is None or dependency_finish > best_start:
+                    best_parent, best_start = dependency, dependency_finish
+            previous[name] = best_parent
+            finish_s[name] = best_start + float(
+                max(runtime_s_by_name.get(name, 0.0), 0.0)
+            )
+            return finish_s[name]
+
+        names = [name for name in self.ordered_names if name in runtime_s_by_name]
+        if not names:
+            return (), 0.0
+        for name in names:
+            resolve(name)
+        tail = max(names, key=lambda item: finish_s[item])
+        path: list[str] = []
+        cursor: str | None = tail
+        while cursor is not None:
+            path.append(cursor)
+            cursor = previous.get(cursor)
+        return tuple(reversed(path)), float(finish_s[tail])
 
 
 class SuccessfulWellPlan(FrozenArbitraryModel):
@@ -507,6 +613,7 @@ def _evaluate_record_from_dicts(
     optimization_context_dict: dict | None = None,
     reference_well_dicts: tuple[dict, ...] | list[dict] | None = None,
     sidetrack_window_override_dict: dict | None = None,
+    pilot_success_dict: dict | None = None,
 ) -> tuple[dict[str, Any], dict | None]:
     """Worker entry-point that accepts/returns plain dicts.
 
@@ -521,19 +628,19 @@ def _evaluate_record_from_dicts(
     opt_ctx: AntiCollisionOptimizationContext | None = None
     if optimization_context_dict is not None:
         opt_ctx = _optimization_context_from_worker_payload(optimization_context_dict)
+    sidetrack_override = None
+    if sidetrack_window_override_dict is not None:
+        sidetrack_override = SidetrackWindowOverride(
+            kind=str(sidetrack_window_override_dict.get("kind", "")),
+            value_m=float(
+                sidetrack_window_override_dict.get("value_m", float("nan"))
+            ),
+        )
     if is_zbs_record(record):
         reference_wells = tuple(
             ImportedTrajectoryWell.model_validate(item)
             for item in tuple(reference_well_dicts or ())
         )
-        sidetrack_override = None
-        if sidetrack_window_override_dict is not None:
-            sidetrack_override = SidetrackWindowOverride(
-                kind=str(sidetrack_window_override_dict.get("kind", "")),
-                value_m=float(
-                    sidetrack_window_override_dict.get("value_m", float("nan"))
-                ),
-            )
         row, success = WelltrackBatchPlanner()._evaluate_zbs_record(
             record=record,
             config=config,
@@ -544,10 +651,34 @@ def _evaluate_record_from_dicts(
             sidetrack_window_override=sidetrack_override,
         )
         return row, success.model_dump() if success is not None else None
+    if pilot_success_dict is not None:
+        pilot_success = SuccessfulWellPlan.model_validate(pilot_success_dict)
+        row, success = WelltrackBatchPlanner()._evaluate_record(
+            record=record,
+            config=config,
+            optimization_context=opt_ctx,
+            recalculated_success_by_name={str(pilot_success.name): pilot_success},
+            sidetrack_window_override=sidetrack_override,
+        )
+        return row, success.model_dump() if success is not None else None
     row, success = _evaluate_record_standalone(record, config, opt_ctx)
     return row, success.model_dump() if success is not None else None
 
 
+def _timed_evaluate_record_from_dicts(
+    *args: Any,
+    **kwargs: Any,
+) -> tuple[dict[str, Any], dict | None, float]:
+    """``_evaluate_record_from_dicts`` plus the solve time measured in the worker.
+
+    Timing inside the worker keeps pool queueing out of the runtime used for
+    the dependency critical path.
+    """
+    started = perf_counter()
+    row, success_dict = _evaluate_record_from_dicts(*args, **kwargs)
+    return row, success_dict, float(perf_counter() - started)
+
+
 def _evaluate_record_standalone(
     record: WelltrackRecord,
     config: TrajectoryConfig,
@@ -800,6 +931,56 @@ def _missing_zbs_parent_problem(record: WelltrackRecord) -> str:
     )
 
 
+class _ParallelBatchInterrupted(Exception):
+    """The process pool failed mid-run; ``finished`` keeps completed wells.
+
+    Completed wells already went through the progress, record-done and
+    success callbacks, so the sequential fallback resumes with the rest.
+    """
+
+    def __init__(
+        self,
+        finished: Mapping[str, tuple[dict[str, Any], SuccessfulWellPlan | None]],
+    ) -> None:
+        super().__init__("parallel batch interrupted")
+        self.finished = dict(finished)
+
+
+class _ParallelCallbackFailed(Exception):
+    """A caller callback raised while the pool was running.
+
+    Wrapping keeps the callback's own error out of the pool-failure
+    fallback: ``evaluate`` re-raises ``error`` instead of re-running wells.
+    """
+
+    def __init__(self, error: Exception) -> None:
+        super().__init__("batch callback failed")
+        self.error = error
+
+
+
+def _notify_well_done(
+    *,
+    index: int,
+    total: int,
+    name: str,
+    row: dict[str, Any],
+    success: SuccessfulWellPlan | None,
+    progress_callback: ProgressCallback | None,
+    record_done_callback: RecordDoneCallback | None,
+    success_callback: SuccessCallback | None,
+) -> None:
+    try:
+        if success is not None and success_callback is not None:
+            success_callback(success)
+        if progress_callback is not None:
+            progress_callback(index, total, name)
+        if record_done_callback is not None:
+            record_done_callback(index, total, name, row)
+    except Exception as exc:
+        raise _ParallelCallbackFailed(exc) from exc
+
+
 class WelltrackBatchPlanner:
     def __init__(self, planner: TrajectoryPlanner | None = None):
         self._planner = planner or TrajectoryPlanner()
@@ -828,6 +1009,8 @@ class WelltrackBatchPlanner:
         solver_progress_callback: SolverProgressCallback | None = None,
         record_done_callback: RecordDoneCallback | None = None,
         parallel_workers: int = 0,
+        predicted_cost_s_by_name: Mapping[str, float] | None = None,
+        success_callback: SuccessCallback | None = None,
     ) -> tuple[list[dict[str, Any]], list[SuccessfulWellPlan]]:
         selected_records = self._selected_records_in_order(
             records=records,
@@ -841,17 +1024,34 @@ class WelltrackBatchPlanner:
         actual_reference_wells_by_key = _actual_reference_wells_by_key(
             reference_wells
         )
+        resumed_results: dict[str, tuple[dict[str, Any], SuccessfulWellPlan | None]] = {}
 
         # ------------------------------------------------------------------
         # Parallel fast-path: when workers > 1 and no dynamic cluster
         # context (which requires iterative sequential execution), submit
-        # all selected wells to a process pool.
+        # all selected wells to a process pool. Solver stages run inside
+        # the workers, so ``solver_progress_callback`` is not called on
+        # this path; progress is reported once per finished well.
         # ------------------------------------------------------------------
         if (
             int(parallel_workers) > 1
             and dynamic_cluster_context is None
             and len(selected_records) > 1
         ):
+            cost_s_by_name = {
+                str(name): float(value)
+                for name, value in (predicted_cost_s_by_name or {}).items()
+            }
+            cost_s_by_name.update(
+                {
+                    name: float(estimate.predicted_s)
+                    for name, estimate in estimate_batch_costs(
+                        record
+                        for record in selected_records
+                        if str(record.name) not in cost_s_by_name
+                    ).items()
+                }
+            )
             try:
                 if self._has_pilot_dependencies(selected_records):
                     return self._evaluate_parallel_with_pilot_dependencies(
@@ -860,14 +1060,14 @@ class WelltrackBatchPlanner:
                         config_by_name=config_by_name,
                         optimization_context_by_name=optimization_context_by_name,
                         reference_wells=tuple(reference_wells),
-                        actual_reference_wells_by_key=actual_reference_wells_by_key,
                         sidetrack_window_overrides_by_key=(
                             sidetrack_window_overrides_by_key
                         ),
                         progress_callback=progress_callback,
-                        solver_progress_callback=solver_progress_callback,
                         record_done_callback=record_done_callback,
                         parallel_workers=int(parallel_workers),
+                        cost_s_by_name=cost_s_by_name,
+                        success_callback=success_callback,
                     )
                 else:
                     return self._evaluate_parallel(
@@ -882,19 +1082,27 @@ class WelltrackBatchPlanner:
                         progress_callback=progress_callback,
                         record_done_callback=record_done_callback,
                         parallel_workers=int(parallel_workers),
+                        cost_s_by_name=cost_s_by_name,
+                        success_callback=success_callback,
                     )
-            except (
-                BrokenProcessPool,
-                PicklingError,
-                OSError,
-                RuntimeError,
-                ValueError,
-            ):
+            except _ParallelCallbackFailed as failed:
+                raise failed.error from None
+            except _ParallelBatchInterrupted as interrupted:
+                resumed_results = interrupted.finished
+            except PROCESS_POOL_ERRORS:
                 pass
 
-        summary_rows: list[dict[str, Any]] = []
-        evaluated_rows_by_name: dict[str, dict[str, Any]] = {}
-        successes: list[SuccessfulWellPlan] = []
+        summary_rows: list[dict[str, Any]] = [
+            row for row, _success in resumed_results.values()
+        ]
+        evaluated_rows_by_name: dict[str, dict[str, Any]] = {
+            name: dict(row) for name, (row, _success) in resumed_results.items()
+        }
+        successes: list[SuccessfulWellPlan] = [
+            success
+            for _row, success in resumed_results.values()
+            if success is not None
+        ]
         total = len(selected_records)
         total_planned_steps = int(total)
         selected_records_by_name = {
@@ -908,9 +1116,15 @@ class WelltrackBatchPlanner:
                 else ()
             )
         }
-        remaining_selected_names = [str(record.name) for record in selected_records]
-        recalculated_success_by_name: dict[str, SuccessfulWellPlan] = {}
-        executed_well_names: list[str] = []
+        remaining_selected_names = [
+            str(record.name)
+            for record in selected_records
+            if str(record.name) not in resumed_results
+        ]
+        recalculated_success_by_name: dict[str, SuccessfulWellPlan] = {
+            str(success.name): success for success in successes
+        }
+        executed_well_names: list[str] = list(resumed_results)
         skipped_selected_names: list[str] = []
         cluster_resolved_early = False
         cluster_blocked = False
@@ -1098,9 +1312,27 @@ class WelltrackBatchPlanner:
             if success is not None:
                 successes.append(success)
                 recalculated_success_by_name[str(success.name)] = success
+                if success_callback is not None:
+                    success_callback(success)
             if record_done_callback is not None:
                 record_done_callback(index, total, record.name, row)
 
+        if resumed_results:
+            # Keep the selection order the parallel paths return.
+            position_by_name = {
+                str(record.name): position
+                for position, record in enumerate(selected_records)
+            }
+            summary_rows.sort(
+                key=lambda row: position_by_name.get(
+                    str(row.get("Скважина", "")).strip(), len(position_by_name)
+                )
+            )
+            successes.sort(
+                key=lambda success: position_by_name.get(
+                    str(success.name), len(position_by_name)
+                )
+            )
         self._last_evaluation_metadata = BatchEvaluationMetadata(
             executed_well_names=tuple(executed_well_names),
             skipped_selected_names=tuple(skipped_selected_names),
@@ -1125,8 +1357,14 @@ class WelltrackBatchPlanner:
         parallel_workers: int,
         progress_total: int | None = None,
         completed_offset: int = 0,
+        cost_s_by_name: Mapping[str, float] | None = None,
+        success_callback: SuccessCallback | None = None,
     ) -> tuple[list[dict[str, Any]], list[SuccessfulWellPlan]]:
-        """Execute selected wells in parallel using a process pool."""
+        """Execute selected wells in parallel using a process pool.
+
+        Wells are submitted longest-predicted-first so that expensive solves
+        do not end up alone at the tail of the run.
+        """
         _mp_ctx = process_pool_context()
         total = len(selected_records)
         workers = min(int(parallel_workers), total)
@@ -1146,9 +1384,12 @@ class WelltrackBatchPlanner:
             else ()
         )
 
+        records_by_name = {str(record.name): record for record in selected_records}
+        submission_order = longest_first_order(ordered_names, cost_s_by_name or {})
+        started = perf_counter()
         pool = ProcessPoolExecutor(max_workers=workers, mp_context=_mp_ctx)
         try:
-            for record in selected_records:
+            for record in (records_by_name[name] for name in submission_order):
                 well_config = (config_by_name or {}).get(str(record.name)) or config
                 opt_ctx = (optimization_context_by_name or {}).get(str(record.name))
                 sidetrack_override = sidetrack_window_overrides_by_key.get(
@@ -1193,19 +1434,18 @@ class WelltrackBatchPlanner:
                     row["Проблема"] = summarize_problem_ru(str(exc))
                     success = None
                 results_by_name[name] = (row, success)
-                if progress_callback is not None:
-                    progress_callback(
-                        callback_offset + completed_count,
-                        callback_total,
-                        name,
-                    )
-                if record_done_callback is not None:
-                    record_done_callback(
-                        callback_offset + completed_count,
-                        callback_total,
-                        name,
-                        row,
-                    )
+                _notify_well_done(
+                    index=callback_offset + completed_count,
+                    total=callback_total,
+                    name=name,
+                    row=row,
+                    success=success,
+                    progress_callback=progress_callback,
+                    record_done_callback=record_done_callback,
+                    success_callback=success_callback,
+                )
+        except PROCESS_POOL_ERRORS as exc:
+            raise _ParallelBatchInterrupted(results_by_name) from exc
         finally:
             pool.shutdown(wait=True)
 
@@ -1234,6 +1474,8 @@ class WelltrackBatchPlanner:
             cluster_resolved_early=False,
             cluster_blocked=False,
             cluster_blocking_reason=None,
+            parallel_worker_count=int(workers),
+            parallel_wall_s=float(perf_counter() - started),
         )
         return summary_rows, successes
 
@@ -1246,141 +1488,154 @@ class WelltrackBatchPlanner:
             dict[str, AntiCollisionOptimizationContext] | None
         ),
         reference_wells: tuple[ImportedTrajectoryWell, ...],
-        actual_reference_wells_by_key: Mapping[str, ImportedTrajectoryWell],
         sidetrack_window_overrides_by_key: Mapping[str, SidetrackWindowOverride],
         progress_callback: ProgressCallback | None,
-        solver_progress_callback: SolverProgressCallback | None,
         record_done_callback: RecordDoneCallback | None,
         parallel_workers: int,
+        cost_s_by_name: Mapping[str, float] | None = None,
+        success_callback: SuccessCallback | None = None,
     ) -> tuple[list[dict[str, Any]], list[SuccessfulWellPlan]]:
-        """Parallelize independent wells while preserving pilot -> sidetrack order."""
-        selected_keys = {well_name_key(record.name) for record in selected_records}
+        """Schedule selected wells as a pilot -> sidetrack dependency DAG.
+
+        Every record is submitted to the pool as soon as its own pilot has
+        succeeded, so parents never wait for unrelated wells. A failed pilot
+        fails its dependents immediately without occupying a worker. Roots
+        are submitted by descending predicted cost of their dependency chain.
+        """
+        _mp_ctx = process_pool_context()
+        graph = BatchDependencyGraph.from_records(selected_records)
+        total = len(selected_records)
+        workers = min(int(parallel_workers), total)
         selected_records_by_name = {
             str(record.name): record for record in selected_records
         }
-        first_wave_records: list[WelltrackRecord] = []
-        dependent_records: list[WelltrackRecord] = []
-        for record in selected_records:
-            depends_on_pilot = (
-                not is_pilot_record(record)
-                and not is_zbs_record(record)
-                and pilot_name_key_for_record(record) in selected_keys
-            )
-            if depends_on_pilot:
-                dependent_records.append(record)
-            else:
-                first_wave_records.append(record)
-
-        total = len(selected_records)
+        has_zbs_records = any(is_zbs_record(record) for record in selected_records)
+        reference_well_dicts = (
+            tuple(well.model_dump() for well in reference_wells)
+            if has_zbs_records
+            else ()
+        )
         rows_by_name: dict[str, dict[str, Any]] = {}
         success_by_name: dict[str, SuccessfulWellPlan] = {}
         executed_well_names: list[str] = []
+        runtime_s_by_name: dict[str, float] = {}
+        future_to_name: dict[Future, str] = {}
 
-        first_wave_rows: list[dict[str, Any]] = []
-        first_wave_successes: list[SuccessfulWellPlan] = []
-        if len(first_wave_records) > 1:
-            first_wave_rows, first_wave_successes = self._evaluate_parallel(
-                selected_records=first_wave_records,
-                config=config,
-                config_by_name=config_by_name,
-                optimization_context_by_name=optimization_context_by_name,
-                reference_wells=reference_wells,
-                sidetrack_window_overrides_by_key=sidetrack_window_overrides_by_key,
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=_mp_ctx)
+
+        def submit(name: str) -> None:
+            record = selected_records_by_name[name]
+            well_config = (config_by_name or {}).get(name) or config
+            opt_ctx = (optimization_context_by_name or {}).get(name)
+            sidetrack_override = sidetrack_window_overrides_by_key.get(
+                well_name_key(name)
+            )
+            override_payload = (
+                {
+                    "kind": str(sidetrack_override.kind),
+                    "value_m": float(sidetrack_override.value_m),
+                }
+                if sidetrack_override is not None
+                else None
+            )
+            pilot_success = next(
+                (
+                    success_by_name[dependency]
+                    for dependency in graph.dependencies_by_name[name]
+                    if dependency in success_by_name
+                ),
+                None,
+            )
+            fut = pool.submit(
+                _timed_evaluate_record_from_dicts,
+                record.model_dump(),
+                well_config.model_dump(),
+                _optimization_context_to_worker_payload(opt_ctx),
+                reference_well_dicts if is_zbs_record(record) else (),
+                override_payload,
+                pilot_success_dict=(
+                    pilot_success.model_dump() if pilot_success is not None else None
+                ),
+            )
+            future_to_name[fut] = name
+
+        def finish(
+            name: str,
+            row: dict[str, Any],
+            success: SuccessfulWellPlan | None,
+            runtime_s: float = 0.0,
+        ) -> None:
+            rows_by_name[name] = row
+            if success is not None:
+                success_by_name[str(success.name)] = success
+            executed_well_names.append(name)
+            runtime_s_by_name[name] = float(max(runtime_s, 0.0))
+            _notify_well_done(
+                index=len(executed_well_names),
+                total=total,
+                name=name,
+                row=row,
+                success=success,
                 progress_callback=progress_callback,
                 record_done_callback=record_done_callback,
-                parallel_workers=parallel_workers,
-                progress_total=total,
-                completed_offset=0,
+                success_callback=success_callback,
             )
-            executed_well_names.extend(str(record.name) for record in first_wave_records)
-        else:
-            for record in first_wave_records:
-                index = len(executed_well_names) + 1
-                if progress_callback is not None:
-                    progress_callback(index, total, record.name)
-                well_config = (config_by_name or {}).get(str(record.name)) or config
-                opt_ctx = (optimization_context_by_name or {}).get(str(record.name))
-                sidetrack_override = sidetrack_window_overrides_by_key.get(
-                    well_name_key(record.name)
-                )
-                row, success = self._evaluate_record(
-                    record=record,
-                    config=well_config,
-                    optimization_context=opt_ctx,
+            for dependent in graph.dependents_by_name.get(name, ()):
+                dependencies = graph.dependencies_by_name[dependent]
+                if not all(item in rows_by_name for item in dependencies):
+                    continue
+                missing_pilot = self._missing_required_pilot_success(
+                    record=selected_records_by_name[dependent],
+                    selected_records_by_name=selected_records_by_name,
                     recalculated_success_by_name=success_by_name,
-                    sidetrack_window_override=sidetrack_override,
-                    actual_reference_wells_by_key=actual_reference_wells_by_key,
                 )
-                first_wave_rows.append(row)
-                if success is not None:
-                    first_wave_successes.append(success)
-                if record_done_callback is not None:
-                    record_done_callback(index, total, record.name, row)
-                executed_well_names.append(str(record.name))
-
-        for row in first_wave_rows:
-            rows_by_name[str(row.get("Скважина", ""))] = row
-        for success in first_wave_successes:
-            success_by_name[str(success.name)] = success
-
-        completed_count = len(first_wave_records)
-        for record in dependent_records:
-            index = completed_count + 1
-            completed_count = index
-            if progress_callback is not None:
-                progress_callback(index, total, record.name)
-
-            planner_progress_callback = None
-            if solver_progress_callback is not None:
-                index_i = int(index)
-                total_i = int(total)
-                name_i = str(record.name)
-
-                def _planner_progress(stage_text: str, stage_fraction: float) -> None:
-                    solver_progress_callback(
-                        index_i,
-                        total_i,
-                        name_i,
-                        stage_text,
-                        stage_fraction,
-                    )
-
-                planner_progress_callback = _planner_progress
-
-            well_config = (config_by_name or {}).get(str(record.name)) or config
-            opt_ctx = (optimization_context_by_name or {}).get(str(record.name))
-            sidetrack_override = sidetrack_window_overrides_by_key.get(
-                well_name_key(record.name)
-            )
-            missing_pilot = self._missing_required_pilot_success(
-                record=record,
-                selected_records_by_name=selected_records_by_name,
-                recalculated_success_by_name=success_by_name,
-            )
-            if missing_pilot is not None:
-                row = self._base_row(record=record)
-                row["Статус"] = "Ошибка расчета"
-                row["Проблема"] = self._missing_required_pilot_problem(
+                if missing_pilot is None:
+                    submit(dependent)
+                    continue
+                failed_row = self._base_row(record=selected_records_by_name[dependent])
+                failed_row["Статус"] = "Ошибка расчета"
+                failed_row["Проблема"] = self._missing_required_pilot_problem(
                     pilot_record=missing_pilot,
                     evaluated_rows_by_name=rows_by_name,
                 )
-                success = None
-            else:
-                row, success = self._evaluate_record(
-                    record=record,
-                    config=well_config,
-                    optimization_context=opt_ctx,
-                    planner_progress_callback=planner_progress_callback,
-                    recalculated_success_by_name=success_by_name,
-                    sidetrack_window_override=sidetrack_override,
-                    actual_reference_wells_by_key=actual_reference_wells_by_key,
-                )
-            rows_by_name[str(record.name)] = row
-            if success is not None:
-                success_by_name[str(success.name)] = success
-            if record_done_callback is not None:
-                record_done_callback(index, total, record.name, row)
-            executed_well_names.append(str(record.name))
+                finish(dependent, failed_row, None)
+
+        started = perf_counter()
+        try:
+            for name in longest_first_order(
+                graph.roots(),
+                graph.chain_cost_s(cost_s_by_name or {}),
+            ):
+                submit(name)
+            while future_to_name:
+                done, _pending = wait(tuple(future_to_name), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = future_to_name.pop(fut)
+                    runtime_s = 0.0
+                    try:
+                        row, success_dict, runtime_s = fut.result()
+                        success = (
+                            SuccessfulWellPlan.model_validate(success_dict)
+                            if success_dict is not None
+                            else None
+                        )
+                    except (BrokenProcessPool, PicklingError):
+                        raise
+                    except Exception as exc:  # noqa: BLE001
+                        row = self._base_row(record=selected_records_by_name[name])
+                        row["Статус"] = "Ошибка расчета"
+                        row["Проблема"] = summarize_problem_ru(str(exc))
+                        success = None
+                    finish(name, row, success, runtime_s)
+        except PROCESS_POOL_ERRORS as exc:
+            raise _ParallelBatchInterrupted(
+                {
+                    name: (rows_by_name[name], success_by_name.get(name))
+                    for name in executed_well_names
+                }
+            ) from exc
+        finally:
+            pool.shutdown(wait=True)
 
         summary_rows: list[dict[str, Any]] = []
         successes: list[SuccessfulWellPlan] = []
@@ -1393,12 +1648,19 @@ class WelltrackBatchPlanner:
             if success is not None:
                 successes.append(success)
 
+        critical_path_names, critical_path_runtime_s = graph.critical_path(
+            runtime_s_by_name
+        )
         self._last_evaluation_metadata = BatchEvaluationMetadata(
             executed_well_names=tuple(executed_well_names),
             skipped_selected_names=(),
             cluster_resolved_early=False,
             cluster_blocked=False,
             cluster_blocking_reason=None,
+            critical_path_well_names=critical_path_names,
+            critical_path_runtime_s=critical_path_runtime_s,
+            parallel_worker_count=int(workers),
+            parallel_wall_s=float(perf_counter() - started),
         )
         return summary_rows, successes
 
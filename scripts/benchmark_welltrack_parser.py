@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Compare the bulk WELLTRACK parser with the previous line-by-line parser.
+
+Generates a synthetic INC file (by default about 50k lines), checks that both
+parsers return identical records and prints the best-of-N timings, including
+the array-only parse used by the reference well import.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from typing import Callable
+
+from pywp.eclipse_welltrack import (
+    _WELLTRACK_RE,
+    WelltrackParseError,
+    WelltrackPoint,
+    WelltrackRecord,
+    _parse_well_name,
+    parse_welltrack_arrays,
+    parse_welltrack_text,
+)
+
+_MD_EPS = 1e-9
+
+
+def line_by_line_parse_welltrack_text(text: str) -> list[WelltrackRecord]:
+    """Reference copy of the parser that tokenized and validated per point."""
+    records: list[WelltrackRecord] = []
+    current_name: str | None = None
+    numeric_tokens: list[str] = []
+
+    def finalize_current(line_no: int) -> None:
+        nonlocal current_name, numeric_tokens
+        if current_name is None:
+            return
+        if len(numeric_tokens) % 4 != 0:
+            raise WelltrackParseError(
+                f"WELLTRACK '{current_name}': ожидались группы X Y Z MD по 4 значения, "
+                f"получено {len(numeric_tokens)} значений в строке {line_no}."
+            )
+        points: list[WelltrackPoint] = []
+        for index in range(0, len(numeric_tokens), 4):
+            try:
+                x = float(numeric_tokens[index + 0])
+                y = float(numeric_tokens[index + 1])
+                z = float(numeric_tokens[index + 2])
+                md = float(numeric_tokens[index + 3])
+            except ValueError as exc:
+                raise WelltrackParseError(
+                    f"WELLTRACK '{current_name}': не удалось разобрать число около строки {line_no}: {exc}"
+                ) from exc
+            points.append(WelltrackPoint(x=x, y=y, z=z, md=md))
+        for index, point in enumerate(points, start=1):
+            if not math.isfinite(float(point.md)):
+                raise WelltrackParseError(
+                    f"WELLTRACK '{current_name}': MD at point #{index} must be finite."
+                )
+            if index == 1:
+                continue
+            previous_md = float(points[index - 2].md)
+            current_md = float(point.md)
+            if current_md + _MD_EPS < previous_md:
+                raise WelltrackParseError(
+                    f"WELLTRACK '{current_name}': MD must be non-decreasing by point order. "
+                    f"Found MD[{index - 1}]={previous_md:.3f} > MD[{index}]={current_md:.3f}."
+                )
+        records.append(WelltrackRecord(name=current_name, points=tuple(points)))
+        current_name = None
+        numeric_tokens = []
+
+    def consume(tail: str, line_no: int) -> None:
+        tokens = numeric_tokens
+        normalized = tail.replace("/", " / ").replace(";", " ; ")
+        for token in normalized.split():
+            if token in {"/", ";"}:
+                finalize_current(line_no=line_no)
+                continue
+            tokens.append(token)
+
+    lines = text.splitlines()
+    for line_no, raw_line in enumerate(lines, start=1):
+        line = raw_line.split("--", 1)[0].strip()
+        if not line:
+            continue
+        welltrack_match = _WELLTRACK_RE.match(line)
+        if welltrack_match is not None:
+            if current_name is not None:
+                finalize_current(line_no=line_no)
+            name, tail = _parse_well_name(
+                rest=welltrack_match.group(1).strip(),
+                line_no=line_no,
+            )
+            current_name = name
+            consume(tail, line_no)
+            continue
+        if current_name is None:
+            continue
+        consume(line, line_no)
+
+    if current_name is not None:
+        finalize_current(line_no=len(lines) if lines else 1)
+    return records
+
+
+def synthetic_welltrack_text(*, wells: int, stations_per_well: int) -> str:
+    lines: list[str] = []
+    for well_index in range(wells):
+        lines.append(f"-- synthetic well {well_index}")
+        lines.append(f"WELLTRACK 'BENCH-{well_index:05d}'")
+        x0 = 1000.0 * (well_index % 40)
+        y0 = 1500.0 * (well_index // 40)
+        for station in range(stations_per_well):
+            md = 10.0 * station
+            lines.append(
+                f"{x0 + 0.35 * md:.3f} {y0 + 0.12 * md:.3f} {0.9 * md:.3f} {md:.2f}"
+            )
+        lines.append("/")
+    return "\n".join(lines) + "\n"
+
+
+def _best_time_s(parse: Callable[[str], object], text: str, repeat: int) -> float:
+    timings: list[float] = []
+    for _ in range(max(int(repeat), 1)):
+        started = time.perf_counter()
+        parse(text)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the bulk WELLTRACK parser against the line-by-line one."
+    )
+    parser.add_argument("--wells", type=int, default=500)
+    parser.add_argument("--stations-per-well", type=int, default=97)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = synthetic_welltrack_text(
+        wells=args.wells,
+        stations_per_well=args.stations_per_well,
+    )
+    if parse_welltrack_text(text) != line_by_line_parse_welltrack_text(text):
+        raise SystemExit("Parsers returned different records.")
+    line_count = text.count("\n")
+    baseline_s = _best_time_s(line_by_line_parse_welltrack_text, text, args.repeat)
+    bulk_s = _best_time_s(parse_welltrack_text, text, args.repeat)
+    arrays_s = _best_time_s(parse_welltrack_arrays, text, args.repeat)
+    print(f"lines: {line_count}, wells: {args.wells}")
+    print(f"line-by-line parser: {baseline_s * 1000.0:.1f} ms")
+    print(
+        f"bulk parser:         {bulk_s * 1000.0:.1f} ms "
+        f"({baseline_s / max(bulk_s, 1e-12):.1f}x)"
+    )
+    print(
+        f"arrays only:         {arrays_s * 1000.0:.1f} ms "
+        f"({baseline_s / max(arrays_s, 1e-12):.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Build a columnar project store from .dev folders and WELLTRACK files.
+
+The store can then be opened with ``pywp.project_store.open_project_store``
+(or from the "Проект на диске" block of the trajectory constructor page)
+without re-reading the source files; wells are materialized on first access.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from pywp.eclipse_welltrack import decode_welltrack_bytes
+from pywp.project_store import open_project_store, save_project_store
+from pywp.reference_trajectories import (
+    REFERENCE_WELL_ACTUAL,
+    REFERENCE_WELL_APPROVED,
+    ImportedTrajectoryWell,
+    parse_reference_trajectory_dev_directories,
+    parse_reference_trajectory_welltrack_text,
+)
+
+
+def collect_wells(
+    *,
+    dev_dirs_by_kind: dict[str, list[Path]],
+    welltrack_files_by_kind: dict[str, list[Path]],
+) -> list[ImportedTrajectoryWell]:
+    wells: list[ImportedTrajectoryWell] = []
+    for kind, directories in dev_dirs_by_kind.items():
+        if directories:
+            wells.extend(
+                parse_reference_trajectory_dev_directories(directories, kind=kind)
+            )
+    for kind, paths in welltrack_files_by_kind.items():
+        for path in paths:
+            text, _encoding = decode_welltrack_bytes(path.read_bytes())
+            wells.extend(parse_reference_trajectory_welltrack_text(text, kind=kind))
+    return wells
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build a columnar project store for fast project opening."
+    )
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--actual-dev", type=Path, action="append", default=[])
+    parser.add_argument("--approved-dev", type=Path, action="append", default=[])
+    parser.add_argument("--actual-welltrack", type=Path, action="append", default=[])
+    parser.add_argument("--approved-welltrack", type=Path, action="append", default=[])
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    wells = collect_wells(
+        dev_dirs_by_kind={
+            REFERENCE_WELL_ACTUAL: args.actual_dev,
+            REFERENCE_WELL_APPROVED: args.approved_dev,
+        },
+        welltrack_files_by_kind={
+            REFERENCE_WELL_ACTUAL: args.actual_welltrack,
+            REFERENCE_WELL_APPROVED: args.approved_welltrack,
+        },
+    )
+    if not wells:
+        raise SystemExit("No reference wells found in the given sources.")
+    import_s = time.perf_counter() - started
+    save_project_store(args.output, reference_wells=wells)
+
+    started = time.perf_counter()
+    store = open_project_store(args.output)
+    open_s = time.perf_counter() - started
+    print(f"wells: {len(store)} -> {args.output}")
+    print(f"import from sources: {import_s * 1000.0:.1f} ms")
+    print(f"open store:          {open_s * 1000.0:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
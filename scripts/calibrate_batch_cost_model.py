@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Measure single-core solve times behind the batch cost model constants.
+
+Plans synthetic wells of every profile family (and ordinary wells of every
+complexity / trajectory type) with the default ``TrajectoryConfig`` in this
+process, one well at a time, and prints the median time per group next to the
+constants currently used by ``pywp.batch_cost_model``. Re-run it after solver
+changes and copy the suggested values when the ranking drifts.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pywp.batch_cost_model import estimate_record_cost
+from pywp.eclipse_welltrack import WelltrackPoint, WelltrackRecord
+from pywp.models import TrajectoryConfig
+from pywp.parallel import process_pool_context
+from pywp.reference_trajectories import (
+    REFERENCE_WELL_ACTUAL,
+    parse_reference_trajectory_table,
+)
+from pywp.welltrack_batch import WelltrackBatchPlanner, _evaluate_record_from_dicts
+
+_REFERENCE_NAME = "9010"
+
+
+def _rotated(x: float, y: float, azimuth_deg: float) -> tuple[float, float]:
+    angle = math.radians(azimuth_deg)
+    return (
+        x * math.cos(angle) - y * math.sin(angle),
+        x * math.sin(angle) + y * math.cos(angle),
+    )
+
+
+def _record(
+    name: str,
+    xyz: list[tuple[float, float, float]],
+    *,
+    azimuth_deg: float,
+    labels: tuple[str, ...] = (),
+) -> WelltrackRecord:
+    points = []
+    for index, (x, y, z) in enumerate(xyz):
+        rx, ry = _rotated(x, y, azimuth_deg)
+        points.append(WelltrackPoint(x=rx, y=ry, z=z, md=float(index + 1)))
+    return WelltrackRecord(name=name, points=tuple(points), point_labels=labels)
+
+
+def _cases(azimuth_deg: float) -> dict[str, WelltrackRecord]:
+    ordinary = [(0.0, 0.0, 0.0), (1000.0, 0.0, 2400.0), (2000.0, 0.0, 2450.0)]
+    return {
+        "ordinary": _record("ORD", ordinary, azimuth_deg=azimuth_deg),
+        "ordinary/complex": _record(
+            "ORD-C",
+            [(0.0, 0.0, 0.0), (2000.0, 0.0, 2400.0), (3000.0, 0.0, 2450.0)],
+            azimuth_deg=azimuth_deg,
+        ),
+        "ordinary/very_complex": _record(
+            "ORD-VC",
+            [(0.0, 0.0, 0.0), (2800.0, 0.0, 2400.0), (3800.0, 0.0, 2450.0)],
+            azimuth_deg=azimuth_deg,
+        ),
+        "ordinary/reverse": _record(
+            "ORD-R",
+            [(0.0, 0.0, 0.0), (500.0, 0.0, 2800.0), (-500.0, 0.0, 2850.0)],
+            azimuth_deg=azimuth_deg,
+        ),
+        "multi_horizontal": _record(
+            "MH",
+            [
+                (0.0, 0.0, 0.0),
+                (-1083.0, -1976.0, 2402.0),
+                (-490.0, -2118.0, 2402.0),
+                (-191.0, -2189.0, 2428.0),
+                (392.0, -2328.0, 2428.0),
+            ],
+            azimuth_deg=azimuth_deg,
+        ),
+        "multi_target": _record(
+            "MT",
+            [
+                (0.0, 0.0, 0.0),
+                (1000.0, 0.0, 2400.0),
+                (1600.0, 60.0, 2415.0),
+                (2200.0, 0.0, 2430.0),
+                (2800.0, -60.0, 2445.0),
+            ],
+            azimuth_deg=azimuth_deg,
+            labels=("S", "t1", "t2", "t3", "t4"),
+        ),
+        "pilot": _record(
+            "ORD_PL",
+            [(0.0, 0.0, 0.0), (0.0, 0.0, 800.0), (200.0, 0.0, 1300.0)],
+            azimuth_deg=azimuth_deg,
+        ),
+        "zbs": _record(
+            f"{_REFERENCE_NAME}_ZBS",
+            [(650.0, 0.0, 1500.0), (1200.0, 0.0, 1500.0)],
+            azimuth_deg=0.0,
+        ),
+    }
+
+
+# Sidetracks from the short synthetic fact well need a shallow kick-off;
+# the level transitions of the synthetic multi-level wells need 3 deg/30 m.
+_CONFIG_OVERRIDES = {
+    "multi_horizontal": {"dls_horizontal_max_deg_per_30m": 3.0},
+    "multi_target": {"dls_horizontal_max_deg_per_30m": 3.0},
+    "zbs": {"kop_min_vertical_m": 100.0, "dls_build_max_deg_per_30m": 12.0},
+}
+
+
+def _reference_well():
+    rows = [
+        (0.0, 0.0, 0.0, 0.0),
+        (0.0, 0.0, 600.0, 600.0),
+        (180.0, 0.0, 1000.0, 1100.0),
+        (420.0, 0.0, 1300.0, 1550.0),
+    ]
+    return parse_reference_trajectory_table(
+        [
+            {"Wellname": _REFERENCE_NAME, "X": x, "Y": y, "Z": z, "MD": md}
+            for x, y, z, md in rows
+        ],
+        default_kind=REFERENCE_WELL_ACTUAL,
+    )[0]
+
+
+def _pool_overhead_s(record: WelltrackRecord, config: TrajectoryConfig) -> float:
+    """Wall time of one pooled solve minus the same solve in-process."""
+    started = time.perf_counter()
+    WelltrackBatchPlanner().evaluate(
+        records=[record], selected_names={record.name}, config=config
+    )
+    in_process_s = time.perf_counter() - started
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=1, mp_context=process_pool_context()) as pool:
+        pool.submit(
+            _evaluate_record_from_dicts, record.model_dump(), config.model_dump()
+        ).result()
+    return max(time.perf_counter() - started - in_process_s, 0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    config = TrajectoryConfig()
+    reference_wells = (_reference_well(),)
+    timings: dict[str, list[float]] = {}
+    estimates: dict[str, float] = {}
+    for repeat in range(max(int(args.repeats), 1)):
+        for group, record in _cases(azimuth_deg=37.0 * repeat).items():
+            started = time.perf_counter()
+            rows, _successes = WelltrackBatchPlanner().evaluate(
+                records=[record],
+                selected_names={record.name},
+                config=config.model_copy(update=_CONFIG_OVERRIDES.get(group, {})),
+                reference_wells=reference_wells,
+            )
+            timings.setdefault(group, []).append(time.perf_counter() - started)
+            estimates[group] = estimate_record_cost(record).model_cost_s
+            if repeat == 0:
+                print(
+                    f"{group:<24} status: {rows[0].get('Статус', '—')} "
+                    f"{rows[0].get('Проблема', '')}"
+                )
+
+    pilot = _cases(azimuth_deg=0.0)["pilot"]
+    overhead_s = statistics.median(
+        _pool_overhead_s(pilot, config) for _ in range(max(int(args.repeats), 1))
+    )
+    print(f"{'pool startup':<24} {overhead_s:.2f} s")
+
+    baseline_s = statistics.median(timings["ordinary"])
+    print()
+    print(f"{'group':<24}{'median, s':>12}{'x ordinary':>12}{'model, s':>12}")
+    for group, values in timings.items():
+        median_s = statistics.median(values)
+        print(
+            f"{group:<24}{median_s:>12.2f}{median_s / baseline_s:>12.2f}"
+            f"{estimates[group]:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
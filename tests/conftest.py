@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from pywp.anticollision_disk_cache import ANTI_COLLISION_DISK_CACHE_DIR_ENV
+from pywp.coordinate_integration import clear_crs_transform_cache
+from pywp.reference_dev_cache import REFERENCE_DEV_CACHE_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def _isolated_anti_collision_disk_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    monkeypatch.setenv(
+        ANTI_COLLISION_DISK_CACHE_DIR_ENV,
+        str(tmp_path_factory.mktemp("anticollision_cache")),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_reference_dev_disk_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    monkeypatch.setenv(
+        REFERENCE_DEV_CACHE_DIR_ENV,
+        str(tmp_path_factory.mktemp("reference_dev_cache")),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_crs_transform_cache() -> None:
+    clear_crs_transform_cache()
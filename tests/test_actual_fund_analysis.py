@@ -5,12 +5,15 @@ import pandas as pd
 import pytest
 
 from pywp.actual_fund_analysis import (
+    ActualFundDepthClusterIndex,
     ActualFundWellMetrics,
+    _mask_intervals,
     _reconstruct_actual_survey,
     actual_well_family_name,
     actual_well_is_horizontal,
     actual_well_pad_group,
     build_actual_fund_kop_depth_function,
+    build_actual_fund_well_analyses,
     build_actual_fund_well_analysis,
     build_actual_fund_well_metrics,
     summarize_actual_fund_by_depth,
@@ -326,3 +329,180 @@ def test_depth_cluster_anchor_uses_min_plus_std_after_outlier_filter() -> None:
     cluster = clusters[0]
     assert cluster.anchor_horizontal_entry_tvd_m < 2000.0
     assert cluster.anchor_kop_md_m < 900.0
+
+
+def test_mask_intervals_returns_runs_including_edges() -> None:
+    md_values = np.array([0.0, 10.0, 20.0, 30.0, 40.0, 50.0])
+
+    assert _mask_intervals(
+        md_values, np.array([True, True, False, True, False, True])
+    ) == [(0.0, 10.0, 10.0), (30.0, 30.0, 0.0), (50.0, 50.0, 0.0)]
+    assert _mask_intervals(md_values, np.zeros(6, dtype=bool)) == []
+    assert _mask_intervals(md_values[:0], np.zeros(0, dtype=bool)) == []
+
+
+def test_actual_fund_well_analysis_handles_repeated_survey_points() -> None:
+    (well,) = _synthetic_hold_actual_well("9004")
+    stations = well.stations
+    repeated = pd.concat(
+        [
+            stations.iloc[:2],
+            stations.iloc[1:2].assign(MD_m=float(stations["MD_m"].iloc[1]) + 1.0),
+            stations.iloc[2:].assign(MD_m=stations["MD_m"].iloc[2:] + 1.0),
+        ],
+        ignore_index=True,
+    )
+
+    survey = _reconstruct_actual_survey(repeated)
+
+    assert np.isfinite(survey["INC_deg"]).all()
+    assert float(survey["INC_deg"].iloc[0]) == pytest.approx(0.0, abs=1e-9)
+
+
+def test_actual_fund_well_analyses_parallel_matches_serial() -> None:
+    wells = (
+        *_actual_wells(),
+        *_synthetic_hold_actual_well(),
+        *_synthetic_noisy_vertical_hold_actual_well(),
+    )
+
+    serial = build_actual_fund_well_analyses(wells, parallel_workers=0)
+    parallel = build_actual_fund_well_analyses(wells, parallel_workers=2)
+
+    assert [item.metrics for item in parallel] == [item.metrics for item in serial]
+    for serial_item, parallel_item in zip(serial, parallel):
+        assert parallel_item.zone_summaries == serial_item.zone_summaries
+        pd.testing.assert_frame_equal(parallel_item.survey, serial_item.survey)
+
+
+def test_actual_fund_well_analyses_parallel_raises_well_errors_without_rerun(
+    monkeypatch,
+) -> None:
+    import pywp.actual_fund_analysis as analysis_module
+
+    class InlineExecutor:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            return None
+
+        def map(self, fn, items, chunksize=1):
+            return [fn(item) for item in items]
+
+    analyzed: list[str] = []
+    original_analyze = analysis_module._analyze_actual_well
+
+    def failing_analyze(actual_well):
+        analyzed.append(str(actual_well.name))
+        if str(actual_well.name) == "7401_PL":
+            raise RuntimeError("broken survey")
+        return original_analyze(actual_well)
+
+    monkeypatch.setattr(analysis_module, "ProcessPoolExecutor", InlineExecutor)
+    monkeypatch.setattr(analysis_module, "_analyze_actual_well", failing_analyze)
+    wells = _actual_wells()
+
+    with pytest.raises(RuntimeError, match="broken survey"):
+        build_actual_fund_well_analyses(wells, parallel_workers=2)
+    assert analyzed == [str(well.name) for well in wells]
+
+
+def _depth_cluster_metric(name: str, entry_tvd_m: float, kop_md_m: float) -> ActualFundWellMetrics:
+    return ActualFundWellMetrics(
+        name=name,
+        family_name=name,
+        pad_group="1",
+        is_horizontal=True,
+        md_total_m=0.0,
+        tvd_end_m=0.0,
+        lateral_departure_m=0.0,
+        kop_md_m=kop_md_m,
+        kop_tvd_m=kop_md_m,
+        horizontal_entry_md_m=entry_tvd_m + 200.0,
+        horizontal_entry_tvd_m=entry_tvd_m,
+        horizontal_length_m=1000.0,
+        hold_inc_deg=45.0,
+        hold_azi_deg=90.0,
+        hold_length_m=300.0,
+        max_inc_deg=90.0,
+        max_dls_deg_per_30m=2.0,
+        max_build_dls_before_hold_deg_per_30m=2.0,
+        is_analysis_eligible=True,
+    )
+
+
+def test_depth_cluster_index_updates_match_full_recomputation() -> None:
+    rng = np.random.default_rng(11)
+    centers = (1500.0, 2300.0, 3100.0)
+    metrics = [
+        _depth_cluster_metric(
+            f"W{index}",
+            float(rng.choice(centers) + rng.normal(0.0, 80.0)),
+            float(rng.uniform(300.0, 1200.0)),
+        )
+        for index in range(60)
+    ]
+    index = ActualFundDepthClusterIndex(metrics[:30], relative_tolerance=0.08)
+    current = list(metrics[:30])
+    for step, metric in enumerate(metrics[30:]):
+        assert index.add(metric)
+        current.append(metric)
+        if step % 3 == 0:
+            removed = current.pop(int(rng.integers(len(current))))
+            assert index.remove(removed.name)
+        assert index.summaries() == summarize_actual_fund_by_depth(
+            current, relative_tolerance=0.08
+        )
+    assert len(index) == len(current)
+    assert index.kop_depth_function() == build_actual_fund_kop_depth_function(
+        current, relative_tolerance=0.08
+    )
+    assert not index.remove("missing")
+    assert not index.add(
+        _depth_cluster_metric("X", 2000.0, 500.0).model_copy(
+            update={"is_analysis_eligible": False}
+        )
+    )
+
+
+def test_depth_cluster_index_sync_applies_only_changed_wells() -> None:
+    metrics = [
+        _depth_cluster_metric(f"W{index}", 1500.0 + 40.0 * index, 400.0 + index)
+        for index in range(12)
+    ]
+    index = ActualFundDepthClusterIndex(metrics, relative_tolerance=0.08)
+    updated = [
+        *metrics[2:],
+        metrics[5].model_copy(update={"name": "W-NEW"}),
+    ]
+    updated[0] = updated[0].model_copy(update={"kop_md_m": 900.0})
+
+    assert not index.sync(metrics)
+    assert index.sync(updated)
+    assert index.summaries() == summarize_actual_fund_by_depth(
+        updated, relative_tolerance=0.08
+    )
+    assert len(index) == len(updated)
+    assert not index.sync(updated)
+
+
+def test_depth_cluster_index_sync_keeps_statistics_of_tied_wells() -> None:
+    metrics = [
+        _depth_cluster_metric(f"W{index}", 2000.0, 400.0 + 10.0 * index)
+        for index in range(4)
+    ]
+    index = ActualFundDepthClusterIndex(metrics, relative_tolerance=0.08)
+    updated = list(metrics)
+    updated[0] = updated[0].model_copy(update={"kop_md_m": 450.0})
+
+    assert index.sync(updated)
+    (synced,) = index.summaries()
+    (full,) = summarize_actual_fund_by_depth(updated, relative_tolerance=0.08)
+    # The re-added well goes after its depth ties; the statistics agree.
+    assert synced.well_names == ("W1", "W2", "W3", "W0")
+    assert full.well_names == ("W0", "W1", "W2", "W3")
+    assert synced.model_copy(update={"well_names": full.well_names}) == full
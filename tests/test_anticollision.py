@@ -4618,3 +4618,74 @@ def test_cluster_action_steps_keep_worst_sf_first_and_preserve_order_label() ->
     )
     assert cluster.first_rerun_well == "well_a"
     assert cluster.rerun_order_label == "well_a → well_c → well_b"
+
+
+def test_streaming_anti_collision_caches_feed_final_incremental_analysis() -> None:
+    successes = [
+        SuccessfulWellPlan(
+            name=name,
+            surface=Point3D(0.0, y_offset_m, 0.0),
+            t1=Point3D(1000.0, y_offset_m, 0.0),
+            t3=Point3D(2000.0, y_offset_m, 0.0),
+            stations=_straight_stations(y_offset_m=y_offset_m),
+            summary={"kop_md_m": 700.0},
+            azimuth_deg=90.0,
+            md_t1_m=1000.0,
+            config=TrajectoryConfig(),
+        )
+        for name, y_offset_m in (
+            ("WELL-A", 0.0),
+            ("WELL-B", 10.0),
+            ("WELL-C", 3000.0),
+        )
+    ]
+    model = PlanningUncertaintyModel()
+    signatures = {str(item.name): f"{item.name}-v1" for item in successes}
+    stream = anticollision_rerun_module.StreamingAntiCollisionAnalysis(
+        model=model,
+        well_signature=lambda success: signatures[str(success.name)],
+        build_overlap_geometry=False,
+    )
+    for success in successes:
+        stream.submit(success)
+    well_cache, pair_cache = stream.finish()
+    conflicts = stream.pop_conflicts()
+
+    assert set(well_cache) == {"WELL-A", "WELL-B", "WELL-C"}
+    assert set(pair_cache) == {
+        ("WELL-A", "WELL-B"),
+        ("WELL-A", "WELL-C"),
+        ("WELL-B", "WELL-C"),
+    }
+    assert [(item.well_a, item.well_b) for item in conflicts] == [
+        ("WELL-B", "WELL-A")
+    ]
+    assert stream.failed_well_names == ()
+    with pytest.raises(RuntimeError):
+        stream.submit(successes[0])
+
+    streamed_analysis, _, _, stats = (
+        anticollision_rerun_module.build_incremental_anti_collision_analysis_for_successes(
+            successes,
+            model=model,
+            build_overlap_geometry=False,
+            well_signature_by_name=signatures,
+            previous_well_cache=well_cache,
+            previous_pair_cache=pair_cache,
+        )
+    )
+    full_analysis = build_anti_collision_analysis_for_successes(
+        successes,
+        model=model,
+        build_overlap_geometry=False,
+    )
+
+    assert stats.rebuilt_well_count == 0
+    assert stats.recalculated_pair_count == 0
+    assert stats.reused_pair_count == 3
+    assert streamed_analysis.overlapping_pair_count == (
+        full_analysis.overlapping_pair_count
+    )
+    assert streamed_analysis.worst_separation_factor == pytest.approx(
+        full_analysis.worst_separation_factor
+    )
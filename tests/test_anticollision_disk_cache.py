@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import os
+
+import pandas as pd
+
+from pywp.anticollision import analyze_anti_collision_incremental, build_anti_collision_well
+from pywp.anticollision_disk_cache import (
+    ANTI_COLLISION_DISK_CACHE_DIR_ENV,
+    ANTI_COLLISION_DISK_CACHE_MAX_MB_ENV,
+    AntiCollisionDiskCache,
+    default_anti_collision_disk_cache,
+    uncertainty_model_digest,
+)
+from pywp.models import Point3D
+from pywp.uncertainty import (
+    UNCERTAINTY_PRESET_MWD_POOR_MAGNETIC,
+    PlanningUncertaintyModel,
+    planning_uncertainty_model_for_preset,
+)
+
+
+def _well(name: str, y_offset_m: float):
+    return build_anti_collision_well(
+        name=name,
+        color="#0B6E4F",
+        stations=pd.DataFrame(
+            {
+                "MD_m": [0.0, 1000.0, 2000.0],
+                "INC_deg": [0.0, 90.0, 90.0],
+                "AZI_deg": [0.0, 90.0, 90.0],
+                "X_m": [0.0, 1000.0, 2000.0],
+                "Y_m": [y_offset_m] * 3,
+                "Z_m": [0.0, 0.0, 0.0],
+            }
+        ),
+        surface=Point3D(0.0, y_offset_m, 0.0),
+        t1=Point3D(1000.0, y_offset_m, 0.0),
+        t3=Point3D(2000.0, y_offset_m, 0.0),
+        azimuth_deg=90.0,
+        md_t1_m=1000.0,
+        include_display_geometry=False,
+    )
+
+
+def test_disk_cache_round_trips_wells_and_pairs_by_signature(tmp_path) -> None:
+    wells = [_well("WELL-A", 0.0), _well("WELL-B", 10.0)]
+    signatures = {"WELL-A": "a-v1", "WELL-B": "b-v1"}
+    _, pair_cache, _ = analyze_anti_collision_incremental(
+        wells,
+        build_overlap_geometry=False,
+        well_signature_by_name=signatures,
+    )
+    model_digest = uncertainty_model_digest(PlanningUncertaintyModel())
+    cache = AntiCollisionDiskCache(tmp_path)
+
+    stored = cache.store(
+        well_cache={well.name: (signatures[well.name], well) for well in wells},
+        pair_cache=pair_cache,
+        well_signature_by_name=signatures,
+        model_digest=model_digest,
+    )
+    reopened = AntiCollisionDiskCache(tmp_path)
+    loaded_wells = reopened.load_wells(signatures, model_digest=model_digest)
+    loaded_pairs = reopened.load_pairs(signatures, model_digest=model_digest)
+
+    assert stored == (2, 1)
+    assert set(loaded_wells) == {"WELL-A", "WELL-B"}
+    assert loaded_wells["WELL-A"][0] == "a-v1"
+    assert set(loaded_pairs) == {("WELL-A", "WELL-B")}
+    _, _, stats = analyze_anti_collision_incremental(
+        [loaded_wells["WELL-A"][1], loaded_wells["WELL-B"][1]],
+        build_overlap_geometry=False,
+        well_signature_by_name=signatures,
+        previous_pair_cache=loaded_pairs,
+    )
+    assert stats.reused_pair_count == 1
+    assert reopened.load_wells({"WELL-A": "a-v2"}, model_digest=model_digest) == {}
+    assert (
+        reopened.load_wells(
+            signatures,
+            model_digest=uncertainty_model_digest(
+                planning_uncertainty_model_for_preset(
+                    UNCERTAINTY_PRESET_MWD_POOR_MAGNETIC
+                )
+            ),
+        )
+        == {}
+    )
+    assert (
+        reopened.load_pairs(
+            signatures,
+            model_digest=model_digest,
+            known_pair_keys=[("WELL-B", "WELL-A")],
+        )
+        == {}
+    )
+
+
+def test_disk_cache_evicts_least_recently_used_files(tmp_path) -> None:
+    wells = [_well(f"WELL-{index}", 100.0 * index) for index in range(3)]
+    signatures = {well.name: f"{well.name}-v1" for well in wells}
+    cache = AntiCollisionDiskCache(tmp_path)
+    for index, well in enumerate(wells):
+        cache.store(
+            well_cache={well.name: (signatures[well.name], well)},
+            pair_cache={},
+            well_signature_by_name=signatures,
+            model_digest="model",
+        )
+        path = cache._well_path(well.name, signatures[well.name], "model")
+        os.utime(path, (1_000_000.0 + index, 1_000_000.0 + index))
+    file_size = cache._well_path("WELL-0", "WELL-0-v1", "model").stat().st_size
+
+    cache.max_bytes = int(2.5 * file_size)
+    assert cache.evict() == 1
+    assert set(cache.load_wells(signatures, model_digest="model")) == {
+        "WELL-1",
+        "WELL-2",
+    }
+
+
+def test_disk_cache_failed_write_leaves_no_temporary_file(tmp_path) -> None:
+    cache = AntiCollisionDiskCache(tmp_path)
+    path = cache._well_path("WELL-0", "WELL-0-v1", "model")
+
+    assert not cache._write(path, lambda: None)
+    assert not path.exists()
+    assert list(path.parent.iterdir()) == []
+
+
+def test_disk_cache_probes_only_pairs_listed_in_partner_manifests(
+    monkeypatch, tmp_path
+) -> None:
+    wells = [_well(f"WELL-{index}", 10.0 * index) for index in range(6)]
+    signatures = {well.name: f"{well.name}-v1" for well in wells}
+    _, pair_cache, _ = analyze_anti_collision_incremental(
+        wells[:2],
+        build_overlap_geometry=False,
+        well_signature_by_name=signatures,
+    )
+    cache = AntiCollisionDiskCache(tmp_path)
+    cache.store(
+        well_cache={},
+        pair_cache=pair_cache,
+        well_signature_by_name=signatures,
+        model_digest="model",
+    )
+    probed: list[str] = []
+    original_load = cache._load
+
+    def _recording_load(path, expected_type):
+        probed.append(path.parent.parent.name)
+        return original_load(path, expected_type)
+
+    monkeypatch.setattr(cache, "_load", _recording_load)
+    loaded = cache.load_pairs(signatures, model_digest="model")
+
+    assert set(loaded) == {("WELL-0", "WELL-1")}
+    assert probed.count("pairs") == 1
+    assert probed.count("partners") == len(wells)
+    assert (
+        cache.load_pairs(
+            {**signatures, "WELL-1": "WELL-1-v2"},
+            model_digest="model",
+        )
+        == {}
+    )
+
+
+def test_disk_cache_evict_if_needed_scans_only_over_estimated_budget(
+    monkeypatch, tmp_path
+) -> None:
+    wells = [_well(f"WELL-{index}", 100.0 * index) for index in range(3)]
+    signatures = {well.name: f"{well.name}-v1" for well in wells}
+    cache = AntiCollisionDiskCache(tmp_path)
+    scans: list[int] = []
+    original_evict = cache.evict
+
+    def _recording_evict() -> int:
+        scans.append(1)
+        return original_evict()
+
+    monkeypatch.setattr(cache, "evict", _recording_evict)
+    cache.store(
+        well_cache={wells[0].name: (signatures[wells[0].name], wells[0])},
+        pair_cache={},
+        well_signature_by_name=signatures,
+        model_digest="model",
+    )
+    assert cache.evict_if_needed() == 0
+    assert len(scans) == 1
+    assert cache.evict_if_needed() == 0
+    cache.store(
+        well_cache={wells[1].name: (signatures[wells[1].name], wells[1])},
+        pair_cache={},
+        well_signature_by_name=signatures,
+        model_digest="model",
+    )
+    assert cache.evict_if_needed() == 0
+    assert len(scans) == 1
+
+    file_size = cache._well_path("WELL-0", "WELL-0-v1", "model").stat().st_size
+    cache.max_bytes = int(2.5 * file_size)
+    cache.store(
+        well_cache={wells[2].name: (signatures[wells[2].name], wells[2])},
+        pair_cache={},
+        well_signature_by_name=signatures,
+        model_digest="model",
+    )
+    assert cache.evict_if_needed() == 1
+    assert len(scans) == 2
+
+
+def test_default_disk_cache_reads_environment(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv(ANTI_COLLISION_DISK_CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setenv(ANTI_COLLISION_DISK_CACHE_MAX_MB_ENV, "2")
+
+    cache = default_anti_collision_disk_cache()
+
+    assert cache is not None
+    assert cache.root == tmp_path
+    assert cache.max_bytes == 2 * 1024 * 1024
+    monkeypatch.setenv(ANTI_COLLISION_DISK_CACHE_DIR_ENV, "")
+    assert default_anti_collision_disk_cache() is None
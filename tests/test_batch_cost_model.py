@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from pywp.batch_cost_model import (
+    PROFILE_MULTI_HORIZONTAL,
+    PROFILE_MULTI_TARGET,
+    PROFILE_ORDINARY,
+    PROFILE_PILOT,
+    BatchParallelOverhead,
+    estimate_batch_costs,
+    estimate_record_cost,
+    longest_first_order,
+    predicted_makespan_s,
+    recommended_parallel_workers,
+    runtime_history_by_name,
+)
+from pywp.eclipse_welltrack import WelltrackPoint, WelltrackRecord
+
+
+def _record(name: str, *xyz: tuple[float, float, float]) -> WelltrackRecord:
+    return WelltrackRecord(
+        name=name,
+        points=tuple(
+            WelltrackPoint(x=x, y=y, z=z, md=float(index + 1))
+            for index, (x, y, z) in enumerate(xyz)
+        ),
+    )
+
+
+def test_estimate_record_cost_ranks_profile_families() -> None:
+    ordinary = estimate_record_cost(
+        _record("A", (0.0, 0.0, 0.0), (600.0, 0.0, 2400.0), (1600.0, 0.0, 2400.0))
+    )
+    multi_horizontal = estimate_record_cost(
+        _record(
+            "B",
+            (0.0, 0.0, 0.0),
+            (600.0, 0.0, 2400.0),
+            (1000.0, 0.0, 2420.0),
+            (1400.0, 0.0, 2440.0),
+            (1800.0, 0.0, 2460.0),
+        )
+    )
+    pilot = estimate_record_cost(
+        _record("A_PL", (0.0, 0.0, 0.0), (0.0, 0.0, 800.0), (200.0, 0.0, 1300.0))
+    )
+
+    assert ordinary.profile_family == PROFILE_ORDINARY
+    assert multi_horizontal.profile_family == PROFILE_MULTI_HORIZONTAL
+    assert pilot.profile_family == PROFILE_PILOT
+    assert pilot.predicted_s < ordinary.predicted_s < multi_horizontal.predicted_s
+
+
+def test_estimate_record_cost_ranks_multi_horizontal_above_target_sequence() -> None:
+    points = (
+        (0.0, 0.0, 0.0),
+        (600.0, 0.0, 2400.0),
+        (1000.0, 0.0, 2420.0),
+        (1400.0, 0.0, 2440.0),
+        (1800.0, 0.0, 2460.0),
+    )
+    multi_horizontal = estimate_record_cost(_record("B", *points))
+    multi_target = estimate_record_cost(
+        _record("C", *points).model_copy(
+            update={"point_labels": ("S", "t1", "t2", "t3", "t4")}
+        )
+    )
+
+    assert multi_horizontal.profile_family == PROFILE_MULTI_HORIZONTAL
+    assert multi_target.profile_family == PROFILE_MULTI_TARGET
+    assert multi_target.target_count == multi_horizontal.target_count
+    assert multi_horizontal.predicted_s > multi_target.predicted_s
+
+
+def test_estimate_record_cost_prefers_measured_history() -> None:
+    record = _record(
+        "A", (0.0, 0.0, 0.0), (600.0, 0.0, 2400.0), (1600.0, 0.0, 2400.0)
+    )
+    model_only = estimate_record_cost(record)
+    with_history = estimate_record_cost(record, history_runtime_s=20.0)
+
+    assert with_history.history_runtime_s == pytest.approx(20.0)
+    assert with_history.predicted_s > 0.8 * 20.0
+    assert with_history.model_cost_s == pytest.approx(model_only.model_cost_s)
+    assert estimate_record_cost(record, history_runtime_s=float("nan")).history_runtime_s is None
+
+
+def test_runtime_history_and_longest_first_order() -> None:
+    history = runtime_history_by_name(
+        [
+            SimpleNamespace(name="A", runtime_s=1.5),
+            SimpleNamespace(name="B", runtime_s=None),
+            SimpleNamespace(name="C", runtime_s=4.0),
+        ]
+    )
+    costs = {
+        name: estimate.predicted_s
+        for name, estimate in estimate_batch_costs(
+            [
+                _record("A", (0.0, 0.0, 0.0), (600.0, 0.0, 2400.0), (1600.0, 0.0, 2400.0)),
+                _record("C", (0.0, 0.0, 0.0), (600.0, 0.0, 2400.0), (1600.0, 0.0, 2400.0)),
+            ],
+            history_runtime_s_by_name=history,
+        ).items()
+    }
+
+    assert history == {"A": 1.5, "C": 4.0}
+    assert longest_first_order(["A", "X", "C"], costs) == ["C", "A", "X"]
+
+
+def test_recommended_parallel_workers_weighs_pool_overhead() -> None:
+    overhead = BatchParallelOverhead(pool_startup_s=2.0, task_overhead_s=0.0)
+
+    assert recommended_parallel_workers([0.1] * 20, max_workers=4, overhead=overhead) == 0
+    assert recommended_parallel_workers([5.0] * 8, max_workers=4, overhead=overhead) == 4
+    assert recommended_parallel_workers([10.0, 10.0], max_workers=4, overhead=overhead) == 2
+    assert predicted_makespan_s([4.0, 3.0, 3.0], workers=2, overhead=overhead) == pytest.approx(8.0)
+    assert predicted_makespan_s([4.0, 3.0, 3.0], workers=0) == pytest.approx(10.0)
+
+
+def test_parallel_overhead_update_tracks_observed_startup() -> None:
+    overhead = BatchParallelOverhead(pool_startup_s=2.0, task_overhead_s=0.0)
+
+    updated = overhead.updated(wall_s=10.0, task_runtimes_s=[4.0, 4.0], workers=2)
+
+    assert updated.pool_startup_s == pytest.approx(0.5 * 2.0 + 0.5 * 6.0)
+    assert overhead.updated(wall_s=10.0, task_runtimes_s=[], workers=2) is overhead
@@ -12,13 +12,17 @@ from pywp.coordinate_integration import (
     INPUT_CRS_OPTIONS,
     _can_transform_directly,
     csv_export_crs,
+    fit_local_crs_approximation,
     meridian_convergence_series_deg,
     _transform_xy,
     apply_crs_to_well_view,
     format_coordinates_for_display,
     get_crs_display_suffix,
     transform_point_to_crs,
+    transform_stations_batch_to_crs,
     transform_stations_to_crs,
+    transform_xy_arrays_to_crs,
+    transform_xy_for_display,
     transform_xy_to_crs,
 )
 from pywp.coordinate_systems import CoordinateSystem, ProjectedCoord
@@ -555,3 +559,154 @@ class TestCoordinateIntegration:
         assert result["X_m"].tolist() == pytest.approx([1001.0, 1101.0])
         assert result["Y_m"].tolist() == pytest.approx([2002.0, 2102.0])
         assert calls["array"] == 1
+
+    def test_transform_stations_batch_projects_all_wells_once_and_caches(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        calls = {"array": 0, "rows": 0}
+
+        class FakeTransformer:
+            def transform_array(
+                self,
+                coords: np.ndarray,
+                _from_crs: CoordinateSystem,
+                _to_crs: CoordinateSystem,
+            ) -> np.ndarray:
+                calls["array"] += 1
+                calls["rows"] += len(coords)
+                return np.asarray(coords, dtype=float) + np.array([1.0, 2.0])
+
+        monkeypatch.setattr(ci, "HAS_PYPROJ", True)
+        monkeypatch.setattr(ci, "_try_create_transformer", lambda: FakeTransformer())
+        wells = [
+            pd.DataFrame({
+                "X_m": [1000.0, 1100.0],
+                "Y_m": [2000.0, 2100.0],
+                "Z_m": [0.0, 50.0],
+            }),
+            pd.DataFrame({"X_m": [3000.0], "Y_m": [4000.0], "Z_m": [10.0]}),
+        ]
+
+        batch = transform_stations_batch_to_crs(
+            wells,
+            CoordinateSystem.WGS84,
+            CoordinateSystem.PULKOVO_1942_ZONE_16,
+        )
+        repeated = transform_stations_to_crs(
+            wells[1],
+            CoordinateSystem.WGS84,
+            CoordinateSystem.PULKOVO_1942_ZONE_16,
+        )
+
+        assert calls == {"array": 1, "rows": 3}
+        assert batch[0].iloc[:, 0].tolist() == pytest.approx([1001.0, 1101.0])
+        assert batch[1].iloc[:, 1].tolist() == pytest.approx([4002.0])
+        pd.testing.assert_frame_equal(batch[1], repeated)
+        assert list(batch[0].columns)[-1] == "Z_TVD_m"
+
+    def test_crs_result_cache_evicts_by_total_array_size(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        calls = {"rows": 0}
+
+        def compute(coords: np.ndarray) -> np.ndarray:
+            calls["rows"] += len(coords)
+            return coords + 1.0
+
+        # Room for two of the three 10-row (160-byte) results.
+        monkeypatch.setattr(ci, "_CRS_RESULT_CACHE_MAX_BYTES", 400)
+        arrays = [np.full((10, 2), float(index)) for index in range(3)]
+        for coords in arrays:
+            ci._bulk_cached_rows([coords], key_prefix=("test",), compute=compute)
+        oversized = ci._bulk_cached_rows(
+            [np.zeros((40, 2))], key_prefix=("test",), compute=compute
+        )
+
+        assert ci._crs_result_cache_bytes == 320
+        assert len(ci._crs_result_cache) == 2
+        assert oversized[0].shape == (40, 2)
+        calls["rows"] = 0
+        ci._bulk_cached_rows(arrays[1:], key_prefix=("test",), compute=compute)
+        assert calls["rows"] == 0
+        ci._bulk_cached_rows(arrays[:1], key_prefix=("test",), compute=compute)
+        assert calls["rows"] == 10
+        ci.clear_crs_transform_cache()
+        assert ci._crs_result_cache_bytes == 0
+
+    @pytest.mark.skipif(not ci.HAS_PYPROJ, reason="pyproj is required")
+    def test_local_crs_approximation_stays_within_tolerance_of_pyproj(self) -> None:
+        rng = np.random.default_rng(5)
+        xy = np.column_stack(
+            [
+                600_000.0 + rng.uniform(0.0, 3_000.0, 500),
+                7_400_000.0 + rng.uniform(0.0, 3_000.0, 500),
+            ]
+        )
+        xy[7] = [np.nan, 7_401_000.0]
+
+        for target_crs in (CoordinateSystem.WGS84_UTM_ZONE_43N, CoordinateSystem.WGS84):
+            approximation = fit_local_crs_approximation(
+                xy, CoordinateSystem.PULKOVO_1942_GK_13N, target_crs
+            )
+            assert approximation is not None
+            assert approximation.max_error_m <= ci.LOCAL_CRS_APPROXIMATION_TOLERANCE_M
+            exact = transform_xy_arrays_to_crs(
+                [xy], CoordinateSystem.PULKOVO_1942_GK_13N, target_crs
+            )[0]
+            display = transform_xy_for_display(
+                xy, CoordinateSystem.PULKOVO_1942_GK_13N, target_crs
+            )
+            tolerance = 0.01 if target_crs.is_projected() else 1e-6
+            np.testing.assert_allclose(display, exact, rtol=0.0, atol=tolerance)
+            assert np.isnan(display[7, 0])
+
+    @pytest.mark.skipif(not ci.HAS_PYPROJ, reason="pyproj is required")
+    def test_apply_crs_to_well_view_reports_display_approximation_error(self) -> None:
+        stations = pd.DataFrame({
+            "X_m": [600_000.0, 600_800.0, 601_500.0],
+            "Y_m": [7_400_000.0, 7_400_600.0, 7_401_200.0],
+            "Z_m": [0.0, 1500.0, 2500.0],
+        })
+        view = SingleWellResultView(
+            well_name="TEST-01",
+            surface=Point3D(x=600_000.0, y=7_400_000.0, z=0.0),
+            t1=Point3D(x=600_800.0, y=7_400_600.0, z=1500.0),
+            t3=Point3D(x=601_500.0, y=7_401_200.0, z=2500.0),
+            stations=stations,
+            summary={"md_m": 3000.0},
+            config={"lateral_tolerance_m": 30.0},
+            azimuth_deg=45.0,
+            md_t1_m=2000.0,
+        )
+
+        result = apply_crs_to_well_view(
+            view,
+            CoordinateSystem.WGS84_UTM_ZONE_43N,
+            CoordinateSystem.PULKOVO_1942_GK_13N,
+        )
+
+        error_m = result.summary["display_crs_approximation_error_m"]
+        assert 0.0 <= error_m <= ci.LOCAL_CRS_APPROXIMATION_TOLERANCE_M
+        assert "display_crs_approximation_error_m" not in view.summary
+
+    @pytest.mark.skipif(not ci.HAS_PYPROJ, reason="pyproj is required")
+    def test_local_crs_approximation_rejects_wide_areas_and_falls_back(self) -> None:
+        xy = np.array([[500_000.0, 6_000_000.0], [700_000.0, 6_300_000.0]])
+
+        assert (
+            fit_local_crs_approximation(
+                xy, CoordinateSystem.PULKOVO_1942_GK_13N, CoordinateSystem.WGS84
+            )
+            is None
+        )
+        np.testing.assert_array_equal(
+            transform_xy_for_display(
+                xy, CoordinateSystem.PULKOVO_1942_GK_13N, CoordinateSystem.WGS84
+            ),
+            transform_xy_arrays_to_crs(
+                [xy], CoordinateSystem.PULKOVO_1942_GK_13N, CoordinateSystem.WGS84
+            )[0],
+        )
+
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import csv
+from io import BytesIO, StringIO
+
+import numpy as np
+import pytest
+from openpyxl import Workbook
+
+from pywp.coordinate_integration import transform_xy_to_crs
+from pywp.coordinate_systems import CoordinateSystem
+from pywp.crs_batch import (
+    CrsBatchInputError,
+    convert_coordinate_table,
+    parse_coordinate_series,
+    parse_dms_series,
+)
+
+_COLUMNS = ("X in", "Y in", "X out", "Y out")
+
+
+def _csv_rows(payload: bytes) -> list[list[str]]:
+    text = payload.decode("utf-8")
+    assert text.startswith("\ufeff")
+    return list(csv.reader(StringIO(text[1:])))
+
+
+def test_parse_dms_series_matches_scalar_values_and_messages() -> None:
+    parsed = parse_dms_series(
+        ["N 71 10 14.94", "E 72 30 0,5", "Q 1 2 3", "N 71 60 0", "N 91 0 0", "N"]
+    )
+
+    assert parsed.direction[:2].tolist() == ["N", "E"]
+    assert parsed.decimal_deg[0] == pytest.approx(71.0 + 10.0 / 60.0 + 14.94 / 3600.0)
+    assert parsed.decimal_deg[1] == pytest.approx(72.5 + 0.5 / 3600.0)
+    assert parsed.error[:2].tolist() == ["", ""]
+    assert all(str(message) for message in parsed.error[2:])
+    assert np.isnan(parsed.decimal_deg[2:]).all()
+
+
+def test_parse_coordinate_series_accepts_decimal_comma_and_dms_axis() -> None:
+    projected = parse_coordinate_series(["1234,5", "12.5", "", "abc"])
+    lon = parse_coordinate_series(["E 72 30 0", "73,25", "N 71 0 0"], dms_axis="lon")
+
+    assert projected[:2].tolist() == pytest.approx([1234.5, 12.5])
+    assert np.isnan(projected[2:]).all()
+    assert lon[:2].tolist() == pytest.approx([72.5, 73.25])
+    assert np.isnan(lon[2])
+
+
+def test_convert_coordinate_table_streams_csv_in_chunks() -> None:
+    source = BytesIO(
+        "X;Y\n"
+        "10,0;20,0\n"
+        "\n"
+        "30;40\n"
+        "oops;50\n"
+        "15;25\n".encode("cp1251")
+    )
+
+    conversion = convert_coordinate_table(
+        source,
+        file_name="points.csv",
+        input_crs=CoordinateSystem.PULKOVO_1942_GK_13N,
+        output_crs=CoordinateSystem.WGS84_UTM_ZONE_43N,
+        columns=_COLUMNS,
+        preview_rows=2,
+        chunk_rows=2,
+    )
+
+    rows = _csv_rows(conversion.csv_bytes)
+    expected_x, expected_y = transform_xy_to_crs(
+        30.0,
+        40.0,
+        CoordinateSystem.PULKOVO_1942_GK_13N,
+        CoordinateSystem.WGS84_UTM_ZONE_43N,
+    )
+    assert conversion.converted_row_count == 3
+    assert conversion.invalid_row_count == 1
+    assert rows[0] == list(_COLUMNS)
+    assert [row[:2] for row in rows[1:]] == [
+        ["10.000", "20.000"],
+        ["30.000", "40.000"],
+        ["15.000", "25.000"],
+    ]
+    assert rows[2][2:] == [f"{expected_x:.3f}", f"{expected_y:.3f}"]
+    assert list(conversion.preview.columns) == list(_COLUMNS)
+    assert len(conversion.preview) == 2
+
+
+def test_convert_coordinate_table_reads_headerless_xlsx() -> None:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append([72.5, 71.25])
+    sheet.append([None, None])
+    sheet.append(["E 72 0 0", "N 71 0 0"])
+    payload = BytesIO()
+    workbook.save(payload)
+    payload.seek(0)
+
+    conversion = convert_coordinate_table(
+        payload,
+        file_name="points.xlsx",
+        input_crs=CoordinateSystem.WGS84,
+        output_crs=CoordinateSystem.WGS84_UTM_ZONE_43N,
+        columns=_COLUMNS,
+    )
+
+    rows = _csv_rows(conversion.csv_bytes)
+    assert conversion.converted_row_count == 2
+    assert conversion.invalid_row_count == 0
+    assert [row[:2] for row in rows[1:]] == [
+        ["72.50000000", "71.25000000"],
+        ["72.00000000", "71.00000000"],
+    ]
+
+
+@pytest.mark.parametrize("payload", [b"", b"\n\n", b"  \r\n"])
+def test_convert_coordinate_table_treats_blank_csv_as_no_points(payload: bytes) -> None:
+    conversion = convert_coordinate_table(
+        BytesIO(payload),
+        file_name="points.csv",
+        input_crs=CoordinateSystem.PULKOVO_1942_GK_13N,
+        output_crs=CoordinateSystem.WGS84_UTM_ZONE_43N,
+        columns=_COLUMNS,
+    )
+
+    assert conversion.converted_row_count == 0
+    assert conversion.invalid_row_count == 0
+    assert conversion.csv_bytes == b""
+    assert list(conversion.preview.columns) == list(_COLUMNS)
+
+
+def test_convert_coordinate_table_skips_leading_blank_lines_in_csv() -> None:
+    conversion = convert_coordinate_table(
+        BytesIO(b"\n\nX;Y\n10;20\n"),
+        file_name="points.csv",
+        input_crs=CoordinateSystem.PULKOVO_1942_GK_13N,
+        output_crs=CoordinateSystem.WGS84_UTM_ZONE_43N,
+        columns=_COLUMNS,
+    )
+
+    assert conversion.converted_row_count == 1
+    assert [row[:2] for row in _csv_rows(conversion.csv_bytes)[1:]] == [
+        ["10.000", "20.000"]
+    ]
+
+
+def test_convert_coordinate_table_rejects_unknown_extension() -> None:
+    with pytest.raises(CrsBatchInputError, match="CSV или XLSX"):
+        convert_coordinate_table(
+            BytesIO(b"1;2\n"),
+            file_name="points.txt",
+            input_crs=CoordinateSystem.PULKOVO_1942_GK_13N,
+            output_crs=CoordinateSystem.WGS84_UTM_ZONE_43N,
+            columns=_COLUMNS,
+        )
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        (b"71,5;55,3\n72,1;56,0\n", [["71.500", "55.300"], ["72.100", "56.000"]]),
+        (b"1000,5;2000,25\n", [["1000.500", "2000.250"]]),
+        (b"10\t20\n30\t40\n", [["10.000", "20.000"], ["30.000", "40.000"]]),
+        (b"X,Y\n10.5,20\n", [["10.500", "20.000"]]),
+    ],
+)
+def test_convert_coordinate_table_prefers_semicolon_over_decimal_comma(
+    payload: bytes,
+    expected: list[list[str]],
+) -> None:
+    conversion = convert_coordinate_table(
+        BytesIO(payload),
+        file_name="points.csv",
+        input_crs=CoordinateSystem.PULKOVO_1942_GK_13N,
+        output_crs=CoordinateSystem.WGS84_UTM_ZONE_43N,
+        columns=_COLUMNS,
+    )
+
+    assert conversion.invalid_row_count == 0
+    assert [row[:2] for row in _csv_rows(conversion.csv_bytes)[1:]] == expected
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import importlib
 
+import numpy as np
 import pytest
 from streamlit.testing.v1 import AppTest
 
 import pywp.coordinate_integration as ci
+import pywp.crs_batch as crs_batch
 from pywp.coordinate_systems import CoordinateSystem
 
 app = importlib.import_module("pages.04_crs_calculator")
@@ -179,18 +181,19 @@ def test_normalize_batch_editor_frame_filters_blank_and_incomplete_rows() -> Non
 
 
 def test_batch_result_frame_uses_shared_transform_function(monkeypatch) -> None:
-    calls: list[tuple[float, float, CoordinateSystem, CoordinateSystem]] = []
+    calls: list[tuple[list[list[float]], CoordinateSystem, CoordinateSystem]] = []
 
     def fake_transform(
-        x: float,
-        y: float,
+        xy_arrays,
         from_crs: CoordinateSystem,
         to_crs: CoordinateSystem,
-    ) -> tuple[float, float]:
-        calls.append((float(x), float(y), from_crs, to_crs))
-        return float(x) + 1.0, float(y) + 2.0
+        *,
+        use_cache: bool = True,
+    ):
+        calls.append(([xy.tolist() for xy in xy_arrays][0], from_crs, to_crs))
+        return [xy + np.array([1.0, 2.0]) for xy in xy_arrays]
 
-    monkeypatch.setattr(app, "transform_xy_to_crs", fake_transform)
+    monkeypatch.setattr(crs_batch, "transform_xy_arrays_to_crs", fake_transform)
 
     result = app._batch_result_frame(
         points=app.pd.DataFrame([{"X": 10.0, "Y": 20.0}, {"X": 30.0, "Y": 40.0}]),
@@ -200,17 +203,10 @@ def test_batch_result_frame_uses_shared_transform_function(monkeypatch) -> None:
 
     assert calls == [
         (
-            10.0,
-            20.0,
+            [[10.0, 20.0], [30.0, 40.0]],
             CoordinateSystem.PULKOVO_1942_GK_13N,
             CoordinateSystem.WGS84_UTM_ZONE_43N,
-        ),
-        (
-            30.0,
-            40.0,
-            CoordinateSystem.PULKOVO_1942_GK_13N,
-            CoordinateSystem.WGS84_UTM_ZONE_43N,
-        ),
+        )
     ]
     assert list(result.columns) == [
         "X input (ГК_13N_42)",
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+import pytest
+
+from pywp.models import Point3D
+from pywp.project_store import (
+    ProjectStoreError,
+    open_project_store,
+    save_project_store,
+)
+from pywp.models import TrajectoryConfig
+from pywp.reference_trajectories import (
+    REFERENCE_WELL_ACTUAL,
+    REFERENCE_WELL_APPROVED,
+    ImportedTrajectoryWell,
+    parse_reference_trajectory_dev_text,
+)
+from pywp.welltrack_batch import SuccessfulWellPlan
+
+
+def _dev_well(name: str, kind: str, *, full_rows: bool):
+    rows = [
+        "0 100 200 0 0 0 0 0 0 0 0",
+        "100 110 210 95 95 10 10 45 8 2.4 44",
+        "200 130 230 185 185 30 30 45 12 1.2 44",
+    ]
+    if not full_rows:
+        rows = [" ".join(row.split()[:4]) for row in rows]
+    return parse_reference_trajectory_dev_text(
+        "\n".join(["MD X Y Z", *rows]),
+        well_name=name,
+        kind=kind,
+    )
+
+
+def test_project_store_round_trips_wells_lazily(tmp_path) -> None:
+    wells = [
+        _dev_well("FACT-1", REFERENCE_WELL_ACTUAL, full_rows=True),
+        _dev_well("APP-1", REFERENCE_WELL_APPROVED, full_rows=False),
+    ]
+
+    save_project_store(tmp_path / "project", reference_wells=wells)
+    store = open_project_store(tmp_path / "project")
+
+    assert store.names == ("FACT-1", "APP-1")
+    assert store.kinds == (REFERENCE_WELL_ACTUAL, REFERENCE_WELL_APPROVED)
+    loaded = store.well("FACT-1")
+    assert store.well(0) is loaded
+    pd.testing.assert_frame_equal(loaded.stations, wells[0].stations)
+    pd.testing.assert_frame_equal(loaded.dev_export_rows, wells[0].dev_export_rows)
+    assert loaded.surface == wells[0].surface
+    assert loaded.azimuth_deg == wells[0].azimuth_deg
+    [approved] = store.wells(kind=REFERENCE_WELL_APPROVED)
+    assert approved.dev_export_rows is None
+    pd.testing.assert_frame_equal(approved.stations, wells[1].stations)
+    with pytest.raises(KeyError):
+        store.well("MISSING")
+
+
+def test_project_store_replaces_previous_store_and_checks_version(
+    tmp_path,
+) -> None:
+    root = tmp_path / "project"
+    save_project_store(
+        root,
+        reference_wells=[_dev_well("FACT-1", REFERENCE_WELL_ACTUAL, full_rows=True)],
+    )
+    save_project_store(
+        root,
+        reference_wells=[_dev_well("FACT-2", REFERENCE_WELL_ACTUAL, full_rows=False)],
+    )
+
+    assert open_project_store(root).names == ("FACT-2",)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["project"]
+
+    manifest_path = root / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["format_version"] = 999
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    with pytest.raises(ProjectStoreError, match="версию"):
+        open_project_store(root)
+    with pytest.raises(ProjectStoreError, match="Не удалось прочитать"):
+        open_project_store(tmp_path / "missing")
+
+
+def test_project_store_keeps_plans_and_missing_text_values(tmp_path) -> None:
+    stations = pd.DataFrame(
+        {
+            "MD_m": [0.0, 100.0, 200.0],
+            "X_m": [0.0, 10.0, 20.0],
+            "Y_m": [0.0, 5.0, 10.0],
+            "Z_m": [0.0, 95.0, 190.0],
+            "segment": pd.Series(["VERTICAL", None, "BUILD"], dtype=object),
+            "label": pd.Series(["a", None, "c"], dtype="str"),
+        }
+    )
+    well = ImportedTrajectoryWell(
+        name="FACT-1",
+        kind=REFERENCE_WELL_ACTUAL,
+        stations=stations,
+        surface=Point3D(0.0, 0.0, 0.0),
+        azimuth_deg=30.0,
+    )
+    plan = SuccessfulWellPlan(
+        name="PLAN-1",
+        surface=Point3D(0.0, 0.0, 0.0),
+        t1=Point3D(100.0, 0.0, 1000.0),
+        t3=Point3D(200.0, 0.0, 1000.0),
+        target_points=(Point3D(150.0, 0.0, 1000.0),),
+        target_labels=("t2",),
+        stations=stations,
+        summary={"md_total_m": 200.0, "kop_md_m": float("nan"), "type": "J"},
+        azimuth_deg=0.0,
+        md_t1_m=150.0,
+        config=TrajectoryConfig(),
+    )
+
+    save_project_store(
+        tmp_path / "project",
+        reference_wells=[well],
+        plans=[plan],
+        plan_summary_rows=[{"Скважина": "PLAN-1", "Статус": "OK"}],
+    )
+    store = open_project_store(tmp_path / "project")
+
+    loaded_well = store.well("FACT-1")
+    pd.testing.assert_frame_equal(loaded_well.stations, stations)
+    assert loaded_well.stations["segment"].iloc[1] is None
+    assert store.plan_names == ("PLAN-1",)
+    [loaded_plan] = store.plans()
+    assert store.plan("PLAN-1") is loaded_plan
+    pd.testing.assert_frame_equal(loaded_plan.stations, stations)
+    assert loaded_plan.model_dump(exclude={"stations", "summary"}) == plan.model_dump(
+        exclude={"stations", "summary"}
+    )
+    assert loaded_plan.summary["type"] == "J"
+    assert loaded_plan.summary["kop_md_m"] != loaded_plan.summary["kop_md_m"]
+    assert store.plan_summary_rows == ({"Скважина": "PLAN-1", "Статус": "OK"},)
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda manifest: manifest.pop("wells"),
+        lambda manifest: manifest["wells"][0].pop("surface"),
+        lambda manifest: manifest["wells"][0]["stations"].update(start="0"),
+        lambda manifest: manifest["columns"].pop("stations"),
+        lambda manifest: manifest["plans"].append({"name": "PLAN"}),
+    ],
+)
+def test_open_project_store_rejects_incomplete_manifest(tmp_path, damage) -> None:
+    root = tmp_path / "project"
+    save_project_store(
+        root,
+        reference_wells=[_dev_well("FACT-1", REFERENCE_WELL_ACTUAL, full_rows=True)],
+    )
+    manifest_path = root / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    damage(manifest)
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    with pytest.raises(ProjectStoreError, match="повреждено"):
+        open_project_store(root)
+
+
+def test_project_store_keeps_numbers_in_object_columns(tmp_path) -> None:
+    stations = pd.DataFrame(
+        {
+            "MD_m": [0.0, 100.0],
+            "X_m": [0.0, 10.0],
+            "Y_m": [0.0, 5.0],
+            "Z_m": [0.0, 95.0],
+            "quality": pd.Series([1.5, None], dtype=object),
+        }
+    )
+    well = ImportedTrajectoryWell(
+        name="FACT-1",
+        kind=REFERENCE_WELL_ACTUAL,
+        stations=stations,
+        surface=Point3D(0.0, 0.0, 0.0),
+        azimuth_deg=30.0,
+    )
+
+    save_project_store(tmp_path / "project", reference_wells=[well])
+    loaded = open_project_store(tmp_path / "project").well("FACT-1").stations
+
+    assert loaded["quality"].dtype == object
+    assert loaded["quality"].tolist() == [1.5, None]
+
+    mixed = stations.assign(quality=pd.Series([1.5, "high"], dtype=object))
+    with pytest.raises(ProjectStoreError, match="разных типов"):
+        save_project_store(
+            tmp_path / "mixed",
+            reference_wells=[well.model_copy(update={"stations": mixed})],
+        )
+    assert not (tmp_path / "mixed").exists()
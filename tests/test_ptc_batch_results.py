@@ -595,6 +595,37 @@ def test_build_batch_survey_welltrack_exports_calculated_station_rows() -> None:
     assert records[0].points[1].md == pytest.approx(100.0)
 
 
+def test_export_rows_block_matches_scalar_number_formatting() -> None:
+    values = np.array(
+        [
+            [1.25, -3e-10, float("nan"), -1e-7],
+            [123456.1234565, float("inf"), -0.0, 2.0],
+        ]
+    )
+
+    welltrack_text = ptc_batch_results._format_export_rows(
+        values, ptc_batch_results._WELLTRACK_ROW_FORMAT
+    )
+    dev_text = ptc_batch_results._format_dev_export_data_block(
+        np.arange(22, dtype=float).reshape(2, 11) * -1.5
+    )
+
+    assert welltrack_text.splitlines() == [
+        " ".join(ptc_batch_results._format_export_number(value) for value in row)
+        for row in values
+    ]
+    assert dev_text.splitlines() == [
+        ptc_batch_results._DEV_EXPORT_DATA_ROW_PREFIX
+        + " ".join(
+            ptc_batch_results._format_export_number(value).rjust(width)
+            for value, width in zip(
+                row, ptc_batch_results._DEV_EXPORT_COLUMN_WIDTHS, strict=True
+            )
+        )
+        for row in np.arange(22, dtype=float).reshape(2, 11) * -1.5
+    ]
+
+
 def test_build_batch_survey_welltrack_skips_nonfinite_required_rows() -> None:
     payload = ptc_batch_results.build_batch_survey_welltrack(
         [
@@ -1150,3 +1181,38 @@ def test_find_selected_success_matches_by_string_name() -> None:
     )
 
     assert selected.name == "2"
+
+
+def test_write_batch_survey_dev_7z_streams_archive_to_disk(tmp_path) -> None:
+    successes = [
+        _success(
+            name=f"WELL-{index}",
+            stations=pd.DataFrame(
+                {
+                    "MD_m": [0.0, 100.0],
+                    "X_m": [10.0 * index, 20.0 * index],
+                    "Y_m": [30.0, 45.0],
+                    "Z_m": [-5.0, 95.0],
+                }
+            ),
+        )
+        for index in range(1, 4)
+    ]
+    payloads = ptc_batch_results.iter_batch_survey_dev_files(successes)
+    archive_path = tmp_path / "survey.7z"
+
+    written = ptc_batch_results.write_batch_survey_dev_7z(successes, archive_path)
+
+    assert written == 3
+    assert next(payloads).file_name == "WELL-1.dev"
+    with py7zr.SevenZipFile(archive_path, mode="r") as archive:
+        assert sorted(archive.getnames()) == ["WELL-1.dev", "WELL-2.dev", "WELL-3.dev"]
+        archive.extractall(path=tmp_path / "extracted")
+    expected = {
+        payload.file_name: payload.data
+        for payload in ptc_batch_results.build_batch_survey_dev_files(successes)
+    }
+    for file_name, data in expected.items():
+        assert (tmp_path / "extracted" / file_name).read_bytes() == data
+    assert ptc_batch_results.write_batch_survey_dev_7z([], tmp_path / "empty.7z") == 0
+    assert not (tmp_path / "empty.7z").exists()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from types import SimpleNamespace
 
 import pandas as pd
@@ -515,6 +516,162 @@ def test_run_batch_logs_partial_parallel_mode_for_pilot_dependencies(
     )
 
 
+def test_run_batch_logs_pilot_dependency_critical_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FakeBatchPlanner:
+        last_evaluation_metadata = SimpleNamespace(
+            skipped_selected_names=(),
+            cluster_blocked=False,
+            cluster_resolved_early=False,
+            cluster_blocking_reason=None,
+            critical_path_well_names=("WELL-A_PL", "WELL-A"),
+            critical_path_runtime_s=12.5,
+        )
+
+        def __init__(self, *_args: object, **_kwargs: object) -> None:
+            pass
+
+        def evaluate(self, **_kwargs: object):
+            return (
+                [
+                    {"Скважина": "WELL-A", "Статус": "OK", "Проблема": ""},
+                    {"Скважина": "WELL-B", "Статус": "OK", "Проблема": ""},
+                ],
+                [],
+            )
+
+    parent, other = _records()
+    state: dict[str, object] = {
+        "wt_successes": [],
+        "wt_summary_rows": None,
+    }
+    fake_st = _FakeStreamlit(state)
+    monkeypatch.setattr(ptc_batch_run, "WelltrackBatchPlanner", FakeBatchPlanner)
+
+    ptc_batch_run.run_batch_if_clicked(
+        requests=[
+            ptc_batch_run.BatchRunRequest(
+                selected_names=["WELL-A", "WELL-B"],
+                config=TrajectoryConfig(),
+                run_clicked=True,
+                parallel_workers=4,
+            )
+        ],
+        records=[parent, other],
+        hooks=_batch_run_hooks(),
+        st_module=fake_st,
+    )
+
+    assert any(
+        "Критический путь зависимостей: WELL-A_PL -> WELL-A (12.50 с)." in str(line)
+        for line in state["wt_last_run_log_lines"]
+    )
+
+
+def test_run_batch_streams_successes_into_anticollision_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FakeStream:
+        def __init__(self) -> None:
+            self.submitted: list[str] = []
+            self.finished = False
+            self.failed_well_names = ("WELL-B",)
+
+        def submit(self, success: object) -> None:
+            self.submitted.append(str(getattr(success, "name", "")))
+
+        def pop_conflicts(self):
+            if len(self.submitted) < 2:
+                return ()
+            return (
+                SimpleNamespace(
+                    well_a="WELL-B",
+                    well_b="WELL-A",
+                    corridor_count=1,
+                    worst_separation_factor=0.42,
+                ),
+            )
+
+        def finish(self):
+            self.finished = True
+            return {"WELL-A": ("sig-a", "well-a")}, {("WELL-A", "WELL-B"): "pair"}
+
+    stream = FakeStream()
+
+    class FakeBatchPlanner:
+        last_evaluation_metadata = SimpleNamespace(
+            skipped_selected_names=(),
+            cluster_blocked=False,
+            cluster_resolved_early=False,
+            cluster_blocking_reason=None,
+        )
+
+        def __init__(self, *_args: object, **_kwargs: object) -> None:
+            pass
+
+        def evaluate(self, **kwargs: object):
+            success_callback = kwargs["success_callback"]
+            record_done_callback = kwargs["record_done_callback"]
+            rows = [
+                {"Скважина": "WELL-A", "Статус": "OK", "Проблема": ""},
+                {"Скважина": "WELL-B", "Статус": "OK", "Проблема": ""},
+            ]
+            successes = [_success("WELL-A"), _success("WELL-B")]
+            for index, (row, success) in enumerate(zip(rows, successes), start=1):
+                success_callback(success)
+                record_done_callback(index, 2, str(success.name), row)
+            return rows, successes
+
+    parent, other = _records()
+    state: dict[str, object] = {
+        "wt_successes": [],
+        "wt_summary_rows": None,
+        "wt_anticollision_analysis_cache": {
+            "key": "old",
+            "pair_cache": {("WELL-A", "WELL-C"): "old-pair"},
+        },
+    }
+    monkeypatch.setattr(ptc_batch_run, "WelltrackBatchPlanner", FakeBatchPlanner)
+
+    ptc_batch_run.run_batch_if_clicked(
+        requests=[
+            ptc_batch_run.BatchRunRequest(
+                selected_names=["WELL-A", "WELL-B"],
+                config=TrajectoryConfig(),
+                run_clicked=True,
+                parallel_workers=2,
+            )
+        ],
+        records=[parent, other],
+        hooks=replace(
+            _batch_run_hooks(),
+            build_anticollision_stream=lambda _records: stream,
+        ),
+        st_module=_FakeStreamlit(state),
+    )
+
+    assert stream.submitted == ["WELL-A", "WELL-B"]
+    assert stream.finished
+    assert any(
+        "Anti-collision (предварительно): пересечение конусов WELL-B ↔ WELL-A, "
+        "минимальный SF 0.42." in str(line)
+        for line in state["wt_last_run_log_lines"]
+    )
+    assert any(
+        "Anti-collision (предварительно): не удалось обработать скважины WELL-B"
+        in str(line)
+        for line in state["wt_last_run_log_lines"]
+    )
+    cache = state["wt_anticollision_analysis_cache"]
+    assert cache["key"] == "old"
+    assert cache["well_cache"] == {"WELL-A": ("sig-a", "well-a")}
+    assert cache["pair_cache"] == {
+        ("WELL-A", "WELL-C"): "old-pair",
+        ("WELL-A", "WELL-B"): "pair",
+    }
+
+
 def test_run_batch_clears_stale_error_and_recommends_no_followup_after_all_ok(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
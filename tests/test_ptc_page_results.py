@@ -2356,3 +2356,17 @@ def test_format_duration_ru_carries_rounded_seconds() -> None:
     assert ptc_core._format_duration_ru(59.6) == "1 мин 00 с"
     assert ptc_core._format_duration_ru(119.6) == "2 мин 00 с"
     assert ptc_core._format_duration_ru(3600.0) == "1 ч 00 мин"
+
+
+def test_success_fragment_signature_follows_station_content() -> None:
+    stations = pd.DataFrame({"X_m": [0.0, 10.0], "Z_m": [0.0, 100.0]})
+    success = SimpleNamespace(name="WELL-1", stations=stations, target_pairs=())
+    same = SimpleNamespace(name="WELL-1", stations=stations.copy(), target_pairs=())
+    moved_stations = stations.copy()
+    moved_stations.loc[1, "X_m"] = 11.0
+    moved = SimpleNamespace(name="WELL-1", stations=moved_stations, target_pairs=())
+
+    signature = ptc_page_results._success_fragment_signature(success)
+
+    assert ptc_page_results._success_fragment_signature(same) == signature
+    assert ptc_page_results._success_fragment_signature(moved) != signature
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 from streamlit.testing.v1 import AppTest
 
+from pywp.batch_cost_model import BatchParallelOverhead
 from pywp.eclipse_welltrack import WelltrackPoint, WelltrackRecord
 from pywp.ptc_page_run import (
     _SIDETRACK_MANUAL,
@@ -53,13 +56,67 @@ def test_sidetrack_parent_names_detects_visible_parent_wells() -> None:
     assert _sidetrack_parent_names(records) == ["WELL-04"]
 
 
-def test_auto_batch_parallel_workers_uses_conservative_thresholds() -> None:
-    assert _auto_batch_parallel_workers(0) == 0
-    assert _auto_batch_parallel_workers(3) == 0
-    assert _auto_batch_parallel_workers(7) == 0
-    assert _auto_batch_parallel_workers(8) == 2
-    assert _auto_batch_parallel_workers(15) == 2
-    assert _auto_batch_parallel_workers(16) == 4
+def _ordinary_records(count: int) -> list[WelltrackRecord]:
+    return [
+        WelltrackRecord(
+            name=f"WELL-{index:02d}",
+            points=(
+                WelltrackPoint(x=100.0 * index, y=0.0, z=0.0, md=1.0),
+                WelltrackPoint(x=100.0 * index + 800.0, y=0.0, z=2200.0, md=2.0),
+                WelltrackPoint(x=100.0 * index + 1800.0, y=0.0, z=2200.0, md=3.0),
+            ),
+        )
+        for index in range(count)
+    ]
+
+
+def test_auto_batch_parallel_workers_follows_predicted_cost(monkeypatch) -> None:
+    monkeypatch.setattr("pywp.ptc_page_run.os.cpu_count", lambda: 8)
+    records = _ordinary_records(12)
+    names = [record.name for record in records]
+
+    assert _auto_batch_parallel_workers(records=records, selected_names=[], state={}) == 0
+    assert (
+        _auto_batch_parallel_workers(records=records, selected_names=names[:1], state={})
+        == 0
+    )
+    assert (
+        _auto_batch_parallel_workers(records=records, selected_names=names, state={})
+        == 4
+    )
+
+    cheap_history = {
+        "wt_successes": [
+            SimpleNamespace(name=name, runtime_s=0.01) for name in names
+        ],
+        "wt_batch_parallel_overhead": BatchParallelOverhead(pool_startup_s=3.0),
+    }
+    assert (
+        _auto_batch_parallel_workers(
+            records=records, selected_names=names, state=cheap_history
+        )
+        == 0
+    )
+
+
+def test_auto_batch_parallel_workers_counts_pilot_of_selected_parent(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr("pywp.ptc_page_run.os.cpu_count", lambda: 8)
+    records = _parent_with_pilot_records()
+    state = {
+        "wt_successes": [
+            SimpleNamespace(name="WELL-04", runtime_s=10.0),
+            SimpleNamespace(name="well-04_PL", runtime_s=10.0),
+        ]
+    }
+
+    assert (
+        _auto_batch_parallel_workers(
+            records=records, selected_names=["WELL-04"], state=state
+        )
+        == 2
+    )
 
 
 def test_sidetrack_parent_names_includes_zbs_target_records() -> None:
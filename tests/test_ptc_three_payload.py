@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 
-from pywp import ptc_three_payload
+from pywp import ptc_three_builders, ptc_three_payload
 from pywp.anticollision_rerun import build_anti_collision_analysis_for_successes
 from pywp.models import Point3D, TrajectoryConfig
 from pywp.ptc_three_builders import (
+    ThreePayloadFragmentCache,
     all_wells_three_payload,
     anticollision_three_payload,
     single_well_three_payload,
@@ -1285,10 +1287,10 @@ def test_all_wells_three_payload_highlights_actual_sidetrack_parent_in_fast_mode
         if str(item.get("role")) == "reference_label"
     }
     hover_names = {
-        str(hover.get("name"))
+        str(label)
         for item in payload["points"]
         if str(item.get("role")) == "reference_hover"
-        for hover in list(item.get("hover") or [])
+        for label in item["hover_columns"]["name"]["labels"]
     }
 
     assert reference_labels["9010"] == [2000.0, 0.0, 0.0]
@@ -1509,3 +1511,252 @@ def test_all_wells_three_payload_includes_multi_horizontal_target_only_pairs() -
         [1050.0, 0.0, 1020.0],
     ]
     assert legend_item["symbol"] == "point"
+
+
+def _straight_success(name: str, x_offset_m: float) -> SuccessfulWellPlan:
+    stations = pd.DataFrame(
+        {
+            "MD_m": [0.0, 1000.0, 2000.0],
+            "X_m": [x_offset_m, x_offset_m + 1000.0, x_offset_m + 2000.0],
+            "Y_m": [0.0, 0.0, 0.0],
+            "Z_m": [0.0, 1500.0, 1500.0],
+        }
+    )
+    return SuccessfulWellPlan(
+        name=name,
+        surface=Point3D(x_offset_m, 0.0, 0.0),
+        t1=Point3D(x_offset_m + 1000.0, 0.0, 1500.0),
+        t3=Point3D(x_offset_m + 2000.0, 0.0, 1500.0),
+        stations=stations,
+        summary={},
+        azimuth_deg=90.0,
+        md_t1_m=1000.0,
+        config=TrajectoryConfig(),
+    )
+
+
+def test_all_wells_three_payload_reuses_cached_blocks_on_focus_change() -> None:
+    successes = [_straight_success("well_01", 0.0), _straight_success("well_02", 5000.0)]
+    fragment_cache = ThreePayloadFragmentCache()
+
+    first = all_wells_three_payload(successes, fragment_cache=fragment_cache)
+    focused = all_wells_three_payload(
+        successes,
+        focus_well_names=("well_02",),
+        fragment_cache=fragment_cache,
+    )
+    uncached = all_wells_three_payload(successes, focus_well_names=("well_02",))
+
+    assert fragment_cache.misses == 2
+    assert fragment_cache.hits == 2
+    assert focused["lines"] == uncached["lines"]
+    assert focused["bounds"] == uncached["bounds"]
+    assert focused["bounds"] != first["bounds"]
+
+    all_wells_three_payload(successes[:1], fragment_cache=fragment_cache)
+    assert len(fragment_cache) == 1
+
+
+def test_fragment_cache_with_content_signature_reuses_blocks_of_equal_copies() -> None:
+    successes = [_straight_success("well_01", 0.0), _straight_success("well_02", 5000.0)]
+    fragment_cache = ThreePayloadFragmentCache(
+        object_signatures={
+            "success": lambda success: (
+                success.name,
+                tuple(success.stations["X_m"].tolist()),
+            )
+        }
+    )
+
+    all_wells_three_payload(successes, fragment_cache=fragment_cache)
+    copies = [success.model_copy(deep=True) for success in successes]
+    all_wells_three_payload(copies, fragment_cache=fragment_cache)
+
+    assert fragment_cache.misses == 2
+    assert fragment_cache.hits == 2
+
+
+def _vertical_build_lateral_xyz() -> tuple[np.ndarray, np.ndarray]:
+    md_values = np.arange(0.0, 5000.0, 10.0)
+    inc_rad = np.deg2rad(np.clip((md_values - 1000.0) / 1500.0 * 90.0, 0.0, 90.0))
+    steps = np.column_stack(
+        [10.0 * np.sin(inc_rad), np.zeros_like(inc_rad), 10.0 * np.cos(inc_rad)]
+    )
+    steps[0] = 0.0
+    return md_values, np.cumsum(steps, axis=0)
+
+
+def _recursive_rdp_indices(points: np.ndarray, tolerance_m: float) -> list[int]:
+    keep = {0, len(points) - 1}
+    spans = [(0, len(points) - 1)]
+    while spans:
+        start, end = spans.pop()
+        if end - start < 2:
+            continue
+        chord = points[end] - points[start]
+        offsets = points[start + 1 : end] - points[start]
+        fraction = np.clip(offsets @ chord / float(chord @ chord), 0.0, 1.0)
+        deviation = np.linalg.norm(offsets - fraction[:, None] * chord, axis=1)
+        split = int(np.argmax(deviation))
+        if deviation[split] > tolerance_m:
+            keep.add(start + 1 + split)
+            spans.extend([(start, start + 1 + split), (start + 1 + split, end)])
+    return sorted(keep)
+
+
+def test_polyline_significance_matches_recursive_rdp() -> None:
+    rng = np.random.default_rng(3)
+    points = np.cumsum(rng.normal(size=(240, 3)) * [10.0, 10.0, 30.0], axis=0)
+    significance = ptc_three_payload.polyline_vertex_significance(points)
+
+    for tolerance_m in (0.5, 2.0, 8.0, 32.0):
+        assert ptc_three_payload.simplified_polyline_indices(
+            significance, tolerance_m=tolerance_m
+        ).tolist() == _recursive_rdp_indices(points, tolerance_m)
+
+
+def test_polyline_lod_levels_keep_build_section_and_drop_straight_parts() -> None:
+    md_values, xyz = _vertical_build_lateral_xyz()
+    significance = ptc_three_payload.polyline_vertex_significance(xyz)
+    levels = ptc_three_payload.polyline_lod_levels(significance)
+
+    assert [tolerance for tolerance, _ in levels] == [2.0, 8.0, 32.0]
+    finest = levels[0][1]
+    assert finest[0] == 0 and finest[-1] == len(xyz) - 1
+    assert len(finest) < 30
+    build_count = int(np.count_nonzero((md_values[finest] > 1000.0) & (md_values[finest] < 2500.0)))
+    assert build_count >= len(finest) - 4
+    for (_, coarse), (_, fine) in zip(levels[1:], levels[:-1], strict=False):
+        assert set(coarse.tolist()) <= set(fine.tolist())
+
+
+def test_merge_three_payloads_carries_lod_levels() -> None:
+    lines = ptc_three_payload.merge_three_line_payloads(
+        [
+            {
+                "name": "well",
+                "segments": [[[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]]],
+                "lod": [
+                    {"tolerance_m": 2.0, "segments": [[[0.0, 0.0, 0.0], [2.0, 0.0, 0.0]]]}
+                ],
+            },
+            {"name": "well", "segments": [[[5.0, 0.0, 0.0], [6.0, 0.0, 0.0]]]},
+        ]
+    )
+    tube = {"vertex_offset": 0, "points_per_ring": 3, "ring_count": 3}
+    tube_vertices = np.zeros((11, 3)).tolist()
+    meshes = ptc_three_payload.merge_three_mesh_payloads(
+        [
+            {
+                "name": "cone",
+                "vertices": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+                "faces": [[0, 1, 2]],
+                "role": "cone",
+            },
+            {
+                "name": "cone",
+                "vertices": tube_vertices,
+                "faces": [[0, 1, 2], [0, 2, 1]],
+                "role": "cone",
+                "tube": tube,
+            },
+            {
+                "name": "cone",
+                "vertices": tube_vertices,
+                "faces": [[0, 1, 2], [0, 2, 1]],
+                "role": "cone",
+                "tube": tube,
+                "lod": [{"tolerance_m": 8.0, "tubes": [{**tube, "rings": [0, 2]}]}],
+            },
+        ]
+    )
+
+    assert lines[0]["lod"] == [
+        {
+            "tolerance_m": 2.0,
+            "segments": [
+                [[0.0, 0.0, 0.0], [2.0, 0.0, 0.0]],
+                [[5.0, 0.0, 0.0], [6.0, 0.0, 0.0]],
+            ],
+        }
+    ]
+    assert meshes[0]["faces"].tolist() == [
+        [0, 1, 2],
+        [3, 4, 5],
+        [3, 5, 4],
+        [14, 15, 16],
+        [14, 16, 15],
+    ]
+    assert [level["tolerance_m"] for level in meshes[0]["lod"]] == [8.0]
+    level = meshes[0]["lod"][0]
+    assert level["tubes"] == [
+        {"vertex_offset": 3, "points_per_ring": 3, "ring_count": 3},
+        {"vertex_offset": 14, "points_per_ring": 3, "ring_count": 3, "rings": [0, 2]},
+    ]
+    assert level["faces"].tolist() == [[0, 1, 2]]
+    assert "tube" not in meshes[0]
+
+
+def test_uncertainty_cone_lod_levels_list_kept_rings_instead_of_faces() -> None:
+    angles = np.linspace(0.0, 2.0 * np.pi, 9)
+    overlay = SimpleNamespace(
+        samples=[
+            SimpleNamespace(
+                md_m=float(md),
+                ring_xyz=np.column_stack(
+                    [x + np.cos(angles), np.sin(angles), np.full_like(angles, z)]
+                ),
+            )
+            for md, (x, _, z) in zip(*_vertical_build_lateral_xyz(), strict=True)
+        ]
+    )
+
+    levels = ptc_three_builders._uncertainty_tube_lod_payload(overlay)
+
+    assert [level["tolerance_m"] for level in levels] == [2.0, 8.0, 32.0]
+    for level in levels:
+        assert set(level) == {"tolerance_m", "tubes"}
+        (tube,) = level["tubes"]
+        assert tube["points_per_ring"] == 8
+        assert tube["ring_count"] == len(overlay.samples)
+        assert tube["rings"][0] == 0 and tube["rings"][-1] == len(overlay.samples) - 1
+        assert len(tube["rings"]) < 30
+
+
+def test_merge_three_point_payloads_recodes_hover_columns() -> None:
+    merged = ptc_three_payload.merge_three_point_payloads(
+        [
+            {
+                "name": "Точки траектории",
+                "points": np.asarray([[0.0, 0.0, 0.0], [0.0, 0.0, 10.0]]),
+                "hover_only": True,
+                "hover_columns": {
+                    "name": {"labels": ["WELL-A"], "codes": np.zeros(2, dtype=np.int32)},
+                    "md": np.asarray([0.0, 10.0]),
+                    "segment": {"labels": ["HOLD"], "codes": np.asarray([-1, 0])},
+                },
+            },
+            {
+                "name": "Точки траектории",
+                "points": np.asarray([[5.0, 0.0, 0.0]]),
+                "hover_only": True,
+                "hover_columns": {
+                    "name": {"labels": ["WELL-B"], "codes": np.zeros(1, dtype=np.int32)},
+                    "md": np.asarray([20.0]),
+                    "inc": np.asarray([3.0]),
+                },
+            },
+        ]
+    )
+
+    assert len(merged) == 1
+    assert "hover" not in merged[0]
+    assert merged[0]["points"].shape == (3, 3)
+    columns = merged[0]["hover_columns"]
+    third = ptc_three_payload.hover_item_from_columns(columns, 2)
+    assert third["name"] == "WELL-B"
+    assert third["md"] == 20.0
+    assert third["inc"] == 3.0
+    assert "segment" not in third
+    assert ptc_three_payload.hover_item_from_columns(columns, 1)["segment"] == "HOLD"
+    assert "inc" not in ptc_three_payload.hover_item_from_columns(columns, 0)
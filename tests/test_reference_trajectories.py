@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import pandas as pd
 import pytest
 
+from pywp import reference_trajectories
 from pywp.eclipse_welltrack import WelltrackParseError
+from pywp.reference_dev_cache import ReferenceDevDiskCache
 from pywp.reference_trajectories import (
     REFERENCE_WELL_ACTUAL,
     REFERENCE_WELL_APPROVED,
@@ -300,3 +303,116 @@ def test_parse_reference_trajectory_dev_directories_accepts_quoted_folder_path(
     )
 
     assert [well.name for well in wells] == ["well_111"]
+
+
+def test_parse_reference_trajectory_dev_text_reports_first_bad_row_and_drops_partial_export() -> None:
+    full_row = "100 10 20 90 90 10 20 45 5 1 44"
+    well = parse_reference_trajectory_dev_text(
+        "\n".join(["0 0 0 0 0 0 0 0 0 0 0", full_row, "200 20 40 180 n/a"]),
+        well_name="PARTIAL",
+        kind=REFERENCE_WELL_ACTUAL,
+    )
+
+    assert well.dev_export_rows is None
+    assert list(well.stations["Z_m"]) == [0.0, -90.0, -180.0]
+
+    with pytest.raises(WelltrackParseError, match="X Y Z в строке 2"):
+        parse_reference_trajectory_dev_text(
+            "\n".join(["0 0 0 0", "100 10 bad 90", "200 20"]),
+            well_name="BROKEN",
+            kind=REFERENCE_WELL_ACTUAL,
+        )
+
+
+def test_dev_numeric_block_parse_matches_line_scan() -> None:
+    rows = [
+        f"{md:.2f};{md * 0.1:.2f};{md * 0.2:.2f};{-md:.2f};{md:.2f};1;2;45;5;1;44"
+        for md in range(0, 3000, 30)
+    ]
+    regular = "\n".join(["# WELL NAME: W", "MD;X;Y;Z;TVD;DX;DY;AZ;INC;DLS;MD", *rows])
+    commented = "\n".join([*rows[:10], "# inside", *rows[10:]])
+
+    bulk = reference_trajectories._dev_row_values_bulk(regular.replace(".", ","))
+    scanned = reference_trajectories._dev_row_values_line_by_line(
+        regular, well_name="W"
+    )
+
+    assert bulk is not None
+    assert bulk.shape == (len(rows), 11)
+    assert bulk.tolist() == scanned.tolist()
+    assert reference_trajectories._dev_row_values_bulk(commented) is None
+    assert parse_reference_trajectory_dev_text(
+        commented, well_name="W", kind=REFERENCE_WELL_ACTUAL
+    ).dev_export_rows.shape == (len(rows), 11)
+
+
+def test_parse_reference_trajectory_dev_directories_reuses_disk_cache_for_unchanged_files(
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    folder = tmp_path / "actual"
+    folder.mkdir()
+    dev_text = "\n".join(["MD X Y Z", "0 0 0 0", "100 1 1 -100"])
+    (folder / "well_1.dev").write_text(dev_text, encoding="utf-8")
+    (folder / "well_2.dev").write_text(dev_text, encoding="utf-8")
+    cache = ReferenceDevDiskCache(tmp_path / "cache")
+
+    first = parse_reference_trajectory_dev_directories(
+        [folder], kind=REFERENCE_WELL_ACTUAL, disk_cache=cache
+    )
+    parsed_paths: list[str] = []
+    original_parse = reference_trajectories.parse_reference_trajectory_dev_file
+
+    def tracking_parse(path, *, kind):
+        parsed_paths.append(str(path))
+        return original_parse(path, kind=kind)
+
+    monkeypatch.setattr(
+        reference_trajectories,
+        "parse_reference_trajectory_dev_file",
+        tracking_parse,
+    )
+    (folder / "well_2.dev").write_text(
+        dev_text + "\n200 2 2 -200", encoding="utf-8"
+    )
+    second = parse_reference_trajectory_dev_directories(
+        [folder], kind=REFERENCE_WELL_ACTUAL, disk_cache=cache
+    )
+
+    assert parsed_paths == [str(folder / "well_2.dev")]
+    assert [well.name for well in second] == ["well_1", "well_2"]
+    pd.testing.assert_frame_equal(second[0].stations, first[0].stations)
+    assert len(second[1].stations) == 3
+    assert cache.load(folder / "well_1.dev", kind=REFERENCE_WELL_APPROVED) is None
+
+
+def test_parse_reference_trajectory_dev_directories_parallel_matches_serial(
+    tmp_path,
+) -> None:
+    folder = tmp_path / "actual"
+    folder.mkdir()
+    for index in range(1, 6):
+        (folder / f"well_{index}.dev").write_text(
+            "\n".join(
+                ["MD X Y Z", "0 0 0 0", f"100 {index} 1 -100", f"200 {index} 5 -195"]
+            ),
+            encoding="utf-8",
+        )
+
+    serial = parse_reference_trajectory_dev_directories(
+        [folder], kind=REFERENCE_WELL_ACTUAL, parallel_workers=0
+    )
+    parallel = parse_reference_trajectory_dev_directories(
+        [folder], kind=REFERENCE_WELL_ACTUAL, parallel_workers=2
+    )
+
+    assert [well.name for well in parallel] == [well.name for well in serial]
+    for serial_well, parallel_well in zip(serial, parallel):
+        pd.testing.assert_frame_equal(parallel_well.stations, serial_well.stations)
+
+    (folder / "well_4.dev").write_text("0 0 0 0\n100 x 1 -100", encoding="utf-8")
+    (folder / "well_5.dev").write_text("0 0 0 0", encoding="utf-8")
+    with pytest.raises(WelltrackParseError, match="'well_4'"):
+        parse_reference_trajectory_dev_directories(
+            [folder], kind=REFERENCE_WELL_ACTUAL, parallel_workers=2
+        )
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import base64
+import json
 from pathlib import Path
 import time
 
+import numpy as np
+import pytest
+import streamlit as st
+
 import pywp.three_viewer as three_viewer
+from pywp import ptc_three_payload
+
+
+@pytest.fixture(autouse=True)
+def _fresh_scene_delta_state():
+    st.session_state.pop(three_viewer._SCENE_DELTA_STATE_KEY, None)
+    yield
+    st.session_state.pop(three_viewer._SCENE_DELTA_STATE_KEY, None)
 
 
 def test_viewer_template_contains_safe_custom_3d_controls() -> None:
@@ -616,7 +630,7 @@ def test_viewer_template_shows_xyz_hover_for_edit_handles() -> None:
     assert "function ensureCircleMarkerTexture()" in html
     assert "new THREE.CanvasTexture(canvas)" in html
     assert "new THREE.PointsMaterial" in html
-    assert "function addPolylineTube()" in html
+    assert "function addPolylineTube(levelSegments, target)" in html
     assert "new THREE.MeshLambertMaterial({" in html
     assert "const depthMaterial = isConflictSegment" in html
     assert "colorWrite: false" in html
@@ -651,7 +665,16 @@ def test_viewer_template_shows_xyz_hover_for_edit_handles() -> None:
     assert "pointCloud.userData.hover = { color: defaultHoverColor }" in html
     assert "pointCloud.userData.hoverItems = itemHoverData" in html
     assert "raycaster.params.Points.threshold = Math.max(worldMarkerSize * 0.55, 3.0)" in html
-    assert "indexedHoverItems && Number.isInteger(intersections[0].index)" in html
+    assert "indexedHoverItems && Number.isInteger(hitIndex)" in html
+    assert "function addHoverColumnCloud(item, columns)" in html
+    assert "pickCloud.layers.set(HOVER_PICK_LAYER);" in html
+    assert "raycaster.layers.enable(HOVER_PICK_LAYER);" in html
+    assert "Number(hoverObject.userData.hoverOffset || 0) + hitIndex" in html
+    assert "function addHoverSphereInstances(points, item, hoverItems)" in html
+    assert "new THREE.InstancedMesh(" in html
+    assert "hoverInstances[hitInstanceId]" in html
+    assert "function addVisibleCrossMarkers(points, item)" in html
+    assert "scaleInstanceZPositions(object, safeRatio);" in html
     assert "const labelOffsetX = 6;" in html
     assert "rect.width - labelWidth - padding - labelOffsetX" in html
     assert "max-width: min(160px, calc(100% - 16px));" in html
@@ -910,7 +933,7 @@ def test_render_local_three_scene_reuses_serialized_payload_for_same_object(
 
     def _fake_component(**kwargs):
         captured.append(dict(kwargs))
-        return {"type": "noop"}
+        return {"type": "pywp:ack", "payload_digest": kwargs["payload_digest"]}
 
     def _counting_json_dumps(*args, **kwargs):
         json_calls["count"] += 1
@@ -934,10 +957,287 @@ def test_render_local_three_scene_reuses_serialized_payload_for_same_object(
     )
 
     assert json_calls["count"] == 1
-    assert captured[0]["payload_json"] == captured[1]["payload_json"]
+    assert captured[0]["payload_json"]
+    assert captured[1]["payload_json"] == ""
+    assert captured[1]["delta_base_digest"] == captured[0]["payload_digest"]
     assert captured[0]["payload_digest"] == captured[1]["payload_digest"]
 
 
+def test_render_local_three_scene_sends_only_changed_scene_objects(
+    monkeypatch,
+) -> None:
+    captured: list[dict[str, object]] = []
+    three_viewer._SERIALIZED_PAYLOAD_CACHE.clear()
+
+    def _fake_component(**kwargs):
+        captured.append(dict(kwargs))
+        return {"type": "pywp:ack", "payload_digest": kwargs["payload_digest"]}
+
+    monkeypatch.setattr(three_viewer, "_viewer_component", _fake_component)
+    monkeypatch.setattr(three_viewer, "_viewer_runtime_digest", lambda: "runtime-digest")
+
+    def _scene(well_b_end: float) -> dict[str, object]:
+        return {
+            "title": "Field",
+            "lines": [
+                {"name": "WELL-A", "role": "trajectory", "segments": [[[0, 0, 0], [1, 1, 1]]]},
+                {
+                    "name": "WELL-B",
+                    "role": "trajectory",
+                    "segments": [[[0, 0, 0], [well_b_end, 0, 0]]],
+                },
+            ],
+        }
+
+    three_viewer.render_local_three_scene(_scene(10.0), height=400, key="field")
+    three_viewer.render_local_three_scene(_scene(20.0), height=400, key="field")
+
+    full_payload = json.loads(str(captured[0]["payload_json"]))
+    assert [item["scene_id"] for item in full_payload["lines"]] == [
+        "lines:trajectory:WELL-A",
+        "lines:trajectory:WELL-B",
+    ]
+    assert captured[0]["delta_json"] == ""
+    assert captured[1]["payload_json"] == ""
+    delta = json.loads(str(captured[1]["delta_json"]))
+    assert delta["base_digest"] == captured[0]["payload_digest"]
+    assert delta["top"]["title"] == "Field"
+    assert delta["collections"]["lines"]["ids"] == [
+        "lines:trajectory:WELL-A",
+        "lines:trajectory:WELL-B",
+    ]
+    assert list(delta["collections"]["lines"]["items"]) == ["lines:trajectory:WELL-B"]
+
+    reruns: list[bool] = []
+
+    def _resync_component(**kwargs):
+        captured.append(dict(kwargs))
+        return {"type": "pywp:resync", "nonce": "n-1"}
+
+    monkeypatch.setattr(three_viewer, "_viewer_component", _resync_component)
+    monkeypatch.setattr(three_viewer.st, "rerun", lambda: reruns.append(True))
+    assert three_viewer.render_local_three_scene(
+        _scene(30.0), height=400, key="field"
+    ) is None
+    monkeypatch.setattr(three_viewer, "_viewer_component", _fake_component)
+    three_viewer.render_local_three_scene(_scene(30.0), height=400, key="field")
+
+    assert reruns == [True]
+    assert captured[-1]["delta_json"] == ""
+    assert json.loads(str(captured[-1]["payload_json"]))["lines"][1]["segments"] == [
+        [[0, 0, 0], [30.0, 0, 0]]
+    ]
+
+
+def test_render_local_three_scene_diffs_only_against_acknowledged_payload(
+    monkeypatch,
+) -> None:
+    captured: list[dict[str, object]] = []
+    acknowledge = {"enabled": False}
+    three_viewer._SERIALIZED_PAYLOAD_CACHE.clear()
+
+    def _fake_component(**kwargs):
+        captured.append(dict(kwargs))
+        if not acknowledge["enabled"]:
+            return None
+        return {"type": "pywp:ack", "payload_digest": kwargs["payload_digest"]}
+
+    monkeypatch.setattr(three_viewer, "_viewer_component", _fake_component)
+    monkeypatch.setattr(three_viewer, "_viewer_runtime_digest", lambda: "runtime-digest")
+
+    def _scene(end_m: float) -> dict[str, object]:
+        return {
+            "title": "Acked",
+            "lines": [{"name": "WELL-A", "segments": [[[0, 0, 0], [end_m, 0, 0]]]}],
+        }
+
+    three_viewer.render_local_three_scene(_scene(10.0), height=400, key="acked")
+    three_viewer.render_local_three_scene(_scene(20.0), height=400, key="acked")
+    acknowledge["enabled"] = True
+    assert (
+        three_viewer.render_local_three_scene(_scene(30.0), height=400, key="acked")
+        is None
+    )
+    three_viewer.render_local_three_scene(_scene(40.0), height=400, key="acked")
+
+    assert captured[0]["request_ack"] is True
+    assert [bool(item["payload_json"]) for item in captured] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+    assert captured[3]["delta_base_digest"] == captured[2]["payload_digest"]
+
+
+def test_serialized_payload_packs_mesh_geometry_as_typed_arrays() -> None:
+    vertices = [
+        [600000.125, 7000000.5, 1500.25],
+        [600010.0, 7000001.0, 1510.0],
+        [600005.0, 7000020.0, 1490.0],
+    ]
+    payload = {
+        "title": "Binary",
+        "meshes": [
+            {"name": "cone", "vertices": vertices, "faces": [[0, 1, 2]], "role": "cone"}
+        ],
+    }
+    three_viewer._SERIALIZED_PAYLOAD_CACHE.clear()
+
+    binary_json, _, _ = three_viewer._serialized_payload(
+        payload, stable_key="binary", instance_token=0
+    )
+    json_json, _, _ = three_viewer._serialized_payload(
+        payload,
+        stable_key="binary",
+        instance_token=0,
+        transport=three_viewer.THREE_PAYLOAD_TRANSPORT_JSON,
+    )
+
+    mesh = json.loads(binary_json)["meshes"][0]
+    assert "vertices" not in mesh and "faces" not in mesh
+    assert mesh["vertex_count"] == 3
+    assert mesh["face_count"] == 1
+    offsets = np.frombuffer(base64.b64decode(mesh["vertices_f32"]), dtype="<f4")
+    decoded = offsets.reshape(-1, 3).astype(float) + np.asarray(mesh["vertex_origin"])
+    assert np.allclose(decoded, vertices, atol=1e-3)
+    faces = np.frombuffer(base64.b64decode(mesh["faces_u16"]), dtype="<u2")
+    assert faces.tolist() == [0, 1, 2]
+    assert json.loads(json_json)["meshes"][0]["vertices"] == vertices
+    assert payload["meshes"][0]["vertices"] is vertices
+
+    template = three_viewer._viewer_template_text()
+    assert "function binaryMeshFromPayloadItem(item)" in template
+    assert "new Uint16Array(decodeBase64Bytes(item.faces_u16).buffer)" in template
+
+
+def test_serialized_payload_accepts_merged_numpy_mesh_buffers() -> None:
+    meshes = ptc_three_payload.merge_three_mesh_payloads(
+        [
+            {
+                "name": "cone",
+                "vertices": np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+                "faces": np.array([[0, 1, 2]]),
+                "role": "cone",
+            },
+            {
+                "name": "cone",
+                "vertices": [[5.0, 0.0, 0.0], [6.0, 0.0, 0.0], [5.0, 1.0, 0.0]],
+                "faces": [[0, 2, 1]],
+                "role": "cone",
+            },
+        ]
+    )
+    payload = {"title": "Merged", "meshes": meshes}
+    three_viewer._SERIALIZED_PAYLOAD_CACHE.clear()
+
+    binary_json, _, _ = three_viewer._serialized_payload(
+        payload, stable_key="merged", instance_token=0
+    )
+    json_json, _, _ = three_viewer._serialized_payload(
+        payload,
+        stable_key="merged",
+        instance_token=0,
+        transport=three_viewer.THREE_PAYLOAD_TRANSPORT_JSON,
+    )
+
+    binary_mesh = json.loads(binary_json)["meshes"][0]
+    faces = np.frombuffer(base64.b64decode(binary_mesh["faces_u16"]), dtype="<u2")
+    assert faces.tolist() == [0, 1, 2, 3, 5, 4]
+    json_mesh = json.loads(json_json)["meshes"][0]
+    assert json_mesh["faces"] == [[0, 1, 2], [3, 5, 4]]
+    assert json_mesh["vertices"][3] == [5.0, 0.0, 0.0]
+
+
+def test_serialized_payload_packs_mesh_lod_levels_and_viewer_builds_lod() -> None:
+    payload = {
+        "title": "LOD",
+        "meshes": [
+            {
+                "name": "cone",
+                "vertices": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]],
+                "faces": [[0, 1, 2], [1, 3, 2]],
+                "role": "cone",
+                "lod": [
+                    {"tolerance_m": 8.0, "faces": [[0, 1, 2]]},
+                    {"tolerance_m": 16.0, "tubes": [{"ring_count": 2, "rings": [0, 1]}]},
+                    {"tolerance_m": 32.0, "faces": [[0, 1, 9]]},
+                ],
+            }
+        ],
+    }
+    three_viewer._SERIALIZED_PAYLOAD_CACHE.clear()
+
+    binary_json, _, _ = three_viewer._serialized_payload(
+        payload, stable_key="lod", instance_token=0
+    )
+
+    levels = json.loads(binary_json)["meshes"][0]["lod"]
+    assert [level["tolerance_m"] for level in levels] == [8.0, 16.0]
+    assert levels[0]["face_count"] == 1
+    faces = np.frombuffer(base64.b64decode(levels[0]["faces_u16"]), dtype="<u2")
+    assert faces.tolist() == [0, 1, 2]
+    assert levels[1] == {
+        "tolerance_m": 16.0,
+        "tubes": [{"ring_count": 2, "rings": [0, 1]}],
+    }
+
+    template = three_viewer._viewer_template_text()
+    assert "const lod = new THREE.LOD();" in template
+    assert "function lodDistanceForTolerance(toleranceM, boundingRadius)" in template
+    assert "const levelGeometry = meshLodGeometry(geometry, level);" in template
+    assert "const tubeIndices = tubeLodIndices(level.tubes, vertexCount);" in template
+    assert 'levelGeometry.setAttribute("position", positionAttribute.clone());' in template
+
+
+def test_serialized_payload_packs_hover_points_in_default_binary_transport() -> None:
+    payload = {
+        "title": "Hover",
+        "points": [
+            {"name": "marker", "points": [[0.0, 0.0, 0.0]]},
+            {
+                "name": "hover",
+                "points": [[10.0, 0.0, 100.0], [20.0, 0.0, 200.0]],
+                "hover_columns": {
+                    "name": {"labels": ["WELL-A"], "codes": np.array([0, 0])},
+                    "md": np.array([100.0, np.nan]),
+                },
+                "hover_only": True,
+            },
+        ],
+    }
+    three_viewer._SERIALIZED_PAYLOAD_CACHE.clear()
+
+    binary_json, _, _ = three_viewer._serialized_payload(
+        payload, stable_key="hover", instance_token=0
+    )
+
+    marker, hover = json.loads(binary_json)["points"]
+    assert marker["points"] == [[0.0, 0.0, 0.0]]
+    assert hover["point_count"] == 2
+    points = np.frombuffer(base64.b64decode(hover["points_f32"]), dtype="<f4")
+    assert (points.reshape(-1, 3) + hover["point_origin"]).tolist() == [
+        [10.0, 0.0, 100.0],
+        [20.0, 0.0, 200.0],
+    ]
+    md = np.frombuffer(base64.b64decode(hover["hover_columns"]["md"]), dtype="<f4")
+    assert md[0] == 100.0 and np.isnan(md[1])
+    assert hover["hover_columns"]["name"]["labels"] == ["WELL-A"]
+
+
+def test_viewer_template_patches_changed_scene_items_in_place() -> None:
+    template = three_viewer._viewer_template_text()
+    component_html = (three_viewer._ASSETS_DIR / "index.html").read_text(
+        encoding="utf-8"
+    )
+
+    assert "function patchViewerPayload(nextPayload)" in template
+    assert "} else if (!patchViewerPayload(nextPayload)) {" in template
+    assert "removeSceneItem(key);" in template
+    assert "addPayloadSceneItems();" in template
+    assert 'emitValue({ type: "pywp:ack", payload_digest: digest });' in component_html
+
+
 def test_three_viewer_runtime_component_relays_json_events() -> None:
     component_html = (three_viewer._ASSETS_DIR / "index.html").read_text(
         encoding="utf-8"
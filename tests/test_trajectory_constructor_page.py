@@ -612,6 +612,74 @@ def test_parse_reference_sources_requires_explicit_uploaded_welltrack_mode(
     assert decode_calls == []
 
 
+def test_project_store_round_trips_fund_and_plans_through_page(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    page = ptc_page_reference
+    page.st.session_state.clear()
+    reference_wells = tuple(_reference_wells())
+    for kind in page._REFERENCE_FUND_OPTIONS:
+        page.reference_state.set_reference_wells_for_kind(
+            kind=kind,
+            wells=tuple(well for well in reference_wells if well.kind == kind),
+        )
+    plan = _successful_plan(name="WELL-A", y_offset_m=0.0)
+    page.st.session_state["wt_successes"] = [plan]
+    page.st.session_state["wt_summary_rows"] = [
+        {"Скважина": "WELL-A", "Статус": "OK"},
+        {"Скважина": "WELL-B", "Статус": "Не рассчитана"},
+    ]
+    project_path = str(tmp_path / "field.pywp")
+    page._save_project_store(project_path)
+
+    page.st.session_state.clear()
+    page.st.session_state["wt_records"] = _records()
+    monkeypatch.setattr(
+        page,
+        "_parse_reference_sources",
+        lambda **_kwargs: pytest.fail("project store must be used"),
+    )
+
+    assert page._open_project_store(project_path, mode="", uploaded_files=[])
+    loaded = page.reference_state.reference_wells_from_state()
+    assert sorted(well.name for well in loaded) == ["APP-001", "FACT-001"]
+    [restored] = page.st.session_state["wt_successes"]
+    assert restored.name == "WELL-A"
+    pd.testing.assert_frame_equal(restored.stations, plan.stations)
+    assert [row["Скважина"] for row in page.st.session_state["wt_summary_rows"]] == [
+        "WELL-A",
+        "WELL-B",
+    ]
+
+
+def test_open_project_store_falls_back_to_source_parsing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    page = ptc_page_reference
+    page.st.session_state.clear()
+    reference_wells = tuple(_reference_wells())
+    parse_calls: list[str] = []
+
+    def fake_parse(*, mode: str, uploaded_files: list[object]):
+        parse_calls.append(mode)
+        return {
+            kind: tuple(well for well in reference_wells if well.kind == kind)
+            for kind in page._REFERENCE_FUND_OPTIONS
+        }
+
+    monkeypatch.setattr(page, "_parse_reference_sources", fake_parse)
+
+    assert page._open_project_store(
+        str(tmp_path / "missing"),
+        mode="Загрузить .dev",
+        uploaded_files=[],
+    )
+    assert parse_calls == ["Загрузить .dev"]
+    assert len(page.reference_state.reference_wells_from_state()) == 2
+
+
 def test_reference_kind_header_aligns_left() -> None:
     captured: dict[str, object] = {}
 
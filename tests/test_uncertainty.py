@@ -13,6 +13,7 @@ from pywp.mcm import compute_positions_min_curv
 from pywp.models import Point3D, TrajectoryConfig
 from pywp.planner import TrajectoryPlanner
 from pywp.uncertainty import (
+    _align_ring_sequence_for_continuity,
     _continuous_extreme_index,
     _open_closed_ring,
     DEFAULT_UNCERTAINTY_PRESET,
@@ -584,6 +585,69 @@ def test_uncertainty_ribbon_and_tube_mesh_are_continuous() -> None:
     assert len(tube.i) > 0
 
 
+def test_uncertainty_tube_mesh_uses_compact_index_buffers() -> None:
+    overlay = build_uncertainty_overlay(
+        stations=_sample_df(),
+        surface=Point3D(0.0, 0.0, 0.0),
+        azimuth_deg=90.0,
+    )
+    tube = build_uncertainty_tube_mesh(overlay)
+
+    assert tube is not None
+    ring_count = len(overlay.samples)
+    points_per_ring = len(overlay.samples[0].ring_xyz) - 1
+    assert tube.vertices_xyz.shape == (ring_count * points_per_ring + 2, 3)
+    assert tube.i.dtype == tube.j.dtype == tube.k.dtype == np.int32
+    assert len(tube.i) == 2 * points_per_ring * ring_count
+    assert (int(tube.i[0]), int(tube.j[0]), int(tube.k[0])) == (
+        0,
+        1,
+        points_per_ring + 1,
+    )
+    assert (int(tube.i[1]), int(tube.j[1]), int(tube.k[1])) == (
+        0,
+        points_per_ring + 1,
+        points_per_ring,
+    )
+    faces = np.concatenate([tube.i, tube.j, tube.k])
+    assert int(faces.min()) == 0
+    assert int(faces.max()) == len(tube.vertices_xyz) - 1
+
+
+def test_batched_ring_alignment_matches_sequential_roll_search() -> None:
+    rng = np.random.default_rng(7)
+    angles = np.linspace(0.0, 2.0 * np.pi, 12, endpoint=False)
+    rings = []
+    for index in range(6):
+        phase = float(rng.uniform(0.0, 2.0 * np.pi))
+        ring = np.column_stack(
+            [
+                (3.0 + index) * np.cos(angles + phase),
+                2.0 * np.sin(angles + phase),
+                np.full_like(angles, 10.0 * index),
+            ]
+        )
+        rings.append(ring[::-1] if index % 2 else ring)
+
+    expected = [rings[0]]
+    for ring in rings[1:]:
+        candidates = [
+            np.roll(base, shift, axis=0)
+            for base in (ring, ring[::-1])
+            for shift in range(len(ring))
+        ]
+        costs = [
+            float(np.mean(np.linalg.norm(item - expected[-1], axis=1)))
+            for item in candidates
+        ]
+        best = int(np.argmin(costs))
+        expected.append(candidates[best] if costs[best] + 1e-9 < costs[0] else ring)
+
+    aligned = _align_ring_sequence_for_continuity(np.stack(rings))
+
+    assert np.allclose(aligned, np.stack(expected), atol=1e-12)
+
+
 def test_regression_overlay_ring_alignment_avoids_twist_for_build_to_hold_case() -> (
     None
 ):
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import plotly.graph_objects as go
 
 from pywp.models import Point3D
 from pywp.uncertainty import build_uncertainty_overlay
 from pywp.visualization import (
+    HIGH_VOLUME_MAX_POINTS_PER_TRACE,
+    HIGH_VOLUME_STATION_THRESHOLD,
     dls_figure,
     plan_view_figure,
     section_view_figure,
@@ -322,3 +326,65 @@ def test_uncertainty_ellipses_are_rendered_on_plan_and_section_views() -> None:
     assert str(ribbons_plan[0].fill) == "toself"
     assert float(ribbons_plan[0].line.width) == 0.0
     assert float(ribbons_section[0].line.width) == 0.0
+
+
+def _dense_df(count: int) -> pd.DataFrame:
+    md = np.linspace(0.0, 6000.0, count)
+    inc = np.clip((md - 500.0) / 20.0, 0.0, 90.0)
+    step = np.diff(md, prepend=0.0)
+    horizontal = np.cumsum(step * np.sin(np.radians(inc)))
+    return pd.DataFrame(
+        {
+            "MD_m": md,
+            "INC_deg": inc,
+            "AZI_deg": np.full(count, 90.0),
+            "segment": np.where(
+                md < 500.0,
+                "VERTICAL",
+                np.where(inc < 90.0, "BUILD1", "HORIZONTAL"),
+            ),
+            "X_m": horizontal,
+            "Y_m": np.zeros(count),
+            "Z_m": np.cumsum(step * np.cos(np.radians(inc))),
+            "DLS_deg_per_30m": np.where((inc > 0.0) & (inc < 90.0), 1.5, 0.0),
+        }
+    )
+
+
+def test_high_volume_figures_use_webgl_and_curvature_aware_decimation() -> None:
+    df = _dense_df(HIGH_VOLUME_STATION_THRESHOLD + 1000)
+    surface = Point3D(0.0, 0.0, 0.0)
+    t1 = Point3D(float(df["X_m"].iloc[3000]), 0.0, float(df["Z_m"].iloc[3000]))
+    t3 = Point3D(float(df["X_m"].iloc[-1]), 0.0, float(df["Z_m"].iloc[-1]))
+
+    fig_plan = plan_view_figure(df, surface=surface, t1=t1, t3=t3)
+    fig_section = section_view_figure(
+        df, surface=surface, azimuth_deg=90.0, t1=t1, t3=t3
+    )
+    fig_dls = dls_figure(df, dls_limits={"BUILD1": 3.0})
+    small_plan = plan_view_figure(_sample_df(), surface=surface, t1=t1, t3=t3)
+
+    for fig in (fig_plan, fig_section):
+        trajectory = next(
+            trace for trace in fig.data if str(trace.name) == "Траектория"
+        )
+        assert isinstance(trajectory, go.Scattergl)
+        assert 2 < len(trajectory.x) <= HIGH_VOLUME_MAX_POINTS_PER_TRACE
+        assert len(trajectory.customdata) == len(trajectory.x)
+    plan_trajectory = next(
+        trace for trace in fig_plan.data if str(trace.name) == "Траектория"
+    )
+    assert float(plan_trajectory.x[-1]) == float(df["X_m"].iloc[-1])
+    build_trace = next(trace for trace in fig_dls.data if str(trace.name) == "BUILD1")
+    assert isinstance(build_trace, go.Scattergl)
+    build_md = df.loc[df["segment"] == "BUILD1", "MD_m"]
+    assert float(build_trace.x[0]) == float(build_md.iloc[0])
+    assert float(build_trace.x[-1]) == float(build_md.iloc[-1])
+    assert isinstance(
+        next(trace for trace in small_plan.data if str(trace.name) == "Траектория"),
+        go.Scatter,
+    )
+    forced = plan_view_figure(
+        _sample_df(), surface=surface, t1=t1, t3=t3, high_volume=True
+    )
+    assert isinstance(forced.data[0], go.Scattergl)
@@ -55,6 +55,7 @@ from pywp.uncertainty import (
     planning_uncertainty_model_for_preset,
 )
 from pywp.welltrack_batch import (
+    BatchDependencyGraph,
     DynamicClusterExecutionContext,
     SuccessfulWellPlan,
     WelltrackBatchPlanner,
@@ -538,6 +539,137 @@ def test_multi_horizontal_constant_dls_fallback_reports_unsupported_reverse_turn
         )
 
 
+def test_constant_dls_transition_batch_delta_matches_scalar_delta() -> None:
+    mid_inc = np.array([60.0, 85.0, 90.0, 110.0])
+    mid_azi = np.array([10.0, 80.0, 135.0, 300.0])
+    dls = np.array([1.0, 2.5, 3.0, 6.0])
+    hold = np.array([0.0, 50.0, 120.0, 400.0])
+
+    delta, build1, build2, valid = (
+        multi_horizontal_module._constant_dls_transition_delta_xyz_batch(
+            start_inc_deg=88.0,
+            start_azi_deg=30.0,
+            mid_inc_deg=mid_inc,
+            mid_azi_deg=mid_azi,
+            end_inc_deg=92.0,
+            end_azi_deg=100.0,
+            dls_deg_per_30m=dls,
+            hold_length_m=hold,
+        )
+    )
+
+    assert bool(np.all(valid))
+    for index in range(len(mid_inc)):
+        expected, expected_build1, expected_build2 = (
+            multi_horizontal_module._constant_dls_transition_delta_xyz(
+                start_inc_deg=88.0,
+                start_azi_deg=30.0,
+                mid_inc_deg=float(mid_inc[index]),
+                mid_azi_deg=float(mid_azi[index]),
+                end_inc_deg=92.0,
+                end_azi_deg=100.0,
+                dls_deg_per_30m=float(dls[index]),
+                hold_length_m=float(hold[index]),
+            )
+        )
+        assert np.allclose(delta[index], expected, atol=1e-9)
+        assert float(build1[index]) == pytest.approx(expected_build1)
+        assert float(build2[index]) == pytest.approx(expected_build2)
+
+
+def test_constant_dls_transition_batch_solver_avoids_scipy_fallback(
+    monkeypatch,
+) -> None:
+    def _unexpected_fallback(**_: object) -> np.ndarray:
+        raise AssertionError("batched Constant-DLS solver should converge")
+
+    monkeypatch.setattr(
+        multi_horizontal_module,
+        "_solve_constant_dls_transition_scipy",
+        _unexpected_fallback,
+    )
+    candidate = multi_horizontal_module._constant_dls_transition_candidate(
+        current={
+            "md_m": 1000.0,
+            "inc_deg": 90.0,
+            "azi_deg": 90.0,
+            "x": 0.0,
+            "y": 0.0,
+            "z": 1000.0,
+        },
+        target=Point3D(800.0, 0.0, 1100.0),
+        target_inc_deg=90.0,
+        target_azi_deg=90.0,
+        segment_name="HORIZONTAL_BUILD1",
+        config=TrajectoryConfig(
+            dls_build_max_deg_per_30m=6.0,
+            dls_horizontal_max_deg_per_30m=3.0,
+        ),
+    )
+
+    assert candidate.endpoint_miss_m < 1e-4
+    assert candidate.max_dls_deg_per_30m <= 3.0 + 1e-6
+    assert candidate.dls_deg_per_30m > 2.5
+
+
+@pytest.mark.parametrize(
+    ("target", "target_azi_deg"),
+    [
+        (Point3D(800.0, 0.0, 1100.0), 90.0),
+        (Point3D(700.0, 250.0, 1060.0), 70.0),
+    ],
+)
+def test_constant_dls_transition_batch_solver_matches_scipy_solver(
+    target: Point3D,
+    target_azi_deg: float,
+) -> None:
+    current = {
+        "md_m": 1000.0,
+        "inc_deg": 90.0,
+        "azi_deg": 90.0,
+        "x": 0.0,
+        "y": 0.0,
+        "z": 1000.0,
+    }
+    config = TrajectoryConfig(
+        dls_build_max_deg_per_30m=6.0,
+        dls_horizontal_max_deg_per_30m=3.0,
+    )
+    candidates = {}
+    for solver_name in (
+        "_solve_constant_dls_transition_batch",
+        "_solve_constant_dls_transition_scipy",
+    ):
+        solver = getattr(multi_horizontal_module, solver_name)
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(
+                multi_horizontal_module,
+                "_solve_constant_dls_transition_batch",
+                solver,
+            )
+            patch.setattr(
+                multi_horizontal_module,
+                "_solve_constant_dls_transition_scipy",
+                solver,
+            )
+            candidates[solver_name] = (
+                multi_horizontal_module._constant_dls_transition_candidate(
+                    current=current,
+                    target=target,
+                    target_inc_deg=90.0,
+                    target_azi_deg=target_azi_deg,
+                    segment_name="HORIZONTAL_BUILD1",
+                    config=config,
+                )
+            )
+
+    batch = candidates["_solve_constant_dls_transition_batch"]
+    reference = candidates["_solve_constant_dls_transition_scipy"]
+    assert batch.endpoint_miss_m < 1e-4
+    assert batch.dls_deg_per_30m == pytest.approx(reference.dls_deg_per_30m, abs=0.05)
+    assert batch.md_span_m == pytest.approx(reference.md_span_m, rel=0.01)
+
+
 def test_turn_solver_build_limit_search_is_monotonic_for_debug_geometry() -> None:
     record = WelltrackRecord(
         name="debug_monotonic",
@@ -3476,6 +3608,147 @@ def test_batch_planner_parallel_workers_fall_back_when_pool_breaks(monkeypatch)
     }
 
 
+def test_batch_planner_resumes_only_unfinished_wells_after_pool_breaks(
+    monkeypatch,
+) -> None:
+    import pywp.welltrack_batch as batch_module
+
+    evaluated_names: list[str] = []
+
+    pending_futures: list[Future] = []
+
+    class HalfBrokenExecutor:
+        def __init__(self, *args, **kwargs) -> None:
+            self._submitted = 0
+
+        def submit(self, fn, record_dict, *args, **kwargs) -> Future:
+            self._submitted += 1
+            future: Future = Future()
+            if self._submitted > 1:
+                pending_futures.append(future)
+                return future
+            evaluated_names.append(str(record_dict["name"]))
+            future.set_result(fn(record_dict, *args, **kwargs))
+            return future
+
+        def shutdown(self, *, wait: bool = True) -> None:
+            pass
+
+    original_evaluate_record = WelltrackBatchPlanner._evaluate_record
+
+    def tracking_evaluate_record(self, *, record, **kwargs):
+        evaluated_names.append(str(record.name))
+        return original_evaluate_record(self, record=record, **kwargs)
+
+    monkeypatch.setattr(batch_module, "ProcessPoolExecutor", HalfBrokenExecutor)
+    monkeypatch.setattr(
+        WelltrackBatchPlanner, "_evaluate_record", tracking_evaluate_record
+    )
+    records = [
+        WelltrackRecord(
+            name=f"PAR-RESUME-{index}",
+            points=(
+                WelltrackPoint(x=50.0 * index, y=0.0, z=0.0, md=0.0),
+                WelltrackPoint(x=50.0 * index + 600.0, y=800.0, z=2400.0, md=2400.0),
+                WelltrackPoint(
+                    x=50.0 * index + 1500.0, y=2000.0, z=2500.0, md=3500.0
+                ),
+            ),
+        )
+        for index in range(2)
+    ]
+    streamed: list[str] = []
+
+    def break_pool_after_first_well(*_args) -> None:
+        while pending_futures:
+            pending_futures.pop().set_exception(
+                batch_module.BrokenProcessPool("worker died")
+            )
+
+    rows, successes = WelltrackBatchPlanner().evaluate(
+        records=records,
+        selected_names={record.name for record in records},
+        config=_fast_batch_config(turn_solver_max_restarts=0),
+        parallel_workers=2,
+        record_done_callback=break_pool_after_first_well,
+        success_callback=lambda success: streamed.append(str(success.name)),
+    )
+
+    assert sorted(evaluated_names) == ["PAR-RESUME-0", "PAR-RESUME-1"]
+    assert sorted(streamed) == ["PAR-RESUME-0", "PAR-RESUME-1"]
+    assert [row["Скважина"] for row in rows] == ["PAR-RESUME-0", "PAR-RESUME-1"]
+    assert [row["Статус"] for row in rows] == ["OK", "OK"]
+    assert [success.name for success in successes] == [
+        "PAR-RESUME-0",
+        "PAR-RESUME-1",
+    ]
+
+
+def test_batch_planner_callback_errors_do_not_trigger_serial_fallback(
+    monkeypatch,
+) -> None:
+    import pywp.welltrack_batch as batch_module
+
+    class InlineExecutor:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def submit(self, fn, record_dict, *args, **kwargs) -> Future:
+            record = WelltrackRecord.model_validate(record_dict)
+            row = WelltrackBatchPlanner._base_row(record)
+            row["Статус"] = "OK"
+            future: Future = Future()
+            future.set_result((row, None))
+            return future
+
+        def shutdown(self, *, wait: bool = True) -> None:
+            pass
+
+    serial_names: list[str] = []
+    original_evaluate_record = WelltrackBatchPlanner._evaluate_record
+
+    def tracking_evaluate_record(self, *, record, **kwargs):
+        serial_names.append(str(record.name))
+        return original_evaluate_record(self, record=record, **kwargs)
+
+    monkeypatch.setattr(batch_module, "ProcessPoolExecutor", InlineExecutor)
+    monkeypatch.setattr(
+        WelltrackBatchPlanner, "_evaluate_record", tracking_evaluate_record
+    )
+    records = [
+        WelltrackRecord(
+            name=f"PAR-CALLBACK-{index}",
+            points=(
+                WelltrackPoint(x=50.0 * index, y=0.0, z=0.0, md=0.0),
+                WelltrackPoint(x=50.0 * index + 600.0, y=800.0, z=2400.0, md=2400.0),
+                WelltrackPoint(
+                    x=50.0 * index + 1500.0, y=2000.0, z=2500.0, md=3500.0
+                ),
+            ),
+        )
+        for index in range(2)
+    ]
+
+    progress_calls: list[str] = []
+
+    def failing_progress(_index, _total, name) -> None:
+        progress_calls.append(str(name))
+        if len(progress_calls) == 1:
+            raise OSError("progress sink closed")
+
+    with pytest.raises(OSError, match="progress sink closed"):
+        WelltrackBatchPlanner().evaluate(
+            records=records,
+            selected_names={record.name for record in records},
+            config=_fast_batch_config(turn_solver_max_restarts=0),
+            parallel_workers=2,
+            progress_callback=failing_progress,
+        )
+
+    assert serial_names == []
+    assert len(progress_calls) == 1
+
+
 def test_batch_planner_parallel_path_keeps_zbs_records(monkeypatch) -> None:
     import pywp.welltrack_batch as batch_module
 
@@ -3535,18 +3808,77 @@ def test_batch_planner_parallel_path_keeps_zbs_records(monkeypatch) -> None:
         parallel_workers=2,
     )
 
-    assert submitted_names == ["9010_ZBS", "PAR-ZBS-REG"]
+    # Longest predicted solve first: an ordinary well outweighs a sidetrack.
+    assert submitted_names == ["PAR-ZBS-REG", "9010_ZBS"]
     assert reference_payload_counts == {"9010_ZBS": 1, "PAR-ZBS-REG": 0}
     assert [row["Статус"] for row in rows] == ["OK", "OK"]
 
 
-def test_batch_planner_parallelizes_independent_wells_when_pilot_dependency_exists(
+def test_batch_planner_parallel_path_reuses_supplied_predicted_costs(
     monkeypatch,
 ) -> None:
     import pywp.welltrack_batch as batch_module
 
+    estimated_names: list[str] = []
     submitted_names: list[str] = []
-    dependent_calls: list[tuple[str, tuple[str, ...]]] = []
+    original_estimate_batch_costs = batch_module.estimate_batch_costs
+
+    def counting_estimate_batch_costs(records, **kwargs):
+        records = list(records)
+        estimated_names.extend(str(record.name) for record in records)
+        return original_estimate_batch_costs(records, **kwargs)
+
+    class InlineExecutor:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def submit(self, _fn, record_dict, *args, **kwargs) -> Future:
+            record = WelltrackRecord.model_validate(record_dict)
+            submitted_names.append(str(record.name))
+            row = WelltrackBatchPlanner._base_row(record)
+            row["Статус"] = "OK"
+            future: Future = Future()
+            future.set_result((row, None))
+            return future
+
+        def shutdown(self, *, wait: bool = True) -> None:
+            pass
+
+    monkeypatch.setattr(
+        batch_module, "estimate_batch_costs", counting_estimate_batch_costs
+    )
+    monkeypatch.setattr(batch_module, "ProcessPoolExecutor", InlineExecutor)
+    records = [
+        WelltrackRecord(
+            name=name,
+            points=(
+                WelltrackPoint(x=offset_m, y=0.0, z=0.0, md=0.0),
+                WelltrackPoint(x=offset_m + 100.0, y=0.0, z=1200.0, md=1200.0),
+                WelltrackPoint(x=offset_m + 500.0, y=0.0, z=1200.0, md=1600.0),
+            ),
+        )
+        for name, offset_m in (("COST-A", 0.0), ("COST-B", 50.0), ("COST-C", 100.0))
+    ]
+
+    WelltrackBatchPlanner().evaluate(
+        records=records,
+        selected_names={record.name for record in records},
+        config=_fast_batch_config(),
+        parallel_workers=2,
+        predicted_cost_s_by_name={"COST-A": 1.0, "COST-C": 9.0},
+    )
+
+    assert estimated_names == ["COST-B"]
+    assert submitted_names[0] == "COST-C"
+
+
+def test_batch_planner_parallelizes_independent_wells_when_pilot_dependency_exists(
+    monkeypatch,
+) -> None:
+    import pywp.welltrack_batch as batch_module
+
+    submitted: list[tuple[str, str | None]] = []
+    worker_runtime_s = {"WELL-A_PL": 2.0, "WELL-A": 3.0, "WELL-B": 4.0}
 
     class InlineExecutor:
         def __init__(self, *args, **kwargs) -> None:
@@ -3563,40 +3895,30 @@ def test_batch_planner_parallelizes_independent_wells_when_pilot_dependency_exis
             **kwargs,
         ) -> Future:
             record = WelltrackRecord.model_validate(record_dict)
-            submitted_names.append(str(record.name))
+            pilot_success_dict = kwargs.get("pilot_success_dict")
+            submitted.append(
+                (
+                    str(record.name),
+                    (
+                        str(pilot_success_dict["name"])
+                        if pilot_success_dict is not None
+                        else None
+                    ),
+                )
+            )
             row = WelltrackBatchPlanner._base_row(record)
             row["Статус"] = "OK"
             success = _straight_success(str(record.name), y_offset_m=0.0)
             future: Future = Future()
-            future.set_result((row, success.model_dump()))
+            future.set_result(
+                (row, success.model_dump(), worker_runtime_s[str(record.name)])
+            )
             return future
 
         def shutdown(self, *, wait: bool = True) -> None:
             pass
 
-    def fake_evaluate_record(
-        self,
-        *,
-        record,
-        config,
-        optimization_context=None,
-        planner_progress_callback=None,
-        recalculated_success_by_name=None,
-        sidetrack_window_override=None,
-        actual_reference_wells_by_key=None,
-    ):
-        dependent_calls.append(
-            (
-                str(record.name),
-                tuple(sorted(str(name) for name in recalculated_success_by_name or {})),
-            )
-        )
-        row = WelltrackBatchPlanner._base_row(record)
-        row["Статус"] = "OK"
-        return row, _straight_success(str(record.name), y_offset_m=10.0)
-
     monkeypatch.setattr(batch_module, "ProcessPoolExecutor", InlineExecutor)
-    monkeypatch.setattr(WelltrackBatchPlanner, "_evaluate_record", fake_evaluate_record)
     records = [
         WelltrackRecord(
             name="WELL-A",
@@ -3624,7 +3946,8 @@ def test_batch_planner_parallelizes_independent_wells_when_pilot_dependency_exis
     ]
     progress_events: list[tuple[int, int, str]] = []
 
-    rows, successes = WelltrackBatchPlanner().evaluate(
+    batch = WelltrackBatchPlanner()
+    rows, successes = batch.evaluate(
         records=records,
         selected_names={"WELL-A", "WELL-B"},
         config=_fast_batch_config(),
@@ -3634,8 +3957,11 @@ def test_batch_planner_parallelizes_independent_wells_when_pilot_dependency_exis
         parallel_workers=4,
     )
 
-    assert submitted_names == ["WELL-A_PL", "WELL-B"]
-    assert dependent_calls == [("WELL-A", ("WELL-A_PL", "WELL-B"))]
+    assert submitted == [
+        ("WELL-A_PL", None),
+        ("WELL-B", None),
+        ("WELL-A", "WELL-A_PL"),
+    ]
     assert [str(row["Скважина"]) for row in rows] == [
         "WELL-A_PL",
         "WELL-A",
@@ -3647,6 +3973,37 @@ def test_batch_planner_parallelizes_independent_wells_when_pilot_dependency_exis
         "WELL-B",
     }
     assert {total for _index, total, _name in progress_events} == {3}
+    assert batch.last_evaluation_metadata.critical_path_well_names == (
+        "WELL-A_PL",
+        "WELL-A",
+    )
+    assert batch.last_evaluation_metadata.critical_path_runtime_s == pytest.approx(
+        5.0
+    )
+
+
+def test_batch_dependency_graph_reports_longest_pilot_chain() -> None:
+    records = [
+        WelltrackRecord(
+            name=name,
+            points=(
+                WelltrackPoint(x=0.0, y=0.0, z=0.0, md=0.0),
+                WelltrackPoint(x=80.0, y=0.0, z=800.0, md=800.0),
+            ),
+        )
+        for name in ("WELL-A_PL", "WELL-A", "WELL-B", "9010_ZBS")
+    ]
+
+    graph = BatchDependencyGraph.from_records(records)
+
+    assert graph.roots() == ("WELL-A_PL", "WELL-B", "9010_ZBS")
+    assert graph.dependencies_by_name["WELL-A"] == ("WELL-A_PL",)
+    assert graph.dependents_by_name["WELL-A_PL"] == ("WELL-A",)
+    path, runtime_s = graph.critical_path(
+        {"WELL-A_PL": 2.0, "WELL-A": 3.0, "WELL-B": 4.5, "9010_ZBS": 1.0}
+    )
+    assert path == ("WELL-A_PL", "WELL-A")
+    assert runtime_s == pytest.approx(5.0)
 
 
 def test_parent_selection_calculates_pilot_before_sidetrack() -> None:
@@ -9,6 +9,7 @@ from types import SimpleNamespace
 
 import numpy as np
 import pandas as pd
+import plotly.graph_objects as go
 import pytest
 from streamlit.testing.v1 import AppTest
 
@@ -16,6 +17,7 @@ from pywp import ptc_batch_results
 from pywp import ptc_core as wt_import_module
 from pywp import ptc_anticollision_params
 from pywp import ptc_edit_targets
+from pywp import ptc_three_payload
 from pywp.actual_fund_analysis import ActualFundKopDepthFunction
 from pywp.anticollision import (
     AntiCollisionAnalysis,
@@ -52,12 +54,22 @@ from pywp.uncertainty import (
     UNCERTAINTY_PRESET_MWD_UNKNOWN_MAGNETIC,
     planning_uncertainty_model_for_preset,
 )
+from pywp.visualization import HIGH_VOLUME_STATION_THRESHOLD
 from pywp.well_pad import apply_pad_layout
 from pywp.welltrack_batch import SuccessfulWellPlan, WelltrackBatchPlanner
 
 pytestmark = pytest.mark.integration
 
 
+def _payload_hover_names(payload: Mapping[str, object]) -> set[str]:
+    names: set[str] = set()
+    for item in payload["points"]:
+        names.update(str(hover.get("name")) for hover in list(item.get("hover") or []))
+        name_column = dict(item.get("hover_columns") or {}).get("name") or {}
+        names.update(str(label) for label in name_column.get("labels", []))
+    return names
+
+
 def _records() -> list[WelltrackRecord]:
     records = [
         WelltrackRecord(
@@ -1683,6 +1695,47 @@ def test_all_wells_plan_figure_keeps_message_only_warning_well_solid() -> None:
     assert str(warning_trace.line.dash) == "solid"
 
 
+def test_all_wells_plan_figure_decimates_when_figure_total_is_high_volume() -> None:
+    page = wt_import_module
+    station_count = 1600
+    md = np.linspace(0.0, 3000.0, station_count)
+    angle = np.linspace(0.0, np.pi, station_count)
+    successes = [
+        _successful_plan(
+            name=f"WELL-{index}",
+            y_offset_m=100.0 * index,
+            stations=pd.DataFrame(
+                {
+                    "MD_m": md,
+                    "INC_deg": np.linspace(0.0, 90.0, station_count),
+                    "AZI_deg": np.full(station_count, 90.0),
+                    "X_m": 1000.0 * np.sin(angle),
+                    "Y_m": 100.0 * index + 1000.0 * (1.0 - np.cos(angle)),
+                    "Z_m": md / 2.0,
+                    "DLS_deg_per_30m": np.full(station_count, 1.0),
+                    "segment": ["BUILD1"] * station_count,
+                }
+            ),
+        )
+        for index in range(4)
+    ]
+    assert station_count < HIGH_VOLUME_STATION_THRESHOLD
+    assert station_count * len(successes) > HIGH_VOLUME_STATION_THRESHOLD
+
+    figure = page._all_wells_plan_figure(successes)
+    single = page._all_wells_plan_figure(successes[:1])
+
+    well_traces = [trace for trace in figure.data if str(trace.name).startswith("WELL-")]
+    well_traces = [trace for trace in well_traces if ":" not in str(trace.name)]
+    assert len(well_traces) == 4
+    for trace in well_traces:
+        assert isinstance(trace, go.Scattergl)
+        assert len(trace.x) < station_count
+        assert len(trace.customdata) == len(trace.x)
+    assert isinstance(single.data[0], go.Scatter)
+    assert len(single.data[0].x) == station_count
+
+
 def _successful_plan_xy(
     *,
     name: str,
@@ -5373,6 +5426,28 @@ def test_welltrack_page_renders_actual_fund_well_detail_viewer() -> None:
     assert str(detail_selectboxes[0].value) == "FACT-H"
 
 
+def test_actual_fund_depth_cluster_index_is_kept_in_session_state(
+    monkeypatch,
+) -> None:
+    page = wt_import_module
+    monkeypatch.setattr(page.st, "session_state", {})
+    metrics = tuple(
+        item.metrics
+        for item in page.build_actual_fund_well_analyses(
+            list(_horizontal_reference_well())
+        )
+    )
+
+    first = page._actual_fund_depth_cluster_index(metrics)
+    added = []
+    monkeypatch.setattr(first, "add", lambda metric: added.append(metric) or True)
+
+    assert page._actual_fund_depth_cluster_index(metrics) is first
+    assert added == []
+    assert page._actual_fund_depth_cluster_index(metrics[:0]) is first
+    assert len(first) == 0
+
+
 def test_actual_fund_vertical_profile_uses_explicit_reversed_tvd_range() -> None:
     page = wt_import_module
     detail = page.build_actual_fund_well_analyses(list(_horizontal_reference_well()))[0]
@@ -12038,11 +12113,7 @@ def test_all_wells_overview_figures_include_reference_trajectories() -> None:
     )
 
     trace_names_plan = {str(trace.name) for trace in figure_plan.data}
-    hover_names_3d = {
-        str(hover.get("name"))
-        for item in payload_3d["points"]
-        for hover in list(item.get("hover") or [])
-    }
+    hover_names_3d = _payload_hover_names(payload_3d)
 
     assert "FACT-1" in hover_names_3d
     assert "APP-1" in hover_names_3d
@@ -12511,21 +12582,13 @@ def test_anticollision_figures_include_reference_trajectory_wells_without_target
     )
     figure_plan = page._all_wells_anticollision_plan_figure(analysis)
 
-    hover_names = {
-        str(hover.get("name"))
-        for item in payload_3d["points"]
-        for hover in list(item.get("hover") or [])
-    }
+    hover_names = _payload_hover_names(payload_3d)
     assert "FACT-1" in hover_names
     assert "APP-1" in hover_names
     mesh_names = {str(item.get("name")) for item in payload_3d["meshes"]}
     assert "FACT-1 (Фактическая) cone" in mesh_names
     assert "APP-1 (Проектная утвержденная) cone" in mesh_names
-    assert not any(
-        "FACT-1 (Фактическая): цели" == str(hover.get("name"))
-        for item in payload_3d["points"]
-        for hover in list(item.get("hover") or [])
-    )
+    assert "FACT-1 (Фактическая): цели" not in _payload_hover_names(payload_3d)
     assert not any(
         "APP-1 (Проектная утвержденная): цели" == str(trace.name)
         for trace in figure_plan.data
@@ -12592,11 +12655,7 @@ def test_all_wells_three_payload_aggregates_reference_wells_in_fast_mode() -> No
     )
 
     line_colors = {str(item["color"]) for item in payload["lines"]}
-    hover_names = {
-        str(hover.get("name"))
-        for item in payload["points"]
-        for hover in list(item.get("hover") or [])
-    }
+    hover_names = _payload_hover_names(payload)
     assert "#6B7280" in line_colors
     assert "#C62828" in line_colors
     assert "FACT-1" in hover_names
@@ -12658,11 +12717,7 @@ def test_anticollision_three_payload_omits_far_reference_wells_from_ac_scope() -
         render_mode=page.WT_3D_RENDER_FAST,
     )
 
-    hover_names = {
-        str(hover.get("name"))
-        for item in payload["points"]
-        for hover in list(item.get("hover") or [])
-    }
+    hover_names = _payload_hover_names(payload)
     analysis_names = {str(well.name) for well in analysis.wells}
     assert analysis_names == {"WELL-A"}
     assert "FACT-FAR" not in hover_names
@@ -12698,11 +12753,7 @@ def test_anticollision_payload_can_show_loaded_reference_wells_outside_ac_scope(
         reference_wells=far_reference_wells,
     )
 
-    hover_names = {
-        str(hover.get("name"))
-        for item in payload["points"]
-        for hover in list(item.get("hover") or [])
-    }
+    hover_names = _payload_hover_names(payload)
     trace_names = {str(trace.name) for trace in figure_plan.data}
 
     assert {"FACT-FAR", "APP-FAR"}.issubset(hover_names)
@@ -12930,7 +12981,9 @@ def test_all_wells_three_payload_preserves_hover_metadata_for_tooltip() -> None:
         item for item in payload["points"] if bool(item.get("hover_only"))
     ]
     assert hover_only_points
-    first_hover = hover_only_points[0]["hover"][0]
+    first_hover = ptc_three_payload.hover_item_from_columns(
+        hover_only_points[0]["hover_columns"], 0
+    )
     assert first_hover["name"] == "WELL-A"
     assert "md" in first_hover
     assert "dls" in first_hover
@@ -13061,7 +13114,7 @@ def test_resolve_3d_render_mode_forces_fast_for_large_reference_scene() -> None:
     assert resolved == page.WT_3D_RENDER_FAST
 
 
-def test_three_payload_decimates_reference_hover_points() -> None:
+def test_three_payload_keeps_full_resolution_reference_hover_columns() -> None:
     page = wt_import_module
     stations = pd.DataFrame(
         {
@@ -13093,16 +13146,17 @@ def test_three_payload_decimates_reference_hover_points() -> None:
 
     assert len(hover_only_points) == 1
     assert str(hover_only_points[0]["role"]) == "reference_hover"
-    assert (
-        len(hover_only_points[0]["points"])
-        == page.WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE
-    )
-    assert (
-        len(hover_only_points[0]["hover"])
-        == page.WT_THREE_MAX_HOVER_POINTS_PER_REFERENCE_TRACE
-    )
-    assert {str(item.get("name")) for item in hover_only_points[0]["hover"]} == {
-        "FACT-001"
+    hover_columns = hover_only_points[0]["hover_columns"]
+    assert len(hover_only_points[0]["points"]) == 300
+    assert len(hover_columns["md"]) == 300
+    assert hover_columns["name"]["labels"] == ["FACT-001"]
+    assert ptc_three_payload.hover_item_from_columns(hover_columns, 150) == {
+        "name": "FACT-001",
+        "segment": "HOLD",
+        "md": 1500.0,
+        "inc": pytest.approx(45.150501672),
+        "azi": 90.0,
+        "dls": 2.0,
     }
 
 
@@ -13156,9 +13210,9 @@ def test_fast_three_payload_keeps_reference_well_hover_names() -> None:
         item for item in payload["points"] if str(item.get("role")) == "reference_hover"
     ]
     hover_names = {
-        str(hover.get("name"))
+        str(label)
         for item in reference_hover
-        for hover in item.get("hover", [])
+        for label in item["hover_columns"]["name"]["labels"]
     }
 
     assert len(reference_hover) <= 2
@@ -13230,10 +13284,10 @@ def test_fast_anticollision_3d_keeps_near_reference_cone_by_xy_gap() -> None:
         item for item in payload["meshes"] if str(item.get("color")) == "#6B7280"
     )
     hover_names = {
-        str(hover.get("name"))
+        str(label)
         for item in payload["points"]
         if str(item.get("role")) == "reference_hover"
-        for hover in list(item.get("hover") or [])
+        for label in item["hover_columns"]["name"]["labels"]
     }
     near_only_reference_cone = next(
         item
@@ -13378,10 +13432,9 @@ def test_anticollision_3d_trajectory_hover_is_reserved_for_wells_targets_and_con
     assert overlap_meshes
     assert well_lines
     trajectory_hovers = [
-        hover
+        ptc_three_payload.hover_item_from_columns(item["hover_columns"], 0)
         for item in payload_3d["points"]
         if str(item.get("role")) == "trajectory_hover"
-        for hover in list(item.get("hover") or [])
     ]
     assert trajectory_hovers
     assert {"md", "dls", "inc", "segment"}.issubset(trajectory_hovers[0].keys())
@@ -11,6 +11,7 @@ from pywp.eclipse_welltrack import (
     _ordered_table_points,
     _ordered_table_zbs_multi_horizontal_point_names,
     decode_welltrack_bytes,
+    parse_welltrack_arrays,
     parse_welltrack_points_table,
     parse_welltrack_text,
     welltrack_multi_horizontal_level_count,
@@ -71,6 +72,60 @@ def test_parse_rejects_decreasing_md_sequence() -> None:
         parse_welltrack_text(text)
 
 
+def test_parse_reports_first_md_problem_in_point_order() -> None:
+    text = """
+    WELLTRACK 'BROKEN-MD'
+    0 0 0 0
+    100 100 2000 3000
+    200 200 2100 2000
+    300 300 2200 inf
+    /
+    WELLTRACK 'NAN-MD'
+    0 0 0 0
+    0 0 10 nan
+    0 0 5 -1
+    /
+    """
+    with pytest.raises(
+        WelltrackParseError,
+        match=r"Found MD\[2\]=3000\.000 > MD\[3\]=2000\.000\.",
+    ):
+        parse_welltrack_text(text)
+    with pytest.raises(WelltrackParseError, match="MD at point #2 must be finite"):
+        parse_welltrack_text(text.split("/", 1)[1])
+
+
+def test_parse_reports_bad_number_with_terminator_line() -> None:
+    text = "WELLTRACK 'BAD'\n0 0 0 0\n1 2 x 4\n/\n"
+    with pytest.raises(
+        WelltrackParseError,
+        match=(
+            "около строки 4: could not convert string to float: 'x'"
+        ),
+    ):
+        parse_welltrack_text(text)
+
+
+def test_parse_welltrack_arrays_matches_records_and_ignores_tail_after_slash() -> None:
+    text = """
+    WELLTRACK 'A' 0 0 0 0 -- comment 9 9 9 9
+    10 0 100 100 / 5 5 5 5
+    7 7 7 7
+    WELLTRACK B
+    0 0 0 0; 1 1 1 1
+    """
+    arrays = parse_welltrack_arrays(text)
+    records = parse_welltrack_text(text)
+
+    assert [item.name for item in arrays] == ["A", "B"]
+    assert arrays[0].xyz_md.tolist() == [[0.0, 0.0, 0.0, 0.0], [10.0, 0.0, 100.0, 100.0]]
+    assert arrays[1].xyz_md.shape == (1, 4)
+    assert [record.name for record in records] == ["A", "B"]
+    assert [
+        [point.x, point.y, point.z, point.md] for point in records[0].points
+    ] == arrays[0].xyz_md.tolist()
+
+
 def test_points_to_targets_requires_strict_md_order_by_default() -> None:
     points = (
         WelltrackPoint(x=0.0, y=0.0, z=0.0, md=0.0),